@@ -13,14 +13,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import asyncio
-import selectors
-from asyncio import AbstractEventLoop
-from typing import Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
 
 from couchbase_columnar.common import JSONType as JSONType  # noqa: F401
 from couchbase_columnar.protocol import configure_logging as configure_logging  # noqa: F401
 
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
 
 class _LoopValidator:
     """
@@ -35,6 +37,9 @@ class _LoopValidator:
         """
         **INTERNAL**
         """
+        # imported on first use so that importing acouchbase_columnar does not import asyncio
+        import asyncio
+        import selectors
         evloop = asyncio.get_event_loop()
         gen_new_loop = not _LoopValidator._is_valid_loop(evloop)
         if gen_new_loop:
@@ -53,6 +58,7 @@ class _LoopValidator:
         """
         if not evloop:
             return False
+        import asyncio
         for meth in _LoopValidator.REQUIRED_METHODS:
             abs_meth, actual_meth = (
                 getattr(asyncio.AbstractEventLoop, meth), getattr(evloop.__class__, meth))
@@ -74,6 +80,7 @@ class _LoopValidator:
         """
         **INTERNAL**
         """
+        import asyncio
         evloop = asyncio.get_event_loop()
         evloop.close()
 
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import sys
 from asyncio import Future
+from datetime import timedelta
 from typing import TYPE_CHECKING, Optional
 
 if sys.version_info < (3, 10):
@@ -25,6 +26,10 @@ else:
     from typing import TypeAlias
 
 from acouchbase_columnar.database import AsyncDatabase
+from couchbase_columnar.metrics import (AdmissionStats,
+                                        ClusterMetrics,
+                                        IoStats,
+                                        StatementStatisticsSnapshot)
 from couchbase_columnar.result import AsyncQueryResult
 
 if TYPE_CHECKING:
@@ -62,8 +67,127 @@ class AsyncCluster:
     def execute_query(self, statement: str, *args: object, **kwargs: object) -> Future[AsyncQueryResult]:
         return self._impl.execute_query(statement, *args, **kwargs)
 
-    def close(self) -> None:
-        return self._impl.close()
+    def warmup(self, timeout: Optional[timedelta] = None) -> Future[None]:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Waits for the cluster's bootstrap to complete (see the `lazy_connect` cluster option) and opens connections to
+        the Columnar query service so that subsequent queries do not pay the connection setup cost.
+
+        Args:
+            timeout (Optional[timedelta]): The maximum amount of time to spend opening connections to the Columnar
+                query service. Defaults to `None` (C++ core default).
+
+        Returns:
+            Future[None]: A :class:`~asyncio.Future` that completes once the connections have been opened.
+
+        Raises:
+            :class:`~acouchbase_columnar.exceptions.TimeoutError`: If none of the Columnar query service endpoints
+                responded before the timeout expired.
+            :class:`~acouchbase_columnar.exceptions.ColumnarError`: If the cluster bootstrap failed or none of the
+                Columnar query service endpoints could be reached.
+        """
+        return self._impl.warmup(timeout=timeout)
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns admission details for an execution lane: the number of queries the lane allows in-flight (see the
+        `adaptive_concurrency` cluster option and the `max_in_flight` execution lane option), the number of queries
+        in-flight and waiting, and how long queries waited to be admitted.
+
+        Args:
+            lane (Optional[str]): The name of the execution lane to return details for (see the `execution_lanes`
+                cluster option). Defaults to `None` (default lane).
+
+        Returns:
+            :class:`~couchbase_columnar.metrics.AdmissionStats`: Admission details for the execution lane.
+
+        Raises:
+            :class:`RuntimeError`: If the cluster is still connecting (see the `lazy_connect` cluster option).
+        """
+        return self._impl.admission_stats(lane=lane)
+
+    def io_stats(self, lane: Optional[str] = None) -> IoStats:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns utilization details for the threads servicing the cluster's I/O.  Use these details to size the
+        `num_io_threads` cluster option; a consistently high loop lag or utilization indicates the I/O threads are
+        saturated.
+
+        Args:
+            lane (Optional[str]): The name of the execution lane to return details for (see the `execution_lanes`
+                cluster option). Defaults to `None` (default lane).
+
+        Returns:
+            :class:`~couchbase_columnar.metrics.IoStats`: Utilization details for the cluster's I/O threads.
+
+        Raises:
+            :class:`RuntimeError`: If the cluster is still connecting (see the `lazy_connect` cluster option).
+        """
+        return self._impl.io_stats(lane=lane)
+
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns a snapshot of the latency (time to first row, total) and throughput (rows/sec, bytes/sec) histograms
+        of the queries executed by the cluster, grouped by database/scope and outcome (`success`, `timeout`,
+        `cancel` or `error`).  The metrics are recorded by the native client as queries complete and aggregated across
+        the cluster's execution lanes.
+
+        Args:
+            reset (Optional[bool]): If `True`, the metrics are reset once the snapshot is taken. Defaults to `None`.
+
+        Returns:
+            :class:`~couchbase_columnar.metrics.ClusterMetrics`: The query metrics, use
+            :meth:`~couchbase_columnar.metrics.ClusterMetrics.to_prometheus` to render the metrics in the Prometheus
+            text exposition format.
+
+        Raises:
+            :class:`RuntimeError`: If the cluster is still connecting (see the `lazy_connect` cluster option).
+        """
+        return self._impl.metrics(reset=reset)
+
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Returns a snapshot of the statistics (calls, latency, rows, bytes and errors) of the queries executed by the
+        cluster, aggregated per statement fingerprint.  Statements that only differ by their literal values, comments
+        or whitespace share a fingerprint.  Requires the `statement_statistics` cluster option.
+
+        Args:
+            reset (Optional[bool]): If `True`, the statistics are reset once the snapshot is taken. Defaults to `None`.
+
+        Returns:
+            :class:`~couchbase_columnar.metrics.StatementStatisticsSnapshot`: The statement statistics, use
+            :meth:`~couchbase_columnar.metrics.StatementStatisticsSnapshot.to_json` to dump them to JSON.
+
+        Raises:
+            :class:`RuntimeError`: If the `statement_statistics` cluster option is not enabled.
+        """
+        return self._impl.statement_statistics(reset=reset)
+
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> Future[None]:
+        """Shuts down this cluster instance, cleaning up all resources associated with it.
+
+        Args:
+            timeout (Optional[timedelta]): **VOLATILE** The maximum amount of time to spend closing the cluster. If
+                the cluster has not closed by then, it continues to close in the background. Defaults to `None` (no
+                timeout).
+            drain (Optional[bool]): **VOLATILE** If set to `True`, queries in-flight when the cluster is closed are
+                allowed to complete (within the timeout) before the cluster's connections are closed. Otherwise
+                in-flight queries are cancelled. New queries are not accepted once the cluster is closing. Defaults to
+                `None` (do not drain).
+
+        Returns:
+            Future[None]: A :class:`~asyncio.Future` that completes once the cluster has closed.
+
+        Raises:
+            :class:`~acouchbase_columnar.exceptions.TimeoutError`: Set on the returned future if the timeout expired
+                before the in-flight queries completed (when draining) or before the cluster's connections closed.  The
+                cluster is closed either way, the queries that had not completed were cancelled and the connections
+                continue to close in the background.
+        """
+        return self._impl.close(timeout=timeout, drain=drain)
 
     @classmethod
     def create_instance(cls,
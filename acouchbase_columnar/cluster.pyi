@@ -14,12 +14,17 @@
 #  limitations under the License.
 
 from asyncio import AbstractEventLoop, Future
-from typing import overload
+from datetime import timedelta
+from typing import Optional, overload
 
 from typing_extensions import Unpack
 
 from acouchbase_columnar.database import AsyncDatabase
 from couchbase_columnar.credential import Credential
+from couchbase_columnar.metrics import (AdmissionStats,
+                                        ClusterMetrics,
+                                        IoStats,
+                                        StatementStatisticsSnapshot)
 from couchbase_columnar.options import (ClusterOptions,
                                         ClusterOptionsKwargs,
                                         QueryOptions,
@@ -114,7 +119,14 @@ class AsyncCluster:
                       *args: str,
                       **kwargs: str) -> Future[AsyncQueryResult]: ...
 
-    def close(self) -> None: ...
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> Future[None]: ...
+
+    def warmup(self, timeout: Optional[timedelta] = None) -> Future[None]: ...
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats: ...
+    def io_stats(self, lane: Optional[str] = None) -> IoStats: ...
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics: ...
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot: ...
 
     @overload
     @classmethod
@@ -0,0 +1,25 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from couchbase_columnar.common.metrics import AdmissionStats as AdmissionStats  # noqa: F401
+from couchbase_columnar.common.metrics import ClusterMetrics as ClusterMetrics  # noqa: F401
+from couchbase_columnar.common.metrics import CoreStats as CoreStats  # noqa: F401
+from couchbase_columnar.common.metrics import Histogram as Histogram  # noqa: F401
+from couchbase_columnar.common.metrics import IoStats as IoStats  # noqa: F401
+from couchbase_columnar.common.metrics import IoThreadStats as IoThreadStats  # noqa: F401
+from couchbase_columnar.common.metrics import QueryOutcomeMetrics as QueryOutcomeMetrics  # noqa: F401
+from couchbase_columnar.common.metrics import StatementStatistics as StatementStatistics  # noqa: F401
+from couchbase_columnar.common.metrics import StatementStatisticsSnapshot as StatementStatisticsSnapshot  # noqa: F401
+from couchbase_columnar.protocol import core_stats as core_stats  # noqa: F401
@@ -17,7 +17,9 @@ from __future__ import annotations
 
 import sys
 from asyncio import Future
+from datetime import timedelta
 from functools import partial
+from time import monotonic, time_ns
 from typing import TYPE_CHECKING, Optional
 
 if sys.version_info < (3, 10):
@@ -27,8 +29,18 @@ else:
 
 from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 from acouchbase_columnar.protocol.query import _AsyncQueryStreamingExecutor
+from couchbase_columnar.common.metrics import (AdmissionStats,
+                                               ClusterMetrics,
+                                               IoStats,
+                                               StatementStatisticsSnapshot)
 from couchbase_columnar.common.result import AsyncQueryResult
-from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
+from couchbase_columnar.common.streaming import QueryInstrumentation
+from couchbase_columnar.protocol.core.lanes import (_ExecutionLane,
+                                                    _InFlightPermit,
+                                                    raise_if_close_timed_out)
+from couchbase_columnar.protocol.core.request import (ClusterRequestBuilder,
+                                                      QueryRequest,
+                                                      WarmupRequest)
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
@@ -47,7 +59,10 @@ class AsyncCluster:
                  **kwargs: object) -> None:
         self._client_adapter = _ClientAdapter(connstr, credential, options, loop, **kwargs)
         self._request_builder = ClusterRequestBuilder(self._client_adapter)
-        self._connect()
+        if self._client_adapter.connection_details.lazy_connect is True:
+            self._connect_in_background()
+        else:
+            self._connect()
 
     @property
     def client_adapter(self) -> _ClientAdapter:
@@ -63,13 +78,20 @@ class AsyncCluster:
         """
         return self._client_adapter.has_connection
 
-    def _close(self) -> None:
+    def _close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None:
         """
             **INTERNAL**
         """
-        req = self._request_builder.build_close_connection_request()
-        self._client_adapter.close_connection(req)
+        deadline = monotonic() + timeout.total_seconds() if timeout is not None else None
+        self._client_adapter.begin_close()
+        drained = True
+        if drain is True:
+            drained = self._client_adapter.drain(timeout.total_seconds() if timeout is not None else None)
+        remaining = timedelta(seconds=max(deadline - monotonic(), 0)) if deadline is not None else None
+        req = self._request_builder.build_close_connection_request(remaining)
+        closed = self._client_adapter.close_connection(req)
         self._client_adapter.reset_client()
+        raise_if_close_timed_out(drained, closed)
 
     def _connect(self) -> None:
         """
@@ -78,7 +100,31 @@ class AsyncCluster:
         req = self._request_builder.build_connection_request()
         self._client_adapter.connect(req)
 
-    def close(self) -> None:
+    def _connect_in_background(self) -> None:
+        """
+            **INTERNAL**
+        """
+        req = self._request_builder.build_connection_request()
+        self._client_adapter.connect_in_background(req)
+
+    async def _close_when_connected(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None:
+        """
+            **INTERNAL**
+        """
+        try:
+            await self._client_adapter.wait_until_connected()
+        except Exception:  # nosec
+            # the background connection failed, there is nothing to close
+            return
+        if not self.has_connection:
+            return
+        if timeout is None and drain is not True:
+            self._close()
+        else:
+            # draining and closing w/ a timeout block (the bindings release the GIL), run in the loop's default executor
+            await self._client_adapter.loop.run_in_executor(None, self._close, timeout, drain)
+
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> Future[None]:
         """Shuts down this cluster instance. Cleaning up all resources associated with it.
 
         .. warning::
@@ -87,25 +133,126 @@ class AsyncCluster:
             is necessary and in those types of applications, this method might be beneficial.
 
         """
+        loop = self._client_adapter.loop
+        if self._client_adapter.forked:
+            # the connection belongs to the parent process, there is nothing to close in this process
+            self._client_adapter.abandon_connection()
+            self._client_adapter.reset_client()
+            closed_ft: Future[None] = loop.create_future()
+            closed_ft.set_result(None)
+            return closed_ft
+        connect_ft = self._client_adapter.connect_future
+        if (connect_ft is not None and not connect_ft.done()) or timeout is not None or drain is True:
+            # cannot block the event loop waiting on the bootstrap or on in-flight queries
+            return loop.create_task(self._close_when_connected(timeout, drain))
+
         if self.has_connection:
             self._close()
         else:
             # TODO: log warning
             print('Cluster does not have a connection.  Ignoring')
+        ft: Future[None] = loop.create_future()
+        ft.set_result(None)
+        return ft
 
     def _query_done_callback(self, executor: _AsyncQueryStreamingExecutor, ft: Future) -> None:
         if ft.cancelled():
             executor.cancel()
 
-    def execute_query(self, statement: str, *args: object, **kwargs: object) -> Future[AsyncQueryResult]:
-        req, _ = self._request_builder.build_query_request(statement, *args, **kwargs)
-        executor = _AsyncQueryStreamingExecutor(self.client_adapter.client,
+    def _submit_query(self,
+                      lane: _ExecutionLane,
+                      req: QueryRequest,
+                      permit: Optional[_InFlightPermit] = None,
+                      instrumentation: Optional[QueryInstrumentation] = None) -> Future[AsyncQueryResult]:
+        """
+            **INTERNAL**
+        """
+        executor = _AsyncQueryStreamingExecutor(lane.client,
                                                 self.client_adapter.loop,
-                                                req)
+                                                req,
+                                                permit=permit,
+                                                instrumentation=instrumentation)
         ft = executor.submit_query()
         ft.add_done_callback(partial(self._query_done_callback, executor))
         return ft
 
+    async def _execute_query_when_admitted(self,
+                                           lane: _ExecutionLane,
+                                           req: QueryRequest,
+                                           instrumentation: Optional[QueryInstrumentation] = None) -> AsyncQueryResult:
+        """
+            **INTERNAL**
+        """
+        permit = await lane.limiter.acquire_async(self.client_adapter.loop, priority=req.priority)
+        return await self._submit_query(lane, req, permit, instrumentation)
+
+    def _execute_query(self,
+                       req: QueryRequest,
+                       instrumentation: Optional[QueryInstrumentation] = None) -> Future[AsyncQueryResult]:
+        """
+            **INTERNAL**
+        """
+        lane = self.client_adapter.get_execution_lane(req.lane)
+        permit = lane.limiter.try_acquire()
+        if permit is None:
+            # the lane is at its in-flight limit, wait (w/o blocking the event loop) for a query to complete
+            return self.client_adapter.loop.create_task(self._execute_query_when_admitted(lane, req, instrumentation))
+        return self._submit_query(lane, req, permit, instrumentation)
+
+    async def _execute_query_when_connected(self,
+                                            req: QueryRequest,
+                                            instrumentation: Optional[QueryInstrumentation] = None) -> AsyncQueryResult:
+        """
+            **INTERNAL**
+        """
+        await self.client_adapter.wait_until_connected()
+        return await self._execute_query(req, instrumentation)
+
+    def execute_query(self, statement: str, *args: object, **kwargs: object) -> Future[AsyncQueryResult]:
+        request_start = time_ns()
+        req, _ = self._request_builder.build_query_request(statement, *args, **kwargs)
+        instrumentation = QueryInstrumentation.create(req,
+                                                      tracer=self.client_adapter.connection_details.tracer,
+                                                      statistics=self.client_adapter.statement_statistics,
+                                                      request_start=request_start)
+        if self.client_adapter.connection_pending:
+            return self.client_adapter.loop.create_task(self._execute_query_when_connected(req, instrumentation))
+        return self._execute_query(req, instrumentation)
+
+    async def _warmup(self, req: WarmupRequest) -> None:
+        """
+            **INTERNAL**
+        """
+        await self.client_adapter.wait_until_connected()
+        # the bindings block (w/o the GIL) until all endpoints have responded, run in the loop's default executor
+        await self.client_adapter.loop.run_in_executor(None, self.client_adapter.warmup, req)
+
+    def warmup(self, timeout: Optional[timedelta] = None) -> Future[None]:
+        """Waits for the cluster's bootstrap to complete and opens connections to the Columnar query service.
+        """
+        req = self._request_builder.build_warmup_request(timeout)
+        return self.client_adapter.loop.create_task(self._warmup(req))
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats:
+        """Returns admission details for an execution lane.
+        """
+        return AdmissionStats(self.client_adapter.admission_stats(lane))
+
+    def io_stats(self, lane: Optional[str] = None) -> IoStats:
+        """Returns utilization details for the threads servicing the I/O of the cluster (or of an execution lane).
+        """
+        return IoStats(self.client_adapter.io_stats(lane))
+
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics:
+        """Returns latency and throughput metrics for the queries executed by the cluster.
+        """
+        return ClusterMetrics(self.client_adapter.query_metrics(reset))
+
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot:
+        """Returns the statistics of the queries executed by the cluster, aggregated per statement fingerprint.
+        """
+        return StatementStatisticsSnapshot(self.client_adapter.statement_statistics_snapshot(reset))
+
     @classmethod
     def create_instance(cls,
                         connstr: str,
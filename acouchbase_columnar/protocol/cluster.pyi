@@ -14,13 +14,18 @@
 #  limitations under the License.
 
 from asyncio import AbstractEventLoop, Future
-from typing import overload
+from datetime import timedelta
+from typing import Optional, overload
 
 from typing_extensions import Unpack
 
 from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 from acouchbase_columnar.protocol.database import AsyncDatabase
 from couchbase_columnar.common.credential import Credential
+from couchbase_columnar.common.metrics import (AdmissionStats,
+                                               ClusterMetrics,
+                                               IoStats,
+                                               StatementStatisticsSnapshot)
 from couchbase_columnar.common.result import AsyncQueryResult
 from couchbase_columnar.options import (ClusterOptions,
                                         ClusterOptionsKwargs,
@@ -82,9 +87,16 @@ class AsyncCluster:
     def client_adapter(self) -> _ClientAdapter: ...
 
     @property
-    def connected(self) -> bool: ...
+    def has_connection(self) -> bool: ...
 
-    def close(self) -> None: ...
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> Future[None]: ...
+
+    def warmup(self, timeout: Optional[timedelta] = None) -> Future[None]: ...
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats: ...
+    def io_stats(self, lane: Optional[str] = None) -> IoStats: ...
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics: ...
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot: ...
 
     def database(self, name: str) -> AsyncDatabase: ...
 
@@ -15,24 +15,34 @@
 
 from __future__ import annotations
 
-from asyncio import Future
+import weakref
+from asyncio import Future, sleep
 from threading import Event
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Optional,
                     Union)
 
 from couchbase_columnar.common.exceptions import ColumnarError, InternalSDKError
-from couchbase_columnar.common.query import QueryMetadata
+from couchbase_columnar.common.query import QueryMetadata, QueryProgress
 from couchbase_columnar.common.result import AsyncQueryResult
-from couchbase_columnar.common.streaming import StreamingExecutor, StreamingState
+from couchbase_columnar.common.resume import QueryResumer
+from couchbase_columnar.common.streaming import (ClientMetricsRecorder,
+                                                 ProgressReporter,
+                                                 QueryInstrumentation,
+                                                 QueryRetryHandler,
+                                                 StreamingExecutor,
+                                                 StreamingState)
 from couchbase_columnar.protocol.core.result import CoreQueryIterator
 from couchbase_columnar.protocol.exceptions import CoreColumnarError, ErrorMapper
 
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
 
+    from couchbase_columnar.common.capture import QueryCaptureWriter
     from couchbase_columnar.protocol.core.client import _CoreClient
+    from couchbase_columnar.protocol.core.lanes import _InFlightPermit
     from couchbase_columnar.protocol.core.request import QueryRequest
 
 
@@ -44,15 +54,36 @@ class _AsyncQueryStreamingExecutor(StreamingExecutor):
     def __init__(self,
                  client: _CoreClient,
                  loop: AbstractEventLoop,
-                 request: QueryRequest) -> None:
+                 request: QueryRequest,
+                 permit: Optional[_InFlightPermit] = None,
+                 instrumentation: Optional[QueryInstrumentation] = None) -> None:
         self._client = client
         self._loop = loop
         self._request = request
+        self._permit = permit
+        if permit is not None:
+            # make sure the lane's slot is given back if the result is dropped before all rows are iterated
+            weakref.finalize(self, permit.release)
+        self._instrumentation = instrumentation
+        if instrumentation is not None:
+            # make sure the query's instrumentation is finished if the result is dropped before all rows are iterated
+            weakref.finalize(self, instrumentation.finish, outcome='abandoned')
         self._query_iter: CoreQueryIterator
         self._deserializer = request.deserializer
+        self._client_metrics = ClientMetricsRecorder()
+        self._progress_reporter = ProgressReporter.create(request)
+        self._retry_handler: Optional[QueryRetryHandler] = None
+        self._capture: Optional[QueryCaptureWriter] = None
+        self._resumer: Optional[QueryResumer] = None
+        if request.resume_key is not None:
+            self._resumer = QueryResumer.create(request)
+            if self._resumer is not None and request.checkpoint_path is not None:
+                # make sure the checkpoint is written if the result is dropped before all rows are iterated
+                weakref.finalize(self, self._resumer.checkpoint)
         self._metadata: Optional[QueryMetadata] = None
         self._streaming_state = StreamingState.NotStarted
         self._row_ft: Future[Any]
+        self._resume_ft: Optional[Future[Union[bool, CoreColumnarError]]] = None
 
     @property
     def cancel_token(self) -> Optional[Event]:
@@ -87,6 +118,46 @@ class _AsyncQueryStreamingExecutor(StreamingExecutor):
             return
         self._query_iter.cancel()
         self._streaming_state = StreamingState.Cancelled
+        self._release_permit()
+        self._finish_instrumentation(outcome='cancel')
+
+    def _release_permit(self) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._permit is not None:
+            self._permit.release()
+
+    def _finish_instrumentation(self,
+                                error: Optional[Exception] = None,
+                                outcome: Optional[str] = None,
+                                metadata: Optional[Callable[[], Optional[QueryMetadata]]] = None) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.finish(error,
+                                         outcome=outcome,
+                                         deserialize_ns=self._client_metrics.deserialize_ns,
+                                         metadata=metadata)
+        if self._capture is not None and not self._capture.closed:
+            if metadata is not None:
+                # fetching the metadata records it to the capture
+                metadata()
+            self._capture.finish(error, outcome=outcome)
+        if self._resumer is not None:
+            self._resumer.finish(completed=error is None and outcome is None)
+
+    def _completed_metadata(self) -> Optional[QueryMetadata]:
+        """
+            **INTERNAL**
+
+        Returns the metadata of a query whose rows have all been streamed, used by the slow query log.
+        """
+        try:
+            return self.get_metadata()
+        except (ColumnarError, InternalSDKError, RuntimeError):
+            return None
 
     def get_metadata(self) -> QueryMetadata:
         # TODO:  Maybe not needed if we get metadata automatically?
@@ -111,42 +182,166 @@ class _AsyncQueryStreamingExecutor(StreamingExecutor):
             raise ErrorMapper.build_error(query_metadata)
         if query_metadata is None:
             return
+        if self._capture is not None:
+            self._capture.metadata_received(query_metadata)
+        self._client_metrics.add_to_metadata(query_metadata)
         self._metadata = QueryMetadata(query_metadata)
 
+    def get_progress(self) -> QueryProgress:
+        if not hasattr(self, '_query_iter'):
+            # the query has not been dispatched yet
+            return QueryProgress({})
+        result_count = self._metadata.metrics().result_count() if self._metadata is not None else None
+        progress = self._query_iter.progress()
+        if self._resumer is not None:
+            progress = self._resumer.progress(progress)
+        return QueryProgress(progress, result_count=result_count)
+
     def submit_query(self) -> Future[AsyncQueryResult]:
         if not StreamingState.okay_to_stream(self._streaming_state):
             raise RuntimeError('Query has been canceled or previously executed.')
 
         self._streaming_state = StreamingState.Started
+        if self._request.capture_path is not None:
+            # only imported if a query is captured, the capture module is rarely used
+            from couchbase_columnar.common.capture import QueryCaptureWriter
+            self._capture = QueryCaptureWriter.create(self._request)
+        if self._capture is not None:
+            # make sure the capture file is closed if the result is dropped before all rows are iterated
+            weakref.finalize(self, self._capture.close)
+        self._retry_handler = QueryRetryHandler.create(self._request)
+        # created before the query is dispatched, the bindings might call back before the query op returns
+        self._iter_ft: Future[AsyncQueryResult] = self._loop.create_future()
+        self._dispatch()
+        return self._iter_ft
+
+    def _dispatch(self) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._resumer is not None:
+            self._resumer.apply()
+        if self._instrumentation is not None:
+            self._instrumentation.dispatch_started()
         try:
             self._query_iter = self._client.columnar_query_op(self._request,
                                                               callback=self._set_query_core_result,
                                                               row_callback=self._row_callback)
         except Exception as ex:
+            self._release_permit()
             # suppress context, we know we have raised an error from the bindings
             if isinstance(ex, CoreColumnarError):
-                raise ErrorMapper.build_error(ex) from None
-            raise InternalSDKError(str(ex)) from None
+                err: Exception = ErrorMapper.build_error(ex)
+            else:
+                err = InternalSDKError(str(ex))
+            self._finish_instrumentation(err)
+            raise err from None
+        if self._instrumentation is not None:
+            self._instrumentation.dispatch_completed()
 
-        self._iter_ft: Future[AsyncQueryResult] = self._loop.create_future()
-        return self._iter_ft
+    def _retry(self, exc: Exception) -> bool:
+        """
+            **INTERNAL**
+
+        Schedules the next attempt if the failed attempt is retried, the query keeps its execution lane slot.  Called
+        from the bindings' I/O thread, the next attempt is dispatched from the event loop once the delay has elapsed.
+        """
+        if self._retry_handler is None:
+            return False
+        delay = self._retry_handler.retry_after(exc)
+        if delay is None:
+            return False
+        if self._permit is not None:
+            # the lane's limiter adapts its limit to the failed attempt
+            self._permit.response_received(exc)
+        self._client_metrics.retrying()
+        self._loop.call_soon_threadsafe(self._loop.call_later, delay, self._redispatch)
+        return True
+
+    def _redispatch(self) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._iter_ft.done():
+            # the application stopped waiting for the query
+            return
+        try:
+            self._dispatch()
+        except Exception as ex:
+            self._iter_ft.set_exception(ex)
+
+    async def _resume(self, exc: Exception) -> Optional[Exception]:
+        """
+            **INTERNAL**
+
+        Dispatches a resumable query again for the rows after its last returned row, until an attempt's response headers
+        are received or the failed attempt is not retried.  Returns the error the query fails with if it is not resumed.
+        """
+        if self._resumer is None or self._retry_handler is None:
+            return exc
+        if self._resumer.progressed:
+            # the attempt returned rows, the retry strategy starts over
+            self._retry_handler.reset()
+        while True:
+            delay = self._retry_handler.retry_after(exc)
+            if delay is None:
+                return exc
+            if self._permit is not None:
+                # the lane's limiter adapts its limit to the failed attempt
+                self._permit.response_received(exc)
+            self._client_metrics.retrying()
+            await sleep(delay)
+            # created before the query is dispatched, the bindings might call back before the query op returns
+            resume_ft: Future[Union[bool, CoreColumnarError]] = self._loop.create_future()
+            self._resume_ft = resume_ft
+            self._dispatch()
+            res = await resume_ft
+            self._resume_ft = None
+            if not isinstance(res, CoreColumnarError):
+                return None
+            exc = ErrorMapper.build_error(res)
 
     async def get_next_row(self) -> Any:
         return await self._get_next_row()
 
-    def _set_query_core_result(self, res:  Union[bool, ColumnarError]) -> None:
+    def _set_query_core_result(self, res: Union[bool, CoreColumnarError]) -> None:
+        if self._resume_ft is not None:
+            # the response of a resumed attempt, the application is already iterating the query's rows
+            self._loop.call_soon_threadsafe(self._resume_ft.set_result, res)
+            return
         if self._iter_ft.cancelled():
             return
 
         if isinstance(res, CoreColumnarError):
             exc = ErrorMapper.build_error(res)
+            if self._retry(exc):
+                return
+            if self._permit is not None:
+                # the lane's limiter adapts its limit to the query's response
+                self._permit.response_received(exc)
+            self._release_permit()
+            self._finish_instrumentation(exc)
             self._loop.call_soon_threadsafe(self._iter_ft.set_exception, exc)
         else:
+            if self._permit is not None:
+                self._permit.response_received()
+            if self._instrumentation is not None:
+                self._instrumentation.headers_received()
+            if self._capture is not None:
+                self._capture.headers_received()
             self._loop.call_soon_threadsafe(self._iter_ft.set_result, AsyncQueryResult(self))
 
     def _row_callback(self, row: Any) -> None:
+        if self._resumer is not None and isinstance(row, CoreColumnarError):
+            # the query might be resumed, the error is handled on the event loop
+            self._loop.call_soon_threadsafe(self._row_ft.set_result, row)
+            return
+        if row is None or isinstance(row, CoreColumnarError):
+            # the query is complete, either all rows have been streamed or an error occurred
+            self._release_permit()
         if isinstance(row, CoreColumnarError):
             exc = ErrorMapper.build_error(row)
+            self._finish_instrumentation(exc)
             self._loop.call_soon_threadsafe(self._row_ft.set_exception, exc)
         else:
             self._loop.call_soon_threadsafe(self._row_ft.set_result, row)
@@ -155,11 +350,36 @@ class _AsyncQueryStreamingExecutor(StreamingExecutor):
         if self._query_iter is None or not StreamingState.okay_to_iterate(self._streaming_state):
             raise StopAsyncIteration
 
+        self._client_metrics.row_requested()
         self._row_ft = self._loop.create_future()
         next(self._query_iter)
         row = await self._row_ft
+        while isinstance(row, CoreColumnarError):
+            exc = await self._resume(ErrorMapper.build_error(row))
+            if exc is not None:
+                self._release_permit()
+                self._finish_instrumentation(exc)
+                raise exc
+            self._row_ft = self._loop.create_future()
+            next(self._query_iter)
+            row = await self._row_ft
         if row is None:
             self._done_streaming = True
+            # finished on the event loop rather than in the row callback, the slow query log might need the metadata
+            self._finish_instrumentation(metadata=self._completed_metadata)
+            if self._progress_reporter is not None:
+                # the result count is only known once all rows have been streamed
+                self._completed_metadata()
+                self._progress_reporter.completed(self.get_progress)
             raise StopAsyncIteration
 
-        return self._deserializer.deserialize(row)
+        if self._instrumentation is not None:
+            self._instrumentation.row_received(row)
+        if self._capture is not None:
+            self._capture.row_received(row)
+        if self._progress_reporter is not None:
+            self._progress_reporter.row_received(self.get_progress)
+        value = self._client_metrics.deserialize(self._deserializer, row)
+        if self._resumer is not None:
+            self._resumer.row_returned(row, value)
+        return value
@@ -18,7 +18,8 @@ from __future__ import annotations
 import sys
 from asyncio import Future
 from functools import partial
-from typing import TYPE_CHECKING
+from time import time_ns
+from typing import TYPE_CHECKING, Optional
 
 if sys.version_info < (3, 10):
     from typing_extensions import TypeAlias
@@ -28,7 +29,9 @@ else:
 from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 from acouchbase_columnar.protocol.query import _AsyncQueryStreamingExecutor
 from couchbase_columnar.common.result import AsyncQueryResult
-from couchbase_columnar.protocol.core.request import ScopeRequestBuilder
+from couchbase_columnar.common.streaming import QueryInstrumentation
+from couchbase_columnar.protocol.core.lanes import _ExecutionLane, _InFlightPermit
+from couchbase_columnar.protocol.core.request import QueryRequest, ScopeRequestBuilder
 
 if TYPE_CHECKING:
     from acouchbase_columnar.protocol.database import AsyncDatabase
@@ -59,14 +62,65 @@ class AsyncScope:
         if ft.cancelled():
             executor.cancel()
 
-    def execute_query(self, statement: str, *args: object, **kwargs: object) -> Future[AsyncQueryResult]:
-        req, _ = self._request_builder.build_query_request(statement, *args, **kwargs)
-        executor = _AsyncQueryStreamingExecutor(self.client_adapter.client,
+    def _submit_query(self,
+                      lane: _ExecutionLane,
+                      req: QueryRequest,
+                      permit: Optional[_InFlightPermit] = None,
+                      instrumentation: Optional[QueryInstrumentation] = None) -> Future[AsyncQueryResult]:
+        """
+            **INTERNAL**
+        """
+        executor = _AsyncQueryStreamingExecutor(lane.client,
                                                 self.client_adapter.loop,
-                                                req)
+                                                req,
+                                                permit=permit,
+                                                instrumentation=instrumentation)
         ft = executor.submit_query()
         ft.add_done_callback(partial(self._query_done_callback, executor))
         return ft
 
+    async def _execute_query_when_admitted(self,
+                                           lane: _ExecutionLane,
+                                           req: QueryRequest,
+                                           instrumentation: Optional[QueryInstrumentation] = None) -> AsyncQueryResult:
+        """
+            **INTERNAL**
+        """
+        permit = await lane.limiter.acquire_async(self.client_adapter.loop, priority=req.priority)
+        return await self._submit_query(lane, req, permit, instrumentation)
+
+    def _execute_query(self,
+                       req: QueryRequest,
+                       instrumentation: Optional[QueryInstrumentation] = None) -> Future[AsyncQueryResult]:
+        """
+            **INTERNAL**
+        """
+        lane = self.client_adapter.get_execution_lane(req.lane)
+        permit = lane.limiter.try_acquire()
+        if permit is None:
+            # the lane is at its in-flight limit, wait (w/o blocking the event loop) for a query to complete
+            return self.client_adapter.loop.create_task(self._execute_query_when_admitted(lane, req, instrumentation))
+        return self._submit_query(lane, req, permit, instrumentation)
+
+    async def _execute_query_when_connected(self,
+                                            req: QueryRequest,
+                                            instrumentation: Optional[QueryInstrumentation] = None) -> AsyncQueryResult:
+        """
+            **INTERNAL**
+        """
+        await self.client_adapter.wait_until_connected()
+        return await self._execute_query(req, instrumentation)
+
+    def execute_query(self, statement: str, *args: object, **kwargs: object) -> Future[AsyncQueryResult]:
+        request_start = time_ns()
+        req, _ = self._request_builder.build_query_request(statement, *args, **kwargs)
+        instrumentation = QueryInstrumentation.create(req,
+                                                      tracer=self.client_adapter.connection_details.tracer,
+                                                      statistics=self.client_adapter.statement_statistics,
+                                                      request_start=request_start)
+        if self.client_adapter.connection_pending:
+            return self.client_adapter.loop.create_task(self._execute_query_when_connected(req, instrumentation))
+        return self._execute_query(req, instrumentation)
+
 
 Scope: TypeAlias = AsyncScope
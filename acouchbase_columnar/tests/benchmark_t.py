@@ -0,0 +1,211 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from statistics import median
+from time import perf_counter_ns
+from typing import (TYPE_CHECKING,
+                    List,
+                    Tuple)
+
+import pytest
+
+from acouchbase_columnar.capture import QueryCapture
+from acouchbase_columnar.result import AsyncQueryResult
+from tests import YieldFixture
+from tests.environments.benchmark import (BENCHMARK_REPLAY_SPEED,
+                                          BenchmarkRecorder,
+                                          BenchmarkResult,
+                                          capture_params,
+                                          peak_rss_kb)
+from tests.environments.mock_server import (MockCapturedResponse,
+                                            MockColumnarServer,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import AsyncTestEnvironment
+
+STREAMING_RESPONSES = [
+    pytest.param(MockQueryResponse(rows=100_000, row_width=64, rows_per_chunk=100), id='narrow'),
+    pytest.param(MockQueryResponse(rows=20_000, row_width=1024, rows_per_chunk=10), id='wide'),
+]
+
+
+class BenchmarkTestSuite:
+    TEST_MANIFEST = [
+        'test_benchmark_concurrent_queries',
+        'test_benchmark_query_overhead',
+        'test_benchmark_replay',
+        'test_benchmark_rows_per_second',
+        'test_benchmark_time_to_first_row',
+    ]
+
+    CONCURRENT_QUERIES = 10
+    ITERATIONS = 3
+    OVERHEAD_ITERATIONS = 200
+    TTFR_ITERATIONS = 50
+
+    def register_capture(self, mock_server: MockColumnarServer, capture_path: str) -> Tuple[str, MockQueryResponse]:
+        capture = QueryCapture.load(capture_path)
+        response = MockCapturedResponse(capture=capture, speed=BENCHMARK_REPLAY_SPEED)
+        statement = f'SELECT * FROM capture WHERE fingerprint = "{capture.statement_fingerprint()}";'
+        mock_server.register_response(statement, response)
+        return statement, response
+
+    def register_statement(self, mock_server: MockColumnarServer, response: MockQueryResponse) -> str:
+        statement = (f'SELECT * FROM benchmark WHERE rows = {response.rows} AND width = {response.row_width} '
+                     f'AND chunk = {response.rows_per_chunk};')
+        mock_server.register_response(statement, response)
+        return statement
+
+    async def drain(self, result: AsyncQueryResult) -> int:
+        rows = 0
+        async for _ in result.rows():
+            rows += 1
+        return rows
+
+    async def warm_up(self, test_env: AsyncTestEnvironment, mock_server: MockColumnarServer) -> None:
+        # the first query pays for bootstrapping the connection, don't measure it
+        statement = self.register_statement(mock_server, MockQueryResponse(rows=1))
+        await test_env.assert_rows(await test_env.cluster_or_scope.execute_query(statement), 1)
+
+    @pytest.mark.asyncio
+    async def test_benchmark_concurrent_queries(self,
+                                                test_env: AsyncTestEnvironment,
+                                                mock_server: MockColumnarServer,
+                                                benchmark_recorder: BenchmarkRecorder) -> None:
+        await self.warm_up(test_env, mock_server)
+        response = MockQueryResponse(rows=10_000, row_width=64, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+
+        async def run_query() -> int:
+            return await self.drain(await test_env.cluster_or_scope.execute_query(statement))
+
+        start = perf_counter_ns()
+        rows = sum(await asyncio.gather(*[run_query() for _ in range(self.CONCURRENT_QUERIES)]))
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.CONCURRENT_QUERIES
+        benchmark_recorder.record(BenchmarkResult('concurrent_queries', 'acouchbase', 'async', rows,
+                                                  self.CONCURRENT_QUERIES, elapsed, peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    async def test_benchmark_query_overhead(self,
+                                            test_env: AsyncTestEnvironment,
+                                            mock_server: MockColumnarServer,
+                                            benchmark_recorder: BenchmarkRecorder) -> None:
+        await self.warm_up(test_env, mock_server)
+        statement = self.register_statement(mock_server, MockQueryResponse(rows=1))
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.OVERHEAD_ITERATIONS):
+            rows += await self.drain(await test_env.cluster_or_scope.execute_query(statement))
+        elapsed = perf_counter_ns() - start
+        assert rows == self.OVERHEAD_ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('query_overhead', 'acouchbase', 'async', rows,
+                                                  self.OVERHEAD_ITERATIONS, elapsed, peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('capture_path', capture_params())
+    async def test_benchmark_replay(self,
+                                    test_env: AsyncTestEnvironment,
+                                    mock_server: MockColumnarServer,
+                                    benchmark_recorder: BenchmarkRecorder,
+                                    request: pytest.FixtureRequest,
+                                    capture_path: str) -> None:
+        await self.warm_up(test_env, mock_server)
+        statement, response = self.register_capture(mock_server, capture_path)
+        rows = 0
+        first_row_times: List[int] = []
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            query_start = perf_counter_ns()
+            query_rows = 0
+            async for _ in (await test_env.cluster_or_scope.execute_query(statement)).rows():
+                if query_rows == 0:
+                    first_row_times.append(perf_counter_ns() - query_start)
+                query_rows += 1
+            rows += query_rows
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult(f'replay[{request.node.callspec.id}]', 'acouchbase', 'replay',
+                                                  rows, self.ITERATIONS, elapsed,
+                                                  time_to_first_row_ns=int(median(first_row_times or [0])),
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('response', STREAMING_RESPONSES)
+    async def test_benchmark_rows_per_second(self,
+                                             test_env: AsyncTestEnvironment,
+                                             mock_server: MockColumnarServer,
+                                             benchmark_recorder: BenchmarkRecorder,
+                                             request: pytest.FixtureRequest,
+                                             response: MockQueryResponse) -> None:
+        await self.warm_up(test_env, mock_server)
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            rows += await self.drain(await test_env.cluster_or_scope.execute_query(statement))
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult(f'rows_per_second[{request.node.callspec.id}]', 'acouchbase',
+                                                  'async', rows, self.ITERATIONS, elapsed,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    async def test_benchmark_time_to_first_row(self,
+                                               test_env: AsyncTestEnvironment,
+                                               mock_server: MockColumnarServer,
+                                               benchmark_recorder: BenchmarkRecorder) -> None:
+        await self.warm_up(test_env, mock_server)
+        response = MockQueryResponse(rows=1000, row_width=64, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        first_row_times: List[int] = []
+        start = perf_counter_ns()
+        for _ in range(self.TTFR_ITERATIONS):
+            query_start = perf_counter_ns()
+            row_iter = (await test_env.cluster_or_scope.execute_query(statement)).rows()
+            await row_iter.__anext__()
+            first_row_times.append(perf_counter_ns() - query_start)
+            rows += 1
+            async for _ in row_iter:
+                rows += 1
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.TTFR_ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('time_to_first_row', 'acouchbase', 'async', rows,
+                                                  self.TTFR_ITERATIONS, elapsed,
+                                                  time_to_first_row_ns=int(median(first_row_times)),
+                                                  peak_rss_kb=peak_rss_kb()))
+
+
+class ClusterBenchmarkTests(BenchmarkTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterBenchmarkTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterBenchmarkTests) if valid_test_method(meth)]
+        test_list = set(BenchmarkTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(self,
+                                   mock_async_test_env: AsyncTestEnvironment) -> YieldFixture[AsyncTestEnvironment]:
+        yield mock_async_test_env
@@ -26,12 +26,30 @@ from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 
 class ConnectionTestSuite:
     TEST_MANIFEST = [
+        'test_close_connection_request',
         'test_connection_string_options',
         'test_dns_srv_disabled',
         'test_invalid_connection_strings',
+        'test_shared_connection_key',
         'test_valid_connection_strings',
     ]
 
+    def test_close_connection_request(self) -> None:
+        from datetime import timedelta
+
+        from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
+
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred)
+        builder = ClusterRequestBuilder(client)
+        # the bindings wait for the close to complete if a timeout is not provided
+        assert 'timeout' not in builder.build_close_connection_request().to_req_dict()
+        req = builder.build_close_connection_request(timedelta(seconds=2.5))
+        assert req.to_req_dict() == {'timeout': 2500000}
+        # a timeout of 0 means no timeout to the bindings, an expired deadline should not wait indefinitely
+        req = builder.build_close_connection_request(timedelta(0))
+        assert req.to_req_dict() == {'timeout': 1}
+
     @pytest.mark.parametrize('connstr, expected_opts',
                              [('couchbases://10.0.0.1?dns_nameserver=127.0.0.1&dump_configuration=true',
                                {'dns_nameserver': '127.0.0.1', 'dump_configuration': True}),
@@ -98,6 +116,25 @@ class ConnectionTestSuite:
         with pytest.raises(ValueError):
             Cluster.create_instance(connstr, cred)
 
+    def test_shared_connection_key(self) -> None:
+        from couchbase_columnar.protocol.core.client_adapter import _ClientAdapter as _BlockingClientAdapter
+        from couchbase_columnar.protocol.core.registry import _ConnectionRegistry
+        from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
+
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, share_connection=True)
+        req = ClusterRequestBuilder(client).build_connection_request()
+        key = _ConnectionRegistry.get_key(req)
+
+        # sync and async clusters w/ the same connection string, credential and options share a key
+        blocking_client = _BlockingClientAdapter('couchbases://localhost', cred, share_connection=True)
+        blocking_req = ClusterRequestBuilder(blocking_client).build_connection_request()
+        assert key == _ConnectionRegistry.get_key(blocking_req)
+
+        other_client = _ClientAdapter('couchbases://localhost', cred, share_connection=True, num_io_threads=2)
+        other_req = ClusterRequestBuilder(other_client).build_connection_request()
+        assert key != _ConnectionRegistry.get_key(other_req)
+
     @pytest.mark.parametrize('connstr', ['couchbases://10.0.0.1',
                                          'couchbases://10.0.0.1:11222,10.0.0.2,10.0.0.3:11207',
                                          'couchbases://10.0.0.1;10.0.0.2:11210;10.0.0.3',
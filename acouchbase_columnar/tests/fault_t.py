@@ -0,0 +1,226 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from acouchbase_columnar.exceptions import (ColumnarError,
+                                            QueryError,
+                                            TimeoutError)
+from acouchbase_columnar.options import QueryOptions
+from acouchbase_columnar.result import AsyncQueryResult
+from tests import YieldFixture
+from tests.environments.benchmark import (BenchmarkRecorder,
+                                          BenchmarkResult,
+                                          peak_rss_kb)
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import AsyncTestEnvironment
+
+
+def to_ns(duration: timedelta) -> int:
+    return int(duration.total_seconds() * 1e9)
+
+
+class FaultTestSuite:
+    TEST_MANIFEST = [
+        'test_cancel_while_stalled',
+        'test_mid_stream_disconnect',
+        'test_service_unavailable',
+        'test_slow_first_byte',
+        'test_timeout_while_stalled',
+        'test_trickling_rows',
+    ]
+
+    # how late a timeout or a cancellation is allowed to be
+    LATENCY_SLACK = timedelta(seconds=1)
+
+    def register_statement(self,
+                           mock_server: MockColumnarServer,
+                           name: str,
+                           response: MockQueryResponse,
+                           fault: MockFault) -> str:
+        statement = f'SELECT * FROM fault WHERE test = "{name}";'
+        mock_server.register_response(statement, response)
+        mock_server.register_fault(statement, fault)
+        return statement
+
+    async def drain(self, result: AsyncQueryResult) -> int:
+        rows = 0
+        async for _ in result.rows():
+            rows += 1
+        return rows
+
+    @pytest.fixture(autouse=True)
+    def clear_faults(self, mock_server: MockColumnarServer) -> YieldFixture[None]:
+        yield
+        mock_server.clear_faults()
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_stalled(self,
+                                        test_env: AsyncTestEnvironment,
+                                        mock_server: MockColumnarServer,
+                                        benchmark_recorder: BenchmarkRecorder) -> None:
+        statement = self.register_statement(mock_server,
+                                            'cancel_while_stalled',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault(stall_after_rows=10))
+        result = await test_env.cluster_or_scope.execute_query(statement)
+        row_iter = result.rows()
+        for _ in range(10):
+            await row_iter.__anext__()
+
+        cancelled_at: List[int] = []
+
+        def cancel() -> None:
+            cancelled_at.append(perf_counter_ns())
+            result.cancel()
+
+        async def iterate() -> None:
+            try:
+                # waits until the query is cancelled, cancelling either ends or fails the iteration
+                async for _ in row_iter:
+                    pass
+            except ColumnarError:
+                pass
+
+        asyncio.get_running_loop().call_later(0.2, cancel)
+        await asyncio.wait_for(iterate(), timeout=(timedelta(milliseconds=200) + self.LATENCY_SLACK).total_seconds())
+        returned_at = perf_counter_ns()
+        assert len(cancelled_at) == 1
+        latency = returned_at - cancelled_at[0]
+        assert latency < to_ns(self.LATENCY_SLACK)
+        benchmark_recorder.record(BenchmarkResult('cancel_while_stalled', 'acouchbase', 'fault', 10, 1, latency,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_disconnect(self,
+                                         test_env: AsyncTestEnvironment,
+                                         mock_server: MockColumnarServer) -> None:
+        statement = self.register_statement(mock_server,
+                                            'mid_stream_disconnect',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault(disconnect_after_rows=100))
+        result = await test_env.cluster_or_scope.execute_query(statement)
+        rows = 0
+        with pytest.raises(ColumnarError):
+            async for _ in result.rows():
+                rows += 1
+        assert rows <= 100
+
+    @pytest.mark.asyncio
+    async def test_service_unavailable(self,
+                                       test_env: AsyncTestEnvironment,
+                                       mock_server: MockColumnarServer) -> None:
+        statement = self.register_statement(mock_server,
+                                            'service_unavailable',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(status=503, error_code=23007))
+        with pytest.raises(QueryError) as ex:
+            await test_env.cluster_or_scope.execute_query(statement, QueryOptions(timeout=timedelta(seconds=5)))
+        assert ex.value.code == 23007
+
+    @pytest.mark.asyncio
+    async def test_slow_first_byte(self,
+                                   test_env: AsyncTestEnvironment,
+                                   mock_server: MockColumnarServer,
+                                   benchmark_recorder: BenchmarkRecorder) -> None:
+        delay = timedelta(milliseconds=500)
+        statement = self.register_statement(mock_server,
+                                            'slow_first_byte',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(first_byte_delay=delay))
+        start = perf_counter_ns()
+        row_iter = (await test_env.cluster_or_scope.execute_query(statement)).rows()
+        await row_iter.__anext__()
+        time_to_first_row = perf_counter_ns() - start
+        rows = 1
+        async for _ in row_iter:
+            rows += 1
+        elapsed = perf_counter_ns() - start
+        assert rows == 10
+        assert time_to_first_row >= to_ns(delay)
+        benchmark_recorder.record(BenchmarkResult('slow_first_byte', 'acouchbase', 'fault', rows, 1, elapsed,
+                                                  time_to_first_row_ns=time_to_first_row,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    async def test_timeout_while_stalled(self,
+                                         test_env: AsyncTestEnvironment,
+                                         mock_server: MockColumnarServer,
+                                         benchmark_recorder: BenchmarkRecorder) -> None:
+        timeout = timedelta(seconds=1)
+        statement = self.register_statement(mock_server,
+                                            'timeout_while_stalled',
+                                            MockQueryResponse(rows=10000, row_width=1024, rows_per_chunk=100),
+                                            MockFault(stall_after_rows=5000))
+        rows = 0
+        start = perf_counter_ns()
+        with pytest.raises(TimeoutError):
+            result = await test_env.cluster_or_scope.execute_query(statement, QueryOptions(timeout=timeout))
+            async for _ in result.rows():
+                rows += 1
+        elapsed = perf_counter_ns() - start
+        assert rows <= 5000
+        # the timeout should fire neither early nor (much) late while the stream is stalled
+        assert elapsed >= to_ns(timeout)
+        assert elapsed < to_ns(timeout + self.LATENCY_SLACK)
+        benchmark_recorder.record(BenchmarkResult('timeout_while_stalled', 'acouchbase', 'fault', rows, 1, elapsed,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.asyncio
+    async def test_trickling_rows(self,
+                                  test_env: AsyncTestEnvironment,
+                                  mock_server: MockColumnarServer) -> None:
+        chunk_delay = timedelta(milliseconds=25)
+        statement = self.register_statement(mock_server,
+                                            'trickling_rows',
+                                            MockQueryResponse(rows=20, rows_per_chunk=1),
+                                            MockFault(chunk_delay=chunk_delay))
+        start = perf_counter_ns()
+        rows = await self.drain(await test_env.cluster_or_scope.execute_query(statement))
+        elapsed = perf_counter_ns() - start
+        assert rows == 20
+        # every row after the first one (and the end of the result set) is delayed
+        assert elapsed >= 20 * to_ns(chunk_delay)
+
+
+class ClusterFaultTests(FaultTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterFaultTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterFaultTests) if valid_test_method(meth)]
+        test_list = set(FaultTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_async_test_env: AsyncTestEnvironment
+    ) -> YieldFixture[AsyncTestEnvironment]:
+        yield mock_async_test_env
@@ -0,0 +1,88 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from tests.environments.benchmark import profile_import
+
+# wall-clock budgets, the import time suite is a benchmark (only run when PYCBCC_BENCHMARK is set), lower them to
+# catch regressions on a known host
+PACKAGE_IMPORT_BUDGET_MS = float(os.environ.get('PYCBCC_IMPORT_BUDGET_MS', '150'))
+CLUSTER_IMPORT_BUDGET_MS = float(os.environ.get('PYCBCC_CLUSTER_IMPORT_BUDGET_MS', '400'))
+
+
+class ImportTestSuite:
+    TEST_MANIFEST = [
+        'test_cluster_import_is_lazy',
+        'test_package_import_is_lazy',
+    ]
+
+    def test_cluster_import_is_lazy(self) -> None:
+        modules = profile_import('acouchbase_columnar.cluster', runs=1).modules
+        for module in ('gzip', 'couchbase_columnar.common.capture', 'couchbase_columnar.bench'):
+            assert module not in modules
+
+    def test_package_import_is_lazy(self) -> None:
+        modules = profile_import('acouchbase_columnar', runs=1).modules
+        # logging is imported, the SDK adds the TRACE level when it is imported
+        for module in ('asyncio', 'couchbase_columnar.common.capture', 'acouchbase_columnar.cluster'):
+            assert module not in modules
+
+
+class ImportTimeTestSuite:
+    TEST_MANIFEST = [
+        'test_cluster_import_time',
+        'test_package_import_time',
+    ]
+
+    def test_cluster_import_time(self) -> None:
+        profile = profile_import('acouchbase_columnar.cluster')
+        assert profile.cumulative_us / 1e3 <= CLUSTER_IMPORT_BUDGET_MS, \
+            f'Importing acouchbase_columnar.cluster took {profile.cumulative_us / 1e3:.1f}ms.'
+
+    def test_package_import_time(self) -> None:
+        profile = profile_import('acouchbase_columnar')
+        assert profile.cumulative_us / 1e3 <= PACKAGE_IMPORT_BUDGET_MS, \
+            f'Importing acouchbase_columnar took {profile.cumulative_us / 1e3:.1f}ms.'
+
+
+class ImportTests(ImportTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ImportTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ImportTests) if valid_test_method(meth)]
+        test_list = set(ImportTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+
+class ImportTimeTests(ImportTimeTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ImportTimeTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ImportTimeTests) if valid_test_method(meth)]
+        test_list = set(ImportTimeTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
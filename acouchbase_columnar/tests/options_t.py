@@ -23,11 +23,16 @@ import pytest
 
 from acouchbase_columnar.credential import Credential
 from acouchbase_columnar.deserializer import DefaultJsonDeserializer
-from acouchbase_columnar.options import (ClusterOptions,
+from acouchbase_columnar.options import (AdaptiveConcurrencyOptions,
+                                         ClusterOptions,
+                                         ExecutionLaneOptions,
                                          IpProtocol,
                                          SecurityOptions,
                                          TimeoutOptions)
 from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
+from acouchbase_columnar.retry import BestEffortRetryStrategy
+from acouchbase_columnar.tracing import InMemoryTracer, NoOpTracer
+from couchbase_columnar.protocol.core.statistics import DEFAULT_STATEMENT_STATISTICS_CAPACITY
 from tests.columnar_config import CONFIG_FILE
 
 
@@ -44,8 +49,23 @@ class ClusterOptionsTestSuite:
     TEST_MANIFEST = [
         'test_options',
         'test_options_kwargs',
+        'test_options_adaptive_concurrency',
+        'test_options_adaptive_concurrency_invalid',
         'test_options_deserializer',
         'test_options_deserializer_kwargs',
+        'test_options_execution_lanes',
+        'test_options_execution_lanes_default_lane',
+        'test_options_execution_lanes_invalid',
+        'test_options_lazy_connect',
+        'test_options_lazy_connect_kwargs',
+        'test_options_num_io_threads',
+        'test_options_num_io_threads_auto',
+        'test_options_num_io_threads_invalid',
+        'test_options_retry_strategy',
+        'test_options_share_connection',
+        'test_options_slow_query_threshold',
+        'test_options_statement_statistics',
+        'test_options_tracer',
         'test_security_options',
         'test_security_options_kwargs',
         'test_timeout_options',
@@ -150,6 +170,184 @@ class ClusterOptionsTestSuite:
                                 **{'deserializer': default_deserializer})
         assert default_deserializer == client.connection_details.default_deserializer
 
+    def test_options_adaptive_concurrency(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        opts = AdaptiveConcurrencyOptions(initial_limit=8, max_limit=64, latency_threshold=timedelta(seconds=2))
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(adaptive_concurrency=opts), event_loop)
+        assert client.connection_details.adaptive_concurrency == {'initial_limit': 8,
+                                                                  'max_limit': 64,
+                                                                  'latency_threshold': 2000000}
+        # queries are admitted by the Python client, the C++ core should not receive the options
+        assert 'adaptive_concurrency' not in client.connection_details.cluster_options
+
+    @pytest.mark.parametrize('opts', [AdaptiveConcurrencyOptions(initial_limit=0),
+                                      AdaptiveConcurrencyOptions(min_limit=8, max_limit=4),
+                                      AdaptiveConcurrencyOptions(backoff_ratio=1.0),
+                                      4])
+    def test_options_adaptive_concurrency_invalid(self, event_loop: AbstractEventLoop, opts: object) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost',
+                           cred,
+                           ClusterOptions(),
+                           event_loop,
+                           **{'adaptive_concurrency': opts})
+
+    def test_options_execution_lanes(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        lanes = {'bulk': ExecutionLaneOptions(num_io_threads=2, max_in_flight=4),
+                 'interactive': ExecutionLaneOptions(max_in_flight=32)}
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(execution_lanes=lanes), event_loop)
+        assert client.connection_details.execution_lanes == {'bulk': {'num_io_threads': 2, 'max_in_flight': 4},
+                                                             'interactive': {'max_in_flight': 32}}
+        # the execution lanes are handled by the Python client, the C++ core should not receive them
+        assert 'execution_lanes' not in client.connection_details.cluster_options
+
+    def test_options_execution_lanes_default_lane(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        lanes = {'default': ExecutionLaneOptions(num_io_threads=2, max_in_flight=8)}
+        client = _ClientAdapter('couchbases://localhost',
+                                cred,
+                                ClusterOptions(num_io_threads='auto', execution_lanes=lanes),
+                                event_loop)
+        assert client.connection_details.cluster_options.get('num_io_threads') == 2
+        assert 'max_io_threads' not in client.connection_details.cluster_options
+
+    @pytest.mark.parametrize('lanes', [{'bulk': ExecutionLaneOptions(max_in_flight=0)},
+                                       {'bulk': ExecutionLaneOptions(num_io_threads=-1)},
+                                       {'': ExecutionLaneOptions()},
+                                       {'bulk': 4}])
+    def test_options_execution_lanes_invalid(self, event_loop: AbstractEventLoop, lanes: Dict[str, object]) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop, **{'execution_lanes': lanes})
+
+    def test_options_lazy_connect(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(lazy_connect=True), event_loop)
+        assert client.connection_details.lazy_connect is True
+        # the bootstrap mode is handled by the Python client, the C++ core should not receive it
+        assert 'lazy_connect' not in client.connection_details.cluster_options
+        assert client.connection_pending is False
+
+    def test_options_lazy_connect_kwargs(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost',
+                                cred,
+                                ClusterOptions(),
+                                event_loop,
+                                **{'lazy_connect': True})
+        assert client.connection_details.lazy_connect is True
+        assert 'lazy_connect' not in client.connection_details.cluster_options
+
+    def test_options_num_io_threads(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(num_io_threads=4), event_loop)
+        assert client.connection_details.cluster_options.get('num_io_threads') == 4
+        # a fixed number of io threads does not allow the C++ client to grow the pool
+        assert 'max_io_threads' not in client.connection_details.cluster_options
+
+    def test_options_num_io_threads_auto(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost',
+                                cred,
+                                ClusterOptions(),
+                                event_loop,
+                                **{'num_io_threads': 'auto'})
+        num_io_threads = client.connection_details.cluster_options.get('num_io_threads')
+        max_io_threads = client.connection_details.cluster_options.get('max_io_threads')
+        assert isinstance(num_io_threads, int)
+        assert isinstance(max_io_threads, int)
+        assert 1 <= num_io_threads <= max_io_threads
+
+    @pytest.mark.parametrize('num_io_threads', [0, -1, 'all', True])
+    def test_options_num_io_threads_invalid(self, event_loop: AbstractEventLoop, num_io_threads: object) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost',
+                           cred,
+                           ClusterOptions(),
+                           event_loop,
+                           **{'num_io_threads': num_io_threads})
+
+    def test_options_retry_strategy(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop)
+        assert client.connection_details.retry_strategy is None
+        strategy = BestEffortRetryStrategy()
+        opts = ClusterOptions(retry_strategy=strategy,
+                              timeout_options=TimeoutOptions(query_timeout=timedelta(seconds=30)))
+        client = _ClientAdapter('couchbases://localhost', cred, opts, event_loop)
+        assert client.connection_details.retry_strategy is strategy
+        # the retried attempts share the query timeout
+        assert client.connection_details.query_timeout == 30000000
+        # the queries are retried by the Python client, the C++ core should not receive the option
+        assert 'retry_strategy' not in client.connection_details.cluster_options
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop, **{'retry_strategy': 'retry'})
+
+    def test_options_share_connection(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(share_connection=True), event_loop)
+        assert client.connection_details.share_connection is True
+        # the connection registry is handled by the Python client, the C++ core should not receive the option
+        assert 'share_connection' not in client.connection_details.cluster_options
+
+    def test_options_slow_query_threshold(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop)
+        assert client.connection_details.slow_query_threshold is None
+        opts = ClusterOptions(slow_query_threshold=timedelta(milliseconds=500))
+        client = _ClientAdapter('couchbases://localhost', cred, opts, event_loop)
+        assert client.connection_details.slow_query_threshold == 500000
+        # the slow queries are logged by the Python client, the C++ core should not receive the option
+        assert 'slow_query_threshold' not in client.connection_details.cluster_options
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost',
+                           cred,
+                           ClusterOptions(),
+                           event_loop,
+                           **{'slow_query_threshold': 'slow'})
+
+    def test_options_statement_statistics(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop)
+        assert client.connection_details.statement_statistics_capacity is None
+        assert client.statement_statistics is None
+        with pytest.raises(RuntimeError):
+            client.statement_statistics_snapshot()
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(statement_statistics=True), event_loop)
+        assert client.statement_statistics is not None
+        assert client.statement_statistics.capacity == DEFAULT_STATEMENT_STATISTICS_CAPACITY
+        # the statistics are recorded by the Python client, the C++ core should not receive the options
+        assert 'statement_statistics' not in client.connection_details.cluster_options
+        assert 'statement_statistics_capacity' not in client.connection_details.cluster_options
+        opts = ClusterOptions(statement_statistics=True, statement_statistics_capacity=10)
+        client = _ClientAdapter('couchbases://localhost', cred, opts, event_loop)
+        assert client.statement_statistics is not None
+        assert client.statement_statistics.capacity == 10
+        # the capacity is ignored if the statistics are not enabled
+        opts = ClusterOptions(statement_statistics_capacity=10)
+        client = _ClientAdapter('couchbases://localhost', cred, opts, event_loop)
+        assert client.statement_statistics is None
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost',
+                           cred,
+                           ClusterOptions(statement_statistics=True, statement_statistics_capacity=0), event_loop)
+
+    def test_options_tracer(self, event_loop: AbstractEventLoop) -> None:
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        tracer = InMemoryTracer()
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(tracer=tracer), event_loop)
+        assert client.connection_details.tracer is tracer
+        # the query spans are created by the Python client, the C++ core should not receive the option
+        assert 'tracer' not in client.connection_details.cluster_options
+        # the no-op tracer is the same as not tracing at all
+        client = _ClientAdapter('couchbases://localhost', cred, ClusterOptions(tracer=NoOpTracer()), event_loop)
+        assert client.connection_details.tracer is None
+        with pytest.raises(ValueError):
+            _ClientAdapter('couchbases://localhost', cred, ClusterOptions(), event_loop, **{'tracer': 'tracer'})
+
     @pytest.mark.parametrize('opts, expected_opts',
                              [({}, None),
                               ({'trust_only_capella': True},
@@ -15,8 +15,11 @@
 
 from __future__ import annotations
 
+import json
+import logging
 from dataclasses import dataclass
 from datetime import timedelta
+from pathlib import Path
 from typing import (Dict,
                     List,
                     Optional,
@@ -25,10 +28,25 @@ from typing import (Dict,
 import pytest
 
 from acouchbase_columnar import JSONType
+from acouchbase_columnar.capture import QueryCapture
 from acouchbase_columnar.credential import Credential
+from acouchbase_columnar.exceptions import TimeoutError
+from acouchbase_columnar.metrics import StatementStatisticsSnapshot
 from acouchbase_columnar.options import QueryOptions
 from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter
-from couchbase_columnar.protocol.core.request import ClusterRequestBuilder, ScopeRequestBuilder
+from acouchbase_columnar.retry import BestEffortRetryStrategy
+from acouchbase_columnar.tracing import InMemoryTracer, statement_fingerprint
+from couchbase_columnar.common.capture import QueryCaptureWriter
+from couchbase_columnar.common.core.query import QueryMetadataCore, QueryProgressCore
+from couchbase_columnar.common.query import QueryProgress
+from couchbase_columnar.common.streaming import (SLOW_QUERY_LOGGER_NAME,
+                                                 ProgressReporter,
+                                                 QueryInstrumentation)
+from couchbase_columnar.protocol.core.request import (DEFAULT_PROGRESS_INTERVAL,
+                                                      DEFAULT_QUERY_TIMEOUT,
+                                                      ClusterRequestBuilder,
+                                                      ScopeRequestBuilder)
+from couchbase_columnar.protocol.core.statistics import _StatementStatisticsRegistry
 
 
 @dataclass
@@ -39,28 +57,79 @@ class QueryContext:
 
 class QueryOptionsTestSuite:
     TEST_MANIFEST = [
+        'test_options_capture_path',
+        'test_options_capture_path_kwargs',
         'test_options_deserializer',
         'test_options_deserializer_kwargs',
+        'test_options_lane',
+        'test_options_lane_kwargs',
         'test_options_named_parameters',
         'test_options_named_parameters_kwargs',
+        'test_options_parent_span',
+        'test_options_parent_span_kwargs',
         'test_options_positional_parameters',
         'test_options_positional_parameters_kwargs',
         'test_options_priority',
         'test_options_priority_kwargs',
+        'test_options_progress_callback',
+        'test_options_progress_callback_kwargs',
         'test_options_raw',
         'test_options_raw_kwargs',
         'test_options_readonly',
         'test_options_readonly_kwargs',
+        'test_options_resume_key',
+        'test_options_resume_key_kwargs',
+        'test_options_retry_strategy',
+        'test_options_retry_strategy_kwargs',
         'test_options_scan_consistency',
         'test_options_scan_consistency_kwargs',
+        'test_options_slow_query_threshold',
+        'test_options_slow_query_threshold_kwargs',
         'test_options_timeout',
-        'test_options_timeout_kwargs'
+        'test_options_timeout_kwargs',
+        'test_query_capture',
+        'test_query_progress_callback',
+        'test_query_slow_query_log',
+        'test_query_statement_statistics',
+        'test_query_tracing_spans',
     ]
 
     @pytest.fixture(scope='class')
     def query_statment(self) -> str:
         return 'SELECT * FROM default'
 
+    def test_options_capture_path(self,
+                                  query_statment: str,
+                                  request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                  query_ctx: QueryContext) -> None:
+        q_opts = QueryOptions(capture_path='query.capture')
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.capture_path == 'query.capture'
+        # the capture is recorded by the Python client, the C++ core should not receive the path
+        assert 'capture_path' not in req.to_req_dict()
+        assert 'capture_path' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(**{'capture_path': 1}))
+
+    def test_options_capture_path_kwargs(self,
+                                         query_statment: str,
+                                         request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                         query_ctx: QueryContext) -> None:
+        kwargs = {'capture_path': 'query.capture'}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.capture_path == 'query.capture'
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_deserializer(self,
                                   query_statment: str,
                                   request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -91,6 +160,34 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_options_lane(self,
+                          query_statment: str,
+                          request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                          query_ctx: QueryContext) -> None:
+        q_opts = QueryOptions(lane='bulk')
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.lane == 'bulk'
+        # the execution lane is handled by the Python client, the C++ core should not receive it
+        assert 'lane' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+    def test_options_lane_kwargs(self,
+                                 query_statment: str,
+                                 request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                 query_ctx: QueryContext) -> None:
+        kwargs = {'lane': 'bulk'}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.lane == 'bulk'
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_named_parameters(self,
                                       query_statment: str,
                                       request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -117,6 +214,36 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_options_parent_span(self,
+                                 query_statment: str,
+                                 request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                 query_ctx: QueryContext) -> None:
+        parent_span = InMemoryTracer().start_span('parent')
+        q_opts = QueryOptions(parent_span=parent_span)
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.parent_span is parent_span
+        # the query spans are created by the Python client, the C++ core should not receive the parent span
+        assert 'parent_span' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+    def test_options_parent_span_kwargs(self,
+                                        query_statment: str,
+                                        request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                        query_ctx: QueryContext) -> None:
+        parent_span = InMemoryTracer().start_span('parent')
+        kwargs = {'parent_span': parent_span}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.parent_span is parent_span
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_positional_parameters(self,
                                            query_statment: str,
                                            request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -167,6 +294,46 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_options_progress_callback(self,
+                                       query_statment: str,
+                                       request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                       query_ctx: QueryContext) -> None:
+        progress: List[QueryProgress] = []
+        q_opts = QueryOptions(progress_callback=progress.append, progress_interval=timedelta(milliseconds=500))
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.progress_callback == progress.append
+        assert req.progress_interval == 500000
+        # the progress callback is called by the Python client, the C++ core should not receive it
+        assert 'progress_callback' not in req.to_req_dict()['query_args']
+        assert 'progress_interval' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(**{'progress_callback': 'bad'}))
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment,
+                                                QueryOptions(progress_interval=timedelta(seconds=-1)))
+
+    def test_options_progress_callback_kwargs(self,
+                                              query_statment: str,
+                                              request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                              query_ctx: QueryContext) -> None:
+        progress: List[QueryProgress] = []
+        kwargs = {'progress_callback': progress.append}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.progress_callback == progress.append
+        # the progress interval defaults to 1s when a progress callback is set
+        assert req.progress_interval == DEFAULT_PROGRESS_INTERVAL
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_raw(self,
                          query_statment: str,
                          request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -217,6 +384,93 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_options_resume_key(self,
+                                query_statment: str,
+                                request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                query_ctx: QueryContext,
+                                tmp_path: Path) -> None:
+        checkpoint_path = str(tmp_path / 'export.checkpoint')
+        q_opts = QueryOptions(resume_key=['name', 'id'], checkpoint_path=checkpoint_path)
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        # a resumable query is executed again when it is resumed, it is read-only and retried by default
+        exp_opts = {'readonly': True, 'timeout': DEFAULT_QUERY_TIMEOUT}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.resume_key == ['name', 'id']
+        assert req.checkpoint_path == checkpoint_path
+        assert isinstance(req.retry_strategy, BestEffortRetryStrategy)
+        # the queries are resumed by the Python client, the C++ core should not receive the key or the checkpoint
+        query_args = req.to_req_dict()['query_args']
+        assert 'resume_key' not in query_args
+        assert 'checkpoint_path' not in query_args
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(resume_key=[]))
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(resume_key='`id`'))
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(resume_key=['id', 'id']))
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(resume_key='id', read_only=False))
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(checkpoint_path=checkpoint_path))
+
+    def test_options_resume_key_kwargs(self,
+                                       query_statment: str,
+                                       request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                       query_ctx: QueryContext) -> None:
+        strategy = BestEffortRetryStrategy(max_attempts=5)
+        kwargs = {'resume_key': 'id', 'retry_strategy': strategy, 'timeout': timedelta(seconds=20)}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts = {'readonly': True, 'timeout': 20000000}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.resume_key == ['id']
+        assert req.checkpoint_path is None
+        assert req.retry_strategy is strategy
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+    def test_options_retry_strategy(self,
+                                    query_statment: str,
+                                    request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                    query_ctx: QueryContext) -> None:
+        strategy = BestEffortRetryStrategy()
+        q_opts = QueryOptions(read_only=True, retry_strategy=strategy)
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        # the attempts of a retried query share its timeout, the cluster's query timeout if the query has none
+        exp_opts = {'readonly': True, 'timeout': DEFAULT_QUERY_TIMEOUT}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.retry_strategy is strategy
+        # the queries are retried by the Python client, the C++ core should not receive the strategy
+        assert 'retry_strategy' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+        # only read-only queries are retried
+        req, _ = request_builder.build_query_request(query_statment, QueryOptions(retry_strategy=strategy))
+        assert req.options == {}
+        assert req.retry_strategy is None
+
+        with pytest.raises(ValueError):
+            request_builder.build_query_request(query_statment, QueryOptions(**{'retry_strategy': 'retry'}))
+
+    def test_options_retry_strategy_kwargs(self,
+                                           query_statment: str,
+                                           request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                           query_ctx: QueryContext) -> None:
+        strategy = BestEffortRetryStrategy()
+        kwargs = {'read_only': True, 'retry_strategy': strategy, 'timeout': timedelta(seconds=20)}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts = {'readonly': True, 'timeout': 20000000}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.retry_strategy is strategy
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_scan_consistency(self,
                                       query_statment: str,
                                       request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -249,6 +503,34 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_options_slow_query_threshold(self,
+                                          query_statment: str,
+                                          request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                          query_ctx: QueryContext) -> None:
+        q_opts = QueryOptions(slow_query_threshold=timedelta(milliseconds=250))
+        req, cancel_token = request_builder.build_query_request(query_statment, q_opts)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.slow_query_threshold == 250000
+        # the slow queries are logged by the Python client, the C++ core should not receive the threshold
+        assert 'slow_query_threshold' not in req.to_req_dict()['query_args']
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
+    def test_options_slow_query_threshold_kwargs(self,
+                                                 query_statment: str,
+                                                 request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                                 query_ctx: QueryContext) -> None:
+        kwargs = {'slow_query_threshold': timedelta(milliseconds=250)}
+        req, cancel_token = request_builder.build_query_request(query_statment, **kwargs)
+        exp_opts: Dict[str, object] = {}
+        assert cancel_token is None
+        assert req.options == exp_opts
+        assert req.slow_query_threshold == 250000
+        assert req.database_name == query_ctx.database_name
+        assert req.scope_name == query_ctx.scope_name
+
     def test_options_timeout(self,
                              query_statment: str,
                              request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
@@ -277,6 +559,222 @@ class QueryOptionsTestSuite:
         assert req.database_name == query_ctx.database_name
         assert req.scope_name == query_ctx.scope_name
 
+    def test_query_capture(self,
+                           query_statment: str,
+                           request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                           tmp_path: Path) -> None:
+        capture_path = str(tmp_path / 'query.capture')
+        req, _ = request_builder.build_query_request(query_statment, capture_path=capture_path)
+        writer = QueryCaptureWriter.create(req)
+        assert writer is not None
+        writer.headers_received()
+        rows = [json.dumps({'id': idx}).encode('utf-8') for idx in range(3)]
+        for row in rows:
+            writer.row_received(row)
+        metadata: QueryMetadataCore = {'request_id': 'capture-request', 'warnings': []}
+        writer.metadata_received(metadata)
+        writer.finish()
+        assert writer.closed is True
+        # records are dropped once the capture is finished
+        writer.row_received(b'{}')
+
+        capture = QueryCapture.load(capture_path)
+        assert capture.statement_fingerprint() == statement_fingerprint(query_statment)
+        assert capture.rows() == rows
+        offsets = capture.row_offsets()
+        assert len(offsets) == 3
+        assert offsets == sorted(offsets)
+        time_to_response = capture.time_to_response()
+        assert time_to_response is not None
+        assert time_to_response <= offsets[0]
+        assert capture.duration() == offsets[-1]
+        captured_metadata = capture.metadata()
+        assert captured_metadata is not None
+        assert captured_metadata.request_id() == 'capture-request'
+        assert capture.error() is None
+        assert list(capture.replay()) == rows
+        assert list(capture.replay(speed=100.0)) == rows
+
+        # a failed query's capture records the error
+        writer = QueryCaptureWriter.create(req)
+        assert writer is not None
+        writer.finish(TimeoutError(message='timed out'))
+        capture = QueryCapture.load(capture_path)
+        assert capture.rows() == []
+        assert capture.metadata() is None
+        assert capture.error() == {'error_type': 'TimeoutError', 'message': str(TimeoutError(message='timed out')),
+                                   'outcome': 'error'}
+
+        # files that are not captures are rejected
+        not_a_capture = tmp_path / 'not.capture'
+        not_a_capture.write_bytes(b'')
+        with pytest.raises(ValueError):
+            QueryCapture.load(str(not_a_capture))
+        # queries without a capture path are not captured
+        req, _ = request_builder.build_query_request(query_statment)
+        assert QueryCaptureWriter.create(req) is None
+
+    def test_query_progress_callback(self,
+                                     query_statment: str,
+                                     request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder]) -> None:
+        progress: List[QueryProgress] = []
+        req, _ = request_builder.build_query_request(query_statment,
+                                                     progress_callback=progress.append,
+                                                     progress_interval=timedelta(0))
+        reporter = ProgressReporter.create(req)
+        assert reporter is not None
+        for rows in range(1, 4):
+            raw: QueryProgressCore = {'rows': rows, 'bytes': rows * 10, 'elapsed_time': rows * 10**9}
+            reporter.row_received(lambda: QueryProgress(raw))
+        reporter.completed(lambda: QueryProgress({'rows': 3, 'bytes': 30, 'elapsed_time': 3 * 10**9, 'completed': True},
+                                                 result_count=3))
+        # the final progress is only reported once
+        reporter.completed(lambda: QueryProgress({}))
+        assert [p.rows() for p in progress] == [1, 2, 3, 3]
+        assert progress[-1].completed() is True
+        assert progress[-1].result_count() == 3
+        assert progress[-1].eta() == timedelta(0)
+        assert progress[0].rows_per_second() == 1.0
+        assert progress[0].bytes_per_second() == 10.0
+        assert progress[0].eta() is None
+        assert progress[0].eta(total_rows=5) == timedelta(seconds=4)
+
+        # rows received within the interval are not reported, the completed progress always is
+        progress.clear()
+        req, _ = request_builder.build_query_request(query_statment,
+                                                     progress_callback=progress.append,
+                                                     progress_interval=timedelta(hours=1))
+        reporter = ProgressReporter.create(req)
+        assert reporter is not None
+        reporter.row_received(lambda: QueryProgress({'rows': 1}))
+        reporter.completed(lambda: QueryProgress({'rows': 1, 'completed': True}))
+        assert len(progress) == 1
+        assert progress[0].completed() is True
+        # queries without a progress callback do not report progress
+        req, _ = request_builder.build_query_request(query_statment)
+        assert ProgressReporter.create(req) is None
+
+    def test_query_slow_query_log(self,
+                                  request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                  query_ctx: QueryContext,
+                                  caplog: pytest.LogCaptureFixture) -> None:
+        statement = 'SELECT * FROM default WHERE id = $id AND name = "secret"'
+        req, _ = request_builder.build_query_request(statement,
+                                                     QueryOptions(slow_query_threshold=timedelta(0)),
+                                                     id='secret-id')
+        instrumentation = QueryInstrumentation.create(req)
+        assert instrumentation is not None
+        caplog.set_level(logging.WARNING, logger=SLOW_QUERY_LOGGER_NAME)
+        instrumentation.dispatch_started()
+        instrumentation.row_received(b'{"a":1}')
+        instrumentation.finish()
+
+        records = [r for r in caplog.records if r.name == SLOW_QUERY_LOGGER_NAME]
+        assert len(records) == 1
+        record = getattr(records[0], 'slow_query')
+        assert json.loads(records[0].getMessage()[len('Slow query: '):]) == record
+        assert record['statement_fingerprint'] == statement_fingerprint(statement)
+        assert record['outcome'] == 'success'
+        assert record['threshold_us'] == 0
+        assert record['rows'] == 1
+        assert record['bytes'] == 7
+        assert record.get('database') == query_ctx.database_name
+        assert record.get('scope') == query_ctx.scope_name
+        # literal values and parameter values are redacted
+        assert 'secret' not in records[0].getMessage()
+        assert record['named_parameters'] == {'id': '<redacted>'}
+
+        # queries faster than the threshold are not logged
+        caplog.clear()
+        req, _ = request_builder.build_query_request(statement, QueryOptions(slow_query_threshold=timedelta(hours=1)))
+        instrumentation = QueryInstrumentation.create(req)
+        assert instrumentation is not None
+        instrumentation.dispatch_started()
+        instrumentation.finish()
+        assert not [r for r in caplog.records if r.name == SLOW_QUERY_LOGGER_NAME]
+
+    def test_query_statement_statistics(self,
+                                        request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder]) -> None:
+        registry = _StatementStatisticsRegistry(capacity=2)
+        statements = ['SELECT * FROM default WHERE id = 1',
+                      'SELECT *   FROM default WHERE id = 2 -- second',
+                      'SELECT * FROM other']
+        for statement in statements:
+            req, _ = request_builder.build_query_request(statement)
+            instrumentation = QueryInstrumentation.create(req, statistics=registry)
+            assert instrumentation is not None
+            instrumentation.dispatch_started()
+            instrumentation.row_received(b'{"a":1}')
+            instrumentation.finish()
+        req, _ = request_builder.build_query_request('SELECT * FROM another')
+        instrumentation = QueryInstrumentation.create(req, statistics=registry)
+        assert instrumentation is not None
+        instrumentation.dispatch_started()
+        instrumentation.finish(error=TimeoutError(message='timed out'))
+        # statements without a tracer or statistics are not instrumented
+        assert QueryInstrumentation.create(req) is None
+
+        snapshot = StatementStatisticsSnapshot(registry.snapshot())
+        assert snapshot.capacity() == 2
+        # the least frequently used statement (SELECT * FROM other) is evicted
+        assert snapshot.evictions() == 1
+        stats = {s.fingerprint(): s for s in snapshot.statements(order_by='calls')}
+        another_fingerprint = statement_fingerprint('SELECT * FROM another')
+        assert list(stats.keys()) == [statement_fingerprint(statements[0]), another_fingerprint]
+        assert stats[statement_fingerprint(statements[0])].calls() == 2
+        assert stats[statement_fingerprint(statements[0])].rows() == 2
+        assert stats[statement_fingerprint(statements[0])].bytes() == 14
+        assert stats[statement_fingerprint(statements[0])].errors() == 0
+        assert stats[another_fingerprint].errors() == 1
+        assert stats[another_fingerprint].timeouts() == 1
+        assert len(snapshot.statements(limit=1)) == 1
+        with pytest.raises(ValueError):
+            snapshot.statements(order_by='statement')
+
+        dumped = json.loads(snapshot.to_json())
+        assert dumped['capacity'] == 2
+        assert len(dumped['statements']) == 2
+        # resetting returns the current statistics and clears the registry
+        assert len(registry.snapshot(reset=True)['statements']) == 2
+        assert registry.snapshot()['statements'] == []
+
+    def test_query_tracing_spans(self,
+                                 query_statment: str,
+                                 request_builder: Union[ClusterRequestBuilder, ScopeRequestBuilder],
+                                 query_ctx: QueryContext) -> None:
+        tracer = InMemoryTracer()
+        parent_span = tracer.start_span('parent')
+        req, _ = request_builder.build_query_request(query_statment, QueryOptions(parent_span=parent_span))
+        tracing = QueryInstrumentation(req, tracer=tracer)
+        tracing.dispatch_started()
+        tracing.dispatch_completed()
+        tracing.headers_received()
+        tracing.row_received(b'{"a":1}')
+        tracing.row_received(b'{"a":2}')
+        tracing.finish(deserialize_ns=1000)
+        # finishing is idempotent
+        tracing.finish(outcome='cancel')
+
+        span_names = [s.name for s in tracer.finished_spans()]
+        assert span_names == ['columnar.request_encoding',
+                              'columnar.dispatch',
+                              'columnar.wait_for_headers',
+                              'columnar.streaming',
+                              'columnar.deserialize',
+                              'columnar.query']
+        query_span = tracer.finished_spans('columnar.query')[0]
+        assert query_span.parent is parent_span
+        assert all(s.parent is query_span for s in tracer.finished_spans() if s is not query_span)
+        assert query_span.attributes['db.columnar.statement_fingerprint'] == statement_fingerprint(query_statment)
+        assert query_span.attributes['db.columnar.rows'] == 2
+        assert query_span.attributes['db.columnar.bytes'] == 14
+        assert query_span.attributes['db.columnar.outcome'] == 'success'
+        assert query_span.attributes.get('db.columnar.database') == query_ctx.database_name
+        assert query_span.attributes.get('db.columnar.scope') == query_ctx.scope_name
+        deserialize_span = tracer.finished_spans('columnar.deserialize')[0]
+        assert deserialize_span.end_time is not None
+        assert deserialize_span.end_time - deserialize_span.start_time == 1000
+
 
 class ClusterQueryOptionsTests(QueryOptionsTestSuite):
 
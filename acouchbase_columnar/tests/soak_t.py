@@ -0,0 +1,175 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Awaitable,
+                    Callable)
+
+import pytest
+
+from acouchbase_columnar.exceptions import ColumnarError, TimeoutError
+from acouchbase_columnar.options import QueryOptions
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+from tests.environments.soak import SOAK_ITERATIONS, LeakTracker
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import AsyncTestEnvironment
+
+
+class SoakTestSuite:
+    TEST_MANIFEST = [
+        'test_cancel_mid_stream',
+        'test_error_response',
+        'test_mid_stream_disconnect',
+        'test_query',
+        'test_timeout_before_headers',
+    ]
+
+    def register_statement(self,
+                           mock_server: MockColumnarServer,
+                           name: str,
+                           response: MockQueryResponse,
+                           fault: MockFault) -> str:
+        statement = f'SELECT * FROM soak WHERE test = "{name}";'
+        mock_server.register_response(statement, response)
+        mock_server.register_fault(statement, fault)
+        return statement
+
+    @pytest.fixture(autouse=True)
+    def clear_faults(self, mock_server: MockColumnarServer) -> YieldFixture[None]:
+        yield
+        mock_server.clear_faults()
+
+    async def soak(self, name: str, leak_tracker: LeakTracker, iteration: Callable[[], Awaitable[None]]) -> None:
+        warmup = max(SOAK_ITERATIONS // 10, 1)
+        for _ in range(warmup):
+            await iteration()
+        leak_tracker.start()
+        for _ in range(SOAK_ITERATIONS):
+            await iteration()
+        leak_tracker.check(name, SOAK_ITERATIONS)
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_stream(self,
+                                     test_env: AsyncTestEnvironment,
+                                     mock_server: MockColumnarServer,
+                                     leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'cancel_mid_stream',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault())
+
+        async def iteration() -> None:
+            result = await test_env.cluster_or_scope.execute_query(statement)
+            rows = 0
+            async for _ in result.rows():
+                rows += 1
+                if rows == 10:
+                    break
+            result.cancel()
+
+        await self.soak('cancel_mid_stream', leak_tracker, iteration)
+
+    @pytest.mark.asyncio
+    async def test_error_response(self,
+                                  test_env: AsyncTestEnvironment,
+                                  mock_server: MockColumnarServer,
+                                  leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'error_response',
+                                            MockQueryResponse(),
+                                            MockFault(status=503))
+
+        async def iteration() -> None:
+            with pytest.raises(ColumnarError):
+                result = await test_env.cluster_or_scope.execute_query(statement)
+                await result.get_all_rows()
+
+        await self.soak('error_response', leak_tracker, iteration)
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_disconnect(self,
+                                         test_env: AsyncTestEnvironment,
+                                         mock_server: MockColumnarServer,
+                                         leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'mid_stream_disconnect',
+                                            MockQueryResponse(rows=100, rows_per_chunk=10),
+                                            MockFault(disconnect_after_rows=50))
+
+        async def iteration() -> None:
+            with pytest.raises(ColumnarError):
+                result = await test_env.cluster_or_scope.execute_query(statement)
+                async for _ in result.rows():
+                    pass
+
+        await self.soak('mid_stream_disconnect', leak_tracker, iteration)
+
+    @pytest.mark.asyncio
+    async def test_query(self,
+                         test_env: AsyncTestEnvironment,
+                         mock_server: MockColumnarServer,
+                         leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server, 'query', MockQueryResponse(rows=100), MockFault())
+
+        async def iteration() -> None:
+            result = await test_env.cluster_or_scope.execute_query(statement)
+            assert len(await result.get_all_rows()) == 100
+            result.metadata()
+
+        await self.soak('query', leak_tracker, iteration)
+
+    @pytest.mark.asyncio
+    async def test_timeout_before_headers(self,
+                                          test_env: AsyncTestEnvironment,
+                                          mock_server: MockColumnarServer,
+                                          leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'timeout_before_headers',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(first_byte_delay=timedelta(milliseconds=100)))
+
+        async def iteration() -> None:
+            with pytest.raises(TimeoutError):
+                await test_env.cluster_or_scope.execute_query(statement,
+                                                              QueryOptions(timeout=timedelta(milliseconds=5)))
+
+        await self.soak('timeout_before_headers', leak_tracker, iteration)
+
+
+class ClusterSoakTests(SoakTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterSoakTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterSoakTests) if valid_test_method(meth)]
+        test_list = set(SoakTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_async_test_env: AsyncTestEnvironment
+    ) -> YieldFixture[AsyncTestEnvironment]:
+        yield mock_async_test_env
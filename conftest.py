@@ -13,40 +13,95 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+from typing import (List,
+                    Optional,
+                    Tuple)
 
 import pytest
 
 pytest_plugins = [
     'tests.columnar_config',
-    'tests.environments.base_environment'
+    'tests.environments.base_environment',
+    'tests.environments.benchmark',
+    'tests.environments.mock_server',
+    'tests.environments.soak',
 ]
 
 _UNIT_TESTS = [
-    'couchbase_columnar/tests/connection_t.py::ConnectionTests'
+    'acouchbase_columnar/tests/import_t.py::ImportTests',
+    'couchbase_columnar/tests/connection_t.py::ConnectionTests',
+    'couchbase_columnar/tests/import_t.py::ImportTests',
 ]
 
 _INTEGRATRION_TESTS = [
     'couchbase_columnar/tests/query_t.py::QueryTests'
 ]
 
+_MOCK_TESTS = [
+    'acouchbase_columnar/tests/fault_t.py::ClusterFaultTests',
+    'couchbase_columnar/tests/admission_t.py::ClusterAdmissionTests',
+    'couchbase_columnar/tests/bench_t.py::ClusterBenchTests',
+    'couchbase_columnar/tests/bootstrap_cache_t.py::ClusterBootstrapCacheTests',
+    'couchbase_columnar/tests/close_t.py::ClusterCloseTests',
+    'couchbase_columnar/tests/fault_t.py::ClusterFaultTests',
+    'couchbase_columnar/tests/fork_t.py::ClusterForkTests',
+    'couchbase_columnar/tests/resume_t.py::ClusterResumeTests',
+    'couchbase_columnar/tests/retry_t.py::ClusterRetryTests',
+    'couchbase_columnar/tests/threads_t.py::ClusterThreadsTests',
+    'couchbase_columnar/tests/warmup_t.py::ClusterWarmupTests',
+]
+
+_SOAK_TESTS = [
+    'acouchbase_columnar/tests/soak_t.py::ClusterSoakTests',
+    'couchbase_columnar/tests/soak_t.py::ClusterSoakTests',
+]
+
+_BENCHMARK_TESTS = [
+    'acouchbase_columnar/tests/benchmark_t.py::ClusterBenchmarkTests',
+    'acouchbase_columnar/tests/import_t.py::ImportTimeTests',
+    'couchbase_columnar/tests/benchmark_t.py::ClusterBenchmarkTests',
+    'couchbase_columnar/tests/import_t.py::ImportTimeTests',
+]
+
 # https://docs.pytest.org/en/7.4.x/reference/reference.html#pytest.hookspec.pytest_collection_modifyitems
 
 
 def pytest_collection_modifyitems(session: pytest.Session,
                                   config: pytest.Config,
-                                  items: List[pytest.Item]) -> None:  # noqa: C901
+                                  items: List[pytest.Item]) -> None:
+    from tests.environments.benchmark import BENCHMARK_ENABLED
+    from tests.environments.soak import SOAK_ENABLED
+
+    api_markers = {
+        'couchbase_columnar': pytest.mark.pycbcc_couchbase,
+        'acouchbase_columnar': pytest.mark.pycbcc_acouchbase,
+    }
+    # the test classes, their marker and, if they are not run, the reason they are skipped
+    test_markers: List[Tuple[List[str], pytest.MarkDecorator, Optional[str]]] = [
+        (_UNIT_TESTS, pytest.mark.pycbcc_unit, None),
+        (_INTEGRATRION_TESTS, pytest.mark.pycbcc_integration, None),
+        (_MOCK_TESTS, pytest.mark.pycbcc_mock, None),
+        (_BENCHMARK_TESTS,
+         pytest.mark.pycbcc_benchmark,
+         None if BENCHMARK_ENABLED else 'Benchmarks are only run when PYCBCC_BENCHMARK is set.'),
+        (_SOAK_TESTS,
+         pytest.mark.pycbcc_soak,
+         None if SOAK_ENABLED else 'Soak tests are only run when PYCBCC_SOAK is set.'),
+    ]
+
     for item in items:
         item_details = item.nodeid.split('::')
 
         item_api = item_details[0].split('/')
-        if item_api[0] == 'couchbase_columnar':
-            item.add_marker(pytest.mark.pycbcc_couchbase)
-        elif item_api[0] == 'acouchbase_columnar':
-            item.add_marker(pytest.mark.pycbcc_acouchbase)
+        api_marker = api_markers.get(item_api[0], None)
+        if api_marker is not None:
+            item.add_marker(api_marker)
 
         test_class_path = '::'.join(item_details[:-1])
-        if test_class_path in _UNIT_TESTS:
-            item.add_marker(pytest.mark.pycbcc_unit)
-        elif test_class_path in _INTEGRATRION_TESTS:
-            item.add_marker(pytest.mark.pycbcc_integration)
+        for test_classes, marker, skip_reason in test_markers:
+            if test_class_path not in test_classes:
+                continue
+            item.add_marker(marker)
+            if skip_reason is not None:
+                item.add_marker(pytest.mark.skip(reason=skip_reason))
+            break
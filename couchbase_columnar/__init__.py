@@ -15,3 +15,28 @@
 
 from couchbase_columnar.common import JSONType as JSONType  # noqa: F401
 from couchbase_columnar.protocol import configure_logging as configure_logging  # noqa: F401
+
+from typing import Any  # nopep8 # isort:skip # noqa: E402
+
+# Submodules that are only imported once they are accessed (PEP 562), e.g. `couchbase_columnar.metrics.Histogram`
+# after `import couchbase_columnar`.  Keeps `import couchbase_columnar` cheap for CLI tools and serverless functions.
+_LAZY_SUBMODULES = frozenset(['bench',
+                              'capture',
+                              'cluster',
+                              'credential',
+                              'database',
+                              'deserializer',
+                              'exceptions',
+                              'metrics',
+                              'options',
+                              'query',
+                              'result',
+                              'scope',
+                              'tracing'])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        import importlib
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
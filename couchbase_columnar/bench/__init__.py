@@ -0,0 +1,29 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    **VOLATILE** This API is subject to change at any time.
+
+    A load generator for sustained throughput and tail-latency testing, run with ``python -m couchbase_columnar.bench``
+    (see ``--help``).  It drives a weighted mix of statements against a cluster (or the local mock Columnar server
+    when run from a source checkout) from concurrent workers using the blocking or the async API, optionally across
+    several processes, closed-loop or at an open-loop arrival rate.  It reports throughput, latency percentiles and
+    the client's CPU time per row.
+"""
+
+from couchbase_columnar.bench.report import BenchReport as BenchReport  # noqa: F401
+from couchbase_columnar.bench.runner import run_bench as run_bench  # noqa: F401
+from couchbase_columnar.bench.workload import BenchConfig as BenchConfig  # noqa: F401
+from couchbase_columnar.bench.workload import BenchStatement as BenchStatement  # noqa: F401
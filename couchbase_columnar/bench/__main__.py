@@ -0,0 +1,162 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    Usage examples:
+
+        # 8 blocking workers, closed loop, against a cluster
+        python -m couchbase_columnar.bench --connstr couchbases://host --username user --password pw \\
+            --statement 'SELECT * FROM `travel-sample`.inventory.airline LIMIT 10;' --workers 8
+
+        # 4 processes x 16 async workers at 2000 queries/s (Poisson arrivals), comparing I/O thread counts
+        python -m couchbase_columnar.bench --workload workload.json --api async --processes 4 --workers 16 \\
+            --rate 2000 --arrival poisson --cluster-option num_io_threads=4
+
+        # against the local mock Columnar server (source checkout only)
+        python -m couchbase_columnar.bench --mock --mock-rows 1000 --statement 'SELECT 1;' --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from contextlib import ExitStack
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional)
+
+from couchbase_columnar.bench.runner import run_bench
+from couchbase_columnar.bench.workload import (BenchConfig,
+                                               BenchStatement,
+                                               load_workload,
+                                               parse_key_values)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m couchbase_columnar.bench',
+                                     description='Load generator for sustained throughput and tail-latency testing.',
+                                     epilog='Option values are parsed as JSON when possible, durations are given in '
+                                            'seconds.',
+                                     formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    target = parser.add_argument_group('target')
+    target.add_argument('--connstr', help='The connection string of the cluster.')
+    target.add_argument('--username', default='Administrator')
+    target.add_argument('--password', default='password')
+    target.add_argument('--database', help='Run the statements against this database (requires --scope).')
+    target.add_argument('--scope', help='Run the statements against this scope (requires --database).')
+    target.add_argument('--trust-pem-file', help='Only trust the certificate(s) in this PEM file.')
+    target.add_argument('--no-verify', action='store_true', help='Do not verify the server certificate.')
+    target.add_argument('--mock', action='store_true',
+                        help='Run against the local mock Columnar server (requires a source checkout).')
+    target.add_argument('--mock-rows', type=int, default=100, help='The number of rows the mock server returns.')
+    target.add_argument('--mock-row-width', type=int, default=64, help='The size, in bytes, of each mock row.')
+
+    workload = parser.add_argument_group('workload')
+    workload.add_argument('--workload', help='A JSON workload file (see couchbase_columnar.bench.workload).')
+    workload.add_argument('--statement', action='append', default=[],
+                          help='A statement to run (can be repeated, the statements are picked uniformly).')
+    workload.add_argument('--api', choices=('blocking', 'async'), default='blocking')
+    workload.add_argument('--workers', type=int, default=1, help='The number of concurrent workers per process.')
+    workload.add_argument('--processes', type=int, default=1, help='The number of worker processes.')
+    workload.add_argument('--rate', type=float,
+                          help='The total (open loop) arrival rate in queries/s, closed loop if not set.')
+    workload.add_argument('--arrival', choices=('fixed', 'poisson'), default='fixed',
+                          help='The (open loop) arrival process.')
+    workload.add_argument('--warmup', type=float, default=5.0, help='The warmup, in seconds, excluded from results.')
+    workload.add_argument('--duration', type=float, default=30.0, help='The measured duration, in seconds.')
+    workload.add_argument('--seed', type=int, help='Seed the statement mix and the arrival schedule.')
+
+    tuning = parser.add_argument_group('tuning')
+    tuning.add_argument('--cluster-option', action='append', metavar='KEY=VALUE',
+                        help='A ClusterOptions option, e.g. num_io_threads=4 (can be repeated).')
+    tuning.add_argument('--timeout-option', action='append', metavar='KEY=VALUE',
+                        help='A TimeoutOptions option, e.g. query_timeout=10 (can be repeated).')
+    tuning.add_argument('--query-option', action='append', metavar='KEY=VALUE',
+                        help='A QueryOptions option applied to every statement, e.g. read_only=true (can be repeated).')
+    tuning.add_argument('--deserializer',
+                        help='The deserializer: default, passthrough (raw rows) or module:Class.')
+
+    parser.add_argument('--output', help='Write the results, as JSON, to this file.')
+    return parser
+
+
+def build_config(args: argparse.Namespace, connstr: Optional[str] = None) -> BenchConfig:
+    workload: Dict[str, Any] = load_workload(args.workload) if args.workload else {}
+    statements: List[BenchStatement] = [*workload.get('statements', []), *map(BenchStatement, args.statement)]
+    # command line options take precedence over the workload file's
+    return BenchConfig(connstr=connstr or args.connstr,
+                       username=args.username,
+                       password=args.password,
+                       statements=statements,
+                       api=args.api,
+                       workers=args.workers,
+                       processes=args.processes,
+                       rate=args.rate,
+                       arrival=args.arrival,
+                       warmup=args.warmup,
+                       duration=args.duration,
+                       database=args.database,
+                       scope=args.scope,
+                       trust_pem_file=args.trust_pem_file,
+                       verify_server_certificate=not args.no_verify,
+                       cluster_options={**workload.get('cluster_options', {}),
+                                        **parse_key_values(args.cluster_option)},
+                       timeout_options={**workload.get('timeout_options', {}),
+                                        **parse_key_values(args.timeout_option)},
+                       query_options={**workload.get('query_options', {}), **parse_key_values(args.query_option)},
+                       deserializer=args.deserializer or workload.get('deserializer', None),
+                       seed=args.seed)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.mock == bool(args.connstr):
+        parser.error('Exactly one of --connstr or --mock is required.')
+    if (args.database is None) != (args.scope is None):
+        parser.error('--database and --scope must be provided together.')
+
+    with ExitStack() as stack:
+        connstr = None
+        if args.mock:
+            try:
+                from tests.environments.mock_server import MockColumnarServer, MockQueryResponse
+            except ImportError:
+                parser.error('--mock requires a source checkout (the mock server lives in tests/environments).')
+            server = stack.enter_context(MockColumnarServer(username=args.username,
+                                                            password=args.password,
+                                                            default_response=MockQueryResponse(
+                                                                rows=args.mock_rows,
+                                                                row_width=args.mock_row_width)))
+            connstr = server.connection_string
+            args.trust_pem_file = server.certificate_path
+        try:
+            config = build_config(args, connstr)
+            config.validate()
+        except (OSError, ValueError, TypeError) as ex:
+            parser.error(str(ex))
+        report = run_bench(config)
+
+    print(report.format())
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump(report.to_dict(), output_file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import (Any,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional)
+
+from couchbase_columnar.bench.workload import BenchConfig
+from couchbase_columnar.protocol.core.statistics import _LatencyHistogram
+
+REPORTED_PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+@dataclass
+class StatementResult:
+    """The outcome of the measured queries of a single statement, latencies are recorded in microseconds.
+    """
+    queries: int = 0
+    rows: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    max_latency: int = 0
+    latency: _LatencyHistogram = field(default_factory=_LatencyHistogram)
+    first_row_latency: _LatencyHistogram = field(default_factory=_LatencyHistogram)
+    first_rows: int = 0
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def record(self, latency_us: int, rows: int, first_row_latency_us: Optional[int]) -> None:
+        self.queries += 1
+        self.rows += rows
+        self.max_latency = max(self.max_latency, latency_us)
+        self.latency.record(latency_us)
+        if first_row_latency_us is not None:
+            self.first_rows += 1
+            self.first_row_latency.record(first_row_latency_us)
+
+    def record_error(self, error: BaseException) -> None:
+        name = type(error).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def merge(self, other: StatementResult) -> None:
+        self.queries += other.queries
+        self.rows += other.rows
+        for name, count in other.errors.items():
+            self.errors[name] = self.errors.get(name, 0) + count
+        self.max_latency = max(self.max_latency, other.max_latency)
+        self.latency.merge(other.latency)
+        self.first_row_latency.merge(other.first_row_latency)
+        self.first_rows += other.first_rows
+
+    def percentiles(self) -> Dict[str, float]:
+        """Returns the latency percentiles, in milliseconds.
+        """
+        percentiles = {f'p{p:g}': min(self.latency.percentile(p, self.queries), self.max_latency) / 1e3
+                       if self.queries > 0 else 0.0 for p in REPORTED_PERCENTILES}
+        percentiles['max'] = self.max_latency / 1e3
+        return percentiles
+
+    def first_row_percentiles(self) -> Dict[str, float]:
+        """Returns the time to first row percentiles, in milliseconds.
+        """
+        return {f'p{p:g}': self.first_row_latency.percentile(p, self.first_rows) / 1e3
+                if self.first_rows > 0 else 0.0 for p in REPORTED_PERCENTILES}
+
+
+@dataclass
+class ProcessResult:
+    """The outcome of a worker process' measured interval, keyed by statement.
+    """
+    statements: Dict[str, StatementResult] = field(default_factory=dict)
+    elapsed_ns: int = 0
+    cpu_time_ns: int = 0
+
+    def statement(self, statement: str) -> StatementResult:
+        result = self.statements.get(statement, None)
+        if result is None:
+            result = self.statements[statement] = StatementResult()
+        return result
+
+    def merge_statements(self, results: Iterable[Dict[str, StatementResult]]) -> None:
+        for statements in results:
+            for statement, result in statements.items():
+                self.statement(statement).merge(result)
+
+
+class BenchReport:
+    """Aggregates the results of all worker processes.
+
+    Throughput is computed over the measured interval (the warmup is excluded).  The CPU time is the client
+    process' (user + system) time during the measured interval, summed across processes, so it includes the time
+    spent in the native I/O threads.
+    """
+
+    def __init__(self, config: BenchConfig, results: List[ProcessResult]) -> None:
+        self._config = config
+        self._total = StatementResult()
+        self._statements: Dict[str, StatementResult] = {}
+        for result in results:
+            for statement, stmt_result in result.statements.items():
+                self._total.merge(stmt_result)
+                self._statements.setdefault(statement, StatementResult()).merge(stmt_result)
+        self._elapsed_ns = max((r.elapsed_ns for r in results), default=0)
+        self._cpu_time_ns = sum(r.cpu_time_ns for r in results)
+
+    @property
+    def total(self) -> StatementResult:
+        return self._total
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self._elapsed_ns / 1e9
+
+    def queries_per_second(self) -> float:
+        return self._total.queries / self.elapsed_seconds if self._elapsed_ns > 0 else 0.0
+
+    def rows_per_second(self) -> float:
+        return self._total.rows / self.elapsed_seconds if self._elapsed_ns > 0 else 0.0
+
+    def cpu_per_row_us(self) -> float:
+        return self._cpu_time_ns / 1e3 / self._total.rows if self._total.rows > 0 else 0.0
+
+    def cpu_per_query_us(self) -> float:
+        return self._cpu_time_ns / 1e3 / self._total.queries if self._total.queries > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        config = self._config
+        return {
+            'config': {
+                'api': config.api,
+                'processes': config.processes,
+                'workers': config.workers,
+                'rate': config.rate,
+                'arrival': config.arrival if config.rate is not None else 'closed',
+                'warmup': config.warmup,
+                'duration': config.duration,
+                'cluster_options': config.cluster_options,
+                'timeout_options': config.timeout_options,
+                'query_options': config.query_options,
+                'deserializer': config.deserializer,
+            },
+            'elapsed_seconds': self.elapsed_seconds,
+            'queries': self._total.queries,
+            'errors': dict(self._total.errors),
+            'rows': self._total.rows,
+            'queries_per_second': self.queries_per_second(),
+            'rows_per_second': self.rows_per_second(),
+            'latency_ms': self._total.percentiles(),
+            'first_row_latency_ms': self._total.first_row_percentiles(),
+            'cpu_time_seconds': self._cpu_time_ns / 1e9,
+            'cpu_per_row_us': self.cpu_per_row_us(),
+            'cpu_per_query_us': self.cpu_per_query_us(),
+            'statements': [{
+                'statement': statement,
+                'queries': result.queries,
+                'errors': dict(result.errors),
+                'rows': result.rows,
+                'latency_ms': result.percentiles(),
+            } for statement, result in self._statements.items()],
+        }
+
+    def format(self) -> str:
+        config = self._config
+        mode = (f'open loop, {config.rate:,g} queries/s ({config.arrival})' if config.rate is not None
+                else 'closed loop')
+        latency = self._total.percentiles()
+        first_row = self._total.first_row_percentiles()
+        lines = [
+            f'api: {config.api}, {config.processes} process(es) x {config.workers} worker(s), {mode}',
+            f'measured: {self.elapsed_seconds:,.1f}s (after {config.warmup:g}s warmup)',
+            f'queries: {self._total.queries:,} ({self.queries_per_second():,.1f}/s), '
+            f'errors: {self._total.error_count:,}, rows: {self._total.rows:,} ({self.rows_per_second():,.0f}/s)',
+            'latency (ms): ' + ', '.join(f'{k} {v:,.3f}' for k, v in latency.items()),
+            'first row (ms): ' + ', '.join(f'{k} {v:,.3f}' for k, v in first_row.items()),
+            f'client cpu: {self._cpu_time_ns / 1e9:,.2f}s, {self.cpu_per_row_us():,.2f} us/row, '
+            f'{self.cpu_per_query_us():,.1f} us/query',
+        ]
+        if self._total.errors:
+            lines.append('errors: ' + ', '.join(f'{k} {v:,}' for k, v in sorted(self._total.errors.items())))
+        if len(self._statements) > 1:
+            for statement, result in self._statements.items():
+                percentiles = result.percentiles()
+                lines.append(f'  {result.queries:,} queries, {result.error_count:,} errors, '
+                             f'p50 {percentiles["p50"]:,.3f}ms, p99 {percentiles["p99"]:,.3f}ms: {statement}')
+        return '\n'.join(lines)
@@ -0,0 +1,316 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+from dataclasses import dataclass
+from random import Random
+from time import (perf_counter_ns,
+                  process_time_ns,
+                  sleep)
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from couchbase_columnar.bench.report import (BenchReport,
+                                             ProcessResult,
+                                             StatementResult)
+from couchbase_columnar.bench.workload import (ArrivalSchedule,
+                                               BenchConfig,
+                                               StatementMix)
+from couchbase_columnar.credential import Credential
+from couchbase_columnar.options import QueryOptions
+
+if TYPE_CHECKING:
+    from acouchbase_columnar.cluster import AsyncCluster
+    from acouchbase_columnar.scope import AsyncScope
+    from couchbase_columnar.cluster import Cluster
+    from couchbase_columnar.scope import Scope
+
+
+@dataclass
+class _Window:
+    """The (perf_counter_ns) boundaries of a process' run: queries arriving before `measure_start_ns` are the warmup,
+    no queries are started after `end_ns`.
+    """
+    measure_start_ns: int
+    end_ns: int
+
+    @classmethod
+    def start_now(cls, config: BenchConfig) -> _Window:
+        measure_start_ns = perf_counter_ns() + int(config.warmup * 1e9)
+        return cls(measure_start_ns, measure_start_ns + int(config.duration * 1e9))
+
+
+class _Worker:
+    """The state shared by the blocking and async workers: the statement mix, the arrival schedule and the results.
+    """
+
+    def __init__(self, config: BenchConfig, window: _Window, worker_idx: int) -> None:
+        rng = Random(config.seed + worker_idx if config.seed is not None else None)
+        self._window = window
+        self._mix = StatementMix(config, rng)
+        rate = config.worker_rate()
+        self._schedule = (ArrivalSchedule(rate, config.arrival, perf_counter_ns(), rng)
+                          if rate is not None else None)
+        self.results: Dict[str, StatementResult] = {}
+
+    def next_query(self) -> Optional[Tuple[int, int, str, QueryOptions]]:
+        """Returns the query's (arrival, delay until the arrival) in ns, statement and options, `None` once the run
+        is over.
+        """
+        now = perf_counter_ns()
+        arrival = self._schedule.next_arrival() if self._schedule is not None else now
+        if arrival >= self._window.end_ns:
+            return None
+        statement, options = self._mix.pick()
+        return arrival, max(arrival - now, 0), statement, options
+
+    def record(self, statement: str, arrival: int, rows: int, first_row: Optional[int]) -> None:
+        if arrival < self._window.measure_start_ns:
+            return
+        now = perf_counter_ns()
+        first_row_us = (first_row - arrival) // 1000 if first_row is not None else None
+        self._result(statement).record((now - arrival) // 1000, rows, first_row_us)
+
+    def record_error(self, statement: str, arrival: int, error: BaseException) -> None:
+        if arrival >= self._window.measure_start_ns:
+            self._result(statement).record_error(error)
+
+    def _result(self, statement: str) -> StatementResult:
+        result = self.results.get(statement, None)
+        if result is None:
+            result = self.results[statement] = StatementResult()
+        return result
+
+
+def _create_credential(config: BenchConfig) -> Credential:
+    return Credential.from_username_and_password(config.username, config.password)
+
+
+def _blocking_worker(target: Union[Cluster, Scope], worker: _Worker) -> None:
+    while True:
+        query = worker.next_query()
+        if query is None:
+            return
+        arrival, delay_ns, statement, options = query
+        if delay_ns > 0:
+            sleep(delay_ns / 1e9)
+        rows = 0
+        first_row: Optional[int] = None
+        try:
+            for _ in target.execute_query(statement, options).rows():
+                if rows == 0:
+                    first_row = perf_counter_ns()
+                rows += 1
+        except Exception as ex:
+            worker.record_error(statement, arrival, ex)
+            continue
+        worker.record(statement, arrival, rows, first_row)
+
+
+def _measure_cpu(window: _Window) -> Tuple[int, int]:
+    """Waits for the measured interval to end, returns its (elapsed, process CPU time) in ns.
+    """
+    delay_ns = window.measure_start_ns - perf_counter_ns()
+    if delay_ns > 0:
+        sleep(delay_ns / 1e9)
+    cpu_start = process_time_ns()
+    delay_ns = window.end_ns - perf_counter_ns()
+    if delay_ns > 0:
+        sleep(delay_ns / 1e9)
+    return window.end_ns - window.measure_start_ns, process_time_ns() - cpu_start
+
+
+async def _async_worker(target: Union[AsyncCluster, AsyncScope], worker: _Worker) -> None:
+    while True:
+        query = worker.next_query()
+        if query is None:
+            return
+        arrival, delay_ns, statement, options = query
+        if delay_ns > 0:
+            await asyncio.sleep(delay_ns / 1e9)
+        rows = 0
+        first_row: Optional[int] = None
+        try:
+            result = await target.execute_query(statement, options)
+            async for _ in result.rows():
+                if rows == 0:
+                    first_row = perf_counter_ns()
+                rows += 1
+        except Exception as ex:
+            worker.record_error(statement, arrival, ex)
+            continue
+        worker.record(statement, arrival, rows, first_row)
+
+
+async def _measure_cpu_async(window: _Window) -> Tuple[int, int]:
+    delay_ns = window.measure_start_ns - perf_counter_ns()
+    if delay_ns > 0:
+        await asyncio.sleep(delay_ns / 1e9)
+    cpu_start = process_time_ns()
+    delay_ns = window.end_ns - perf_counter_ns()
+    if delay_ns > 0:
+        await asyncio.sleep(delay_ns / 1e9)
+    return window.end_ns - window.measure_start_ns, process_time_ns() - cpu_start
+
+
+def _run_blocking(config: BenchConfig, process_idx: int, barrier: Optional[Any]) -> ProcessResult:
+    from couchbase_columnar.cluster import Cluster
+
+    cluster = Cluster.create_instance(config.connstr, _create_credential(config), config.build_cluster_options())
+    try:
+        cluster.warmup()
+        target: Union[Cluster, Scope] = cluster
+        if config.database is not None and config.scope is not None:
+            target = cluster.database(config.database).scope(config.scope)
+        if barrier is not None:
+            barrier.wait()
+        window = _Window.start_now(config)
+        workers = [_Worker(config, window, process_idx * config.workers + idx) for idx in range(config.workers)]
+        threads = [threading.Thread(target=_blocking_worker, args=(target, worker), daemon=True)
+                   for worker in workers]
+        for thread in threads:
+            thread.start()
+        elapsed_ns, cpu_time_ns = _measure_cpu(window)
+        for thread in threads:
+            thread.join()
+    finally:
+        cluster.close()
+    result = ProcessResult(elapsed_ns=elapsed_ns, cpu_time_ns=cpu_time_ns)
+    result.merge_statements(worker.results for worker in workers)
+    return result
+
+
+def _run_async(config: BenchConfig, process_idx: int, barrier: Optional[Any]) -> ProcessResult:
+    from acouchbase_columnar import get_event_loop
+    from acouchbase_columnar.cluster import AsyncCluster
+
+    loop = get_event_loop()
+
+    async def run() -> ProcessResult:
+        cluster = AsyncCluster.create_instance(config.connstr,
+                                               _create_credential(config),
+                                               config.build_cluster_options(),
+                                               loop)
+        try:
+            await cluster.warmup()
+            target: Union[AsyncCluster, AsyncScope] = cluster
+            if config.database is not None and config.scope is not None:
+                target = cluster.database(config.database).scope(config.scope)
+            if barrier is not None:
+                # do not block the event loop (and the cluster's bootstrap) while the other processes catch up
+                await loop.run_in_executor(None, barrier.wait)
+            window = _Window.start_now(config)
+            workers = [_Worker(config, window, process_idx * config.workers + idx)
+                       for idx in range(config.workers)]
+            tasks = [loop.create_task(_async_worker(target, worker)) for worker in workers]
+            elapsed_ns, cpu_time_ns = await _measure_cpu_async(window)
+            await asyncio.gather(*tasks)
+        finally:
+            await cluster.close()
+        result = ProcessResult(elapsed_ns=elapsed_ns, cpu_time_ns=cpu_time_ns)
+        result.merge_statements(worker.results for worker in workers)
+        return result
+
+    return loop.run_until_complete(run())
+
+
+def run_process(config: BenchConfig, process_idx: int = 0, barrier: Optional[Any] = None) -> ProcessResult:
+    """Runs the benchmark's workers in the current process.
+
+    Args:
+        config (:class:`.BenchConfig`): The benchmark's configuration.
+        process_idx (int): The index of the process, used to give each worker a distinct seed.
+        barrier (Optional[multiprocessing.Barrier]): If set, the workers start once every process has connected.
+    """
+    if config.api == 'async':
+        return _run_async(config, process_idx, barrier)
+    return _run_blocking(config, process_idx, barrier)
+
+
+def _process_main(config: BenchConfig, process_idx: int, barrier: Any, results: Any) -> None:
+    """The entry point of a worker process, puts the (index, result or error) onto the results queue.
+    """
+    try:
+        results.put((process_idx, run_process(config, process_idx, barrier)))
+    except BaseException as ex:
+        # do not leave the other processes waiting for this one
+        barrier.abort()
+        results.put((process_idx, f'{type(ex).__name__}: {ex}'))
+
+
+def _run_processes(config: BenchConfig) -> List[ProcessResult]:
+    # spawn (rather than fork) so that no native I/O threads are inherited from the parent
+    ctx = multiprocessing.get_context('spawn')
+    barrier = ctx.Barrier(config.processes)
+    results_queue = ctx.Queue()
+    processes = [ctx.Process(target=_process_main, args=(config, idx, barrier, results_queue), daemon=True)
+                 for idx in range(config.processes)]
+    for process in processes:
+        process.start()
+    results: Dict[int, ProcessResult] = {}
+    errors: List[str] = []
+    try:
+        while len(results) + len(errors) < config.processes:
+            try:
+                process_idx, result = results_queue.get(timeout=1.0)
+            except queue.Empty:
+                crashed = [idx for idx, p in enumerate(processes)
+                           if idx not in results and p.exitcode not in (None, 0)]
+                if crashed:
+                    raise RuntimeError(f'Worker process(es) {crashed} exited unexpectedly.') from None
+                continue
+            if isinstance(result, ProcessResult):
+                results[process_idx] = result
+            else:
+                errors.append(f'process {process_idx}: {result}')
+    finally:
+        for process in processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+    if errors:
+        raise RuntimeError(f'Benchmark failed: {"; ".join(errors)}')
+    return [results[idx] for idx in sorted(results)]
+
+
+def run_bench(config: BenchConfig) -> BenchReport:
+    """Runs the benchmark, in worker processes if `config.processes` is greater than one.
+
+    Args:
+        config (:class:`.BenchConfig`): The benchmark's configuration.
+
+    Returns:
+        :class:`.BenchReport`: The aggregated results of the benchmark.
+
+    Raises:
+        `ValueError`: If the configuration is invalid.
+        `RuntimeError`: If a worker process failed.
+    """
+    config.validate()
+    if config.processes == 1:
+        results = [run_process(config)]
+    else:
+        results = _run_processes(config)
+    return BenchReport(config, results)
@@ -0,0 +1,235 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import timedelta
+from importlib import import_module
+from random import Random
+from typing import (Any,
+                    Dict,
+                    List,
+                    Mapping,
+                    Optional,
+                    Tuple)
+
+from couchbase_columnar.common.options_base import (ClusterOptionsKwargs,
+                                                    QueryOptionsKwargs,
+                                                    TimeoutOptionsKwargs)
+from couchbase_columnar.deserializer import DefaultJsonDeserializer, Deserializer
+from couchbase_columnar.options import (ClusterOptions,
+                                        QueryOptions,
+                                        SecurityOptions,
+                                        TimeoutOptions)
+
+
+class PassthroughDeserializer(Deserializer):
+    """Returns the raw (JSON) rows, used to measure the client's overhead without the cost of deserializing rows.
+    """
+
+    def deserialize(self, value: bytes) -> Any:
+        return value
+
+
+DESERIALIZERS: Dict[str, Deserializer] = {
+    'default': DefaultJsonDeserializer(),
+    'passthrough': PassthroughDeserializer(),
+}
+
+
+def load_deserializer(name: str) -> Deserializer:
+    """Returns one of the known deserializers (`default` or `passthrough`), or imports a `module:Class` deserializer.
+    """
+    if name in DESERIALIZERS:
+        return DESERIALIZERS[name]
+    module_name, sep, class_name = name.partition(':')
+    if not sep:
+        raise ValueError(f'Unknown deserializer: {name}.  Expected one of {list(DESERIALIZERS)} or module:Class.')
+    deserializer = getattr(import_module(module_name), class_name)()
+    if not isinstance(deserializer, Deserializer):
+        raise ValueError(f'{name} is not a Deserializer.')
+    return deserializer
+
+
+def parse_option_value(key: str, value: Any, annotations: Mapping[str, Any]) -> Any:
+    """Converts a command line (or workload file) value to the type of the option, durations are given in seconds.
+    """
+    if key not in annotations:
+        raise ValueError(f'Invalid option: {key}.  Valid options: {sorted(annotations)}.')
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+    if 'timedelta' in str(annotations[key]) and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(seconds=value)
+    return value
+
+
+def parse_options(options: Mapping[str, Any], annotations: Mapping[str, Any]) -> Dict[str, Any]:
+    return {key: parse_option_value(key, value, annotations) for key, value in options.items()}
+
+
+def parse_key_values(pairs: Optional[List[str]]) -> Dict[str, str]:
+    """Parses `key=value` command line arguments.
+    """
+    parsed: Dict[str, str] = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition('=')
+        if not sep or not key:
+            raise ValueError(f'Expected key=value, got: {pair}.')
+        parsed[key.strip()] = value
+    return parsed
+
+
+@dataclass
+class BenchStatement:
+    statement: str
+    weight: float = 1.0
+    query_options: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchConfig:
+    """The (picklable) configuration of a benchmark run, every worker process builds its cluster from it.
+    """
+    connstr: str
+    username: str
+    password: str
+    statements: List[BenchStatement]
+    api: str = 'blocking'
+    workers: int = 1
+    processes: int = 1
+    rate: Optional[float] = None
+    arrival: str = 'fixed'
+    warmup: float = 5.0
+    duration: float = 30.0
+    database: Optional[str] = None
+    scope: Optional[str] = None
+    trust_pem_file: Optional[str] = None
+    verify_server_certificate: bool = True
+    cluster_options: Dict[str, Any] = field(default_factory=dict)
+    timeout_options: Dict[str, Any] = field(default_factory=dict)
+    query_options: Dict[str, Any] = field(default_factory=dict)
+    deserializer: Optional[str] = None
+    seed: Optional[int] = None
+
+    def validate(self) -> None:
+        if not self.statements:
+            raise ValueError('At least one statement is required.')
+        if any(s.weight <= 0 for s in self.statements):
+            raise ValueError('Statement weights must be positive.')
+        if self.api not in ('blocking', 'async'):
+            raise ValueError(f'Unknown api: {self.api}.')
+        if self.arrival not in ('fixed', 'poisson'):
+            raise ValueError(f'Unknown arrival process: {self.arrival}.')
+        if self.workers < 1 or self.processes < 1:
+            raise ValueError('At least one worker and one process are required.')
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError('The arrival rate must be positive.')
+        if self.duration <= 0 or self.warmup < 0:
+            raise ValueError('The duration must be positive and the warmup must not be negative.')
+        # fail fast, before any worker is started
+        self.build_cluster_options()
+        for stmt in self.statements:
+            self.build_query_options(stmt)
+
+    @property
+    def total_workers(self) -> int:
+        return self.workers * self.processes
+
+    def worker_rate(self) -> Optional[float]:
+        """The arrival rate of a single worker, the total rate is spread evenly across all workers.
+        """
+        return self.rate / self.total_workers if self.rate is not None else None
+
+    def build_cluster_options(self) -> ClusterOptions:
+        opts = parse_options(self.cluster_options, ClusterOptionsKwargs.__annotations__)
+        if self.timeout_options:
+            opts['timeout_options'] = TimeoutOptions(**parse_options(self.timeout_options,
+                                                                     TimeoutOptionsKwargs.__annotations__))
+        if self.trust_pem_file is not None:
+            opts['security_options'] = SecurityOptions.trust_only_pem_file(self.trust_pem_file)
+        elif not self.verify_server_certificate:
+            opts['security_options'] = SecurityOptions(verify_server_certificate=False)
+        if self.deserializer is not None:
+            opts['deserializer'] = load_deserializer(self.deserializer)
+        return ClusterOptions(**opts)
+
+    def build_query_options(self, stmt: BenchStatement) -> QueryOptions:
+        opts = {**self.query_options, **stmt.query_options}
+        return QueryOptions(**parse_options(opts, QueryOptionsKwargs.__annotations__))
+
+
+class StatementMix:
+    """Picks the statements of a workload according to their weights.
+    """
+
+    def __init__(self, config: BenchConfig, rng: Random) -> None:
+        self._rng = rng
+        self._statements = [(stmt.statement, config.build_query_options(stmt)) for stmt in config.statements]
+        self._weights = [stmt.weight for stmt in config.statements]
+
+    def pick(self) -> Tuple[str, QueryOptions]:
+        if len(self._statements) == 1:
+            return self._statements[0]
+        return self._rng.choices(self._statements, weights=self._weights)[0]
+
+
+class ArrivalSchedule:
+    """The (open-loop) arrival times of a worker's queries, in perf_counter_ns() time.
+
+    Queries are scheduled independently of how long previous queries took, a query's latency is measured from its
+    scheduled arrival time so that queueing behind slow queries is not hidden (coordinated omission).
+    """
+
+    def __init__(self, rate: float, arrival: str, start_ns: int, rng: Random) -> None:
+        self._interval_ns = 1e9 / rate
+        self._poisson = arrival == 'poisson'
+        self._rng = rng
+        # spread the workers' first arrivals over one interval
+        self._next_ns = start_ns + rng.random() * self._interval_ns
+
+    def next_arrival(self) -> int:
+        arrival = int(self._next_ns)
+        if self._poisson:
+            self._next_ns += self._rng.expovariate(1.0) * self._interval_ns
+        else:
+            self._next_ns += self._interval_ns
+        return arrival
+
+
+def load_workload(path: str) -> Dict[str, Any]:
+    """Loads a JSON workload file, e.g.:
+
+        {
+            "statements": [
+                {"statement": "SELECT * FROM a LIMIT 10;", "weight": 9},
+                {"statement": "SELECT * FROM b;", "weight": 1, "query_options": {"timeout": 30}}
+            ],
+            "cluster_options": {"num_io_threads": 4},
+            "query_options": {"read_only": true}
+        }
+    """
+    with open(path, 'r') as workload_file:
+        workload: Dict[str, Any] = json.load(workload_file)
+    workload['statements'] = [BenchStatement(s['statement'],
+                                             weight=float(s.get('weight', 1.0)),
+                                             query_options=dict(s.get('query_options', {})))
+                              if isinstance(s, dict) else BenchStatement(str(s))
+                              for s in workload.get('statements', [])]
+    return workload
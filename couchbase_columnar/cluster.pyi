@@ -14,13 +14,18 @@
 #  limitations under the License.
 
 from concurrent.futures import Future
-from typing import overload
+from datetime import timedelta
+from typing import Optional, overload
 
 from typing_extensions import Unpack
 
 from couchbase_columnar import JSONType
 from couchbase_columnar.credential import Credential
 from couchbase_columnar.database import Database
+from couchbase_columnar.metrics import (AdmissionStats,
+                                        ClusterMetrics,
+                                        IoStats,
+                                        StatementStatisticsSnapshot)
 from couchbase_columnar.options import (ClusterOptions,
                                         ClusterOptionsKwargs,
                                         QueryOptions,
@@ -170,7 +175,14 @@ class Cluster:
                       cancel_token: CancelToken,
                       **kwargs: str) -> Future[BlockingQueryResult]: ...
 
-    def close(self) -> None: ...
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None: ...
+
+    def warmup(self, timeout: Optional[timedelta] = None) -> None: ...
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats: ...
+    def io_stats(self, lane: Optional[str] = None) -> IoStats: ...
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics: ...
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot: ...
 
     @overload
     @classmethod
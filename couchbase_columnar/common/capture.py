@@ -0,0 +1,304 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    A capture file is a gzip compressed sequence of records.  Each record is a header (record type, the offset in
+    nanoseconds since the query was dispatched and the payload length) followed by the payload:
+
+        HEADER      JSON: format version, normalized statement, statement fingerprint, database, scope, capture time
+        RESPONSE    (no payload) the response headers were received
+        ROW         the raw (JSON) row, as received from the Columnar service
+        METADATA    JSON: the query's metadata
+        ERROR       JSON: the type and message of the error the query failed with, or the outcome (e.g. cancel)
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+from datetime import (datetime,
+                      timedelta,
+                      timezone)
+from threading import Lock
+from time import (perf_counter_ns,
+                  sleep,
+                  time_ns)
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    Iterator,
+                    List,
+                    Optional,
+                    Tuple)
+
+from couchbase_columnar.common.core.query import QueryMetadataCore
+from couchbase_columnar.common.query import QueryMetadata
+from couchbase_columnar.common.tracing import normalize_statement, statement_fingerprint
+
+if TYPE_CHECKING:
+    from couchbase_columnar.protocol.core.request import QueryRequest
+
+
+CAPTURE_FORMAT_VERSION = 1
+
+_RECORD_HEADER = struct.Struct('>BQI')
+_RECORD_HEADER_TYPE = 0
+_RECORD_RESPONSE_TYPE = 1
+_RECORD_ROW_TYPE = 2
+_RECORD_METADATA_TYPE = 3
+_RECORD_ERROR_TYPE = 4
+
+
+def _read_records(path: str) -> Iterator[Tuple[int, int, bytes]]:
+    with gzip.GzipFile(path, 'rb') as capture_file:
+        while True:
+            record_header = capture_file.read(_RECORD_HEADER.size)
+            if not record_header:
+                return
+            if len(record_header) < _RECORD_HEADER.size:
+                raise ValueError(f'Truncated capture file: {path}.')
+            record_type, offset, length = _RECORD_HEADER.unpack(record_header)
+            payload = capture_file.read(length) if length > 0 else b''
+            if len(payload) < length:
+                raise ValueError(f'Truncated capture file: {path}.')
+            yield record_type, offset, payload
+
+
+class QueryCaptureWriter:
+    """
+        **INTERNAL**
+
+    Records the raw response stream of a query (response headers, rows, metadata and their timing) to a capture file.
+    """
+
+    def __init__(self, path: str, request: QueryRequest) -> None:
+        self._start = perf_counter_ns()
+        self._lock = Lock()
+        self._file: Optional[gzip.GzipFile] = gzip.GzipFile(path, 'wb')
+        self._write(_RECORD_HEADER_TYPE, json.dumps({
+            'version': CAPTURE_FORMAT_VERSION,
+            'statement': normalize_statement(request.statement),
+            'statement_fingerprint': statement_fingerprint(request.statement),
+            'database': request.database_name,
+            'scope': request.scope_name,
+            'captured_at': time_ns(),
+        }).encode('utf-8'))
+
+    @classmethod
+    def create(cls, request: QueryRequest) -> Optional[QueryCaptureWriter]:
+        if request.capture_path is None:
+            return None
+        return cls(request.capture_path, request)
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def _write(self, record_type: int, payload: bytes = b'') -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            offset = perf_counter_ns() - self._start
+            self._file.write(_RECORD_HEADER.pack(record_type, offset, len(payload)))
+            if payload:
+                self._file.write(payload)
+
+    def headers_received(self) -> None:
+        self._write(_RECORD_RESPONSE_TYPE)
+
+    def row_received(self, row: bytes) -> None:
+        self._write(_RECORD_ROW_TYPE, row)
+
+    def metadata_received(self, metadata: QueryMetadataCore) -> None:
+        self._write(_RECORD_METADATA_TYPE, json.dumps(metadata, default=str).encode('utf-8'))
+
+    def finish(self, error: Optional[BaseException] = None, outcome: Optional[str] = None) -> None:
+        if error is not None or outcome is not None:
+            self._write(_RECORD_ERROR_TYPE, json.dumps({
+                'error_type': type(error).__name__ if error is not None else None,
+                'message': str(error) if error is not None else None,
+                'outcome': outcome or 'error',
+            }).encode('utf-8'))
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class QueryCapture:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The raw response stream of a query, as recorded when the query was executed with the `capture_path` query option.
+    Captures can be replayed offline, e.g. to benchmark deserializers against real result sets.
+    """
+
+    def __init__(self,
+                 header: Dict[str, Any],
+                 rows: List[bytes],
+                 row_offsets: List[int],
+                 response_offset: Optional[int] = None,
+                 metadata: Optional[QueryMetadataCore] = None,
+                 error: Optional[Dict[str, Any]] = None) -> None:
+        self._header = header
+        self._rows = rows
+        self._row_offsets = row_offsets
+        self._response_offset = response_offset
+        self._metadata = metadata
+        self._error = error
+
+    @classmethod
+    def load(cls, path: str) -> QueryCapture:
+        """Loads a capture file.
+
+        Args:
+            path (str): The path of the capture file.
+
+        Returns:
+            :class:`.QueryCapture`: The query's capture.
+
+        Raises:
+            ValueError: If the file is not a capture file or its format version is not supported.
+        """
+        header: Optional[Dict[str, Any]] = None
+        rows: List[bytes] = []
+        row_offsets: List[int] = []
+        response_offset: Optional[int] = None
+        metadata: Optional[QueryMetadataCore] = None
+        error: Optional[Dict[str, Any]] = None
+        for record_type, offset, payload in _read_records(path):
+            if record_type == _RECORD_HEADER_TYPE:
+                header = json.loads(payload)
+            elif header is None:
+                raise ValueError(f'Not a query capture file: {path}.')
+            elif record_type == _RECORD_RESPONSE_TYPE:
+                response_offset = offset
+            elif record_type == _RECORD_ROW_TYPE:
+                rows.append(payload)
+                row_offsets.append(offset)
+            elif record_type == _RECORD_METADATA_TYPE:
+                metadata = json.loads(payload)
+            elif record_type == _RECORD_ERROR_TYPE:
+                error = json.loads(payload)
+        if header is None:
+            raise ValueError(f'Not a query capture file: {path}.')
+        if header.get('version') != CAPTURE_FORMAT_VERSION:
+            raise ValueError(f'Unsupported capture format version: {header.get("version")}.')
+        return cls(header, rows, row_offsets, response_offset=response_offset, metadata=metadata, error=error)
+
+    def statement(self) -> str:
+        """Get the (normalized) statement of the captured query, literals are replaced by placeholders.
+
+        Returns:
+            str: The normalized statement.
+        """
+        return str(self._header.get('statement', ''))
+
+    def statement_fingerprint(self) -> str:
+        """Get the fingerprint of the captured query's statement.
+
+        Returns:
+            str: The statement fingerprint.
+        """
+        return str(self._header.get('statement_fingerprint', ''))
+
+    def captured_at(self) -> datetime:
+        """Get the time the query was captured.
+
+        Returns:
+            datetime: The (UTC) time the query was dispatched.
+        """
+        return datetime.fromtimestamp(int(self._header.get('captured_at', 0)) / 1e9, tz=timezone.utc)
+
+    def time_to_response(self) -> Optional[timedelta]:
+        """Get the amount of time between dispatching the query and receiving the response headers.
+
+        Returns:
+            Optional[timedelta]: The time to the response, `None` if no response was received.
+        """
+        if self._response_offset is None:
+            return None
+        return timedelta(microseconds=self._response_offset / 1000)
+
+    def duration(self) -> timedelta:
+        """Get the amount of time between dispatching the query and receiving the last row.
+
+        Returns:
+            timedelta: The duration of the captured stream.
+        """
+        last_offset = self._row_offsets[-1] if self._row_offsets else (self._response_offset or 0)
+        return timedelta(microseconds=last_offset / 1000)
+
+    def rows(self) -> List[bytes]:
+        """Get the raw rows of the captured query.
+
+        Returns:
+            List[bytes]: The raw (JSON) rows, as received from the Columnar service.
+        """
+        return list(self._rows)
+
+    def row_offsets(self) -> List[timedelta]:
+        """Get the times, relative to dispatching the query, the rows were received at.
+
+        Returns:
+            List[timedelta]: The offset of each row.
+        """
+        return [timedelta(microseconds=offset / 1000) for offset in self._row_offsets]
+
+    def metadata(self) -> Optional[QueryMetadata]:
+        """Get the metadata of the captured query.
+
+        Returns:
+            Optional[:class:`~couchbase_columnar.query.QueryMetadata`]: The query's metadata, `None` if the stream
+            did not complete.
+        """
+        if self._metadata is None:
+            return None
+        return QueryMetadata(self._metadata)
+
+    def error(self) -> Optional[Dict[str, Any]]:
+        """Get the error (or outcome, e.g. a cancellation) the captured query ended with.
+
+        Returns:
+            Optional[Dict[str, Any]]: The error's type and message, `None` if all rows were received.
+        """
+        return self._error
+
+    def replay(self, speed: Optional[float] = None) -> Iterator[bytes]:
+        """Replays the captured rows.
+
+        Args:
+            speed (Optional[float]): The speed of the replay relative to the original stream, e.g. 1.0 to yield the
+                rows at the pace they were originally received.  Defaults to `None` (as fast as possible).
+
+        Returns:
+            Iterator[bytes]: The raw rows.
+        """
+        if speed is None or speed <= 0:
+            yield from self._rows
+            return
+        start = perf_counter_ns()
+        for row, offset in zip(self._rows, self._row_offsets):
+            delay = offset / speed - (perf_counter_ns() - start)
+            if delay > 0:
+                sleep(delay / 1e9)
+            yield row
+
+    def __repr__(self) -> str:
+        return (f'QueryCapture(statement_fingerprint={self.statement_fingerprint()!r}, rows={len(self._rows)}, '
+                f'duration={self.duration()})')
@@ -0,0 +1,138 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from typing import (List,
+                    Tuple,
+                    TypedDict)
+
+
+class AdmissionStatsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    adaptive: bool
+    admitted: int
+    in_flight: int
+    limit: int
+    limit_decreases: int
+    limit_increases: int
+    max_limit: int
+    min_limit: int
+    # queue wait times are in microseconds
+    queue_wait_max_time: int
+    queue_wait_time: int
+    queued: int
+
+
+class IoThreadStatsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    cpu_time: int
+    utilization: float
+
+
+class IoStatsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    loop_lag: int
+    max_io_threads: int
+    threads: List[IoThreadStatsCore]
+
+
+class CoreStatsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    callback_errors: int
+    callback_max_time: int
+    callback_time: int
+    callbacks: int
+    future_wait_max_time: int
+    future_wait_time: int
+    future_waits: int
+    gil_acquisitions: int
+    gil_wait_max_time: int
+    gil_wait_time: int
+    row_bytes: int
+    rows: int
+
+
+class HistogramCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    count: int
+    sum: int
+    min: int
+    max: int
+    # (bucket upper bound, count) of the non-empty buckets, in ascending order
+    buckets: List[Tuple[int, int]]
+
+
+class QueryOutcomeMetricsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    database_name: str
+    scope_name: str
+    outcome: str
+    queries: int
+    rows: int
+    bytes: int
+    first_row_latency: HistogramCore
+    total_latency: HistogramCore
+    rows_per_second: HistogramCore
+    bytes_per_second: HistogramCore
+
+
+class StatementStatisticsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    fingerprint: str
+    statement: str
+    calls: int
+    errors: int
+    timeouts: int
+    cancellations: int
+    rows: int
+    bytes: int
+    # latencies are in microseconds
+    total_latency: int
+    min_latency: int
+    max_latency: int
+    p50_latency: int
+    p99_latency: int
+
+
+class StatementStatisticsSnapshotCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    capacity: int
+    evictions: int
+    statements: List[StatementStatisticsCore]
@@ -30,6 +30,21 @@ class QueryMetricsCore(TypedDict, total=False):
     processed_objects: int
 
 
+class QueryClientMetricsCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    dispatch_time: int
+    time_to_headers: int
+    time_to_first_row: int
+    time_to_last_row: int
+    bytes_received: int
+    deserialize_time: int
+    consumer_time: int
+    attempts: int
+
+
 class QueryWarningCore(TypedDict, total=False):
     """
         **INTERNAL**
@@ -39,6 +54,17 @@ class QueryWarningCore(TypedDict, total=False):
     message: str
 
 
+class QueryProgressCore(TypedDict, total=False):
+    """
+        **INTERNAL**
+    """
+
+    rows: int
+    bytes: int
+    elapsed_time: int
+    completed: bool
+
+
 class QueryMetadataCore(TypedDict, total=False):
     """
         **INTERNAL**
@@ -47,3 +73,4 @@ class QueryMetadataCore(TypedDict, total=False):
     request_id: str
     warnings: List[QueryWarningCore]
     metrics: QueryMetricsCore
+    client_metrics: QueryClientMetricsCore
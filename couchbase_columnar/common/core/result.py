@@ -24,7 +24,7 @@ from typing import (Any,
                     Optional,
                     Union)
 
-from couchbase_columnar.common.query import QueryMetadata
+from couchbase_columnar.common.query import QueryMetadata, QueryProgress
 
 
 class QueryResult(ABC):
@@ -40,6 +40,10 @@ class QueryResult(ABC):
     def metadata(self) -> Optional[QueryMetadata]:
         raise NotImplementedError
 
+    @abstractmethod
+    def progress(self) -> QueryProgress:
+        raise NotImplementedError
+
     @abstractmethod
     def rows(self) -> Union[AsyncIterable[Any], Iterable[Any]]:
         raise NotImplementedError
@@ -17,17 +17,21 @@ from __future__ import annotations
 
 from datetime import timedelta
 from enum import Enum
-from os import path
+from os import cpu_count, path
 from typing import (Any,
+                    Callable,
                     Dict,
                     Generic,
                     List,
                     Optional,
+                    Tuple,
                     TypeVar,
                     Union)
 from urllib.parse import quote
 
 from couchbase_columnar.common.deserializer import Deserializer
+from couchbase_columnar.common.retry import RetryStrategy
+from couchbase_columnar.common.tracing import RequestSpan, RequestTracer
 
 T = TypeVar('T')
 E = TypeVar('E', bound=Enum)
@@ -81,6 +85,97 @@ def validate_path(value: str) -> str:
     return value
 
 
+def auto_io_threads() -> Tuple[int, int]:
+    """ **INTERNAL**
+
+    Returns the initial and max number of io threads for `num_io_threads='auto'`.  The pool starts small and the
+    C++ client adds threads (up to the max) when the existing threads are saturated.
+    """
+    cpus = cpu_count() or 1
+    initial_threads = max(1, min(4, cpus // 4))
+    return initial_threads, max(initial_threads, min(16, cpus))
+
+
+def validate_num_io_threads(value: Union[int, str]) -> int:
+    if value == 'auto':
+        return auto_io_threads()[0]
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"Expected num_io_threads to be a positive int or 'auto' instead of {value}.")
+    return value
+
+
+def num_io_threads_to_max(value: Union[int, str]) -> Optional[int]:
+    if value == 'auto':
+        return auto_io_threads()[1]
+    return None
+
+
+def validate_bootstrap_cache_ttl(value: timedelta) -> int:
+    if not isinstance(value, timedelta) or value <= timedelta(0):
+        raise ValueError(f'Expected bootstrap_cache_ttl to be a positive timedelta instead of {value}.')
+    return timedelta_as_microseconds(value)
+
+
+def validate_max_in_flight(value: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f'Expected max_in_flight to be a positive int instead of {value}.')
+    return value
+
+
+def validate_concurrency_limit(value: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f'Expected adaptive concurrency limit to be a positive int instead of {value}.')
+    return value
+
+
+def validate_backoff_ratio(value: float) -> float:
+    if isinstance(value, bool) or not isinstance(value, (float, int)) or not 0 < value < 1:
+        raise ValueError(f'Expected backoff_ratio to be a float between 0 and 1 (exclusive) instead of {value}.')
+    return float(value)
+
+
+def validate_latency_threshold(value: timedelta) -> int:
+    if not isinstance(value, timedelta) or value <= timedelta(0):
+        raise ValueError(f'Expected latency_threshold to be a positive timedelta instead of {value}.')
+    return timedelta_as_microseconds(value)
+
+
+def validate_statement_statistics_capacity(value: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f'Expected statement_statistics_capacity to be a positive int instead of {value}.')
+    return value
+
+
+def validate_progress_callback(value: Callable[..., Any]) -> Callable[..., Any]:
+    if not callable(value):
+        raise ValueError(f'Expected progress_callback to be callable instead of {type(value)}.')
+    return value
+
+
+def validate_progress_interval(value: timedelta) -> int:
+    if not isinstance(value, timedelta) or value < timedelta(0):
+        raise ValueError(f'Expected progress_interval to be a non-negative timedelta instead of {value}.')
+    return timedelta_as_microseconds(value)
+
+
+def validate_resume_key(value: Union[str, List[str]]) -> List[str]:
+    """ **INTERNAL**
+
+    The resume key is the name of a field of the rows, or a list of names.  The names are quoted as identifiers in the
+    resumed statement, so they must not contain backticks.
+    """
+    fields = [value] if isinstance(value, str) else value
+    if not isinstance(fields, (list, tuple)) or not fields:
+        raise ValueError('Expected resume_key to be a field name or a non-empty list of field names '
+                         f'instead of {value}.')
+    for field in fields:
+        if not isinstance(field, str) or not field or '`' in field:
+            raise ValueError(f'Invalid resume_key field name: {field!r}.')
+    if len(set(fields)) != len(fields):
+        raise ValueError(f'Duplicate resume_key field names: {value}.')
+    return list(fields)
+
+
 class ValidateBaseClass(Generic[T]):
     """ **INTERNAL** """
 
@@ -136,4 +231,7 @@ VALIDATE_INT = ValidateType[int]()
 VALIDATE_FLOAT = ValidateType[float]()
 VALIDATE_STR = ValidateType[str]()
 VALIDATE_DESERIALIZER = ValidateBaseClass[Deserializer]()
+VALIDATE_REQUEST_SPAN = ValidateBaseClass[RequestSpan]()
+VALIDATE_REQUEST_TRACER = ValidateBaseClass[RequestTracer]()
+VALIDATE_RETRY_STRATEGY = ValidateBaseClass[RetryStrategy]()
 VALIDATE_STR_LIST = ValidateList[str]()
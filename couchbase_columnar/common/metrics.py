@@ -0,0 +1,820 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple,
+                    cast)
+
+from couchbase_columnar.common.core.metrics import (AdmissionStatsCore,
+                                                    CoreStatsCore,
+                                                    HistogramCore,
+                                                    IoStatsCore,
+                                                    IoThreadStatsCore,
+                                                    QueryOutcomeMetricsCore,
+                                                    StatementStatisticsCore,
+                                                    StatementStatisticsSnapshotCore)
+
+
+class AdmissionStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Admission details for an execution lane: how many queries the lane allows in-flight, and how long queries waited
+    to be admitted.  Use these details to tune the `adaptive_concurrency` cluster option and the `max_in_flight`
+    execution lane option.
+    """
+
+    def __init__(self, raw: AdmissionStatsCore) -> None:
+        self._raw = raw
+
+    def adaptive(self) -> bool:
+        """Get whether the lane adapts its limit to the service's load (see the `adaptive_concurrency` cluster option).
+
+        Returns:
+            bool: True if the lane adapts its limit, False otherwise.
+        """
+        return self._raw.get('adaptive') or False
+
+    def limit(self) -> Optional[int]:
+        """Get the number of queries currently allowed in-flight on the lane.
+
+        Returns:
+            Optional[int]: The number of queries currently allowed in-flight, `None` if unlimited.
+        """
+        return self._raw.get('limit', None)
+
+    def in_flight(self) -> int:
+        """Get the number of queries currently in-flight on the lane.
+
+        Returns:
+            int: The number of queries currently in-flight on the lane.
+        """
+        return self._raw.get('in_flight') or 0
+
+    def queued(self) -> int:
+        """Get the number of queries currently waiting to be admitted.
+
+        Returns:
+            int: The number of queries currently waiting to be admitted.
+        """
+        return self._raw.get('queued') or 0
+
+    def admitted(self) -> int:
+        """Get the total number of queries admitted by the lane.
+
+        Returns:
+            int: The total number of queries admitted by the lane.
+        """
+        return self._raw.get('admitted') or 0
+
+    def queue_wait_time(self) -> timedelta:
+        """Get the total amount of time queries waited to be admitted.
+
+        Returns:
+            timedelta: The total amount of time queries waited to be admitted.
+        """
+        return timedelta(microseconds=self._raw.get('queue_wait_time') or 0)
+
+    def queue_wait_max_time(self) -> timedelta:
+        """Get the longest amount of time a query waited to be admitted.
+
+        Returns:
+            timedelta: The longest amount of time a query waited to be admitted.
+        """
+        return timedelta(microseconds=self._raw.get('queue_wait_max_time') or 0)
+
+    def limit_increases(self) -> int:
+        """Get the number of times the lane raised its limit.
+
+        Returns:
+            int: The number of times the lane raised its limit (always 0 if the lane does not adapt its limit).
+        """
+        return self._raw.get('limit_increases') or 0
+
+    def limit_decreases(self) -> int:
+        """Get the number of times the lane lowered its limit because the service was overloaded.
+
+        Returns:
+            int: The number of times the lane lowered its limit (always 0 if the lane does not adapt its limit).
+        """
+        return self._raw.get('limit_decreases') or 0
+
+    def __repr__(self) -> str:
+        return "AdmissionStats:{}".format(self._raw)
+
+
+class IoThreadStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Utilization details for a single thread servicing a connection's I/O.
+    """
+
+    def __init__(self, raw: IoThreadStatsCore) -> None:
+        self._raw = raw
+
+    def cpu_time(self) -> timedelta:
+        """Get the total amount of CPU time the thread has used.
+
+        Returns:
+            timedelta: The total amount of CPU time the thread has used.
+        """
+        return timedelta(microseconds=self._raw.get('cpu_time') or 0)
+
+    def utilization(self) -> float:
+        """Get the fraction (0.0 - 1.0) of wall clock time the thread spent on the CPU during the last sample interval.
+
+        Returns:
+            float: The fraction of wall clock time the thread spent on the CPU during the last sample interval.
+        """
+        return self._raw.get('utilization') or 0.0
+
+    def __repr__(self) -> str:
+        return "IoThreadStats:{}".format(self._raw)
+
+
+class CoreStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Process-wide counters of the bindings' hot paths: acquiring the GIL from the I/O threads, handing rows to Python,
+    calling Python callbacks and blocking on query results.  Use these details to tell whether query throughput is
+    limited by GIL contention, by the application's callbacks or by waiting for the server.
+    """
+
+    def __init__(self, raw: CoreStatsCore) -> None:
+        self._raw = raw
+
+    def gil_acquisitions(self) -> int:
+        """Get the number of times the bindings acquired the GIL to hand results to Python.
+
+        Returns:
+            int: The number of times the bindings acquired the GIL to hand results to Python.
+        """
+        return self._raw.get('gil_acquisitions') or 0
+
+    def gil_wait_time(self) -> timedelta:
+        """Get the total amount of time spent waiting to acquire the GIL.
+
+        Returns:
+            timedelta: The total amount of time spent waiting to acquire the GIL.
+        """
+        return timedelta(microseconds=(self._raw.get('gil_wait_time') or 0) / 1000)
+
+    def gil_wait_max_time(self) -> timedelta:
+        """Get the longest amount of time spent waiting to acquire the GIL.
+
+        Returns:
+            timedelta: The longest amount of time spent waiting to acquire the GIL.
+        """
+        return timedelta(microseconds=(self._raw.get('gil_wait_max_time') or 0) / 1000)
+
+    def rows(self) -> int:
+        """Get the number of rows handed to Python.
+
+        Returns:
+            int: The number of rows handed to Python.
+        """
+        return self._raw.get('rows') or 0
+
+    def row_bytes(self) -> int:
+        """Get the total number of bytes copied into the rows handed to Python.
+
+        Returns:
+            int: The total number of bytes copied into the rows handed to Python.
+        """
+        return self._raw.get('row_bytes') or 0
+
+    def callbacks(self) -> int:
+        """Get the number of Python callbacks called by the bindings.
+
+        Returns:
+            int: The number of Python callbacks called by the bindings.
+        """
+        return self._raw.get('callbacks') or 0
+
+    def callback_errors(self) -> int:
+        """Get the number of Python callbacks that raised an exception.
+
+        Returns:
+            int: The number of Python callbacks that raised an exception.
+        """
+        return self._raw.get('callback_errors') or 0
+
+    def callback_time(self) -> timedelta:
+        """Get the total amount of time spent in Python callbacks.
+
+        Returns:
+            timedelta: The total amount of time spent in Python callbacks.
+        """
+        return timedelta(microseconds=(self._raw.get('callback_time') or 0) / 1000)
+
+    def callback_max_time(self) -> timedelta:
+        """Get the longest amount of time spent in a Python callback.
+
+        Returns:
+            timedelta: The longest amount of time spent in a Python callback.
+        """
+        return timedelta(microseconds=(self._raw.get('callback_max_time') or 0) / 1000)
+
+    def future_waits(self) -> int:
+        """Get the number of times a (blocking) query waited for its response headers or its next row.
+
+        Returns:
+            int: The number of times a query waited for its response headers or its next row.
+        """
+        return self._raw.get('future_waits') or 0
+
+    def future_wait_time(self) -> timedelta:
+        """Get the total amount of time (blocking) queries waited for their response headers or their next row.
+
+        Returns:
+            timedelta: The total amount of time queries waited for their response headers or their next row.
+        """
+        return timedelta(microseconds=(self._raw.get('future_wait_time') or 0) / 1000)
+
+    def future_wait_max_time(self) -> timedelta:
+        """Get the longest amount of time a (blocking) query waited for its response headers or its next row.
+
+        Returns:
+            timedelta: The longest amount of time a query waited for its response headers or its next row.
+        """
+        return timedelta(microseconds=(self._raw.get('future_wait_max_time') or 0) / 1000)
+
+    def __repr__(self) -> str:
+        return "CoreStats:{}".format(self._raw)
+
+
+class IoStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Utilization details for the threads servicing a connection's I/O.  Use these details to size the
+    `num_io_threads` cluster option.
+    """
+
+    def __init__(self, raw: IoStatsCore) -> None:
+        self._raw = raw
+
+    def loop_lag(self) -> timedelta:
+        """Get how long work waited to be picked up by an I/O thread during the last sample interval.
+
+        A consistently high loop lag indicates the I/O threads are saturated.
+
+        Returns:
+            timedelta: How long work waited to be picked up by an I/O thread during the last sample interval.
+        """
+        return timedelta(microseconds=self._raw.get('loop_lag') or 0)
+
+    def max_io_threads(self) -> int:
+        """Get the maximum number of I/O threads the connection is allowed to use.
+
+        Returns:
+            int: The maximum number of I/O threads the connection is allowed to use.
+        """
+        return self._raw.get('max_io_threads') or 0
+
+    def num_io_threads(self) -> int:
+        """Get the number of I/O threads the connection is currently using.
+
+        Returns:
+            int: The number of I/O threads the connection is currently using.
+        """
+        return len(self._raw.get('threads') or [])
+
+    def threads(self) -> List[IoThreadStats]:
+        """Get the utilization details for each I/O thread.
+
+        Returns:
+            List[:class:`.IoThreadStats`]: The utilization details for each I/O thread.
+        """
+        return list(map(IoThreadStats, self._raw.get('threads') or []))
+
+    def __repr__(self) -> str:
+        return "IoStats:{}".format(self._raw)
+
+
+class Histogram:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A snapshot of a log-linear (HDR-style) histogram.  Values are grouped into buckets with a relative error of at
+    most ~6%.
+    """
+
+    def __init__(self, raw: HistogramCore) -> None:
+        self._raw = raw
+
+    def count(self) -> int:
+        """Get the number of recorded values.
+
+        Returns:
+            int: The number of recorded values.
+        """
+        return self._raw.get('count') or 0
+
+    def sum(self) -> int:
+        """Get the sum of the recorded values.
+
+        Returns:
+            int: The sum of the recorded values.
+        """
+        return self._raw.get('sum') or 0
+
+    def min(self) -> int:
+        """Get the smallest recorded value.
+
+        Returns:
+            int: The smallest recorded value (0 if no values have been recorded).
+        """
+        return self._raw.get('min') or 0
+
+    def max(self) -> int:
+        """Get the largest recorded value.
+
+        Returns:
+            int: The largest recorded value (0 if no values have been recorded).
+        """
+        return self._raw.get('max') or 0
+
+    def mean(self) -> float:
+        """Get the mean of the recorded values.
+
+        Returns:
+            float: The mean of the recorded values (0.0 if no values have been recorded).
+        """
+        count = self.count()
+        return self.sum() / count if count > 0 else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """Get the value at the provided percentile.
+
+        Args:
+            percentile (float): The percentile (0.0 - 100.0).
+
+        Returns:
+            int: The upper bound of the bucket the percentile falls in (0 if no values have been recorded).
+
+        Raises:
+            `ValueError`: If the percentile is not between 0.0 and 100.0.
+        """
+        if not 0.0 <= percentile <= 100.0:
+            raise ValueError('Percentile must be between 0.0 and 100.0.')
+        count = self.count()
+        if count == 0:
+            return 0
+        target = max(count * percentile / 100.0, 1)
+        seen = 0
+        for upper_bound, bucket_count in self.buckets():
+            seen += bucket_count
+            if seen >= target:
+                return min(upper_bound, self.max())
+        return self.max()
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """Get the non-empty buckets of the histogram.
+
+        Returns:
+            List[Tuple[int, int]]: The (upper bound, count) of each non-empty bucket, in ascending order.
+        """
+        return [(ub, c) for ub, c in self._raw.get('buckets') or []]
+
+    def __repr__(self) -> str:
+        return "Histogram:{}".format(self._raw)
+
+
+class QueryOutcomeMetrics:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Latency and throughput metrics of the queries executed against a database/scope that completed with the same
+    outcome (`success`, `timeout`, `cancel` or `error`).
+    """
+
+    def __init__(self, raw: QueryOutcomeMetricsCore) -> None:
+        self._raw = raw
+
+    def database_name(self) -> Optional[str]:
+        """Get the name of the database the queries were executed against.
+
+        Returns:
+            Optional[str]: The name of the database, `None` for cluster level queries.
+        """
+        return self._raw.get('database_name') or None
+
+    def scope_name(self) -> Optional[str]:
+        """Get the name of the scope the queries were executed against.
+
+        Returns:
+            Optional[str]: The name of the scope, `None` for cluster level queries.
+        """
+        return self._raw.get('scope_name') or None
+
+    def outcome(self) -> str:
+        """Get the outcome of the queries.
+
+        Returns:
+            str: One of `success`, `timeout`, `cancel` or `error`.
+        """
+        return self._raw.get('outcome') or 'error'
+
+    def queries(self) -> int:
+        """Get the number of queries.
+
+        Returns:
+            int: The number of queries.
+        """
+        return self._raw.get('queries') or 0
+
+    def rows(self) -> int:
+        """Get the total number of rows received.
+
+        Returns:
+            int: The total number of rows received.
+        """
+        return self._raw.get('rows') or 0
+
+    def bytes(self) -> int:
+        """Get the total number of bytes of the rows received.
+
+        Returns:
+            int: The total number of bytes of the rows received.
+        """
+        return self._raw.get('bytes') or 0
+
+    def first_row_latency(self) -> Histogram:
+        """Get the histogram of the time (in microseconds) from submitting a query to receiving its first row.
+
+        Returns:
+            :class:`.Histogram`: The histogram of the time to the first row (queries w/o rows are not recorded).
+        """
+        return Histogram(self._raw.get('first_row_latency') or {})
+
+    def total_latency(self) -> Histogram:
+        """Get the histogram of the time (in microseconds) from submitting a query to its completion.
+
+        Returns:
+            :class:`.Histogram`: The histogram of the total query latency.
+        """
+        return Histogram(self._raw.get('total_latency') or {})
+
+    def rows_per_second(self) -> Histogram:
+        """Get the histogram of each query's throughput in rows per second.
+
+        Returns:
+            :class:`.Histogram`: The histogram of rows per second.
+        """
+        return Histogram(self._raw.get('rows_per_second') or {})
+
+    def bytes_per_second(self) -> Histogram:
+        """Get the histogram of each query's throughput in bytes per second.
+
+        Returns:
+            :class:`.Histogram`: The histogram of bytes per second.
+        """
+        return Histogram(self._raw.get('bytes_per_second') or {})
+
+    def __repr__(self) -> str:
+        return "QueryOutcomeMetrics:{}".format(self._raw)
+
+
+class ClusterMetrics:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A snapshot of the latency and throughput metrics of the queries executed by a cluster, grouped by
+    database/scope and outcome.
+    """
+
+    # Prometheus histogram bucket boundaries, latencies are exposed in seconds
+    LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                                          1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+    RATE_BUCKETS: Tuple[float, ...] = (1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9)
+
+    def __init__(self, raw: Iterable[List[QueryOutcomeMetricsCore]]) -> None:
+        merged: Dict[Tuple[str, str, str], QueryOutcomeMetricsCore] = {}
+        # each execution lane has its own connection (and therefore its own metrics)
+        for snapshot in raw:
+            for entry in snapshot:
+                key = (entry.get('database_name', ''), entry.get('scope_name', ''), entry.get('outcome', 'error'))
+                if key in merged:
+                    merged[key] = ClusterMetrics._merge_entries(merged[key], entry)
+                else:
+                    merged[key] = entry
+        self._raw = [entry for entry in merged.values() if entry.get('queries', 0) > 0]
+
+    @staticmethod
+    def _merge_histograms(a: HistogramCore, b: HistogramCore) -> HistogramCore:
+        buckets: Dict[int, int] = {}
+        for upper_bound, count in list(a.get('buckets') or []) + list(b.get('buckets') or []):
+            buckets[upper_bound] = buckets.get(upper_bound, 0) + count
+        counts = [h.get('count', 0) for h in (a, b)]
+        return {
+            'count': sum(counts),
+            'sum': a.get('sum', 0) + b.get('sum', 0),
+            'min': min(h.get('min', 0) for h, c in zip((a, b), counts) if c > 0) if any(counts) else 0,
+            'max': max(a.get('max', 0), b.get('max', 0)),
+            'buckets': sorted(buckets.items()),
+        }
+
+    @staticmethod
+    def _merge_entries(a: QueryOutcomeMetricsCore, b: QueryOutcomeMetricsCore) -> QueryOutcomeMetricsCore:
+        return {
+            'database_name': a.get('database_name', ''),
+            'scope_name': a.get('scope_name', ''),
+            'outcome': a.get('outcome', 'error'),
+            'queries': a.get('queries', 0) + b.get('queries', 0),
+            'rows': a.get('rows', 0) + b.get('rows', 0),
+            'bytes': a.get('bytes', 0) + b.get('bytes', 0),
+            'first_row_latency': ClusterMetrics._merge_histograms(a.get('first_row_latency', {}),
+                                                                  b.get('first_row_latency', {})),
+            'total_latency': ClusterMetrics._merge_histograms(a.get('total_latency', {}),
+                                                              b.get('total_latency', {})),
+            'rows_per_second': ClusterMetrics._merge_histograms(a.get('rows_per_second', {}),
+                                                                b.get('rows_per_second', {})),
+            'bytes_per_second': ClusterMetrics._merge_histograms(a.get('bytes_per_second', {}),
+                                                                 b.get('bytes_per_second', {})),
+        }
+
+    def query_metrics(self,
+                      database_name: Optional[str] = None,
+                      scope_name: Optional[str] = None,
+                      outcome: Optional[str] = None) -> List[QueryOutcomeMetrics]:
+        """Get the query metrics, optionally filtered by database, scope and/or outcome.
+
+        Args:
+            database_name (Optional[str]): Only return the metrics of queries executed against this database.
+            scope_name (Optional[str]): Only return the metrics of queries executed against this scope.
+            outcome (Optional[str]): Only return the metrics of queries with this outcome (`success`, `timeout`,
+                `cancel` or `error`).
+
+        Returns:
+            List[:class:`.QueryOutcomeMetrics`]: The matching query metrics.
+        """
+        metrics = map(QueryOutcomeMetrics, self._raw)
+        return [m for m in metrics
+                if (database_name is None or m.database_name() == database_name)
+                and (scope_name is None or m.scope_name() == scope_name)
+                and (outcome is None or m.outcome() == outcome)]
+
+    def to_prometheus(self, prefix: str = 'couchbase_columnar') -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Latencies are exposed in seconds.  The bucket counts are derived from the underlying histograms, so a value
+        close to a bucket boundary might be counted in the next bucket.
+
+        Args:
+            prefix (str): The prefix of the metric names. Defaults to `couchbase_columnar`.
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format.
+        """
+        lines: List[str] = []
+        counters = (('queries_total', 'queries', 'Number of completed queries.'),
+                    ('query_rows_total', 'rows', 'Number of rows received.'),
+                    ('query_bytes_total', 'bytes', 'Number of bytes of the rows received.'))
+        for name, key, help_text in counters:
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for entry in self._raw:
+                lines.append(f'{prefix}_{name}{{{self._labels(entry)}}} {entry.get(key, 0)}')
+
+        histograms = (('query_first_row_latency_seconds', 'first_row_latency', 1e-6, self.LATENCY_BUCKETS,
+                       'Time from submitting a query to receiving its first row.'),
+                      ('query_latency_seconds', 'total_latency', 1e-6, self.LATENCY_BUCKETS,
+                       'Time from submitting a query to its completion.'),
+                      ('query_rows_per_second', 'rows_per_second', 1.0, self.RATE_BUCKETS,
+                       'Throughput of each query in rows per second.'),
+                      ('query_bytes_per_second', 'bytes_per_second', 1.0, self.RATE_BUCKETS,
+                       'Throughput of each query in bytes per second.'))
+        for name, key, scale, boundaries, help_text in histograms:
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} histogram')
+            for entry in self._raw:
+                histogram: HistogramCore = entry.get(key, {})  # type: ignore[assignment]
+                labels = self._labels(entry)
+                buckets = histogram.get('buckets') or []
+                for boundary in boundaries:
+                    count = sum(c for ub, c in buckets if ub * scale <= boundary)
+                    lines.append(f'{prefix}_{name}_bucket{{{labels},le="{boundary:g}"}} {count}')
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="+Inf"}} {histogram.get("count", 0)}')
+                lines.append(f'{prefix}_{name}_sum{{{labels}}} {histogram.get("sum", 0) * scale:g}')
+                lines.append(f'{prefix}_{name}_count{{{labels}}} {histogram.get("count", 0)}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _labels(entry: QueryOutcomeMetricsCore) -> str:
+        def escape(value: str) -> str:
+            return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        return (f'database="{escape(entry.get("database_name", ""))}",'
+                f'scope="{escape(entry.get("scope_name", ""))}",'
+                f'outcome="{escape(entry.get("outcome", "error"))}"')
+
+    def __repr__(self) -> str:
+        return "ClusterMetrics:{}".format(self._raw)
+
+
+class StatementStatistics:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The aggregated statistics of the queries executed with the same statement fingerprint (statements that only differ
+    by their literal values, comments or whitespace share a fingerprint).  Latencies are measured from dispatching the
+    query to receiving its last row (or error).
+    """
+
+    def __init__(self, raw: StatementStatisticsCore) -> None:
+        self._raw = raw
+
+    def fingerprint(self) -> str:
+        """Get the statement's fingerprint.
+
+        Returns:
+            str: The statement's fingerprint.
+        """
+        return self._raw.get('fingerprint') or ''
+
+    def statement(self) -> str:
+        """Get the normalized statement (literal values are replaced with `?`).
+
+        Returns:
+            str: The normalized statement.
+        """
+        return self._raw.get('statement') or ''
+
+    def calls(self) -> int:
+        """Get the number of times the statement was executed.
+
+        Returns:
+            int: The number of times the statement was executed.
+        """
+        return self._raw.get('calls') or 0
+
+    def errors(self) -> int:
+        """Get the number of executions that failed (including timeouts).
+
+        Returns:
+            int: The number of executions that failed.
+        """
+        return self._raw.get('errors') or 0
+
+    def timeouts(self) -> int:
+        """Get the number of executions that timed out.
+
+        Returns:
+            int: The number of executions that timed out.
+        """
+        return self._raw.get('timeouts') or 0
+
+    def cancellations(self) -> int:
+        """Get the number of executions that were canceled.
+
+        Returns:
+            int: The number of executions that were canceled.
+        """
+        return self._raw.get('cancellations') or 0
+
+    def rows(self) -> int:
+        """Get the total number of rows received.
+
+        Returns:
+            int: The total number of rows received.
+        """
+        return self._raw.get('rows') or 0
+
+    def bytes(self) -> int:
+        """Get the total number of bytes of the rows received.
+
+        Returns:
+            int: The total number of bytes of the rows received.
+        """
+        return self._raw.get('bytes') or 0
+
+    def total_latency(self) -> timedelta:
+        """Get the total latency of all executions.
+
+        Returns:
+            timedelta: The total latency of all executions.
+        """
+        return timedelta(microseconds=self._raw.get('total_latency') or 0)
+
+    def mean_latency(self) -> timedelta:
+        """Get the mean latency of an execution.
+
+        Returns:
+            timedelta: The mean latency of an execution.
+        """
+        calls = self.calls()
+        return self.total_latency() / calls if calls > 0 else timedelta(0)
+
+    def min_latency(self) -> timedelta:
+        """Get the lowest latency of an execution.
+
+        Returns:
+            timedelta: The lowest latency of an execution.
+        """
+        return timedelta(microseconds=self._raw.get('min_latency') or 0)
+
+    def max_latency(self) -> timedelta:
+        """Get the highest latency of an execution.
+
+        Returns:
+            timedelta: The highest latency of an execution.
+        """
+        return timedelta(microseconds=self._raw.get('max_latency') or 0)
+
+    def p50_latency(self) -> timedelta:
+        """Get the median latency of an execution.
+
+        Returns:
+            timedelta: The median latency of an execution (within ~6%).
+        """
+        return timedelta(microseconds=self._raw.get('p50_latency') or 0)
+
+    def p99_latency(self) -> timedelta:
+        """Get the 99th percentile latency of an execution.
+
+        Returns:
+            timedelta: The 99th percentile latency of an execution (within ~6%).
+        """
+        return timedelta(microseconds=self._raw.get('p99_latency') or 0)
+
+    def __repr__(self) -> str:
+        return "StatementStatistics:{}".format(self._raw)
+
+
+class StatementStatisticsSnapshot:
+    """**VOLATILE** This API is subject to change at any time.
+
+    A snapshot of the statement statistics recorded by a cluster (see the `statement_statistics` cluster option).
+    """
+
+    ORDER_BY_KEYS: Tuple[str, ...] = ('bytes', 'calls', 'errors', 'max_latency', 'p99_latency', 'rows',
+                                      'total_latency')
+
+    def __init__(self, raw: StatementStatisticsSnapshotCore) -> None:
+        self._raw = raw
+
+    def capacity(self) -> int:
+        """Get the maximum number of statements the cluster keeps statistics for.
+
+        Returns:
+            int: The maximum number of statements.
+        """
+        return self._raw.get('capacity') or 0
+
+    def evictions(self) -> int:
+        """Get the number of statements that have been evicted to make room for new statements.
+
+        Returns:
+            int: The number of evicted statements.
+        """
+        return self._raw.get('evictions') or 0
+
+    def statements(self, order_by: str = 'total_latency', limit: Optional[int] = None) -> List[StatementStatistics]:
+        """Get the statistics of each statement, in descending order.
+
+        Args:
+            order_by (str): The statistic to order the statements by, one of `bytes`, `calls`, `errors`, `max_latency`,
+                `p99_latency`, `rows` or `total_latency`. Defaults to `total_latency`.
+            limit (Optional[int]): The maximum number of statements to return. Defaults to `None` (all statements).
+
+        Returns:
+            List[:class:`.StatementStatistics`]: The statistics of each statement.
+
+        Raises:
+            `ValueError`: If the order_by statistic is not valid.
+        """
+        if order_by not in self.ORDER_BY_KEYS:
+            raise ValueError(f'Invalid order_by statistic: {order_by}. Valid statistics: '
+                             f'{", ".join(self.ORDER_BY_KEYS)}.')
+        statements = sorted(self._raw.get('statements') or [],
+                            key=lambda s: cast(int, s.get(order_by, 0)),
+                            reverse=True)
+        return [StatementStatistics(s) for s in statements[:limit]]
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Dump the snapshot to JSON.  Latencies are in microseconds.
+
+        Args:
+            indent (Optional[int]): The indentation of the JSON document. Defaults to `None` (compact).
+
+        Returns:
+            str: The snapshot as a JSON document.
+        """
+        return json.dumps(self._raw, indent=indent)
+
+    def __repr__(self) -> str:
+        return "StatementStatisticsSnapshot:{}".format(self._raw)
@@ -26,8 +26,14 @@ else:
 
 from couchbase_columnar.common.config_profile import CONFIG_PROFILES
 from couchbase_columnar.common.enums import KnownConfigProfiles
+from couchbase_columnar.common.options_base import AdaptiveConcurrencyOptionsBase
+from couchbase_columnar.common.options_base import (  # noqa: F401
+    AdaptiveConcurrencyOptionsKwargs as AdaptiveConcurrencyOptionsKwargs)
 from couchbase_columnar.common.options_base import ClusterOptionsBase
 from couchbase_columnar.common.options_base import ClusterOptionsKwargs as ClusterOptionsKwargs  # noqa: F401
+from couchbase_columnar.common.options_base import ExecutionLaneOptionsBase
+from couchbase_columnar.common.options_base import (  # noqa: F401
+    ExecutionLaneOptionsKwargs as ExecutionLaneOptionsKwargs)
 from couchbase_columnar.common.options_base import QueryOptionsBase
 from couchbase_columnar.common.options_base import QueryOptionsKwargs as QueryOptionsKwargs  # noqa: F401
 from couchbase_columnar.common.options_base import SecurityOptionsBase
@@ -52,7 +58,10 @@ class ClusterOptions(ClusterOptionsBase):
         The authenticator is mandatory, all the other cluster options are optional.
 
     Args:
+        adaptive_concurrency (AdaptiveConcurrencyOptions, optional): **VOLATILE** This API is subject to change at any time. Set to adapt the number of queries each execution lane admits at any one time to the service's load.  The limit grows while queries succeed and shrinks when queries are rejected because the service is overloaded, time out or (optionally) are slow to respond.  Queries that exceed the limit wait, prioritized queries (see the `priority` query option) first.  See :class:`~couchbase_columnar.options.AdaptiveConcurrencyOptions` for details. Defaults to `None` (disabled).
         allow_unknown_qstr_options (bool, optional): If enabled, allows unknown query string options to pass through to C++ core. Defaults to `False` (disabled).
+        bootstrap_cache_path (str, optional): **VOLATILE** This API is subject to change at any time. If set, the nodes the cluster bootstraps from (the DNS SRV records the connection string resolved to, or the connection string's nodes) are cached in this directory, keyed by the connection string.  Subsequent clusters created with the same connection string bootstrap from the cached nodes instead of resolving DNS SRV records.  If bootstrapping from the cached nodes fails, the cache entry is discarded and the cluster bootstraps from the connection string. Defaults to `None` (disabled).
+        bootstrap_cache_ttl (timedelta, optional): **VOLATILE** This API is subject to change at any time. Set to configure how long cached bootstrap nodes are used before the connection string is resolved again.  Only used if `bootstrap_cache_path` is set. Defaults to `None` (1 hour).
         config_poll_floor (timedelta, optional): Set to configure polling floor interval. Defaults to `None` (50ms).
         config_poll_interval (timedelta, optional): Set to configure polling floor interval. Defaults to `None` (2.5s).
         deserializer (Deserializer, optional): Set to configure global serializer to translate JSON to Python objects. Defaults to `None` (:class:`~couchbase_columnar.deserializer.DefaultJsonDeserializer`).
@@ -61,10 +70,19 @@ class ClusterOptions(ClusterOptionsBase):
         dns_port (int, optional): **VOLATILE** This API is subject to change at any time. Set to configure custom DNS port. Defaults to `None`.
         dump_configuration (bool, optional): If enabled, dump received server configuration when TRACE level logging. Defaults to `False` (disabled).
         enable_clustermap_notification (bool, optional): If enabled, allows server to push configuration updates asynchronously. Defaults to `True` (enabled).
+        execution_lanes (Mapping[str, ExecutionLaneOptions], optional): **VOLATILE** This API is subject to change at any time. Set to configure named execution lanes.  Each lane has its own connection (I/O threads and HTTP connections) and, optionally, a limit on in-flight queries.  Queries select a lane via the `lane` query option.  A lane named `'default'` configures the cluster's primary connection. See :class:`~couchbase_columnar.options.ExecutionLaneOptions` for details. Defaults to `None`.
         ip_protocol (Union[IpProtocol, str], optional): Controls preference of IP protocol for name resolution. Defaults to `None` (any).
+        lazy_connect (bool, optional): If enabled, the cluster is bootstrapped in the background and creating the cluster instance returns immediately.  Operations wait for the bootstrap to complete.  Defaults to `False` (disabled).
         network (str, optional): Set to configure external network. Defaults to `None` (auto).
+        num_io_threads (Union[int, str], optional): **VOLATILE** This API is subject to change at any time. Set to configure the number of threads servicing the connection's I/O.  If set to `'auto'`, the initial thread count is sized from the CPU count and threads are added when the existing threads are saturated. Defaults to `None` (1).
+        retry_strategy (RetryStrategy, optional): **VOLATILE** This API is subject to change at any time. Set to retry read-only queries (see the `read_only` query option) that fail with a temporary error before any of their rows are received.  See :class:`~couchbase_columnar.retry.BestEffortRetryStrategy`.  All attempts of a query share the query's timeout, each attempt's timeout is the time remaining.  Can be overridden per query with the `retry_strategy` query option. Defaults to `None` (queries are not retried).
         security_options (SecurityOptions, optional): Security options for SDK connection.
+        share_connection (bool, optional): **VOLATILE** This API is subject to change at any time. If enabled, clusters (sync and async) created in the same process with the same connection string, credential and options share a single underlying connection.  The connection is closed once every cluster sharing it has been closed. Defaults to `False` (disabled).
+        slow_query_threshold (timedelta, optional): **VOLATILE** This API is subject to change at any time. Set to log queries that take at least this long, from being dispatched until their last row is received or they fail, to the `couchbase_columnar.slow_query` logger.  Each record is logged at WARNING level as JSON and is also attached to the log record as its `slow_query` attribute.  It contains the request ID, statement fingerprint, normalized statement, redacted parameters, the client timing breakdown and the query metrics.  Can be overridden per query with the `slow_query_threshold` query option. Defaults to `None` (disabled).
+        statement_statistics (bool, optional): **VOLATILE** This API is subject to change at any time. If enabled, the cluster aggregates the statistics (calls, latency, rows, bytes and errors) of the queries it executes per statement fingerprint (statements that only differ by their literal values share a fingerprint).  See :meth:`~couchbase_columnar.cluster.Cluster.statement_statistics`. Defaults to `False` (disabled).
+        statement_statistics_capacity (int, optional): **VOLATILE** This API is subject to change at any time. Set to configure the maximum number of statements the cluster keeps statistics for, once reached the least frequently executed statement is evicted.  Only used if `statement_statistics` is enabled. Defaults to `None` (1000).
         timeout_options (TimeoutOptions, optional): Timeout options for various SDK operations. See :class:`~couchbase_columnar.options.ClusterTimeoutOptions` for details.
+        tracer (RequestTracer, optional): **VOLATILE** This API is subject to change at any time. Set to trace the lifecycle of queries (building the request, dispatching it, waiting for the response headers, streaming and deserializing the rows).  See :class:`~couchbase_columnar.tracing.OpenTelemetryTracer` to record the spans with OpenTelemetry. Defaults to `None` (:class:`~couchbase_columnar.tracing.NoOpTracer`, queries are not traced).
         user_agent_extra (str, optional): Set to add further details to identification fields in server protocols. Defaults to `None` (`{Python SDK version} (python/{Python version})`).
     """  # noqa: E501
 
@@ -104,6 +122,38 @@ class ClusterOptions(ClusterOptionsBase):
         return opts
 
 
+class AdaptiveConcurrencyOptions(AdaptiveConcurrencyOptionsBase):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Available options to set for adaptive concurrency when creating a cluster.
+
+    Each execution lane adapts its limit independently (additive increase, multiplicative decrease).  Every query that succeeds while the lane is busy raises the limit by one, every query that signals the service is overloaded multiplies the limit by the `backoff_ratio`.
+    The `max_in_flight` execution lane option, if set, caps the lane's limit.
+    All options are optional and default to `None`.
+
+    Args:
+        backoff_ratio (float, optional): Set to configure the ratio the limit is multiplied by when the service is overloaded, must be between 0 and 1. Defaults to `None` (0.9).
+        initial_limit (int, optional): Set to configure the limit a lane starts with. Defaults to `None` (16).
+        latency_threshold (timedelta, optional): Set to treat queries whose response headers take at least this long (from being admitted) as a sign the service is overloaded. Defaults to `None` (disabled, only errors shrink the limit).
+        max_limit (int, optional): Set to configure the maximum limit. Defaults to `None` (256).
+        min_limit (int, optional): Set to configure the minimum limit. Defaults to `None` (1).
+    """  # noqa: E501
+
+
+class ExecutionLaneOptions(ExecutionLaneOptionsBase):
+    """**VOLATILE** This API is subject to change at any time.
+
+    Available options to set for an execution lane when creating a cluster.
+
+    Execution lanes isolate workloads from one another, e.g. interactive queries from bulk exports.  Each lane is serviced by its own connection.
+    All options are optional and default to `None`.
+
+    Args:
+        max_in_flight (int, optional): Set to limit the number of queries that can be in-flight on the lane at any one time.  Queries that exceed the limit wait until an in-flight query completes.  If the `adaptive_concurrency` cluster option is set, caps the lane's adaptive limit. Defaults to `None` (unlimited).
+        num_io_threads (Union[int, str], optional): Set to configure the number of threads servicing the lane's I/O. See the `num_io_threads` cluster option for details. Defaults to `None` (cluster setting).
+    """  # noqa: E501
+
+
 class SecurityOptions(SecurityOptionsBase):
     """Available security options to set when creating a cluster.
 
@@ -208,21 +258,32 @@ class QueryOptions(QueryOptionsBase):
     Args:
         cancel_token (:class:~`threaad.Event`, optional): None
         cancel_poll_interval (float, optional): None
+        capture_path (str, optional): **VOLATILE** This API is subject to change at any time. Set to the path of a file to record the query's raw response stream (response headers, rows, metadata and their timing) to. The capture can be loaded with :meth:`~couchbase_columnar.capture.QueryCapture.load` and replayed offline. Defaults to `None` (not captured).
+        checkpoint_path (str, optional): **VOLATILE** This API is subject to change at any time. Set to the path of a file to persist the resume key of the last row returned by a resumable query to (see the `resume_key` query option). If the file exists when the query is executed, the query resumes after the persisted key, so that an export interrupted by a crashed process can be resumed by executing the same query again. The checkpoint is written at most once per second and when the query fails, rows returned after the last checkpoint are returned again when the query is resumed. The file is removed once all rows have been returned. Defaults to `None` (not persisted).
         deserializer (Deserializer, optional): None
+        lane (str, optional): **VOLATILE** This API is subject to change at any time. Set to the name of the execution lane the query should be executed on. See the `execution_lanes` cluster option. Defaults to `None` (default lane).
         lazy_execute: (bool, optional): None
         named_parameters (Dict[str, JSONType], optional): None
+        parent_span (RequestSpan, optional): **VOLATILE** This API is subject to change at any time. Set to the span the query's spans should be children of. Only used if the `tracer` cluster option is set. Defaults to `None` (the tracer's current span, if any).
         positional_parameters (Iterable[JSONType], optional): None
-        priority (bool, optional): None
+        priority (bool, optional): If enabled, the query is prioritized by the service.  If the query has to wait to be admitted on its execution lane (see the `max_in_flight` execution lane option and the `adaptive_concurrency` cluster option), it is admitted ahead of waiting queries that are not prioritized. Defaults to `None` (disabled).
+        progress_callback (Callable[[QueryProgress], None], optional): **VOLATILE** This API is subject to change at any time. Set to be called with the query's :class:`~couchbase_columnar.query.QueryProgress` (rows and bytes received so far, rate and ETA) while the rows are iterated, at most once per `progress_interval` and once more when all rows have been received.  The callback is called from the thread (or event loop) iterating the rows, so it should return quickly. Defaults to `None`.
+        progress_interval (timedelta, optional): **VOLATILE** This API is subject to change at any time. Set to configure the minimum amount of time between calls to the `progress_callback`. Defaults to `None` (1s).
         query_context (str, optional): None
         raw (Dict[str, Any], optional): None
         read_only (bool, optional): None
+        resume_key (Union[str, List[str]], optional): **VOLATILE** This API is subject to change at any time. Set to the field (or list of fields) of the rows that totally orders the query's result to make the query resumable. The rows must be JSON objects and the query must be a SELECT statement without a LIMIT or OFFSET clause (other than in its subqueries), the result is ordered by the key and the statement's own ORDER BY clause is superseded. If the query fails with a temporary error while its rows are streamed, it is executed again for the rows after the last returned row's key and the iteration continues with the next row. Resumable queries are read-only and are retried with the `retry_strategy` (:class:`~couchbase_columnar.retry.BestEffortRetryStrategy` if none is set). All attempts share the query's timeout. Defaults to `None` (not resumable).
+        retry_strategy (RetryStrategy, optional): **VOLATILE** This API is subject to change at any time. Set to retry the query, if it is read-only, when it fails with a temporary error. See the `retry_strategy` cluster option. Defaults to `None` (the cluster's retry strategy).
         scan_consistency (QueryScanConsistency, optional): None
+        slow_query_threshold (timedelta, optional): **VOLATILE** This API is subject to change at any time. Set to log the query to the `couchbase_columnar.slow_query` logger if it takes at least this long. See the `slow_query_threshold` cluster option. Defaults to `None` (the cluster's threshold).
         timeout (timedelta, optional): Set to configure allowed time for operation to complete. Defaults to `None` (75s).
     """  # noqa: E501
 
 
 OptionsClass: TypeAlias = Union[
+    AdaptiveConcurrencyOptions,
     ClusterOptions,
+    ExecutionLaneOptions,
     SecurityOptions,
     TimeoutOptions,
     QueryOptions,
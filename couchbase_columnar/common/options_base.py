@@ -19,10 +19,12 @@ from __future__ import annotations
 import sys
 from datetime import timedelta
 from typing import (Any,
+                    Callable,
                     Dict,
                     Iterable,
                     List,
                     Literal,
+                    Mapping,
                     Optional,
                     TypedDict,
                     Union,
@@ -37,6 +39,9 @@ from typing_extensions import Unpack
 from couchbase_columnar.common import JSONType
 from couchbase_columnar.common.deserializer import Deserializer
 from couchbase_columnar.common.enums import IpProtocol, QueryScanConsistency
+from couchbase_columnar.common.query import QueryProgress
+from couchbase_columnar.common.retry import RetryStrategy
+from couchbase_columnar.common.tracing import RequestSpan, RequestTracer
 
 """
     Python Columnar SDK Cluster Options Classes
@@ -44,7 +49,10 @@ from couchbase_columnar.common.enums import IpProtocol, QueryScanConsistency
 
 
 class ClusterOptionsKwargs(TypedDict, total=False):
+    adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsBase]
     allow_unknown_qstr_options: Optional[bool]
+    bootstrap_cache_path: Optional[str]
+    bootstrap_cache_ttl: Optional[timedelta]
     config_poll_floor: Optional[timedelta]
     config_poll_interval: Optional[timedelta]
     deserializer: Optional[Deserializer]
@@ -53,15 +61,27 @@ class ClusterOptionsKwargs(TypedDict, total=False):
     dns_port: Optional[int]
     dump_configuration: Optional[bool]
     enable_clustermap_notification: Optional[bool]
+    execution_lanes: Optional[Mapping[str, ExecutionLaneOptionsBase]]
     ip_protocol: Optional[Union[IpProtocol, str]]
+    lazy_connect: Optional[bool]
     network: Optional[str]
+    num_io_threads: Optional[Union[int, Literal['auto']]]
+    retry_strategy: Optional[RetryStrategy]
     security_options: Optional[SecurityOptionsBase]
+    share_connection: Optional[bool]
+    slow_query_threshold: Optional[timedelta]
+    statement_statistics: Optional[bool]
+    statement_statistics_capacity: Optional[int]
     timeout_options: Optional[TimeoutOptionsBase]
+    tracer: Optional[RequestTracer]
     user_agent_extra: Optional[str]
 
 
 ClusterOptionsValidKeys: TypeAlias = Literal[
+    'adaptive_concurrency',
     'allow_unknown_qstr_options',
+    'bootstrap_cache_path',
+    'bootstrap_cache_ttl',
     'config_poll_floor',
     'config_poll_interval',
     'deserializer',
@@ -70,10 +90,19 @@ ClusterOptionsValidKeys: TypeAlias = Literal[
     'dns_port',
     'dump_configuration',
     'enable_clustermap_notification',
+    'execution_lanes',
     'ip_protocol',
+    'lazy_connect',
     'network',
+    'num_io_threads',
+    'retry_strategy',
     'security_options',
+    'share_connection',
+    'slow_query_threshold',
+    'statement_statistics',
+    'statement_statistics_capacity',
     'timeout_options',
+    'tracer',
     'user_agent_extra',
 ]
 
@@ -84,7 +113,10 @@ class ClusterOptionsBase(Dict[str, Any]):
     """
 
     VALID_OPTION_KEYS: List[ClusterOptionsValidKeys] = [
+        'adaptive_concurrency',
         'allow_unknown_qstr_options',
+        'bootstrap_cache_path',
+        'bootstrap_cache_ttl',
         'config_poll_floor',
         'config_poll_interval',
         'deserializer',
@@ -93,10 +125,19 @@ class ClusterOptionsBase(Dict[str, Any]):
         'dns_port',
         'dump_configuration',
         'enable_clustermap_notification',
+        'execution_lanes',
         'ip_protocol',
+        'lazy_connect',
         'network',
+        'num_io_threads',
+        'retry_strategy',
         'security_options',
+        'share_connection',
+        'slow_query_threshold',
+        'statement_statistics',
+        'statement_statistics_capacity',
         'timeout_options',
+        'tracer',
         'user_agent_extra',
     ]
 
@@ -107,7 +148,10 @@ class ClusterOptionsBase(Dict[str, Any]):
     @overload
     def __init__(self,
                  *,
+                 adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsBase] = None,
                  allow_unknown_qstr_options: Optional[bool] = None,
+                 bootstrap_cache_path: Optional[str] = None,
+                 bootstrap_cache_ttl: Optional[timedelta] = None,
                  config_poll_floor: Optional[timedelta] = None,
                  config_poll_interval: Optional[timedelta] = None,
                  deserializer: Optional[Deserializer] = None,
@@ -116,10 +160,19 @@ class ClusterOptionsBase(Dict[str, Any]):
                  dns_port: Optional[int] = None,
                  dump_configuration: Optional[bool] = None,
                  enable_clustermap_notification: Optional[bool] = None,
+                 execution_lanes: Optional[Mapping[str, ExecutionLaneOptionsBase]] = None,
                  ip_protocol: Optional[Union[IpProtocol, str]] = None,
+                 lazy_connect: Optional[bool] = None,
                  network: Optional[str] = None,
+                 num_io_threads: Optional[Union[int, Literal['auto']]] = None,
+                 retry_strategy: Optional[RetryStrategy] = None,
                  security_options: Optional[SecurityOptionsBase] = None,
+                 share_connection: Optional[bool] = None,
+                 slow_query_threshold: Optional[timedelta] = None,
+                 statement_statistics: Optional[bool] = None,
+                 statement_statistics_capacity: Optional[int] = None,
                  timeout_options: Optional[TimeoutOptionsBase] = None,
+                 tracer: Optional[RequestTracer] = None,
                  user_agent_extra: Optional[str] = None,
                  ) -> None:
         ...
@@ -129,6 +182,94 @@ class ClusterOptionsBase(Dict[str, Any]):
         super().__init__(**filtered_kwargs)
 
 
+class AdaptiveConcurrencyOptionsKwargs(TypedDict, total=False):
+    backoff_ratio: Optional[float]
+    initial_limit: Optional[int]
+    latency_threshold: Optional[timedelta]
+    max_limit: Optional[int]
+    min_limit: Optional[int]
+
+
+AdaptiveConcurrencyOptionsValidKeys: TypeAlias = Literal[
+    'backoff_ratio',
+    'initial_limit',
+    'latency_threshold',
+    'max_limit',
+    'min_limit',
+]
+
+
+class AdaptiveConcurrencyOptionsBase(Dict[str, object]):
+    """
+        **INTERNAL**
+    """
+
+    VALID_OPTION_KEYS: List[AdaptiveConcurrencyOptionsValidKeys] = [
+        'backoff_ratio',
+        'initial_limit',
+        'latency_threshold',
+        'max_limit',
+        'min_limit',
+    ]
+
+    @overload
+    def __init__(self) -> None:
+        ...
+
+    @overload
+    def __init__(self,
+                 *,
+                 backoff_ratio: Optional[float] = None,
+                 initial_limit: Optional[int] = None,
+                 latency_threshold: Optional[timedelta] = None,
+                 max_limit: Optional[int] = None,
+                 min_limit: Optional[int] = None,
+                 ) -> None:
+        ...
+
+    def __init__(self, **kwargs: Unpack[AdaptiveConcurrencyOptionsKwargs]) -> None:
+        filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super().__init__(**filtered_kwargs)
+
+
+class ExecutionLaneOptionsKwargs(TypedDict, total=False):
+    max_in_flight: Optional[int]
+    num_io_threads: Optional[Union[int, Literal['auto']]]
+
+
+ExecutionLaneOptionsValidKeys: TypeAlias = Literal[
+    'max_in_flight',
+    'num_io_threads',
+]
+
+
+class ExecutionLaneOptionsBase(Dict[str, object]):
+    """
+        **INTERNAL**
+    """
+
+    VALID_OPTION_KEYS: List[ExecutionLaneOptionsValidKeys] = [
+        'max_in_flight',
+        'num_io_threads',
+    ]
+
+    @overload
+    def __init__(self) -> None:
+        ...
+
+    @overload
+    def __init__(self,
+                 *,
+                 max_in_flight: Optional[int] = None,
+                 num_io_threads: Optional[Union[int, Literal['auto']]] = None,
+                 ) -> None:
+        ...
+
+    def __init__(self, **kwargs: Unpack[ExecutionLaneOptionsKwargs]) -> None:
+        filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super().__init__(**filtered_kwargs)
+
+
 class SecurityOptionsKwargs(TypedDict, total=False):
     trust_only_capella: Optional[bool]
     trust_only_pem_file: Optional[str]
@@ -245,28 +386,46 @@ class TimeoutOptionsBase(Dict[str, object]):
 
 
 class QueryOptionsKwargs(TypedDict, total=False):
+    capture_path: Optional[str]
+    checkpoint_path: Optional[str]
     deserializer: Optional[Deserializer]
+    lane: Optional[str]
     lazy_execute: Optional[bool]
     named_parameters: Optional[Dict[str, JSONType]]
+    parent_span: Optional[RequestSpan]
     positional_parameters: Optional[Iterable[JSONType]]
     priority: Optional[bool]
+    progress_callback: Optional[Callable[[QueryProgress], None]]
+    progress_interval: Optional[timedelta]
     query_context: Optional[str]
     raw: Optional[Dict[str, Any]]
     read_only: Optional[bool]
+    resume_key: Optional[Union[str, List[str]]]
+    retry_strategy: Optional[RetryStrategy]
     scan_consistency: Optional[QueryScanConsistency]
+    slow_query_threshold: Optional[timedelta]
     timeout: Optional[timedelta]
 
 
 QueryOptionsValidKeys: TypeAlias = Literal[
+    'capture_path',
+    'checkpoint_path',
     'deserializer',
+    'lane',
     'lazy_execute',
     'named_parameters',
+    'parent_span',
     'positional_parameters',
     'priority',
+    'progress_callback',
+    'progress_interval',
     'query_context',
     'raw',
     'read_only',
+    'resume_key',
+    'retry_strategy',
     'scan_consistency',
+    'slow_query_threshold',
     'timeout',
 ]
 
@@ -274,15 +433,24 @@ QueryOptionsValidKeys: TypeAlias = Literal[
 class QueryOptionsBase(Dict[str, object]):
 
     VALID_OPTION_KEYS: List[QueryOptionsValidKeys] = [
+        'capture_path',
+        'checkpoint_path',
         'deserializer',
+        'lane',
         'lazy_execute',
         'named_parameters',
+        'parent_span',
         'positional_parameters',
         'priority',
+        'progress_callback',
+        'progress_interval',
         'query_context',
         'raw',
         'read_only',
+        'resume_key',
+        'retry_strategy',
         'scan_consistency',
+        'slow_query_threshold',
         'timeout',
     ]
 
@@ -293,15 +461,24 @@ class QueryOptionsBase(Dict[str, object]):
     @overload
     def __init__(self,
                  *,
+                 capture_path: Optional[str] = None,
+                 checkpoint_path: Optional[str] = None,
                  deserializer: Optional[Deserializer] = None,
+                 lane: Optional[str] = None,
                  lazy_execute: Optional[bool] = None,
                  named_parameters: Optional[Dict[str, JSONType]] = None,
+                 parent_span: Optional[RequestSpan] = None,
                  positional_parameters: Optional[Iterable[JSONType]] = None,
                  priority: Optional[bool] = None,
+                 progress_callback: Optional[Callable[[QueryProgress], None]] = None,
+                 progress_interval: Optional[timedelta] = None,
                  query_context: Optional[str] = None,
                  raw: Optional[Dict[str, Any]] = None,
                  read_only: Optional[bool] = None,
+                 resume_key: Optional[Union[str, List[str]]] = None,
+                 retry_strategy: Optional[RetryStrategy] = None,
                  scan_consistency: Optional[QueryScanConsistency] = None,
+                 slow_query_threshold: Optional[timedelta] = None,
                  timeout: Optional[timedelta] = None,
                  ) -> None:
         ...
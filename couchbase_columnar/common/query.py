@@ -20,8 +20,10 @@ from datetime import timedelta
 from threading import Event
 from typing import List, Optional
 
-from couchbase_columnar.common.core.query import (QueryMetadataCore,
+from couchbase_columnar.common.core.query import (QueryClientMetricsCore,
+                                                  QueryMetadataCore,
                                                   QueryMetricsCore,
+                                                  QueryProgressCore,
                                                   QueryWarningCore)
 
 
@@ -98,6 +100,178 @@ class QueryMetrics:
         return "QueryMetrics:{}".format(self._raw)
 
 
+class QueryClientMetrics:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Timings of a query as observed by the client.  Durations are measured from when the query was submitted to the
+    C++ core.
+    """
+
+    def __init__(self, raw: QueryClientMetricsCore) -> None:
+        self._raw = raw
+
+    def dispatch_time(self) -> timedelta:
+        """Get the amount of time spent dispatching the query request.
+
+        Returns:
+            timedelta: The amount of time spent dispatching the query request.
+        """
+        return timedelta(microseconds=(self._raw.get('dispatch_time') or 0) / 1000)
+
+    def time_to_headers(self) -> timedelta:
+        """Get the amount of time until the response headers were received.
+
+        Returns:
+            timedelta: The amount of time until the response headers were received.
+        """
+        return timedelta(microseconds=(self._raw.get('time_to_headers') or 0) / 1000)
+
+    def time_to_first_row(self) -> timedelta:
+        """Get the amount of time until the first row was received.
+
+        Returns:
+            timedelta: The amount of time until the first row was received (zero if the query returned no rows).
+        """
+        return timedelta(microseconds=(self._raw.get('time_to_first_row') or 0) / 1000)
+
+    def time_to_last_row(self) -> timedelta:
+        """Get the amount of time until the end of the result set was received.
+
+        Returns:
+            timedelta: The amount of time until the end of the result set was received.
+        """
+        return timedelta(microseconds=(self._raw.get('time_to_last_row') or 0) / 1000)
+
+    def bytes_received(self) -> int:
+        """Get the total number of bytes of the rows that were received.
+
+        Returns:
+            int: The total number of bytes of the rows that were received.
+        """
+        return self._raw.get('bytes_received') or 0
+
+    def deserialize_time(self) -> timedelta:
+        """Get the total amount of time spent deserializing rows.
+
+        Returns:
+            timedelta: The total amount of time spent deserializing rows.
+        """
+        return timedelta(microseconds=(self._raw.get('deserialize_time') or 0) / 1000)
+
+    def consumer_time(self) -> timedelta:
+        """Get the total amount of time the application spent between receiving a row and requesting the next row.
+
+        Returns:
+            timedelta: The total amount of time the application held rows.
+        """
+        return timedelta(microseconds=(self._raw.get('consumer_time') or 0) / 1000)
+
+    def attempts(self) -> int:
+        """Get the number of times the query was dispatched, more than 1 if the query was retried.
+
+        Returns:
+            int: The number of times the query was dispatched.
+        """
+        return self._raw.get('attempts') or 1
+
+    def __repr__(self) -> str:
+        return "QueryClientMetrics:{}".format(self._raw)
+
+
+class QueryProgress:
+    """**VOLATILE** This API is subject to change at any time.
+
+    The progress of a streaming query: the rows and bytes received so far.  The rows and bytes are counted as they are
+    received by the client, the application might not have iterated all of them yet.
+    """
+
+    def __init__(self, raw: QueryProgressCore, result_count: Optional[int] = None) -> None:
+        self._raw = raw
+        self._result_count = result_count
+
+    def rows(self) -> int:
+        """Get the number of rows received so far.
+
+        Returns:
+            int: The number of rows received so far.
+        """
+        return self._raw.get('rows') or 0
+
+    def bytes(self) -> int:
+        """Get the number of bytes of the rows received so far.
+
+        Returns:
+            int: The number of bytes of the rows received so far.
+        """
+        return self._raw.get('bytes') or 0
+
+    def elapsed(self) -> timedelta:
+        """Get the amount of time since the query was submitted (until it completed, if it has completed).
+
+        Returns:
+            timedelta: The amount of time since the query was submitted.
+        """
+        return timedelta(microseconds=(self._raw.get('elapsed_time') or 0) / 1000)
+
+    def completed(self) -> bool:
+        """Get whether the query has completed, either all rows have been received or the query failed.
+
+        Returns:
+            bool: `True` if the query has completed, `False` otherwise.
+        """
+        return self._raw.get('completed') or False
+
+    def rows_per_second(self) -> float:
+        """Get the average rate at which rows have been received.
+
+        Returns:
+            float: The average number of rows received per second.
+        """
+        elapsed = self.elapsed().total_seconds()
+        return self.rows() / elapsed if elapsed > 0 else 0.0
+
+    def bytes_per_second(self) -> float:
+        """Get the average rate at which bytes have been received.
+
+        Returns:
+            float: The average number of bytes received per second.
+        """
+        elapsed = self.elapsed().total_seconds()
+        return self.bytes() / elapsed if elapsed > 0 else 0.0
+
+    def result_count(self) -> Optional[int]:
+        """Get the total number of rows of the result set, if known.
+
+        The Columnar service reports the result count with the query's metrics, at the end of the result set.
+
+        Returns:
+            Optional[int]: The total number of rows of the result set, `None` if not known yet.
+        """
+        return self._result_count
+
+    def eta(self, total_rows: Optional[int] = None) -> Optional[timedelta]:
+        """Get the estimated amount of time until all rows have been received, based on the average rate so far.
+
+        Args:
+            total_rows (Optional[int]): The expected number of rows of the result set (e.g. from a prior
+                `SELECT COUNT(*)`).  Defaults to `None` (the result count, if known).
+
+        Returns:
+            Optional[timedelta]: The estimated amount of time until all rows have been received, `None` if the total
+            number of rows is not known or no rows have been received yet.
+        """
+        if self.completed():
+            return timedelta(0)
+        total = total_rows if total_rows is not None else self._result_count
+        rate = self.rows_per_second()
+        if total is None or rate <= 0:
+            return None
+        return timedelta(seconds=max(total - self.rows(), 0) / rate)
+
+    def __repr__(self) -> str:
+        return "QueryProgress:{}".format({**self._raw, 'result_count': self._result_count})
+
+
 class QueryMetadata:
     def __init__(self, raw: Optional[QueryMetadataCore]) -> None:
         self._raw = raw if raw is not None else {}
@@ -126,5 +300,15 @@ class QueryMetadata:
         """
         return QueryMetrics(self._raw['metrics'])
 
+    def client_metrics(self) -> QueryClientMetrics:
+        """**VOLATILE** This API is subject to change at any time.
+
+        Get the timings of the query as observed by the client (e.g. time to first row, time spent deserializing rows).
+
+        Returns:
+            :class:`.QueryClientMetrics`: A :class:`.QueryClientMetrics` instance.
+        """
+        return QueryClientMetrics(self._raw.get('client_metrics', {}))
+
     def __repr__(self) -> str:
         return "QueryMetadata:{}".format(self._raw)
@@ -21,7 +21,7 @@ from typing import (Any,
                     Optional)
 
 from couchbase_columnar.common.core.result import QueryResult as QueryResult
-from couchbase_columnar.common.query import QueryMetadata
+from couchbase_columnar.common.query import QueryMetadata, QueryProgress
 from couchbase_columnar.common.streaming import (AsyncIterator,
                                                  BlockingIterator,
                                                  StreamingExecutor)
@@ -58,6 +58,17 @@ class BlockingQueryResult(QueryResult):
         """  # noqa: E501
         return self._executor.get_metadata()
 
+    def progress(self) -> QueryProgress:
+        """**VOLATILE** This API is subject to change at any time.
+
+        The progress of the query: the rows and bytes received so far, the rate they are received at and (once all
+        rows have been received) the query's result count.
+
+        Returns:
+            :class:`~couchbase_columnar.query.QueryProgress`: An instance of :class:`~couchbase_columnar.query.QueryProgress`.
+        """  # noqa: E501
+        return self._executor.get_progress()
+
     def rows(self) -> Iterable[Any]:
         """The rows which have been returned by the query.
 
@@ -106,6 +117,17 @@ class AsyncQueryResult(QueryResult):
         """  # noqa: E501
         return self._executor.get_metadata()
 
+    def progress(self) -> QueryProgress:
+        """**VOLATILE** This API is subject to change at any time.
+
+        The progress of the query: the rows and bytes received so far, the rate they are received at and (once all
+        rows have been received) the query's result count.
+
+        Returns:
+            :class:`~couchbase_columnar.query.QueryProgress`: An instance of :class:`~couchbase_columnar.query.QueryProgress`.
+        """  # noqa: E501
+        return self._executor.get_progress()
+
     def rows(self) -> AsyncIterator:
         """The rows which have been returned by the query.
 
@@ -0,0 +1,335 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    A resumable query (see the `resume_key` query option) is executed as a keyset query: the statement is wrapped in a
+    subquery ordered by the resume key and, once the query has returned rows, only the rows after the last returned
+    row's key are selected.  For the key `(a, b)` the resumed statement is:
+
+        SELECT VALUE resumable_row FROM (<statement>) AS resumable_row
+        WHERE (resumable_row.`a` > $resume_key_0)
+           OR (resumable_row.`a` = $resume_key_0 AND resumable_row.`b` > $resume_key_1)
+        ORDER BY resumable_row.`a`, resumable_row.`b`;
+
+    A checkpoint file is a JSON object: format version, the query's digest (statement, resume key, parameters, database
+    and scope), the last returned row's key and the number of rows and bytes returned before it was written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from threading import Lock
+from time import perf_counter_ns
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional)
+
+from couchbase_columnar.common.core.query import QueryProgressCore
+from couchbase_columnar.common.deserializer import DefaultJsonDeserializer
+
+if TYPE_CHECKING:
+    from couchbase_columnar.protocol.core.request import QueryRequest
+
+CHECKPOINT_FORMAT_VERSION = 1
+# the checkpoint is written at most once per second (in nanoseconds)
+CHECKPOINT_INTERVAL = 1_000_000_000
+RESUME_ALIAS = 'resumable_row'
+RESUME_PARAMETER_PREFIX = 'resume_key_'
+
+
+def keyset_statement(statement: str, resume_key: List[str], resumed: bool = False) -> str:
+    """
+        **INTERNAL**
+
+    Returns the statement ordered by the resume key, if `resumed` is `True` only the rows after the key passed as the
+    `resume_key_<idx>` named parameters are selected.
+    """
+    fields = [f'{RESUME_ALIAS}.`{field}`' for field in resume_key]
+    stmt = statement.strip()
+    while stmt.endswith(';'):
+        stmt = stmt[:-1].rstrip()
+    # the statement might end with a line comment
+    keyset = f'SELECT VALUE {RESUME_ALIAS} FROM (\n{stmt}\n) AS {RESUME_ALIAS}'
+    if resumed:
+        terms = []
+        for idx, field in enumerate(fields):
+            conditions = [f'{fields[prev]} = ${RESUME_PARAMETER_PREFIX}{prev}' for prev in range(idx)]
+            conditions.append(f'{field} > ${RESUME_PARAMETER_PREFIX}{idx}')
+            terms.append(f'({" AND ".join(conditions)})')
+        keyset += f' WHERE {" OR ".join(terms)}'
+    return f'{keyset} ORDER BY {", ".join(fields)};'
+
+
+def _skip_quoted(statement: str, idx: int) -> int:
+    """
+        **INTERNAL**
+
+    Returns the index after the string literal or quoted identifier starting at `idx`.  A backslash escapes the next
+    character and a doubled quote is a quote.
+    """
+    quote = statement[idx]
+    idx += 1
+    while idx < len(statement):
+        if statement[idx] == '\\':
+            idx += 2
+        elif statement[idx] != quote:
+            idx += 1
+        elif statement.startswith(quote * 2, idx):
+            idx += 2
+        else:
+            return idx + 1
+    return len(statement)
+
+
+def _skip_comment(statement: str, idx: int) -> int:
+    """
+        **INTERNAL**
+
+    Returns the index after the comment starting at `idx`, or `idx` if no comment starts there.
+    """
+    if statement.startswith('--', idx):
+        end = statement.find('\n', idx)
+        return len(statement) if end == -1 else end + 1
+    if statement.startswith('/*', idx):
+        end = statement.find('*/', idx + 2)
+        return len(statement) if end == -1 else end + 2
+    return idx
+
+
+def has_top_level_limit(statement: str) -> bool:
+    """
+        **INTERNAL**
+
+    Returns whether the statement has a LIMIT or OFFSET clause outside of parentheses (i.e. not in a subquery).  A
+    resumed statement selects the rows after the resume key from the statement's result, a LIMIT or OFFSET applied to
+    the statement would be applied again to the remaining rows.  String literals, quoted identifiers and comments are
+    skipped.
+    """
+    depth = 0
+    idx = 0
+    while idx < len(statement):
+        char = statement[idx]
+        comment_end = _skip_comment(statement, idx)
+        if comment_end != idx:
+            idx = comment_end
+        elif char in ('"', "'", '`'):
+            idx = _skip_quoted(statement, idx)
+        elif char.isalpha() or char == '_':
+            start = idx
+            while idx < len(statement) and (statement[idx].isalnum() or statement[idx] in ('_', '$')):
+                idx += 1
+            # a keyword, not a field (e.g. `d.offset`)
+            keyword = start == 0 or statement[start - 1] != '.'
+            if keyword and depth == 0 and statement[start:idx].upper() in ('LIMIT', 'OFFSET'):
+                return True
+        elif char in ('(', '['):
+            depth += 1
+            idx += 1
+        elif char in (')', ']'):
+            depth = max(depth - 1, 0)
+            idx += 1
+        else:
+            idx += 1
+    return False
+
+
+class QueryResumer:
+    """
+        **INTERNAL**
+
+    Tracks the resume key of the last row a resumable query returned and rewrites the query's statement before each
+    attempt, so that a resumed attempt only selects the rows after it.
+    """
+
+    def __init__(self, request: QueryRequest, resume_key: List[str]) -> None:
+        self._request = request
+        self._resume_key = resume_key
+        self._statement = request.statement
+        options: Dict[str, Any] = dict(request.options) if request.options is not None else {}
+        self._named_parameters: Dict[str, Any] = dict(options.get('named_parameters', None) or {})
+        # the key is read from the deserialized row only if it is plain JSON, it is sent back as named parameters
+        self._json_rows = type(request.deserializer) is DefaultJsonDeserializer
+        self._lock = Lock()
+        self._last_key: Optional[List[Any]] = None
+        self._rows = 0
+        self._bytes = 0
+        self._rows_at_dispatch = 0
+        self._bytes_at_dispatch = 0
+        self._finished = False
+        self._checkpoint_path = request.checkpoint_path
+        self._next_checkpoint = 0
+        self._digest = ''
+        if self._checkpoint_path is not None:
+            self._digest = self._get_digest(options)
+            self._load_checkpoint()
+
+    @classmethod
+    def create(cls, request: QueryRequest) -> Optional[QueryResumer]:
+        if request.resume_key is None:
+            return None
+        return cls(request, request.resume_key)
+
+    @property
+    def progressed(self) -> bool:
+        """
+            **INTERNAL**
+
+        Whether the current attempt has returned rows.
+        """
+        return self._rows > self._rows_at_dispatch
+
+    def _get_digest(self, options: Dict[str, Any]) -> str:
+        query = {
+            'statement': self._statement,
+            'resume_key': self._resume_key,
+            'positional_parameters': options.get('positional_parameters', None),
+            'named_parameters': self._named_parameters,
+            'database': self._request.database_name,
+            'scope': self._request.scope_name,
+        }
+        return hashlib.sha256(json.dumps(query, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _load_checkpoint(self) -> None:
+        if self._checkpoint_path is None:
+            return
+        try:
+            with open(self._checkpoint_path, 'r') as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            # no (readable) checkpoint, the query starts from its first row
+            return
+        if (not isinstance(checkpoint, dict)
+                or checkpoint.get('version') != CHECKPOINT_FORMAT_VERSION
+                or checkpoint.get('digest') != self._digest):
+            return
+        key = checkpoint.get('key')
+        rows = checkpoint.get('rows')
+        num_bytes = checkpoint.get('bytes')
+        if not isinstance(key, list) or len(key) != len(self._resume_key):
+            return
+        self._last_key = key
+        self._rows = rows if isinstance(rows, int) and rows >= 0 else 0
+        self._bytes = num_bytes if isinstance(num_bytes, int) and num_bytes >= 0 else 0
+
+    def apply(self) -> None:
+        """
+            **INTERNAL**
+
+        Rewrites the request's statement (and named parameters) before an attempt is dispatched.
+        """
+        with self._lock:
+            self._rows_at_dispatch = self._rows
+            self._bytes_at_dispatch = self._bytes
+            last_key = self._last_key
+        self._request.statement = keyset_statement(self._statement, self._resume_key, resumed=last_key is not None)
+        if last_key is None or self._request.options is None:
+            return
+        named_parameters = dict(self._named_parameters)
+        named_parameters.update({f'{RESUME_PARAMETER_PREFIX}{idx}': value for idx, value in enumerate(last_key)})
+        self._request.options['named_parameters'] = named_parameters
+
+    def row_returned(self, row: bytes, value: Any) -> None:
+        """
+            **INTERNAL**
+
+        Records the key of a row returned to the application.
+        """
+        if not self._json_rows or not isinstance(value, dict):
+            value = json.loads(row)
+        try:
+            key = [value[field] for field in self._resume_key]
+        except (KeyError, TypeError):
+            raise ValueError(f'The rows of a resumable query must be JSON objects with the resume key fields '
+                             f'{self._resume_key}.') from None
+        checkpoint = False
+        with self._lock:
+            self._last_key = key
+            self._rows += 1
+            self._bytes += len(row)
+            if self._checkpoint_path is not None:
+                now = perf_counter_ns()
+                if now >= self._next_checkpoint:
+                    self._next_checkpoint = now + CHECKPOINT_INTERVAL
+                    checkpoint = True
+        if checkpoint:
+            self.checkpoint()
+
+    def progress(self, progress: QueryProgressCore) -> QueryProgressCore:
+        """
+            **INTERNAL**
+
+        Adds the rows and bytes returned before the current attempt was dispatched to the attempt's progress.
+        """
+        if self._rows_at_dispatch == 0:
+            return progress
+        resumed_progress = progress.copy()
+        resumed_progress['rows'] = progress.get('rows', 0) + self._rows_at_dispatch
+        resumed_progress['bytes'] = progress.get('bytes', 0) + self._bytes_at_dispatch
+        return resumed_progress
+
+    def checkpoint(self) -> None:
+        """
+            **INTERNAL**
+
+        Atomically replaces the checkpoint file, a crashed process never leaves a partially written checkpoint.  The
+        checkpoint is best effort, the query is not failed if it cannot be written.
+        """
+        if self._checkpoint_path is None:
+            return
+        with self._lock:
+            if self._finished or self._last_key is None:
+                return
+            checkpoint = {
+                'version': CHECKPOINT_FORMAT_VERSION,
+                'digest': self._digest,
+                'key': self._last_key,
+                'rows': self._rows,
+                'bytes': self._bytes,
+            }
+        import tempfile
+        try:
+            directory = os.path.dirname(os.path.abspath(self._checkpoint_path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.checkpoint-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as tmp_file:
+                    json.dump(checkpoint, tmp_file)
+                os.replace(tmp_path, self._checkpoint_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def finish(self, completed: bool) -> None:
+        """
+            **INTERNAL**
+
+        Removes the checkpoint once all rows have been returned, persists it otherwise.
+        """
+        if not completed:
+            self.checkpoint()
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        if completed and self._checkpoint_path is not None:
+            try:
+                os.unlink(self._checkpoint_path)
+            except OSError:
+                pass
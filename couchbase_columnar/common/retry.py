@@ -0,0 +1,111 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from couchbase_columnar.common.exceptions import ColumnarError, QueryError
+
+# the error codes the Columnar service reports when it is temporarily unable to execute a query
+RETRYABLE_ERROR_CODES = frozenset([23000, 23003, 23007])
+
+
+class RetryStrategy(ABC):
+    """Interface a custom retry strategy must implement
+
+    Only read-only queries (see the `read_only` query option) that failed before any of their rows were received, and
+    resumable queries (see the `resume_key` query option), are retried, the strategy decides whether the failed attempt
+    is retried and how long to wait before the next attempt.  The query's timeout covers all of its attempts.
+    """
+
+    @abstractmethod
+    def retry_after(self, attempt: int, error: Exception) -> Optional[timedelta]:
+        """Returns how long to wait before retrying a failed attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, the first attempt is 1.
+            error (Exception): The error the attempt failed with.
+
+        Returns:
+            Optional[timedelta]: The delay before the next attempt, `None` if the query should not be retried.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type) -> bool:
+        return (hasattr(subclass, 'retry_after') and
+                callable(subclass.retry_after))
+
+
+class BestEffortRetryStrategy(RetryStrategy):
+    """Retries the errors the Columnar service reports as temporary, and lost connections (e.g. a restarted node), with
+    exponential backoff and full jitter.
+
+    Args:
+        max_attempts (int, optional): The maximum number of attempts, including the first one. Defaults to 3.
+        initial_backoff (timedelta, optional): The maximum delay before the second attempt. Defaults to 100
+            milliseconds.
+        max_backoff (timedelta, optional): The maximum delay between two attempts. Defaults to 5 seconds.
+        backoff_multiplier (float, optional): The factor the maximum delay grows by after each attempt. Defaults to 2.
+        retryable_error_codes (Iterable[int], optional): The :class:`~couchbase_columnar.exceptions.QueryError` codes
+            that are retried. Defaults to `None` (23000, 23003 and 23007).
+
+    Each delay is chosen at random between 0 and the maximum delay, so that clients that failed at the same time do not
+    retry at the same time.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 initial_backoff: timedelta = timedelta(milliseconds=100),
+                 max_backoff: timedelta = timedelta(seconds=5),
+                 backoff_multiplier: float = 2.0,
+                 retryable_error_codes: Optional[Iterable[int]] = None) -> None:
+        if not isinstance(max_attempts, int) or isinstance(max_attempts, bool) or max_attempts < 1:
+            raise ValueError('The max_attempts must be a positive integer.')
+        if not isinstance(initial_backoff, timedelta) or initial_backoff < timedelta(0):
+            raise ValueError('The initial_backoff must be a non-negative timedelta.')
+        if not isinstance(max_backoff, timedelta) or max_backoff < initial_backoff:
+            raise ValueError('The max_backoff must be a timedelta of at least the initial_backoff.')
+        if not isinstance(backoff_multiplier, (int, float)) or backoff_multiplier < 1:
+            raise ValueError('The backoff_multiplier must be at least 1.')
+        self._max_attempts = max_attempts
+        self._initial_backoff = initial_backoff.total_seconds()
+        self._max_backoff = max_backoff.total_seconds()
+        self._backoff_multiplier = float(backoff_multiplier)
+        if retryable_error_codes is None:
+            self._retryable_error_codes = RETRYABLE_ERROR_CODES
+        else:
+            self._retryable_error_codes = frozenset(retryable_error_codes)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Returns `True` if the error is temporary.
+        """
+        if isinstance(error, QueryError):
+            return error.code in self._retryable_error_codes
+        # the connection was lost, the Columnar service did not report an error
+        return type(error) is ColumnarError
+
+    def retry_after(self, attempt: int, error: Exception) -> Optional[timedelta]:
+        if attempt >= self._max_attempts or not self.is_retryable(error):
+            return None
+        # only imported once a query is retried, importing the SDK should not import random
+        import random
+
+        # the exponent is bounded, the maximum delay is reached long before
+        backoff = min(self._initial_backoff * self._backoff_multiplier ** min(attempt - 1, 64), self._max_backoff)
+        return timedelta(seconds=random.uniform(0, backoff))
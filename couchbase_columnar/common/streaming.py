@@ -15,13 +15,18 @@
 
 from __future__ import annotations
 
+import json
 import sys
 from abc import ABC, abstractmethod
-from asyncio import Future
+from datetime import timedelta
 from enum import IntEnum
-from threading import Event
-from typing import (Any,
+from threading import Event, Lock
+from time import perf_counter_ns, time_ns
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
                     Coroutine,
+                    Dict,
                     List,
                     Optional,
                     Union)
@@ -33,8 +38,44 @@ else:
     from collections.abc import AsyncIterator as PyAsyncIterator
     from collections.abc import Iterator
 
-from couchbase_columnar.common.exceptions import ColumnarError, InternalSDKError
-from couchbase_columnar.common.query import QueryMetadata
+from couchbase_columnar.common.core.query import QueryMetadataCore
+from couchbase_columnar.common.deserializer import Deserializer
+from couchbase_columnar.common.exceptions import (ColumnarError,
+                                                  InternalSDKError,
+                                                  QueryOperationCanceledError,
+                                                  TimeoutError)
+from couchbase_columnar.common.query import QueryMetadata, QueryProgress
+from couchbase_columnar.common.retry import RetryStrategy
+from couchbase_columnar.common.tracing import (RequestSpan,
+                                               RequestTracer,
+                                               normalize_statement,
+                                               statement_fingerprint)
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from logging import Logger
+
+    from couchbase_columnar.protocol.core.request import QueryRequest
+    from couchbase_columnar.protocol.core.statistics import _StatementStatisticsRegistry
+
+SLOW_QUERY_LOGGER_NAME = 'couchbase_columnar.slow_query'
+_SLOW_QUERY_LOGGER: Optional[Logger] = None
+_WARNING = 30  # logging.WARNING, without importing logging
+# the minimum timeout (in microseconds) of a retried attempt, a retry with less time remaining would time out anyway
+MIN_RETRY_TIMEOUT = 1000
+
+
+def _slow_query_logger() -> Logger:
+    """
+        **INTERNAL**
+
+    Returns the slow query logger, logging is only imported once a query is slow.
+    """
+    global _SLOW_QUERY_LOGGER
+    if _SLOW_QUERY_LOGGER is None:
+        import logging
+        _SLOW_QUERY_LOGGER = logging.getLogger(SLOW_QUERY_LOGGER_NAME)
+    return _SLOW_QUERY_LOGGER
 
 
 class StreamingState(IntEnum):
@@ -52,6 +93,392 @@ class StreamingState(IntEnum):
         return state == StreamingState.Started
 
 
+def _as_microseconds(duration: timedelta) -> int:
+    return duration // timedelta(microseconds=1)
+
+
+class ClientMetricsRecorder:
+    """
+        **INTERNAL**
+
+    Records the client side timings of a query that happen in Python (deserializing rows and the time the application
+    holds a row before requesting the next one) and the number of attempts if the query is retried.  The remaining
+    timings are recorded by the bindings.
+    """
+
+    __slots__ = ('_deserialize_ns', '_consumer_ns', '_row_returned_ns', '_attempts')
+
+    def __init__(self) -> None:
+        self._deserialize_ns = 0
+        self._consumer_ns = 0
+        self._row_returned_ns: Optional[int] = None
+        self._attempts = 1
+
+    def retrying(self) -> None:
+        self._attempts += 1
+
+    def row_requested(self) -> None:
+        if self._row_returned_ns is not None:
+            self._consumer_ns += perf_counter_ns() - self._row_returned_ns
+            self._row_returned_ns = None
+
+    def deserialize(self, deserializer: Deserializer, row: bytes) -> Any:
+        start = perf_counter_ns()
+        value = deserializer.deserialize(row)
+        self._row_returned_ns = perf_counter_ns()
+        self._deserialize_ns += self._row_returned_ns - start
+        return value
+
+    @property
+    def deserialize_ns(self) -> int:
+        return self._deserialize_ns
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    def add_to_metadata(self, metadata: QueryMetadataCore) -> None:
+        client_metrics = metadata.setdefault('client_metrics', {})
+        client_metrics['deserialize_time'] = self._deserialize_ns
+        client_metrics['consumer_time'] = self._consumer_ns
+        client_metrics['attempts'] = self._attempts
+
+
+class ProgressReporter:
+    """
+        **INTERNAL**
+
+    Calls a query's progress callback while the rows are iterated, at most once per interval and once more when the
+    query has completed.
+    """
+
+    __slots__ = ('_callback', '_interval_ns', '_next_due_ns', '_completed')
+
+    def __init__(self, callback: Callable[[QueryProgress], None], interval: int) -> None:
+        self._callback = callback
+        # the interval is in microseconds
+        self._interval_ns = interval * 1000
+        self._next_due_ns = perf_counter_ns() + self._interval_ns
+        self._completed = False
+
+    @classmethod
+    def create(cls, request: QueryRequest) -> Optional[ProgressReporter]:
+        if request.progress_callback is None:
+            return None
+        return cls(request.progress_callback, request.progress_interval or 0)
+
+    def row_received(self, progress: Callable[[], QueryProgress]) -> None:
+        now = perf_counter_ns()
+        if now < self._next_due_ns:
+            return
+        self._next_due_ns = now + self._interval_ns
+        self._callback(progress())
+
+    def completed(self, progress: Callable[[], QueryProgress]) -> None:
+        if self._completed:
+            return
+        self._completed = True
+        self._callback(progress())
+
+
+class QueryRetryHandler:
+    """
+        **INTERNAL**
+
+    Decides whether a failed attempt of a read-only query is retried, see the `retry_strategy` query option.  The
+    attempts share the query's timeout: the deadline is set when the query is first dispatched and each retry's timeout
+    is the time remaining once its backoff has elapsed.  Only attempts that failed before any rows were received are
+    retried, unless the query is resumable (see the `resume_key` query option).
+    """
+
+    __slots__ = ('_strategy', '_request', '_deadline_ns', '_attempt')
+
+    def __init__(self, strategy: RetryStrategy, request: QueryRequest, timeout: int) -> None:
+        self._strategy = strategy
+        self._request = request
+        # the timeout is in microseconds
+        self._deadline_ns = perf_counter_ns() + timeout * 1000
+        self._attempt = 1
+
+    @classmethod
+    def create(cls, request: QueryRequest) -> Optional[QueryRetryHandler]:
+        if request.retry_strategy is None or request.options is None:
+            return None
+        return cls(request.retry_strategy, request, request.options.get('timeout', None) or 0)
+
+    def reset(self) -> None:
+        """
+            **INTERNAL**
+
+        A resumed query returned rows since it was last retried, the strategy is asked as if the next failure was the
+        query's first.
+        """
+        self._attempt = 1
+
+    def retry_after(self, error: Exception) -> Optional[float]:
+        """
+            **INTERNAL**
+
+        Returns the delay (in seconds) before the next attempt, `None` if the failed attempt is not retried.  The
+        request's timeout is set to the time remaining once the delay has elapsed.
+        """
+        # the attempt's timeout is the time remaining, a timed out attempt has exhausted the query's deadline
+        if isinstance(error, (TimeoutError, QueryOperationCanceledError)):
+            return None
+        delay = self._strategy.retry_after(self._attempt, error)
+        if delay is None:
+            return None
+        delay_ns = max(_as_microseconds(delay), 0) * 1000
+        remaining = (self._deadline_ns - perf_counter_ns() - delay_ns) // 1000
+        if remaining < MIN_RETRY_TIMEOUT:
+            return None
+        if self._request.options is not None:
+            self._request.options['timeout'] = remaining
+        self._attempt += 1
+        return delay_ns / 1e9
+
+
+class QueryInstrumentation:
+    """
+        **INTERNAL**
+
+    Observes a query's lifecycle to record its tracing spans (if the cluster has a tracer), its statement statistics
+    (if the cluster records statement statistics) and to log it to the slow query logger (if it has a slow query
+    threshold).
+
+    The `columnar.query` span covers the whole query, its children cover building the request, dispatching it to the
+    bindings, waiting for the response headers, streaming the rows and deserializing the rows.  Rows are deserialized
+    one at a time while streaming, so the `columnar.deserialize` span is recorded once the query completes and its
+    duration is the total time spent deserializing rows.
+    """
+
+    def __init__(self,
+                 request: QueryRequest,
+                 tracer: Optional[RequestTracer] = None,
+                 statistics: Optional[_StatementStatisticsRegistry] = None,
+                 request_start: Optional[int] = None) -> None:
+        self._tracer = tracer
+        self._statistics = statistics
+        self._request = request
+        self._statement = request.statement
+        self._fingerprint = statement_fingerprint(request.statement)
+        self._lock = Lock()
+        self._rows = 0
+        self._bytes = 0
+        self._finished = False
+        self._dispatch_start: Optional[int] = None
+        self._span: Optional[RequestSpan] = None
+        self._stage: Optional[RequestSpan] = None
+        self._streaming_start: Optional[int] = None
+        if tracer is not None:
+            self._start_query_span(tracer, request, request_start if request_start is not None else time_ns())
+
+    @classmethod
+    def create(cls,
+               request: QueryRequest,
+               tracer: Optional[RequestTracer] = None,
+               statistics: Optional[_StatementStatisticsRegistry] = None,
+               request_start: Optional[int] = None) -> Optional[QueryInstrumentation]:
+        """
+            **INTERNAL**
+
+        Returns `None` if the cluster neither traces queries, records statement statistics nor logs slow queries,
+        queries are then not instrumented at all.
+        """
+        if tracer is None and statistics is None and request.slow_query_threshold is None:
+            return None
+        return cls(request, tracer=tracer, statistics=statistics, request_start=request_start)
+
+    def _start_query_span(self, tracer: RequestTracer, request: QueryRequest, start: int) -> None:
+        """
+            **INTERNAL**
+        """
+        self._span = tracer.start_span('columnar.query', parent=request.parent_span, start_time=start)
+        self._span.set_attribute('db.system', 'couchbase_columnar')
+        self._span.set_attribute('db.operation', 'query')
+        self._span.set_attribute('db.columnar.statement_fingerprint', self._fingerprint)
+        if request.database_name is not None:
+            self._span.set_attribute('db.columnar.database', request.database_name)
+        if request.scope_name is not None:
+            self._span.set_attribute('db.columnar.scope', request.scope_name)
+        if request.lane is not None:
+            self._span.set_attribute('db.columnar.lane', request.lane)
+        tracer.start_span('columnar.request_encoding', parent=self._span, start_time=start).end()
+        self._propagate_context(self._span, request)
+
+    @staticmethod
+    def _propagate_context(span: RequestSpan, request: QueryRequest) -> None:
+        """
+            **INTERNAL**
+
+        The Columnar service records a request's client context ID, use the span's context so that the server side
+        request can be found from the trace.  A client context ID provided via the raw query option takes precedence.
+        """
+        traceparent = span.propagation_context()
+        if traceparent is None or request.options is None:
+            return
+        raw = request.options.get('raw') or {}
+        if 'client_context_id' not in raw:
+            request.options['raw'] = {**raw, 'client_context_id': traceparent}
+
+    def _start_stage(self, name: str) -> None:
+        # the query might have been canceled by another thread
+        if self._tracer is None or self._finished:
+            return
+        if self._stage is not None:
+            self._stage.end()
+        self._stage = self._tracer.start_span(name, parent=self._span)
+
+    def dispatch_started(self) -> None:
+        self._dispatch_start = perf_counter_ns()
+        self._start_stage('columnar.dispatch')
+
+    def dispatch_completed(self) -> None:
+        self._start_stage('columnar.wait_for_headers')
+
+    def headers_received(self) -> None:
+        self._streaming_start = time_ns()
+        self._start_stage('columnar.streaming')
+
+    def row_received(self, row: bytes) -> None:
+        self._rows += 1
+        self._bytes += len(row)
+
+    @property
+    def logs_slow_queries(self) -> bool:
+        """
+            **INTERNAL**
+        """
+        return self._request.slow_query_threshold is not None
+
+    def finish(self,
+               error: Optional[BaseException] = None,
+               outcome: Optional[str] = None,
+               deserialize_ns: int = 0,
+               metadata: Optional[Callable[[], Optional[QueryMetadata]]] = None) -> None:
+        """
+            **INTERNAL**
+
+        Ends the query's spans, records its statement statistics and logs it if it is slow.  The outcome is derived
+        from the error if not provided.  The metadata callable is only called if the query is logged as slow.
+        """
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        if outcome is None:
+            if error is None:
+                outcome = 'success'
+            elif isinstance(error, TimeoutError):
+                outcome = 'timeout'
+            elif isinstance(error, QueryOperationCanceledError):
+                outcome = 'cancel'
+            else:
+                outcome = 'error'
+        latency = (perf_counter_ns() - self._dispatch_start) // 1000 if self._dispatch_start is not None else 0
+        if self._statistics is not None and outcome != 'abandoned':
+            self._statistics.record(self._fingerprint,
+                                    self._statement,
+                                    outcome,
+                                    latency,
+                                    self._rows,
+                                    self._bytes)
+        threshold = self._request.slow_query_threshold
+        if (threshold is not None
+                and outcome != 'abandoned'
+                and latency >= threshold
+                and _slow_query_logger().isEnabledFor(_WARNING)):
+            query_metadata = metadata() if metadata is not None and error is None else None
+            record = self._slow_query_record(error, outcome, latency, query_metadata)
+            _slow_query_logger().warning('Slow query: %s', json.dumps(record), extra={'slow_query': record})
+        if self._span is not None:
+            self._end_spans(error, outcome, deserialize_ns)
+
+    def _slow_query_record(self,
+                           error: Optional[BaseException],
+                           outcome: str,
+                           latency: int,
+                           metadata: Optional[QueryMetadata]) -> Dict[str, Any]:
+        """
+            **INTERNAL**
+
+        Builds the structured record of a slow query.  The statement is normalized and the parameter values are
+        redacted so that the record does not contain user data.  Durations are in microseconds.
+        """
+        request = self._request
+        options = request.options or {}
+        record: Dict[str, Any] = {
+            'statement_fingerprint': self._fingerprint,
+            'statement': normalize_statement(self._statement),
+            'outcome': outcome,
+            'duration_us': latency,
+            'threshold_us': request.slow_query_threshold,
+            'rows': self._rows,
+            'bytes': self._bytes,
+        }
+        if metadata is not None:
+            record['request_id'] = metadata.request_id()
+        client_context_id = (options.get('raw') or {}).get('client_context_id', None)
+        if client_context_id is not None:
+            record['client_context_id'] = client_context_id
+        for key, value in (('database', request.database_name),
+                           ('scope', request.scope_name),
+                           ('lane', request.lane)):
+            if value is not None:
+                record[key] = value
+        positional_parameters = options.get('positional_parameters', None)
+        if positional_parameters:
+            record['positional_parameters'] = ['<redacted>' for _ in positional_parameters]
+        named_parameters = options.get('named_parameters', None)
+        if named_parameters:
+            record['named_parameters'] = {name: '<redacted>' for name in named_parameters}
+        if error is not None:
+            record['error'] = type(error).__name__
+        if metadata is not None:
+            client_metrics = metadata.client_metrics()
+            record['client_metrics'] = {
+                'dispatch_time_us': _as_microseconds(client_metrics.dispatch_time()),
+                'time_to_headers_us': _as_microseconds(client_metrics.time_to_headers()),
+                'time_to_first_row_us': _as_microseconds(client_metrics.time_to_first_row()),
+                'time_to_last_row_us': _as_microseconds(client_metrics.time_to_last_row()),
+                'deserialize_time_us': _as_microseconds(client_metrics.deserialize_time()),
+                'consumer_time_us': _as_microseconds(client_metrics.consumer_time()),
+                'bytes_received': client_metrics.bytes_received(),
+                'attempts': client_metrics.attempts(),
+            }
+            metrics = metadata.metrics()
+            record['metrics'] = {
+                'elapsed_time_us': _as_microseconds(metrics.elapsed_time()),
+                'execution_time_us': _as_microseconds(metrics.execution_time()),
+                'result_count': metrics.result_count(),
+                'result_size': metrics.result_size(),
+                'processed_objects': metrics.processed_objects(),
+            }
+        return record
+
+    def _end_spans(self, error: Optional[BaseException], outcome: str, deserialize_ns: int) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._tracer is None or self._span is None:
+            return
+        if self._stage is not None:
+            if error is not None:
+                self._stage.set_error(error)
+            self._stage.end()
+        if self._streaming_start is not None:
+            deserialize_span = self._tracer.start_span('columnar.deserialize',
+                                                       parent=self._span,
+                                                       start_time=self._streaming_start)
+            deserialize_span.end(self._streaming_start + deserialize_ns)
+        self._span.set_attribute('db.columnar.rows', self._rows)
+        self._span.set_attribute('db.columnar.bytes', self._bytes)
+        self._span.set_attribute('db.columnar.outcome', outcome)
+        if error is not None:
+            self._span.set_error(error)
+        self._span.end()
+
+
 class StreamingExecutor(ABC):
 
     @property
@@ -94,6 +521,10 @@ class StreamingExecutor(ABC):
     def get_next_row(self) -> Union[Coroutine[Any, Any, Any], Any]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_progress(self) -> QueryProgress:
+        raise NotImplementedError
+
 
 class BlockingIterator(Iterator[Any]):
     def __init__(self, executor: StreamingExecutor) -> None:
@@ -0,0 +1,286 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from threading import Lock
+from time import time_ns
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Union)
+
+from couchbase_columnar.common.exceptions import FeatureUnavailableError
+
+SpanAttributeValue = Union[str, int, float, bool]
+
+
+class RequestSpan(ABC):
+    """Interface a span created by a :class:`.RequestTracer` must implement
+    """
+
+    @abstractmethod
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def end(self, end_time: Optional[int] = None) -> None:
+        """Ends the span.
+
+        Args:
+            end_time (Optional[int]): The end time of the span, in nanoseconds since the epoch. Defaults to `None`
+                (now).
+        """
+        raise NotImplementedError
+
+    def set_error(self, error: BaseException) -> None:
+        """Marks the span as failed.
+        """
+        self.set_attribute('error.type', type(error).__name__)
+
+    def propagation_context(self) -> Optional[str]:
+        """Returns the context to propagate to the Columnar service (a W3C `traceparent`), or `None` to not propagate
+        the span's context.
+        """
+        return None
+
+
+class RequestTracer(ABC):
+    """Interface a custom tracer must implement
+    """
+
+    @abstractmethod
+    def start_span(self,
+                   name: str,
+                   parent: Optional[RequestSpan] = None,
+                   start_time: Optional[int] = None) -> RequestSpan:
+        """Starts a span.
+
+        Args:
+            name (str): The name of the span.
+            parent (Optional[RequestSpan]): The parent of the span. Defaults to `None` (the tracer's current span,
+                if any).
+            start_time (Optional[int]): The start time of the span, in nanoseconds since the epoch. Defaults to
+                `None` (now).
+        """
+        raise NotImplementedError
+
+
+class NoOpSpan(RequestSpan):
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        pass
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        pass
+
+    def set_error(self, error: BaseException) -> None:
+        pass
+
+
+class NoOpTracer(RequestTracer):
+    """The default tracer, queries are not traced.
+    """
+
+    def start_span(self,
+                   name: str,
+                   parent: Optional[RequestSpan] = None,
+                   start_time: Optional[int] = None) -> RequestSpan:
+        return NoOpSpan()
+
+
+class InMemorySpan(RequestSpan):
+    """A span recorded by the :class:`.InMemoryTracer`.
+    """
+
+    def __init__(self,
+                 tracer: InMemoryTracer,
+                 name: str,
+                 parent: Optional[InMemorySpan],
+                 start_time: int) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.start_time = start_time
+        self.end_time: Optional[int] = None
+        self.attributes: Dict[str, SpanAttributeValue] = {}
+        self.error: Optional[BaseException] = None
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        self.attributes[key] = value
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        if self.end_time is not None:
+            return
+        self.end_time = end_time if end_time is not None else time_ns()
+        self._tracer._span_ended(self)
+
+    def set_error(self, error: BaseException) -> None:
+        super().set_error(error)
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f'InMemorySpan(name={self.name!r}, attributes={self.attributes})'
+
+
+class InMemoryTracer(RequestTracer):
+    """A tracer that keeps the spans it records in memory, useful for testing.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._finished: List[InMemorySpan] = []
+
+    def start_span(self,
+                   name: str,
+                   parent: Optional[RequestSpan] = None,
+                   start_time: Optional[int] = None) -> InMemorySpan:
+        return InMemorySpan(self,
+                            name,
+                            parent if isinstance(parent, InMemorySpan) else None,
+                            start_time if start_time is not None else time_ns())
+
+    def _span_ended(self, span: InMemorySpan) -> None:
+        with self._lock:
+            self._finished.append(span)
+
+    def finished_spans(self, name: Optional[str] = None) -> List[InMemorySpan]:
+        """Returns the spans that have ended (optionally only the spans with the provided name), in the order they
+        ended.
+        """
+        with self._lock:
+            return [s for s in self._finished if name is None or s.name == name]
+
+    def clear(self) -> None:
+        """Removes all the recorded spans.
+        """
+        with self._lock:
+            self._finished.clear()
+
+
+class OpenTelemetrySpan(RequestSpan):
+    """A span recorded by the :class:`.OpenTelemetryTracer`.
+    """
+
+    def __init__(self, span: Any) -> None:
+        self._span = span
+
+    @property
+    def span(self) -> Any:
+        """The wrapped `opentelemetry.trace.Span`.
+        """
+        return self._span
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        self._span.set_attribute(key, value)
+
+    def end(self, end_time: Optional[int] = None) -> None:
+        self._span.end(end_time=end_time)
+
+    def set_error(self, error: BaseException) -> None:
+        from opentelemetry.trace import Status, StatusCode
+        super().set_error(error)
+        self._span.record_exception(error)
+        self._span.set_status(Status(StatusCode.ERROR, str(error)))
+
+    def propagation_context(self) -> Optional[str]:
+        ctx = self._span.get_span_context()
+        if not ctx.is_valid:
+            return None
+        return f'00-{ctx.trace_id:032x}-{ctx.span_id:016x}-{int(ctx.trace_flags):02x}'
+
+
+class OpenTelemetryTracer(RequestTracer):
+    """A tracer that records spans with OpenTelemetry.  Requires the `opentelemetry-api` package.
+
+    Args:
+        tracer (Optional[`opentelemetry.trace.Tracer`]): The OpenTelemetry tracer to record spans with. Defaults to
+            `None` (the tracer of the global tracer provider).
+
+    Raises:
+        :class:`~couchbase_columnar.exceptions.FeatureUnavailableError`: If the `opentelemetry-api` package is not
+            installed.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise FeatureUnavailableError(('The OpenTelemetry tracer requires the opentelemetry-api package. '
+                                           'Install it with: pip install couchbase-columnar[otel]')) from None
+        self._trace = trace
+        self._tracer = tracer if tracer is not None else trace.get_tracer('couchbase_columnar')
+
+    def start_span(self,
+                   name: str,
+                   parent: Optional[RequestSpan] = None,
+                   start_time: Optional[int] = None) -> OpenTelemetrySpan:
+        # w/o an explicit parent, the span is a child of the current OpenTelemetry span (if any)
+        context = self._trace.set_span_in_context(parent.span) if isinstance(parent, OpenTelemetrySpan) else None
+        span = self._tracer.start_span(name,
+                                       context=context,
+                                       kind=self._trace.SpanKind.CLIENT,
+                                       start_time=start_time)
+        return OpenTelemetrySpan(span)
+
+
+_STATEMENT_TOKENS = re.compile(r"""
+    (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")
+    | (?P<identifier>`(?:[^`]|``)*`)
+    | (?P<number>(?<![\w$])\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    """, re.VERBOSE | re.DOTALL)
+_LITERAL_LIST = re.compile(r'\?(?:\s*,\s*\?)+')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _replace_statement_token(match: re.Match[str]) -> str:
+    if match.lastgroup == 'comment':
+        return ' '
+    if match.lastgroup == 'identifier':
+        return match.group()
+    return '?'
+
+
+def normalize_statement(statement: str) -> str:
+    """Normalizes a SQL++ statement so that statements that only differ by their literal values, comments or
+    whitespace are the same.
+
+    Args:
+        statement (str): The statement to normalize.
+
+    Returns:
+        str: The normalized statement, literal values are replaced with `?`.
+    """
+    normalized = _STATEMENT_TOKENS.sub(_replace_statement_token, statement)
+    normalized = _LITERAL_LIST.sub('?', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip().rstrip(';').rstrip()
+
+
+def statement_fingerprint(statement: str) -> str:
+    """Returns a fingerprint of a SQL++ statement.  Statements that only differ by their literal values, comments or
+    whitespace have the same fingerprint (see :func:`.normalize_statement`).
+
+    Args:
+        statement (str): The statement to fingerprint.
+
+    Returns:
+        str: The fingerprint of the statement (16 hexadecimal characters).
+    """
+    return hashlib.sha256(normalize_statement(statement).encode('utf-8')).hexdigest()[:16]
@@ -14,8 +14,13 @@
 #  limitations under the License.
 
 from couchbase_columnar.common.enums import IpProtocol as IpProtocol  # noqa: F401
+from couchbase_columnar.common.options import AdaptiveConcurrencyOptions as AdaptiveConcurrencyOptions  # noqa: F401
+from couchbase_columnar.common.options import (  # noqa: F401
+    AdaptiveConcurrencyOptionsKwargs as AdaptiveConcurrencyOptionsKwargs)
 from couchbase_columnar.common.options import ClusterOptions as ClusterOptions  # noqa: F401
 from couchbase_columnar.common.options import ClusterOptionsKwargs as ClusterOptionsKwargs  # noqa: F401
+from couchbase_columnar.common.options import ExecutionLaneOptions as ExecutionLaneOptions  # noqa: F401
+from couchbase_columnar.common.options import ExecutionLaneOptionsKwargs as ExecutionLaneOptionsKwargs  # noqa: F401
 from couchbase_columnar.common.options import QueryOptions as QueryOptions  # noqa: F401
 from couchbase_columnar.common.options import QueryOptionsKwargs as QueryOptionsKwargs  # noqa: F401
 from couchbase_columnar.common.options import SecurityOptions as SecurityOptions  # noqa: F401
@@ -13,35 +13,64 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from __future__ import annotations
+
 import os
 import sys
-from functools import partial, partialmethod
-from typing import (Dict,
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
                     Optional,
                     Union)
 
-try:
-    # Importing the ssl package allows us to utilize some Python voodoo to find OpenSSL.
-    # This is particularly helpful on M1 macs (PYCBC-1386).
-    import ssl  # noqa: F401 # nopep8 # isort:skip # noqa: E402
-    import couchbase_columnar.protocol.pycbcc_core  # noqa: F401 # nopep8 # isort:skip # noqa: E402
-except ImportError:
+if TYPE_CHECKING:
+    from logging import Logger
+
+    from couchbase_columnar.common.metrics import CoreStats
+
+
+def _add_openssl_dll_directory() -> None:
+    """**INTERNAL**"""
     # should only need to do this on Windows w/ Python >= 3.8 due to the changes made for how DLLs are resolved
-    if sys.platform.startswith('win32') and (3, 8) <= sys.version_info:
-        open_ssl_dir = os.getenv('PYCBCC_OPENSSL_DIR')
-        # if not set by environment, try to use libcrypto and libssl that comes w/ Windows Python install
-        if not open_ssl_dir:
-            for p in sys.path:
-                if os.path.split(p)[-1] == 'DLLs':
-                    open_ssl_dir = p
-                    break
-
-        if open_ssl_dir:
-            os.add_dll_directory(open_ssl_dir)
-        else:
-            print(('PYCBCC: Caught import error. '
-                   'Most likely due to not finding OpenSSL libraries. '
-                   'Set PYCBCC_OPENSSL_DIR to location where OpenSSL libraries can be found.'))
+    if not sys.platform.startswith('win32') or sys.version_info < (3, 8):
+        return
+    open_ssl_dir = os.getenv('PYCBCC_OPENSSL_DIR')
+    # if not set by environment, try to use libcrypto and libssl that comes w/ Windows Python install
+    if not open_ssl_dir:
+        for p in sys.path:
+            if os.path.split(p)[-1] == 'DLLs':
+                open_ssl_dir = p
+                break
+
+    if open_ssl_dir:
+        os.add_dll_directory(open_ssl_dir)
+    else:
+        print(('PYCBCC: Caught import error. '
+               'Most likely due to not finding OpenSSL libraries. '
+               'Set PYCBCC_OPENSSL_DIR to location where OpenSSL libraries can be found.'))
+
+
+def _load_ssl() -> None:
+    """**INTERNAL**
+
+    Loads the native module, importing ssl first where it is needed to find OpenSSL.
+    """
+    try:
+        if sys.platform == 'darwin':
+            # Importing the ssl package allows us to utilize some Python voodoo to find OpenSSL.
+            # This is particularly helpful on M1 macs (PYCBC-1386).
+            import ssl  # noqa: F401 # isort:skip
+        import couchbase_columnar.protocol.pycbcc_core  # noqa: F401 # isort:skip
+    except ImportError:
+        # importing ssl is slow, so elsewhere it is only used as a fallback when OpenSSL cannot be found otherwise
+        try:
+            import ssl  # noqa: F401 # isort:skip
+            import couchbase_columnar.protocol.pycbcc_core  # noqa: F401 # isort:skip
+        except ImportError:
+            _add_openssl_dll_directory()
+
+
+_load_ssl()
 
 try:
     from couchbase_columnar._version import __version__
@@ -58,18 +87,36 @@ except Exception:  # nosec
     pass
 
 """ Add support for logging, adding a TRACE level to logging """
-import json  # nopep8 # isort:skip # noqa: E402
+# registering the level is cheap, applications rely on logging.TRACE and Logger.trace once the SDK has been imported
 import logging  # nopep8 # isort:skip # noqa: E402
+from functools import partial, partialmethod  # nopep8 # isort:skip # noqa: E402
 
 from couchbase_columnar.protocol.pycbcc_core import CXXCBC_METADATA, pycbcc_logger  # nopep8 # isort:skip # noqa: E402
 
 _PYCBCC_LOGGER = pycbcc_logger()
-_CXXCBC_METADATA_JSON = json.loads(CXXCBC_METADATA)
+_CXXCBC_METADATA_CACHE: Optional[Dict[str, str]] = None
 logging.TRACE = 5  # type: ignore
 logging.addLevelName(logging.TRACE, 'TRACE')  # type: ignore
 logging.Logger.trace = partialmethod(logging.Logger.log, logging.TRACE)  # type: ignore
 logging.trace = partial(logging.log, logging.TRACE)  # type: ignore
 
+
+def _cxxcbc_metadata() -> Dict[str, str]:
+    """**INTERNAL**"""
+    global _CXXCBC_METADATA_CACHE
+    if _CXXCBC_METADATA_CACHE is None:
+        import json
+        _CXXCBC_METADATA_CACHE = json.loads(CXXCBC_METADATA)
+    return _CXXCBC_METADATA_CACHE
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: the metadata is only parsed once it is used
+    if name == '_CXXCBC_METADATA_JSON':
+        return _cxxcbc_metadata()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 """
 
 pycbc teardown methods
@@ -77,12 +124,15 @@ pycbc teardown methods
 """
 import atexit  # nopep8 # isort:skip # noqa: E402
 
+_LOGGING_SINK_FLUSH_TIMEOUT_MS = 1000
+
 
 def _pycbcc_teardown(**kwargs: object) -> None:
     """**INTERNAL**"""
     global _PYCBCC_LOGGER
     if _PYCBCC_LOGGER:
-        # TODO:  see about synchronizing the logger's shutdown here
+        # hand any queued log messages to Python logging prior to logging's shutdown (atexit handlers run LIFO)
+        _PYCBCC_LOGGER.flush_logging_sink(timeout=_LOGGING_SINK_FLUSH_TIMEOUT_MS)
         _PYCBCC_LOGGER = None  # type: ignore
 
 
@@ -101,9 +151,13 @@ _METADATA_KEYS = ['openssl_default_cert_dir',
 
 
 def get_metadata(as_str: Optional[bool] = False, detailed: Optional[bool] = False) -> Union[Dict[str, str], str]:
-    metadata = _CXXCBC_METADATA_JSON if detailed is True else {
-        k: v for k, v in _CXXCBC_METADATA_JSON.items() if k in _METADATA_KEYS}
-    return json.dumps(metadata) if as_str is True else metadata
+    metadata_json = _cxxcbc_metadata()
+    metadata = metadata_json if detailed is True else {
+        k: v for k, v in metadata_json.items() if k in _METADATA_KEYS}
+    if as_str is True:
+        import json
+        return json.dumps(metadata)
+    return metadata
 
 
 """
@@ -114,7 +168,6 @@ Logging methods
 
 
 def configure_console_logger() -> None:
-    import os
     log_level = os.getenv('PYCBCC_LOG_LEVEL', None)
     if log_level:
         _PYCBCC_LOGGER.create_console_logger(log_level.lower())
@@ -124,12 +177,44 @@ def configure_console_logger() -> None:
 
 
 def configure_logging(name: str,
-                      level: Optional[int] = logging.INFO,
-                      parent_logger: Optional[logging.Logger] = None) -> None:
+                      level: Optional[int] = None,
+                      parent_logger: Optional[Logger] = None,
+                      max_queue_size: Optional[int] = None,
+                      rate_limit: Optional[int] = None) -> None:
+    """
+    Routes the underlying couchbase++ library's log messages to the Python logger with the provided name.
+
+    Messages are filtered against the Python logger's effective level prior to being queued and are handed to the
+    Python logger, in batches, on a dedicated thread so that logging does not stall the SDK's I/O threads.
+
+    Args:
+        name (str): The name of the Python logger.
+        level (Optional[int]): The log level of the underlying couchbase++ library. Defaults to `logging.INFO`.
+        parent_logger (Optional[logging.Logger]): If provided, the logger is created as a child of the parent logger.
+        max_queue_size (Optional[int]): **VOLATILE** The maximum number of log messages waiting to be handed to the
+            Python logger. Messages are dropped (and the number dropped is logged) when the queue is full. Defaults to
+            `None` (10000).
+        rate_limit (Optional[int]): **VOLATILE** The maximum number of log messages per second logged from the same
+            source location. Suppressed messages are summarized once the rate limit window expires. Defaults to
+            `None` (no rate limit).
+
+    Raises:
+        `RuntimeError`: If a logger has already been configured.
+        `ValueError`: If max_queue_size or rate_limit is negative.
+    """
+    sink_kwargs: Dict[str, int] = {}
+    for key, val in (('max_queue_size', max_queue_size), ('rate_limit', rate_limit)):
+        if val is None:
+            continue
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(f'Expected {key} to be a non-negative int, instead got {val}.')
+        sink_kwargs[key] = val
+    if level is None:
+        level = logging.INFO
     if parent_logger:
         name = f'{parent_logger.name}.{name}'
     logger = logging.getLogger(name)
-    _PYCBCC_LOGGER.configure_logging_sink(logger, level)
+    _PYCBCC_LOGGER.configure_logging_sink(logger, level, **sink_kwargs)
     logger.info(f'Python Couchbase Columnar Client ({PYCBCC_VERSION})')
     logger.debug(get_metadata(as_str=True))
 
@@ -151,3 +236,27 @@ def enable_protocol_logger_to_save_network_traffic_to_file(filename: str) -> Non
 
 
 configure_console_logger()
+
+"""
+
+Native stats methods
+
+"""
+from couchbase_columnar.protocol.pycbcc_core import stats as _core_stats  # nopep8 # isort:skip # noqa: E402
+
+
+def core_stats(reset: Optional[bool] = None) -> CoreStats:
+    """**VOLATILE** This API is subject to change at any time.
+
+    Get the process-wide counters of the bindings' hot paths (GIL acquisitions from the I/O threads and the time spent
+    waiting for the GIL, rows and bytes handed to Python, Python callbacks and the time spent in them, and the time
+    spent blocking on query results).  The counters are cheap enough to leave enabled in production.
+
+    Args:
+        reset (Optional[bool]): If `True`, the counters are reset once they are read. Defaults to `None`.
+
+    Returns:
+        :class:`~couchbase_columnar.metrics.CoreStats`: The bindings' counters.
+    """
+    from couchbase_columnar.common.metrics import CoreStats
+    return CoreStats(_core_stats(reset=reset is True))
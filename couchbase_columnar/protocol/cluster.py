@@ -17,12 +17,20 @@ from __future__ import annotations
 
 import atexit
 from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from time import monotonic, time_ns
 from typing import (TYPE_CHECKING,
                     Optional,
                     Union)
 
+from couchbase_columnar.common.metrics import (AdmissionStats,
+                                               ClusterMetrics,
+                                               IoStats,
+                                               StatementStatisticsSnapshot)
 from couchbase_columnar.common.result import BlockingQueryResult
+from couchbase_columnar.common.streaming import QueryInstrumentation
 from couchbase_columnar.protocol.core.client_adapter import _ClientAdapter
+from couchbase_columnar.protocol.core.lanes import raise_if_close_timed_out
 from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
 from couchbase_columnar.protocol.query import _QueryStreamingExecutor
 
@@ -40,12 +48,15 @@ class Cluster:
                  **kwargs: object) -> None:
         self._client_adapter = _ClientAdapter(connstr, credential, options, **kwargs)
         self._request_builder = ClusterRequestBuilder(self._client_adapter)
-        self._connect()
         # Allow the default max_workers which is (as of Python 3.8): min(32, os.cpu_count() + 4).
         # We can add an option later if we see a need
         self._tp_executor = ThreadPoolExecutor()
         self._tp_executor_shutdown_called = False
         atexit.register(self._shutdown_executor)
+        if self._client_adapter.connection_details.lazy_connect is True:
+            self._connect_in_background()
+        else:
+            self._connect()
 
     @property
     def client_adapter(self) -> _ClientAdapter:
@@ -68,15 +79,22 @@ class Cluster:
         """
         return self._tp_executor
 
-    def _close(self) -> None:
+    def _close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None:
         """
             **INTERNAL**
         """
-        req = self._request_builder.build_close_connection_request()
-        self._client_adapter.close_connection(req)
+        deadline = monotonic() + timeout.total_seconds() if timeout is not None else None
+        self._client_adapter.begin_close()
+        drained = True
+        if drain is True:
+            drained = self._client_adapter.drain(timeout.total_seconds() if timeout is not None else None)
+        remaining = timedelta(seconds=max(deadline - monotonic(), 0)) if deadline is not None else None
+        req = self._request_builder.build_close_connection_request(remaining)
+        closed = self._client_adapter.close_connection(req)
         self._client_adapter.reset_client()
         if self._tp_executor_shutdown_called is False:
             self._tp_executor.shutdown()
+        raise_if_close_timed_out(drained, closed)
 
     def _connect(self) -> None:
         """
@@ -85,12 +103,19 @@ class Cluster:
         req = self._request_builder.build_connection_request()
         self._client_adapter.connect(req)
 
+    def _connect_in_background(self) -> None:
+        """
+            **INTERNAL**
+        """
+        req = self._request_builder.build_connection_request()
+        self._client_adapter.connect_in_background(req, self._tp_executor)
+
     def _shutdown_executor(self) -> None:
         if self._tp_executor_shutdown_called is False:
             self._tp_executor.shutdown()
         self._tp_executor_shutdown_called = True
 
-    def close(self) -> None:
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None:
         """Shuts down this cluster instance. Cleaning up all resources associated with it.
 
         .. warning::
@@ -99,12 +124,50 @@ class Cluster:
             is necessary and in those types of applications, this method might be beneficial.
 
         """
+        if self._client_adapter.forked:
+            # the connection belongs to the parent process, there is nothing to close in this process
+            self._client_adapter.abandon_connection()
+            self._client_adapter.reset_client()
+            self._shutdown_executor()
+            return
+        if self._client_adapter.connection_pending:
+            try:
+                self._client_adapter.wait_until_connected()
+            except Exception:  # nosec
+                # the background connection failed, there is nothing to close
+                pass
         if self.has_connection:
-            self._close()
+            self._close(timeout, drain)
         else:
             # TODO: log warning and/or exception?
             print('Cluster does not have a connection.  Ignoring')
 
+    def warmup(self, timeout: Optional[timedelta] = None) -> None:
+        """Waits for the cluster's bootstrap to complete and opens connections to the Columnar query service.
+        """
+        req = self._request_builder.build_warmup_request(timeout)
+        self._client_adapter.warmup(req)
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats:
+        """Returns admission details for an execution lane.
+        """
+        return AdmissionStats(self._client_adapter.admission_stats(lane))
+
+    def io_stats(self, lane: Optional[str] = None) -> IoStats:
+        """Returns utilization details for the threads servicing the I/O of the cluster (or of an execution lane).
+        """
+        return IoStats(self._client_adapter.io_stats(lane))
+
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics:
+        """Returns latency and throughput metrics for the queries executed by the cluster.
+        """
+        return ClusterMetrics(self._client_adapter.query_metrics(reset))
+
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot:
+        """Returns the statistics of the queries executed by the cluster, aggregated per statement fingerprint.
+        """
+        return StatementStatisticsSnapshot(self._client_adapter.statement_statistics_snapshot(reset))
+
     def _execute_query_in_background(self, executor: _QueryStreamingExecutor) -> BlockingQueryResult:
         """
             **INTERNAL**
@@ -116,12 +179,20 @@ class Cluster:
                       statement: str,
                       *args: object,
                       **kwargs: object) -> Union[BlockingQueryResult, Future[BlockingQueryResult]]:
+        request_start = time_ns()
         req, cancel_token = self._request_builder.build_query_request(statement, *args, **kwargs)
         lazy_execute = req.options.pop('lazy_execute', None)
-        executor = _QueryStreamingExecutor(self.client_adapter.client,
+        lane = self.client_adapter.get_execution_lane(req.lane)
+        instrumentation = QueryInstrumentation.create(req,
+                                                      tracer=self.client_adapter.connection_details.tracer,
+                                                      statistics=self.client_adapter.statement_statistics,
+                                                      request_start=request_start)
+        executor = _QueryStreamingExecutor(lane.client,
                                            req,
                                            cancel_token=cancel_token,
-                                           lazy_execute=lazy_execute)
+                                           lazy_execute=lazy_execute,
+                                           limiter=lane.limiter,
+                                           instrumentation=instrumentation)
         if executor.cancel_token is not None:
             executor.set_threadpool_executor(self.threadpool_executor)
             if lazy_execute is True:
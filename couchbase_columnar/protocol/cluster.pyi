@@ -14,12 +14,17 @@
 #  limitations under the License.
 
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import overload
+from datetime import timedelta
+from typing import Optional, overload
 
 from typing_extensions import Unpack
 
 from couchbase_columnar import JSONType
 from couchbase_columnar.common.credential import Credential
+from couchbase_columnar.common.metrics import (AdmissionStats,
+                                               ClusterMetrics,
+                                               IoStats,
+                                               StatementStatisticsSnapshot)
 from couchbase_columnar.common.query import CancelToken
 from couchbase_columnar.common.result import BlockingQueryResult
 from couchbase_columnar.options import (ClusterOptions,
@@ -55,12 +60,19 @@ class Cluster:
     def client_adapter(self) -> _ClientAdapter: ...
 
     @property
-    def connected(self) -> bool: ...
+    def has_connection(self) -> bool: ...
 
     @property
     def threadpool_executor(self) -> ThreadPoolExecutor: ...
 
-    def close(self) -> None: ...
+    def close(self, timeout: Optional[timedelta] = None, drain: Optional[bool] = None) -> None: ...
+
+    def warmup(self, timeout: Optional[timedelta] = None) -> None: ...
+
+    def admission_stats(self, lane: Optional[str] = None) -> AdmissionStats: ...
+    def io_stats(self, lane: Optional[str] = None) -> IoStats: ...
+    def metrics(self, reset: Optional[bool] = None) -> ClusterMetrics: ...
+    def statement_statistics(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshot: ...
 
     @overload
     def execute_query(self, statement: str) -> BlockingQueryResult: ...
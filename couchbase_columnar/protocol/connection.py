@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import (TYPE_CHECKING,
+                    Any,
                     Dict,
                     List,
                     Optional,
@@ -28,8 +29,13 @@ from couchbase_columnar.common.core.utils import is_null_or_empty, to_query_str
 from couchbase_columnar.common.credential import Credential
 from couchbase_columnar.common.deserializer import DefaultJsonDeserializer, Deserializer
 from couchbase_columnar.common.options import ClusterOptions
+from couchbase_columnar.common.retry import RetryStrategy
+from couchbase_columnar.common.tracing import NoOpTracer, RequestTracer
 from couchbase_columnar.protocol import PYCBCC_VERSION
-from couchbase_columnar.protocol.options import (ClusterOptionsTransformedKwargs,
+from couchbase_columnar.protocol.core.statistics import DEFAULT_STATEMENT_STATISTICS_CAPACITY
+from couchbase_columnar.protocol.options import (AdaptiveConcurrencyOptionsTransformedKwargs,
+                                                 ClusterOptionsTransformedKwargs,
+                                                 ExecutionLaneOptionsTransformedKwargs,
                                                  QueryStrVal,
                                                  SecurityOptionsTransformedKwargs)
 
@@ -37,6 +43,9 @@ if TYPE_CHECKING:
     from couchbase_columnar.protocol.options import OptionsBuilder
 
 
+DEFAULT_EXECUTION_LANE = 'default'
+
+
 class StreamingTimeouts(TypedDict, total=False):
     query_timeout: Optional[int]
 
@@ -144,7 +153,18 @@ class _ConnectionDetails:
     cluster_options: ClusterOptionsTransformedKwargs
     credential: Dict[str, str]
     default_deserializer: Deserializer
+    adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsTransformedKwargs] = None
+    bootstrap_cache_path: Optional[str] = None
+    bootstrap_cache_ttl: Optional[int] = None
     enable_dns_srv: Optional[bool] = None
+    execution_lanes: Optional[Dict[str, ExecutionLaneOptionsTransformedKwargs]] = None
+    lazy_connect: Optional[bool] = None
+    query_timeout: Optional[int] = None
+    retry_strategy: Optional[RetryStrategy] = None
+    share_connection: Optional[bool] = None
+    slow_query_threshold: Optional[int] = None
+    statement_statistics_capacity: Optional[int] = None
+    tracer: Optional[RequestTracer] = None
 
     # TODO:  is this needed?  If so, need to flesh out the validation matrix
     def validate_security_options(self) -> None:
@@ -183,6 +203,50 @@ class _ConnectionDetails:
         if default_deserializer is None:
             default_deserializer = DefaultJsonDeserializer()
 
+        # the Python client handles the bootstrap mode, the C++ core does not need to know about it
+        lazy_connect = cluster_opts.pop('lazy_connect', None)
+
+        # the Python client manages the bootstrap cache, the C++ core only receives the (cached) nodes to bootstrap from
+        bootstrap_cache_path = cluster_opts.pop('bootstrap_cache_path', None)
+        bootstrap_cache_ttl = cluster_opts.pop('bootstrap_cache_ttl', None)
+
+        # the Python client manages the process-wide connection registry, the C++ core does not need to know about it
+        share_connection = cluster_opts.pop('share_connection', None)
+
+        # the Python client logs the slow queries, the threshold is the default of the slow_query_threshold query option
+        slow_query_threshold = cluster_opts.pop('slow_query_threshold', None)
+
+        # the Python client records the statement statistics, the capacity is only set if they are enabled
+        statement_statistics = cluster_opts.pop('statement_statistics', None)
+        statement_statistics_capacity = cluster_opts.pop('statement_statistics_capacity', None)
+        if statement_statistics is True:
+            statement_statistics_capacity = statement_statistics_capacity or DEFAULT_STATEMENT_STATISTICS_CAPACITY
+        else:
+            statement_statistics_capacity = None
+
+        # the Python client creates the query spans, the no-op tracer (the default) means no spans are created at all
+        tracer = cluster_opts.pop('tracer', None)
+        if isinstance(tracer, NoOpTracer):
+            tracer = None
+
+        # the Python client creates a connection per execution lane, the 'default' lane is the primary connection
+        execution_lanes = cluster_opts.pop('execution_lanes', None)
+        if execution_lanes is not None and DEFAULT_EXECUTION_LANE in execution_lanes:
+            default_lane = execution_lanes[DEFAULT_EXECUTION_LANE]
+            if 'num_io_threads' in default_lane:
+                cluster_opts['num_io_threads'] = default_lane['num_io_threads']
+                cluster_opts.pop('max_io_threads', None)
+            if 'max_io_threads' in default_lane:
+                cluster_opts['max_io_threads'] = default_lane['max_io_threads']
+
+        # the Python client admits the queries, the C++ core does not need to know about it
+        adaptive_concurrency = cluster_opts.pop('adaptive_concurrency', None)
+
+        # the Python client retries the queries, the retries share the query timeout so the client needs to know it
+        retry_strategy = cluster_opts.pop('retry_strategy', None)
+        timeout_opts: Dict[str, Any] = dict(cluster_opts.get('timeout_options', None) or {})
+        query_timeout = timeout_opts.get('analytics_timeout', None)
+
         if 'user_agent_extra' in cluster_opts:
             cluster_opts['user_agent_extra'] = f'{PYCBCC_VERSION};{cluster_opts["user_agent_extra"]}'
         else:
@@ -192,6 +256,17 @@ class _ConnectionDetails:
                         cluster_opts,
                         credential.asdict(),
                         default_deserializer,
-                        enable_dns_srv=enable_dns_srv)
+                        adaptive_concurrency=adaptive_concurrency,
+                        bootstrap_cache_path=bootstrap_cache_path,
+                        bootstrap_cache_ttl=bootstrap_cache_ttl,
+                        enable_dns_srv=enable_dns_srv,
+                        execution_lanes=execution_lanes,
+                        lazy_connect=lazy_connect,
+                        query_timeout=query_timeout,
+                        retry_strategy=retry_strategy,
+                        share_connection=share_connection,
+                        slow_query_threshold=slow_query_threshold,
+                        statement_statistics_capacity=statement_statistics_capacity,
+                        tracer=tracer)
         conn_dtls.validate_security_options()
         return conn_dtls
@@ -0,0 +1,236 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Dict,
+                    List,
+                    Optional)
+from urllib.parse import urlparse
+
+from couchbase_columnar.common.core.utils import timedelta_as_microseconds
+from couchbase_columnar.protocol.core import PyCapsuleType
+from couchbase_columnar.protocol.exceptions import CoreColumnarError
+from couchbase_columnar.protocol.pycbcc_core import create_connection, get_bootstrap_nodes
+
+if TYPE_CHECKING:
+    from couchbase_columnar.protocol.core.request import ConnectRequest
+
+BOOTSTRAP_CACHE_VERSION = 1
+DEFAULT_BOOTSTRAP_CACHE_TTL = timedelta_as_microseconds(timedelta(hours=1))
+
+
+@dataclass
+class _BootstrapCacheEntry:
+    """
+        **INTERNAL**
+
+    The nodes a connection string bootstraps from.  `resolved_at` (seconds since the epoch) is the time the
+    connection string was last resolved, it is not updated when the nodes are refreshed from a connection that
+    bootstrapped from the cache so that DNS SRV records are resolved again once the entry expires.
+    """
+    connection_str: str
+    nodes: List[str]
+    resolved_at: float
+    version: int = BOOTSTRAP_CACHE_VERSION
+
+    def is_valid(self, connection_str: str, ttl: int, now: float) -> bool:
+        """
+            **INTERNAL**
+        """
+        if self.version != BOOTSTRAP_CACHE_VERSION or self.connection_str != connection_str:
+            return False
+        if not isinstance(self.nodes, list) or not self.nodes or not all(map(_is_valid_node, self.nodes)):
+            return False
+        age_us = (now - self.resolved_at) * 1e6
+        return 0 <= age_us < ttl
+
+
+def _is_valid_node(node: Any) -> bool:
+    """
+        **INTERNAL**
+
+    Cached nodes are `host:port` pairs, anything else (including characters that would alter the connection string)
+    invalidates the entry.
+    """
+    if not isinstance(node, str):
+        return False
+    host, sep, port = node.rpartition(':')
+    if not sep or not host or not port.isdigit():
+        return False
+    return not any(c in host for c in ',/?#@ ')
+
+
+class _BootstrapCache:
+    """
+        **INTERNAL**
+
+    On-disk cache of the nodes connection strings bootstrap from, see the `bootstrap_cache_path` cluster option.  Each
+    connection string has its own JSON file, named after a digest of the connection string.  The cache is best effort:
+    entries that cannot be read, are malformed or have expired are ignored, and failing to write an entry does not fail
+    the bootstrap.
+    """
+
+    def __init__(self, path: str, ttl: Optional[int] = None) -> None:
+        self._path = path
+        self._ttl = ttl if ttl is not None else DEFAULT_BOOTSTRAP_CACHE_TTL
+
+    @staticmethod
+    def get_key(connection_str: str) -> str:
+        """
+            **INTERNAL**
+        """
+        return hashlib.sha256(connection_str.encode('utf-8')).hexdigest()
+
+    def entry_path(self, connection_str: str) -> str:
+        """
+            **INTERNAL**
+        """
+        return os.path.join(self._path, f'{self.get_key(connection_str)}.json')
+
+    def load(self, connection_str: str) -> Optional[_BootstrapCacheEntry]:
+        """
+            **INTERNAL**
+
+        Returns the cached entry for the connection string, `None` if there is no valid entry.
+        """
+        entry_path = self.entry_path(connection_str)
+        try:
+            with open(entry_path, 'r') as entry_file:
+                entry = _BootstrapCacheEntry(**json.load(entry_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError):
+            self.invalidate(connection_str)
+            return None
+        if not entry.is_valid(connection_str, self._ttl, time.time()):
+            self.invalidate(connection_str)
+            return None
+        return entry
+
+    def store(self, entry: _BootstrapCacheEntry) -> None:
+        """
+            **INTERNAL**
+
+        Atomically replaces the entry for the entry's connection string, concurrent processes sharing the cache
+        directory never observe a partially written entry.
+        """
+        import tempfile
+        try:
+            os.makedirs(self._path, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._path, prefix='.bootstrap-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as tmp_file:
+                    json.dump(asdict(entry), tmp_file)
+                os.replace(tmp_path, self.entry_path(entry.connection_str))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def invalidate(self, connection_str: str) -> None:
+        """
+            **INTERNAL**
+        """
+        try:
+            os.unlink(self.entry_path(connection_str))
+        except OSError:
+            pass
+
+    def refresh(self, connection_str: str, conn: Any, resolved_at: Optional[float] = None) -> None:
+        """
+            **INTERNAL**
+
+        Stores the nodes the connection bootstraps from.  `resolved_at` is the time of the cached entry the connection
+        bootstrapped from (if any).
+        """
+        try:
+            nodes = get_bootstrap_nodes(conn)
+        except Exception:
+            return
+        if not nodes or not all(map(_is_valid_node, nodes)):
+            return
+        self.store(_BootstrapCacheEntry(connection_str,
+                                        nodes,
+                                        resolved_at if resolved_at is not None else time.time()))
+
+
+def with_nodes(connection_str: str, nodes: List[str]) -> str:
+    """
+        **INTERNAL**
+
+    Returns the connection string with its hosts replaced by the nodes.  The nodes have explicit ports so the C++ core
+    does not attempt to resolve DNS SRV records.
+    """
+    return urlparse(connection_str)._replace(netloc=','.join(nodes)).geturl()
+
+
+def _create_connection_from_nodes(connection_str: str,
+                                  nodes: List[str],
+                                  final_kwargs: Dict[str, Any]) -> Optional[PyCapsuleType]:
+    """
+        **INTERNAL**
+
+    Returns the native connection bootstrapped from the nodes, `None` if bootstrapping from the nodes failed.
+    """
+    try:
+        ret = create_connection(with_nodes(connection_str, nodes), **final_kwargs)
+    except CoreColumnarError:
+        return None
+    return None if isinstance(ret, CoreColumnarError) else ret
+
+
+def create_connection_from_request(req: ConnectRequest) -> PyCapsuleType:
+    """
+        **INTERNAL**
+
+    Creates the native connection for the connect request.  The connection bootstraps from the request's bootstrap
+    nodes (a forked child reconnecting with its parent's nodes) or, if the request has a bootstrap cache, from the
+    cached nodes.  The cache is refreshed once the connection is established.  If bootstrapping from the nodes fails,
+    the cache entry is discarded and the connection bootstraps from the connection string.
+    """
+    final_kwargs = req.to_req_dict()
+    conn_str = final_kwargs.pop('connection_str')
+    if req.bootstrap_nodes:
+        ret = _create_connection_from_nodes(conn_str, req.bootstrap_nodes, final_kwargs)
+        if ret is not None:
+            return ret
+
+    if req.bootstrap_cache_path is None:
+        return create_connection(conn_str, **final_kwargs)
+
+    cache = _BootstrapCache(req.bootstrap_cache_path, req.bootstrap_cache_ttl)
+    entry = cache.load(conn_str)
+    if entry is not None:
+        ret = _create_connection_from_nodes(conn_str, entry.nodes, final_kwargs)
+        if ret is not None:
+            cache.refresh(conn_str, ret, entry.resolved_at)
+            return ret
+        # the cached nodes are stale, resolve the connection string again
+        cache.invalidate(conn_str)
+
+    ret = create_connection(conn_str, **final_kwargs)
+    if not isinstance(ret, CoreColumnarError):
+        cache.refresh(conn_str, ret)
+    return ret
@@ -15,20 +15,53 @@
 
 from __future__ import annotations
 
+import weakref
 from typing import (TYPE_CHECKING,
+                    Any,
                     Callable,
+                    Dict,
+                    List,
                     Optional)
 
+from couchbase_columnar.common.exceptions import ColumnarError, TimeoutError
 from couchbase_columnar.protocol.core import PyCapsuleType
+from couchbase_columnar.protocol.core.bootstrap_cache import create_connection_from_request
+from couchbase_columnar.protocol.core.registry import _CONNECTION_REGISTRY
 from couchbase_columnar.protocol.core.result import CoreQueryIterator
 from couchbase_columnar.protocol.pycbcc_core import (close_connection,
                                                      columnar_query,
-                                                     create_connection)
+                                                     get_bootstrap_nodes,
+                                                     get_io_thread_stats,
+                                                     get_query_metrics,
+                                                     warmup_connection)
 
 if TYPE_CHECKING:
+    from couchbase_columnar.common.core.metrics import IoStatsCore, QueryOutcomeMetricsCore
     from couchbase_columnar.protocol.core.request import (CloseConnectionRequest,
                                                           ConnectRequest,
-                                                          QueryRequest)
+                                                          QueryRequest,
+                                                          WarmupRequest)
+
+
+def raise_if_warmup_failed(endpoints: List[Dict[str, Any]]) -> None:
+    """
+    **INTERNAL**
+
+    Raises if none of the Columnar query service endpoints a warmup pinged reported `ok`: a
+    :class:`~couchbase_columnar.exceptions.TimeoutError` if an endpoint timed out, a
+    :class:`~couchbase_columnar.exceptions.ColumnarError` otherwise.
+    """
+    if any(endpoint.get('state') == 'ok' for endpoint in endpoints):
+        return
+    if not endpoints:
+        raise ColumnarError(message='Unable to warm up the cluster, no Columnar query service endpoints were found.')
+    details = ', '.join(f'{endpoint.get("remote")} ({endpoint.get("error", endpoint.get("state"))})'
+                        for endpoint in endpoints)
+    if any(endpoint.get('state') == 'timeout' for endpoint in endpoints):
+        raise TimeoutError(message=f'Timed out warming up the cluster, no Columnar query service endpoint responded: '
+                                   f'{details}.')
+    raise ColumnarError(message=f'Unable to warm up the cluster, no Columnar query service endpoint responded: '
+                                f'{details}.')
 
 
 class _CoreClient:
@@ -38,6 +71,8 @@ class _CoreClient:
 
     def __init__(self) -> None:
         self._connection: Optional[PyCapsuleType] = None
+        self._shared_key: Optional[str] = None
+        self._release_shared: Optional[weakref.finalize] = None
 
     @property
     def has_connection(self) -> bool:
@@ -60,19 +95,88 @@ class _CoreClient:
         """
         self._connection = conn
 
+    @property
+    def is_shared(self) -> bool:
+        """
+        **INTERNAL**
+        """
+        return self._shared_key is not None
+
     def close_connection(self, req: CloseConnectionRequest) -> bool:
         """
         **INTERNAL**
         """
+        if self._shared_key is not None:
+            if self._release_shared is not None:
+                self._release_shared.detach()
+            # the shared connection is only closed once the last client using it is closed
+            closed = _CONNECTION_REGISTRY.release(self._shared_key, req)
+            self._shared_key = None
+            return closed
         return close_connection(self.connection, **req.to_req_dict())
 
+    def abandon_connection(self) -> None:
+        """
+        **INTERNAL**
+
+        Drops the client's connection w/o closing it, used once the connection belongs to the parent process (see
+        :mod:`~couchbase_columnar.protocol.core.fork`).  The bindings do not touch a connection inherited from the
+        parent when it is deallocated.
+        """
+        if self._release_shared is not None:
+            self._release_shared.detach()
+        self._release_shared = None
+        self._shared_key = None
+        self._connection = None
+
     def connect(self, req: ConnectRequest) -> PyCapsuleType:
         """
         **INTERNAL**
         """
-        final_kwargs = req.to_req_dict()
-        conn_str = final_kwargs.pop('connection_str')
-        return create_connection(conn_str, **final_kwargs)
+        return create_connection_from_request(req)
+
+    def connect_shared(self, req: ConnectRequest) -> PyCapsuleType:
+        """
+        **INTERNAL**
+
+        Returns the native connection shared (via the process-wide connection registry) by all clients created with
+        an equivalent connect request.
+        """
+        key, conn = _CONNECTION_REGISTRY.acquire(req)
+        self._shared_key = key
+        # if the client is garbage collected w/o being closed, give the reference back w/o blocking on a close,
+        # the native connection is torn down once it is deallocated
+        self._release_shared = weakref.finalize(self, _CONNECTION_REGISTRY.release, key)
+        return conn
+
+    def get_bootstrap_nodes(self) -> List[str]:
+        """
+        **INTERNAL**
+
+        Returns the nodes the connection bootstraps from, an empty list if they are not available.
+        """
+        try:
+            return get_bootstrap_nodes(self.connection)
+        except Exception:
+            return []
+
+    def warmup(self, req: WarmupRequest) -> List[Dict[str, Any]]:
+        """
+        **INTERNAL**
+        """
+        return warmup_connection(self.connection, **req.to_req_dict())
+
+    def get_io_thread_stats(self) -> IoStatsCore:
+        """
+        **INTERNAL**
+        """
+        return get_io_thread_stats(self.connection)
+
+    def get_query_metrics(self, reset: Optional[bool] = None) -> List[QueryOutcomeMetricsCore]:
+        """
+        **INTERNAL**
+        """
+        return get_query_metrics(self.connection, reset=reset is True)
 
     def columnar_query_op(self,
                           req: QueryRequest,
@@ -16,8 +16,14 @@
 from __future__ import annotations
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from functools import wraps
-from typing import (Callable,
+from threading import Lock
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
                     Literal,
                     Optional,
                     TypeVar,
@@ -28,13 +34,22 @@ if sys.version_info < (3, 10):
 else:
     from typing import TypeAlias
 
+from couchbase_columnar.common.core.metrics import (AdmissionStatsCore,
+                                                    IoStatsCore,
+                                                    QueryOutcomeMetricsCore,
+                                                    StatementStatisticsSnapshotCore)
 from couchbase_columnar.common.credential import Credential
 from couchbase_columnar.common.deserializer import Deserializer
 from couchbase_columnar.common.exceptions import ColumnarError, InternalSDKError
 from couchbase_columnar.protocol.connection import _ConnectionDetails
-from couchbase_columnar.protocol.core.client import _CoreClient
-from couchbase_columnar.protocol.core.request import CloseConnectionRequest, ConnectRequest
+from couchbase_columnar.protocol.core.client import _CoreClient, raise_if_warmup_failed
+from couchbase_columnar.protocol.core.fork import fork_generation, run_in_thread
+from couchbase_columnar.protocol.core.lanes import _ExecutionLane, _ExecutionLanes
+from couchbase_columnar.protocol.core.request import (CloseConnectionRequest,
+                                                      ConnectRequest,
+                                                      WarmupRequest)
 from couchbase_columnar.protocol.core.result import CoreResult
+from couchbase_columnar.protocol.core.statistics import _StatementStatisticsRegistry
 from couchbase_columnar.protocol.exceptions import CoreColumnarError, ErrorMapper
 from couchbase_columnar.protocol.options import OptionsBuilder
 
@@ -97,14 +112,45 @@ class _ClientAdapter:
                                                        credential,
                                                        options,
                                                        **kwargs)
+        self._connect_ft: Optional[Future[Optional[CoreResult]]] = None
+        # the fork generation the connection was created in and the request to reconnect with after a fork
+        self._fork_generation: Optional[int] = None
+        self._fork_connect_req: Optional[ConnectRequest] = None
+        self._fork_lock = Lock()
+        self._execution_lanes = _ExecutionLanes()
+        self._statement_statistics: Optional[_StatementStatisticsRegistry] = None
+        if self._conn_details.statement_statistics_capacity is not None:
+            self._statement_statistics = _StatementStatisticsRegistry(self._conn_details.statement_statistics_capacity)
 
     @property
     def client(self) -> _CoreClient:
         """
             **INTERNAL**
         """
+        if self.connection_pending:
+            self.wait_until_connected()
         return self._client
 
+    @property
+    def connection_pending(self) -> bool:
+        """
+            **INTERNAL**
+
+        If the process forked since the connection was created, a new connection is created in the background.
+        """
+        if self._connect_ft is None and self.forked:
+            self._reconnect_after_fork()
+        return self._connect_ft is not None
+
+    @property
+    def forked(self) -> bool:
+        """
+            **INTERNAL**
+
+        True if the connection was created by a parent process.
+        """
+        return self._fork_generation is not None and self._fork_generation != fork_generation()
+
     @property
     def has_connection(self) -> bool:
         """
@@ -121,6 +167,13 @@ class _ClientAdapter:
         """
         return self._conn_details
 
+    @property
+    def statement_statistics(self) -> Optional[_StatementStatisticsRegistry]:
+        """
+            **INTERNAL**
+        """
+        return self._statement_statistics
+
     @property
     def default_deserializer(self) -> Deserializer:
         """
@@ -135,14 +188,16 @@ class _ClientAdapter:
         """
         return self._opts_builder
 
-    @BlockingWrapper.block(True)
-    def close_connection(self, req: CloseConnectionRequest) -> None:
+    def close_connection(self, req: CloseConnectionRequest) -> bool:
         """
             **INTERNAL**
+
+        Returns False if the connections did not close before the request's timeout expired.
         """
 
         try:
-            self.client.close_connection(req)
+            req, lanes_closed = self._execution_lanes.close(req)
+            return self._client.close_connection(req) is not False and lanes_closed
         except Exception as ex:
             # suppress context, we know we have raised an error from the bindings
             if isinstance(ex, CoreColumnarError):
@@ -157,10 +212,152 @@ class _ClientAdapter:
         if not hasattr(self, '_client'):
             self._client = _CoreClient()
 
-        ret = self.client.connect(req)
+        share_connection = self._conn_details.share_connection
+        if share_connection is True:
+            ret = self._client.connect_shared(req)
+        else:
+            ret = self._client.connect(req)
         if isinstance(ret, CoreColumnarError):
             raise ErrorMapper.build_error(ret)
         self._client.connection = ret
+        self._execution_lanes.connect(self._client,
+                                      req,
+                                      self._conn_details.execution_lanes,
+                                      share_connection=share_connection,
+                                      adaptive_concurrency=self._conn_details.adaptive_concurrency)
+        # the parent's bootstrap nodes spare forked children the DNS SRV lookup
+        self._fork_connect_req = replace(req, bootstrap_nodes=self._client.get_bootstrap_nodes() or None)
+        self._fork_generation = fork_generation()
+
+    def connect_in_background(self, req: ConnectRequest, tp_executor: ThreadPoolExecutor) -> None:
+        """
+            **INTERNAL**
+        """
+        self._connect_ft = tp_executor.submit(self.connect, req)
+
+    def wait_until_connected(self) -> None:
+        """
+            **INTERNAL**
+
+        Blocks until a connection that is being created in the background is available.  If the background
+        connection failed, the error is raised (each time this method is called).  Safe to call from multiple threads.
+        """
+        connect_ft = self._connect_ft
+        if connect_ft is None:
+            return
+        connect_ft.result()
+        with self._fork_lock:
+            # another thread might have cleared the future, or a reconnect after a fork replaced it
+            if self._connect_ft is connect_ft:
+                self._connect_ft = None
+
+    def abandon_connection(self) -> None:
+        """
+            **INTERNAL**
+
+        Drops the connections w/o closing them, used once the connections belong to the parent process.
+        """
+        self._fork_generation = None
+        self._execution_lanes.abandon()
+        if hasattr(self, '_client'):
+            self._client.abandon_connection()
+
+    def _reconnect_after_fork(self) -> None:
+        """
+            **INTERNAL**
+
+        The connection belongs to the parent process: its I/O threads do not exist in this process and its sockets
+        are shared w/ the parent.  Create a new connection, from the parent's bootstrap nodes, in the background.
+        """
+        with self._fork_lock:
+            if not self.forked or self._connect_ft is not None or self._fork_connect_req is None:
+                return
+            req = self._fork_connect_req
+            self.abandon_connection()
+            self._connect_ft = run_in_thread(self.connect, req)
+
+    def warmup(self, req: WarmupRequest) -> List[Dict[str, Any]]:
+        """
+            **INTERNAL**
+        """
+        client = self.client
+        try:
+            endpoints = client.warmup(req)
+        except Exception as ex:
+            # suppress context, we know we have raised an error from the bindings
+            if isinstance(ex, CoreColumnarError):
+                raise ErrorMapper.build_error(ex) from None
+            raise InternalSDKError(str(ex)) from None
+        raise_if_warmup_failed(endpoints)
+        return endpoints
+
+    def get_execution_lane(self, lane_name: Optional[str] = None) -> _ExecutionLane:
+        """
+            **INTERNAL**
+        """
+        if self.connection_pending:
+            self.wait_until_connected()
+        return self._execution_lanes.get(lane_name)
+
+    def admission_stats(self, lane_name: Optional[str] = None) -> AdmissionStatsCore:
+        """
+            **INTERNAL**
+        """
+        return self.get_execution_lane(lane_name).limiter.stats()
+
+    def io_stats(self, lane_name: Optional[str] = None) -> IoStatsCore:
+        """
+            **INTERNAL**
+        """
+        lane = self.get_execution_lane(lane_name)
+        try:
+            return lane.client.get_io_thread_stats()
+        except Exception as ex:
+            # suppress context, we know we have raised an error from the bindings
+            if isinstance(ex, CoreColumnarError):
+                raise ErrorMapper.build_error(ex) from None
+            raise InternalSDKError(str(ex)) from None
+
+    def statement_statistics_snapshot(self, reset: Optional[bool] = None) -> StatementStatisticsSnapshotCore:
+        """
+            **INTERNAL**
+        """
+        if self._statement_statistics is None:
+            raise RuntimeError('Statement statistics are not enabled, see the statement_statistics cluster option.')
+        return self._statement_statistics.snapshot(reset is True)
+
+    def query_metrics(self, reset: Optional[bool] = None) -> List[List[QueryOutcomeMetricsCore]]:
+        """
+            **INTERNAL**
+
+        Returns the query metrics of each of the cluster's connections.
+        """
+        if self.connection_pending:
+            self.wait_until_connected()
+        try:
+            return [client.get_query_metrics(reset) for client in self._execution_lanes.clients]
+        except Exception as ex:
+            # suppress context, we know we have raised an error from the bindings
+            if isinstance(ex, CoreColumnarError):
+                raise ErrorMapper.build_error(ex) from None
+            raise InternalSDKError(str(ex)) from None
+
+    def begin_close(self) -> None:
+        """
+            **INTERNAL**
+
+        Stops the cluster from executing new queries.
+        """
+        self._execution_lanes.begin_close()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+            **INTERNAL**
+
+        Blocks until the queries in-flight on every execution lane have completed, or until the timeout (in seconds)
+        expires.  Returns False if the timeout expired.
+        """
+        return self._execution_lanes.drain(timeout)
 
     def reset_client(self) -> None:
         """
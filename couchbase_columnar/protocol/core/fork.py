@@ -0,0 +1,92 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    **INTERNAL**
+
+    Fork handling.  A forked child inherits the parent's native connections, but not their I/O threads, and the
+    connections' sockets are shared with the parent.  Every fork bumps the process' fork generation, clients compare
+    the generation they connected in with the current generation to find out their connection belongs to the parent
+    and bootstrap a new connection (see the client adapters).
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future
+from threading import Thread
+from typing import (Any,
+                    Callable,
+                    List,
+                    TypeVar)
+
+T = TypeVar('T')
+
+_FORK_GENERATION = 0
+_AFTER_FORK_IN_CHILD: List[Callable[[], None]] = []
+
+
+def fork_generation() -> int:
+    """
+        **INTERNAL**
+
+    Returns the number of forks between the first import of the SDK and the calling process.
+    """
+    return _FORK_GENERATION
+
+
+def register_after_fork_in_child(callback: Callable[[], None]) -> None:
+    """
+        **INTERNAL**
+
+    Registers a callback to run in the child after a fork, e.g. to reset process-wide state holding locks or native
+    connections.
+    """
+    _AFTER_FORK_IN_CHILD.append(callback)
+
+
+def _after_fork_in_child() -> None:
+    """
+        **INTERNAL**
+    """
+    global _FORK_GENERATION
+    _FORK_GENERATION += 1
+    for callback in _AFTER_FORK_IN_CHILD:
+        callback()
+
+
+def run_in_thread(fn: Callable[..., T], *args: Any) -> Future[T]:
+    """
+        **INTERNAL**
+
+    Runs the function in a new daemon thread.  Unlike an executor, the thread is not inherited from the parent so
+    this is safe to use right after a fork.
+    """
+    ft: Future[T] = Future()
+
+    def run() -> None:
+        if not ft.set_running_or_notify_cancel():
+            return
+        try:
+            ft.set_result(fn(*args))
+        except BaseException as ex:
+            ft.set_exception(ex)
+
+    Thread(target=run, daemon=True).start()
+    return ft
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,607 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, replace
+from threading import (Condition,
+                       Event,
+                       Lock)
+from time import monotonic
+from typing import (TYPE_CHECKING,
+                    Deque,
+                    Dict,
+                    List,
+                    Optional,
+                    Tuple,
+                    Union)
+
+from couchbase_columnar.common.exceptions import QueryError, TimeoutError
+from couchbase_columnar.protocol.connection import DEFAULT_EXECUTION_LANE
+from couchbase_columnar.protocol.core.client import _CoreClient
+from couchbase_columnar.protocol.core.request import CloseConnectionRequest
+from couchbase_columnar.protocol.exceptions import CoreColumnarError, ErrorMapper
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Future
+
+    from couchbase_columnar.common.core.metrics import AdmissionStatsCore
+    from couchbase_columnar.protocol.core.request import ConnectRequest
+    from couchbase_columnar.protocol.options import (AdaptiveConcurrencyOptionsTransformedKwargs,
+                                                     ExecutionLaneOptionsTransformedKwargs)
+
+_LimiterWaiter = Union[Event, Tuple['AbstractEventLoop', 'Future[None]']]
+
+# the Columnar error codes of queries rejected because the service is overloaded (temporarily unavailable, job queue
+# is full)
+OVERLOADED_ERROR_CODES = frozenset([23000, 23007])
+DEFAULT_ADAPTIVE_BACKOFF_RATIO = 0.9
+DEFAULT_ADAPTIVE_INITIAL_LIMIT = 16
+DEFAULT_ADAPTIVE_MAX_LIMIT = 256
+DEFAULT_ADAPTIVE_MIN_LIMIT = 1
+
+
+class _InFlightPermit:
+    """
+        **INTERNAL**
+
+    A slot on an execution lane held by a single in-flight query.  Releasing the permit is idempotent so that
+    every path a query can complete by (all rows streamed, error, cancel, garbage collected) can release it.
+    """
+
+    def __init__(self, limiter: _InFlightLimiter) -> None:
+        self._limiter = limiter
+        self._acquired_at = monotonic()
+        self._released = False
+        self._responded = False
+        self._lock = Lock()
+
+    @property
+    def acquired_at(self) -> float:
+        """
+            **INTERNAL**
+        """
+        return self._acquired_at
+
+    @property
+    def released(self) -> bool:
+        """
+            **INTERNAL**
+        """
+        return self._released
+
+    def response_received(self, error: Optional[Exception] = None) -> None:
+        """
+            **INTERNAL**
+
+        Records the query's response (the error the query failed with before streaming rows, if any), the lane's
+        limiter adapts its limit to it.  Only the first response of the permit is recorded.
+        """
+        with self._lock:
+            if self._responded or self._released:
+                return
+            self._responded = True
+        self._limiter._response_received(self, error)
+
+    def release(self) -> None:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._limiter._release()
+
+
+class _InFlightLimiter:
+    """
+        **INTERNAL**
+
+    Tracks, and optionally limits, the number of queries in-flight on an execution lane.  Permits are released from
+    the bindings' I/O threads, the calling thread and the event loop, so the limiter is thread-safe.  Waiters, both
+    blocking and asyncio, are served in FIFO order (prioritized queries first) and a released slot is handed directly
+    to the next waiter.
+    """
+
+    def __init__(self, max_in_flight: Optional[int] = None) -> None:
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._lock = Lock()
+        self._idle = Condition(self._lock)
+        self._waiters: Deque[_LimiterWaiter] = deque()
+        self._priority_waiters: Deque[_LimiterWaiter] = deque()
+        self._admitted = 0
+        self._queue_wait_time = 0.0
+        self._queue_wait_max_time = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        """
+            **INTERNAL**
+        """
+        return self._in_flight
+
+    @property
+    def max_in_flight(self) -> Optional[int]:
+        """
+            **INTERNAL**
+        """
+        return self._max_in_flight
+
+    @property
+    def limit(self) -> Optional[int]:
+        """
+            **INTERNAL**
+
+        The number of queries currently allowed in-flight on the lane, `None` if unlimited.
+        """
+        return self._max_in_flight
+
+    def _has_capacity(self) -> bool:
+        """
+            **INTERNAL**
+        """
+        if self._waiters or self._priority_waiters:
+            return False
+        limit = self.limit
+        return limit is None or self._in_flight < limit
+
+    def _admit(self) -> _InFlightPermit:
+        """
+            **INTERNAL**
+
+        Must be called w/ the lock held.
+        """
+        self._in_flight += 1
+        self._admitted += 1
+        return _InFlightPermit(self)
+
+    def _admit_waiter(self, wait_start: float) -> _InFlightPermit:
+        """
+            **INTERNAL**
+
+        The slot was handed off by _release(), the in-flight count does not change.
+        """
+        wait_time = monotonic() - wait_start
+        with self._lock:
+            self._admitted += 1
+            self._queue_wait_time += wait_time
+            self._queue_wait_max_time = max(self._queue_wait_max_time, wait_time)
+        return _InFlightPermit(self)
+
+    def _get_waiters(self, priority: Optional[bool]) -> Deque[_LimiterWaiter]:
+        """
+            **INTERNAL**
+        """
+        return self._priority_waiters if priority is True else self._waiters
+
+    def try_acquire(self) -> Optional[_InFlightPermit]:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            if not self._has_capacity():
+                return None
+            return self._admit()
+
+    def acquire(self, priority: Optional[bool] = None) -> _InFlightPermit:
+        """
+            **INTERNAL**
+
+        Blocks until a slot is available on the lane.
+        """
+        with self._lock:
+            if self._has_capacity():
+                return self._admit()
+            waiter = Event()
+            self._get_waiters(priority).append(waiter)
+        wait_start = monotonic()
+        waiter.wait()
+        return self._admit_waiter(wait_start)
+
+    async def acquire_async(self, loop: AbstractEventLoop, priority: Optional[bool] = None) -> _InFlightPermit:
+        """
+            **INTERNAL**
+
+        Waits, without blocking the event loop, until a slot is available on the lane.
+        """
+        # imported here so that the blocking API does not pay for importing asyncio
+        from asyncio import CancelledError
+
+        with self._lock:
+            if self._has_capacity():
+                return self._admit()
+            ft: Future[None] = loop.create_future()
+            waiter: _LimiterWaiter = (loop, ft)
+            waiters = self._get_waiters(priority)
+            waiters.append(waiter)
+
+        wait_start = monotonic()
+        try:
+            await ft
+        except CancelledError:
+            with self._lock:
+                try:
+                    waiters.remove(waiter)
+                    handed_off = False
+                except ValueError:
+                    handed_off = ft.done() and not ft.cancelled()
+            # if the slot was handed off, but we were cancelled prior to resuming, give it back.  If the hand off is
+            # still pending, _hand_off_to_future() will see the cancelled future and give the slot back.
+            if handed_off:
+                self._release()
+            raise
+        return self._admit_waiter(wait_start)
+
+    def _hand_off_to_future(self, ft: Future[None]) -> None:
+        """
+            **INTERNAL**
+        """
+        if ft.done():
+            # the waiter was cancelled, pass the slot along
+            self._release()
+        else:
+            ft.set_result(None)
+
+    def _wake_next_waiter(self) -> bool:
+        """
+            **INTERNAL**
+
+        Hands a slot to the next waiter, prioritized waiters first.  Must be called w/ the lock held.  Returns False
+        if there are no waiters.
+        """
+        for waiters in (self._priority_waiters, self._waiters):
+            while waiters:
+                waiter = waiters.popleft()
+                if isinstance(waiter, Event):
+                    waiter.set()
+                    return True
+                loop, ft = waiter
+                if loop.is_closed():
+                    continue
+                loop.call_soon_threadsafe(self._hand_off_to_future, ft)
+                return True
+        return False
+
+    def _release(self) -> None:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            limit = self.limit
+            # if the limit was lowered below the in-flight count, the slot is not handed off
+            if (limit is None or self._in_flight <= limit) and self._wake_next_waiter():
+                return
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.notify_all()
+
+    def _response_received(self, permit: _InFlightPermit, error: Optional[Exception] = None) -> None:
+        """
+            **INTERNAL**
+
+        The limit is fixed, the response does not change it.
+        """
+
+    def stats(self) -> AdmissionStatsCore:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            stats: AdmissionStatsCore = {
+                'adaptive': False,
+                'admitted': self._admitted,
+                'in_flight': self._in_flight,
+                'queue_wait_max_time': int(self._queue_wait_max_time * 1e6),
+                'queue_wait_time': int(self._queue_wait_time * 1e6),
+                'queued': len(self._waiters) + len(self._priority_waiters),
+            }
+            limit = self.limit
+        if limit is not None:
+            stats['limit'] = limit
+        return stats
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+            **INTERNAL**
+
+        Blocks until no queries are in-flight on the lane, or until the timeout (in seconds) expires.  Returns False
+        if the timeout expired.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+
+class _AdaptiveInFlightLimiter(_InFlightLimiter):
+    """
+        **INTERNAL**
+
+    An in-flight limiter whose limit adapts to the service's load (see the `adaptive_concurrency` cluster option).
+    Every response is a sample: a success while the lane is busy grows the limit by one over a full limit's worth of
+    responses (additive increase), a sign the service is overloaded multiplies the limit by the backoff ratio
+    (multiplicative decrease).  Queries admitted before the last decrease do not decrease the limit again, otherwise a
+    single overloaded moment would collapse the limit to its minimum.
+    """
+
+    def __init__(self,
+                 options: AdaptiveConcurrencyOptionsTransformedKwargs,
+                 max_in_flight: Optional[int] = None) -> None:
+        super().__init__(max_in_flight)
+        max_limit = options.get('max_limit', None) or DEFAULT_ADAPTIVE_MAX_LIMIT
+        if max_in_flight is not None:
+            max_limit = min(max_limit, max_in_flight)
+        self._max_limit = max_limit
+        self._min_limit = min(options.get('min_limit', None) or DEFAULT_ADAPTIVE_MIN_LIMIT, max_limit)
+        initial_limit = options.get('initial_limit', None) or DEFAULT_ADAPTIVE_INITIAL_LIMIT
+        self._limit = float(min(max(initial_limit, self._min_limit), self._max_limit))
+        self._backoff_ratio = options.get('backoff_ratio', None) or DEFAULT_ADAPTIVE_BACKOFF_RATIO
+        latency_threshold = options.get('latency_threshold', None)
+        self._latency_threshold = latency_threshold / 1e6 if latency_threshold else None
+        self._last_decrease: Optional[float] = None
+        self._limit_increases = 0
+        self._limit_decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """
+            **INTERNAL**
+        """
+        return int(self._limit)
+
+    def _is_overloaded(self, permit: _InFlightPermit, error: Optional[Exception]) -> bool:
+        """
+            **INTERNAL**
+        """
+        if error is None:
+            return self._latency_threshold is not None and monotonic() - permit.acquired_at >= self._latency_threshold
+        if isinstance(error, TimeoutError):
+            return True
+        return isinstance(error, QueryError) and error.code in OVERLOADED_ERROR_CODES
+
+    def _response_received(self, permit: _InFlightPermit, error: Optional[Exception] = None) -> None:
+        """
+            **INTERNAL**
+        """
+        overloaded = self._is_overloaded(permit, error)
+        if error is not None and not overloaded:
+            # errors unrelated to the service's load (e.g. a syntax error or a cancelled query) do not change the limit
+            return
+        with self._lock:
+            prev_limit = self.limit
+            if overloaded:
+                if self._last_decrease is not None and permit.acquired_at < self._last_decrease:
+                    return
+                self._limit = max(self._limit * self._backoff_ratio, float(self._min_limit))
+                self._last_decrease = monotonic()
+                if self.limit < prev_limit:
+                    self._limit_decreases += 1
+                return
+            # only grow the limit while it is being used, otherwise an idle lane would grow it w/o bound
+            if self._in_flight * 2 < prev_limit and not (self._waiters or self._priority_waiters):
+                return
+            self._limit = min(self._limit + 1 / self._limit, float(self._max_limit))
+            if self.limit > prev_limit:
+                self._limit_increases += 1
+                while self._in_flight < self.limit and self._wake_next_waiter():
+                    self._in_flight += 1
+
+    def stats(self) -> AdmissionStatsCore:
+        """
+            **INTERNAL**
+        """
+        stats = super().stats()
+        stats['adaptive'] = True
+        stats['limit_decreases'] = self._limit_decreases
+        stats['limit_increases'] = self._limit_increases
+        stats['max_limit'] = self._max_limit
+        stats['min_limit'] = self._min_limit
+        return stats
+
+
+def raise_if_close_timed_out(drained: bool, closed: Optional[object]) -> None:
+    """
+        **INTERNAL**
+
+    Raises a :class:`~couchbase_columnar.exceptions.TimeoutError` if closing a cluster w/ a timeout did not complete
+    in time.  The cluster is closed either way, the error tells the application its in-flight queries were cut off or
+    its connections continue to close in the background.
+    """
+    if not drained:
+        raise TimeoutError(message=('Timed out draining the queries in-flight, the queries that had not completed were '
+                                    'cancelled when the cluster was closed.'))
+    if closed is False:
+        raise TimeoutError(message=('Timed out closing the cluster, its connections continue to close in the '
+                                    'background.'))
+
+
+@dataclass
+class _ExecutionLane:
+    """
+        **INTERNAL**
+    """
+    name: str
+    client: _CoreClient
+    limiter: _InFlightLimiter
+
+
+class _ExecutionLanes:
+    """
+        **INTERNAL**
+
+    The execution lanes of a cluster.  The default lane uses the cluster's primary connection, every other lane
+    has its own connection (and therefore its own I/O threads and HTTP connections).
+    """
+
+    def __init__(self) -> None:
+        self._lanes: Dict[str, _ExecutionLane] = {}
+        self._closing = False
+
+    @staticmethod
+    def _create_limiter(lane_options: Optional[ExecutionLaneOptionsTransformedKwargs],
+                        adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsTransformedKwargs] = None
+                        ) -> _InFlightLimiter:
+        """
+            **INTERNAL**
+
+        Every lane has a limiter so that its in-flight queries can be drained when the cluster is closed.  If adaptive
+        concurrency is enabled, each lane adapts its own limit and the lane's `max_in_flight` caps the limit.
+        """
+        max_in_flight = lane_options.get('max_in_flight') if lane_options is not None else None
+        if adaptive_concurrency is not None:
+            return _AdaptiveInFlightLimiter(adaptive_concurrency, max_in_flight)
+        return _InFlightLimiter(max_in_flight)
+
+    def connect(self,
+                default_client: _CoreClient,
+                req: ConnectRequest,
+                lane_options: Optional[Dict[str, ExecutionLaneOptionsTransformedKwargs]] = None,
+                share_connection: Optional[bool] = None,
+                adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsTransformedKwargs] = None) -> None:
+        """
+            **INTERNAL**
+        """
+        lane_options = lane_options or {}
+        default_limiter = self._create_limiter(lane_options.get(DEFAULT_EXECUTION_LANE), adaptive_concurrency)
+        lanes = {DEFAULT_EXECUTION_LANE: _ExecutionLane(DEFAULT_EXECUTION_LANE, default_client, default_limiter)}
+        try:
+            for lane_name, opts in lane_options.items():
+                if lane_name == DEFAULT_EXECUTION_LANE:
+                    continue
+                client = _CoreClient()
+                lane_req = req.for_execution_lane(opts)
+                ret = client.connect_shared(lane_req) if share_connection is True else client.connect(lane_req)
+                if isinstance(ret, CoreColumnarError):
+                    raise ErrorMapper.build_error(ret)
+                client.connection = ret
+                lanes[lane_name] = _ExecutionLane(lane_name, client, self._create_limiter(opts, adaptive_concurrency))
+        except BaseException:
+            # the cluster is not connected, close the primary connection and the lanes connected so far
+            self._close_clients([lane.client for lane in lanes.values()])
+            raise
+        self._lanes = lanes
+        self._closing = False
+
+    @staticmethod
+    def _close_clients(clients: List[_CoreClient]) -> None:
+        """
+            **INTERNAL**
+
+        Closes the clients' connections (shared connections are given back to the registry), errors are suppressed so
+        that the caller's error is raised.
+        """
+        for client in clients:
+            if not client.has_connection:
+                continue
+            try:
+                client.close_connection(CloseConnectionRequest())
+            except Exception:  # nosec
+                pass
+            # the connection is closed, the client must not use it again
+            client.abandon_connection()
+
+    def begin_close(self) -> None:
+        """
+            **INTERNAL**
+
+        Stops the lanes from admitting new queries.
+        """
+        self._closing = True
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+            **INTERNAL**
+
+        Blocks until every lane has no queries in-flight, or until the timeout (in seconds) expires.  Returns False
+        if the timeout expired.
+        """
+        deadline = monotonic() + timeout if timeout is not None else None
+        for lane in self._lanes.values():
+            remaining = max(deadline - monotonic(), 0) if deadline is not None else None
+            if not lane.limiter.wait_until_idle(remaining):
+                return False
+        return True
+
+    def close(self, req: CloseConnectionRequest) -> Tuple[CloseConnectionRequest, bool]:
+        """
+            **INTERNAL**
+
+        Closes the connection of every lane other than the default lane.  The request's timeout bounds closing all of
+        the lanes, the returned request (to close the default lane's connection with) has the remaining time.  The
+        returned flag is False if a lane's connection did not close before the timeout expired (it continues to close
+        in the background).
+        """
+        deadline = monotonic() + req.timeout / 1e6 if req.timeout is not None else None
+        closed = True
+        for lane in self._lanes.values():
+            if lane.name != DEFAULT_EXECUTION_LANE and lane.client.has_connection:
+                if lane.client.close_connection(self._remaining(req, deadline)) is False:
+                    closed = False
+        self._lanes = {}
+        return self._remaining(req, deadline), closed
+
+    def abandon(self) -> None:
+        """
+            **INTERNAL**
+
+        Drops the connection of every lane w/o closing it, used once the connections belong to the parent process.
+        """
+        for lane in self._lanes.values():
+            lane.client.abandon_connection()
+        self._lanes = {}
+
+    @staticmethod
+    def _remaining(req: CloseConnectionRequest, deadline: Optional[float]) -> CloseConnectionRequest:
+        """
+            **INTERNAL**
+        """
+        if deadline is None:
+            return req
+        # a timeout of 0 means no timeout to the bindings
+        return replace(req, timeout=max(int((deadline - monotonic()) * 1e6), 1))
+
+    def get(self, lane_name: Optional[str] = None) -> _ExecutionLane:
+        """
+            **INTERNAL**
+        """
+        if self._closing:
+            raise RuntimeError('Cannot use the cluster, it is being closed.')
+        lane = self._lanes.get(lane_name or DEFAULT_EXECUTION_LANE, None)
+        if lane is None:
+            raise ValueError((f'Execution lane {lane_name} does not exist. '
+                              f'Available lanes: {", ".join(self.names)}.'))
+        return lane
+
+    @property
+    def names(self) -> List[str]:
+        """
+            **INTERNAL**
+        """
+        return list(self._lanes.keys())
+
+    @property
+    def clients(self) -> List[_CoreClient]:
+        """
+            **INTERNAL**
+
+        The clients of the lanes, lanes that share a native connection (see the `share_connection` cluster option)
+        are only returned once.
+        """
+        clients: Dict[int, _CoreClient] = {}
+        for lane in self._lanes.values():
+            if lane.client.has_connection:
+                clients.setdefault(id(lane.client.connection), lane.client)
+        return list(clients.values())
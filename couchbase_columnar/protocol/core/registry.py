@@ -0,0 +1,160 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import json
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import (TYPE_CHECKING,
+                    Dict,
+                    Optional,
+                    Tuple)
+
+from couchbase_columnar.protocol.core import PyCapsuleType
+from couchbase_columnar.protocol.core.bootstrap_cache import create_connection_from_request
+from couchbase_columnar.protocol.core.fork import register_after_fork_in_child
+from couchbase_columnar.protocol.exceptions import CoreColumnarError
+from couchbase_columnar.protocol.pycbcc_core import close_connection
+
+if TYPE_CHECKING:
+    from couchbase_columnar.protocol.core.request import CloseConnectionRequest, ConnectRequest
+
+
+@dataclass
+class _RegistryEntry:
+    """
+        **INTERNAL**
+    """
+    key: str
+    refcount: int = 0
+    connect_ft: Future[PyCapsuleType] = field(default_factory=Future)
+
+
+class _ConnectionRegistry:
+    """
+        **INTERNAL**
+
+    Process-wide registry of native connections.  Clusters (sync or async) created with the `share_connection` cluster
+    option and the same connection string, credential and options share a single refcounted native connection.  The
+    native connection is closed once the last cluster using it is closed (or garbage collected).
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: Dict[str, _RegistryEntry] = {}
+
+    @staticmethod
+    def get_key(req: ConnectRequest) -> str:
+        """
+            **INTERNAL**
+
+        Returns the registry key for the connect request.  The key is a digest so that the registry does not keep the
+        credential around in plain text.
+        """
+        req_json = json.dumps(req.to_req_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(req_json.encode('utf-8')).hexdigest()
+
+    def acquire(self, req: ConnectRequest) -> Tuple[str, PyCapsuleType]:
+        """
+            **INTERNAL**
+
+        Returns the registry key and the shared native connection for the connect request, creating the connection if
+        needed.  Callers must call :meth:`release` with the key once they no longer use the connection.
+        """
+        key = self.get_key(req)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            create = entry is None
+            if entry is None:
+                entry = _RegistryEntry(key)
+                self._entries[key] = entry
+            entry.refcount += 1
+
+        if create:
+            self._create_connection(entry, req)
+
+        # if the connection failed, the entry has been removed from the registry so there is nothing to release
+        return key, entry.connect_ft.result()
+
+    def _create_connection(self, entry: _RegistryEntry, req: ConnectRequest) -> None:
+        """
+            **INTERNAL**
+        """
+        try:
+            ret = create_connection_from_request(req)
+        except BaseException as ex:
+            self._fail_entry(entry, ex)
+            return
+        if isinstance(ret, CoreColumnarError):
+            self._fail_entry(entry, ret)
+            return
+        entry.connect_ft.set_result(ret)
+
+    def _fail_entry(self, entry: _RegistryEntry, ex: BaseException) -> None:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            if self._entries.get(entry.key, None) is entry:
+                del self._entries[entry.key]
+        # every caller waiting on the connection raises the error
+        entry.connect_ft.set_exception(ex)
+
+    def release(self, key: str, req: Optional[CloseConnectionRequest] = None) -> bool:
+        """
+            **INTERNAL**
+
+        Releases a reference to a shared native connection.  When the last reference is released the connection is
+        removed from the registry and, if a close request is provided, closed (bounded by the request's timeout).
+        Otherwise the connection is torn down once the connection object is deallocated.  Returns False if the
+        connection did not close before the request's timeout expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return True
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return True
+            del self._entries[key]
+
+        if req is not None and entry.connect_ft.done() and entry.connect_ft.exception() is None:
+            return close_connection(entry.connect_ft.result(), **req.to_req_dict()) is not False
+        return True
+
+    def reset_after_fork(self) -> None:
+        """
+            **INTERNAL**
+
+        Called in the child after a fork.  The registered connections belong to the parent process, and the lock might
+        have been held by another of the parent's threads.
+        """
+        self._lock = Lock()
+        self._entries = {}
+
+    def refcount(self, key: str) -> int:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            return entry.refcount if entry is not None else 0
+
+
+_CONNECTION_REGISTRY = _ConnectionRegistry()
+register_after_fork_in_child(_CONNECTION_REGISTRY.reset_after_fork)
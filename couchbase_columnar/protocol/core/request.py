@@ -17,11 +17,15 @@ from __future__ import annotations
 
 import json
 import sys
-from dataclasses import asdict, dataclass
+from dataclasses import (asdict,
+                         dataclass,
+                         replace)
+from datetime import timedelta
 from typing import (TYPE_CHECKING,
                     Any,
                     Callable,
                     Dict,
+                    List,
                     Optional,
                     Tuple,
                     Union)
@@ -31,23 +35,37 @@ if sys.version_info < (3, 10):
 else:
     from typing import TypeAlias
 
+from couchbase_columnar.common.core.utils import timedelta_as_microseconds
 from couchbase_columnar.common.deserializer import Deserializer
 from couchbase_columnar.common.options import QueryOptions
 from couchbase_columnar.common.query import CancelToken
-from couchbase_columnar.protocol.options import ClusterOptionsTransformedKwargs, QueryOptionsTransformedKwargs
+from couchbase_columnar.common.resume import has_top_level_limit
+from couchbase_columnar.common.retry import BestEffortRetryStrategy, RetryStrategy
+from couchbase_columnar.common.tracing import RequestSpan
+from couchbase_columnar.protocol.options import (ClusterOptionsTransformedKwargs,
+                                                 ExecutionLaneOptionsTransformedKwargs,
+                                                 QueryOptionsTransformedKwargs)
 
 if TYPE_CHECKING:
     from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter as AsyncClientAdapter
+    from couchbase_columnar.protocol.connection import _ConnectionDetails
     from couchbase_columnar.protocol.core.client_adapter import _ClientAdapter as BlockingClientAdapter
 
+DEFAULT_PROGRESS_INTERVAL = timedelta_as_microseconds(timedelta(seconds=1))
+DEFAULT_QUERY_TIMEOUT = timedelta_as_microseconds(timedelta(minutes=10))
+
 
 @dataclass
 class CloseConnectionRequest:
     callback: Optional[Callable[..., None]] = None
     errback: Optional[Callable[..., None]] = None
+    timeout: Optional[int] = None
 
     def to_req_dict(self) -> Dict[str, Any]:
-        return ClusterRequestBuilder.to_req_dict(self)
+        req_dict = ClusterRequestBuilder.to_req_dict(self)
+        if req_dict.get('timeout', None) is None:
+            req_dict.pop('timeout', None)
+        return req_dict
 
 
 @dataclass
@@ -56,9 +74,16 @@ class ConnectRequest:
     credential: Dict[str, str]
     options: Optional[ClusterOptionsTransformedKwargs] = None
     enable_dns_srv: Optional[bool] = None
+    bootstrap_cache_path: Optional[str] = None
+    bootstrap_cache_ttl: Optional[int] = None
+    bootstrap_nodes: Optional[List[str]] = None
 
     def to_req_dict(self) -> Dict[str, Any]:
         req_dict = asdict(self)
+        # the bootstrap cache and the bootstrap nodes are handled by the Python client
+        req_dict.pop('bootstrap_cache_path')
+        req_dict.pop('bootstrap_cache_ttl')
+        req_dict.pop('bootstrap_nodes')
         if self.enable_dns_srv is False:
             if 'options' not in req_dict:
                 req_dict['options'] = {}
@@ -68,6 +93,30 @@ class ConnectRequest:
 
         return req_dict
 
+    def for_execution_lane(self, lane_options: ExecutionLaneOptionsTransformedKwargs) -> ConnectRequest:
+        options: ClusterOptionsTransformedKwargs = {**self.options} if self.options else {}
+        if 'num_io_threads' in lane_options:
+            options['num_io_threads'] = lane_options['num_io_threads']
+            # a fixed number of io threads for the lane overrides the cluster's auto setting
+            options.pop('max_io_threads', None)
+        if 'max_io_threads' in lane_options:
+            options['max_io_threads'] = lane_options['max_io_threads']
+        return ConnectRequest(self.connection_str,
+                              self.credential,
+                              options,
+                              self.enable_dns_srv,
+                              self.bootstrap_cache_path,
+                              self.bootstrap_cache_ttl,
+                              self.bootstrap_nodes)
+
+
+@dataclass
+class WarmupRequest:
+    timeout: Optional[int] = None
+
+    def to_req_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
 
 @dataclass
 class QueryRequest:
@@ -76,11 +125,38 @@ class QueryRequest:
     options: Optional[QueryOptionsTransformedKwargs] = None
     database_name: Optional[str] = None
     scope_name: Optional[str] = None
+    lane: Optional[str] = None
+    parent_span: Optional[RequestSpan] = None
+    slow_query_threshold: Optional[int] = None
+    progress_callback: Optional[Callable[..., Any]] = None
+    progress_interval: Optional[int] = None
+    capture_path: Optional[str] = None
+    retry_strategy: Optional[RetryStrategy] = None
+    resume_key: Optional[List[str]] = None
+    checkpoint_path: Optional[str] = None
+
+    @property
+    def priority(self) -> bool:
+        return self.options is not None and self.options.get('priority', None) is True
 
     def to_req_dict(self) -> Dict[str, Any]:
-        req_dict = {k: v for k, v in asdict(self).items() if v is not None}
-        # we don't need the deserializer in the request
+        # asdict() deep copies the fields, spans, callbacks and retry strategies might not be copyable (and C++ core
+        # does not need them)
+        req_dict = {k: v
+                    for k, v in asdict(replace(self,
+                                               parent_span=None,
+                                               progress_callback=None,
+                                               retry_strategy=None)).items()
+                    if v is not None}
+        # we don't need the deserializer, the execution lane, the slow query threshold, the progress interval, the
+        # capture path, the resume key or the checkpoint path
         req_dict.pop('deserializer', None)
+        req_dict.pop('lane', None)
+        req_dict.pop('slow_query_threshold', None)
+        req_dict.pop('progress_interval', None)
+        req_dict.pop('capture_path', None)
+        req_dict.pop('resume_key', None)
+        req_dict.pop('checkpoint_path', None)
         req_options = req_dict.pop('options', None)
         # core C++ wants all args JSONified,
         for opt_key, opt_val in req_options.items():
@@ -103,7 +179,74 @@ class QueryRequest:
 
 
 ClusterRequest: TypeAlias = Union[CloseConnectionRequest,
-                                  ConnectRequest]
+                                  ConnectRequest,
+                                  WarmupRequest]
+
+
+def create_query_request(conn_details: _ConnectionDetails,
+                         statement: str,
+                         q_opts: QueryOptionsTransformedKwargs,
+                         database_name: Optional[str] = None,
+                         scope_name: Optional[str] = None) -> QueryRequest:
+    """
+        **INTERNAL**
+
+    Creates the request for a cluster or scope level query from its transformed options, the options the Python client
+    handles itself are removed from the options sent to C++ core.
+    """
+    # add the default serializer if one does not exist
+    deserializer = q_opts.pop('deserializer', None) or conn_details.default_deserializer
+    # the execution lane determines which connection the query is executed on, C++ core does not need it
+    lane = q_opts.pop('lane', None)
+    # the Python client creates the query spans, C++ core does not need the parent span
+    parent_span = q_opts.pop('parent_span', None)
+    # the Python client logs the slow queries, the query's threshold overrides the cluster's threshold
+    slow_query_threshold = q_opts.pop('slow_query_threshold', None)
+    if slow_query_threshold is None:
+        slow_query_threshold = conn_details.slow_query_threshold
+    # the Python client calls the progress callback while the rows are iterated, C++ core does not need it
+    progress_callback = q_opts.pop('progress_callback', None)
+    progress_interval = q_opts.pop('progress_interval', None)
+    if progress_callback is not None and progress_interval is None:
+        progress_interval = DEFAULT_PROGRESS_INTERVAL
+    # the Python client records the query's response stream, C++ core does not need the capture path
+    capture_path = q_opts.pop('capture_path', None)
+    # the Python client resumes the query after its last returned row, C++ core does not need the resume key
+    resume_key = q_opts.pop('resume_key', None)
+    checkpoint_path = q_opts.pop('checkpoint_path', None)
+    if resume_key is None and checkpoint_path is not None:
+        raise ValueError('The checkpoint_path query option requires the resume_key query option.')
+    if resume_key is not None:
+        if q_opts.get('readonly', None) is False:
+            raise ValueError('A resumable query must be read-only.')
+        if has_top_level_limit(statement):
+            raise ValueError('A resumable query cannot have a LIMIT or OFFSET clause, the clause would be applied '
+                             'again to the rows selected when the query is resumed.')
+        # the query is executed again when it is resumed, make sure it does not modify any data
+        q_opts['readonly'] = True
+    # the Python client retries read-only queries, the attempts share the query's timeout
+    retry_strategy = q_opts.pop('retry_strategy', None) or conn_details.retry_strategy
+    if resume_key is not None and retry_strategy is None:
+        retry_strategy = BestEffortRetryStrategy()
+    if q_opts.get('readonly', None) is not True:
+        retry_strategy = None
+    elif retry_strategy is not None and q_opts.get('timeout', None) is None:
+        q_opts['timeout'] = conn_details.query_timeout or DEFAULT_QUERY_TIMEOUT
+
+    return QueryRequest(statement,
+                        deserializer,
+                        options=q_opts,
+                        database_name=database_name,
+                        scope_name=scope_name,
+                        lane=lane,
+                        parent_span=parent_span,
+                        slow_query_threshold=slow_query_threshold,
+                        progress_callback=progress_callback,
+                        progress_interval=progress_interval,
+                        capture_path=capture_path,
+                        retry_strategy=retry_strategy,
+                        resume_key=resume_key,
+                        checkpoint_path=checkpoint_path)
 
 
 class ClusterRequestBuilder:
@@ -117,10 +260,20 @@ class ClusterRequestBuilder:
         return ConnectRequest(self._conn_details.connection_str,
                               self._conn_details.credential,
                               self._conn_details.cluster_options,
-                              self._conn_details.enable_dns_srv)
+                              self._conn_details.enable_dns_srv,
+                              self._conn_details.bootstrap_cache_path,
+                              self._conn_details.bootstrap_cache_ttl)
+
+    def build_close_connection_request(self, timeout: Optional[timedelta] = None) -> CloseConnectionRequest:
+        if timeout is None:
+            return CloseConnectionRequest()
+        # a timeout of 0 means no timeout to the bindings
+        return CloseConnectionRequest(timeout=max(timedelta_as_microseconds(timeout), 1))
 
-    def build_close_connection_request(self) -> CloseConnectionRequest:
-        return CloseConnectionRequest()
+    def build_warmup_request(self, timeout: Optional[timedelta] = None) -> WarmupRequest:
+        if timeout is None:
+            return WarmupRequest()
+        return WarmupRequest(timeout=timedelta_as_microseconds(timeout))
 
     def build_query_request(self,  # noqa: C901
                             statement: str,
@@ -159,15 +312,7 @@ class ClusterRequestBuilder:
             q_opts['positional_parameters'] = parsed_args_list
         if named_params and len(named_params) > 0:
             q_opts['named_parameters'] = named_params
-        # add the default serializer if one does not exist
-        deserializer = q_opts.pop('deserializer', None) or self._conn_details.default_deserializer
-
-        final_opts = {}
-        for k, v in q_opts.items():
-            if k != 'deserializer':
-                final_opts[k] = v
-
-        return QueryRequest(statement, deserializer, options=q_opts), cancel_token
+        return create_query_request(self._conn_details, statement, q_opts), cancel_token
 
     @staticmethod
     def to_req_dict(request: ClusterRequest) -> Dict[str, Any]:
@@ -233,19 +378,11 @@ class ScopeRequestBuilder:
             q_opts['positional_parameters'] = parsed_args_list
         if named_params and len(named_params) > 0:
             q_opts['named_parameters'] = named_params
-        # add the default serializer if one does not exist
-        deserializer = q_opts.pop('deserializer', None) or self._conn_details.default_deserializer
-
-        final_opts = {}
-        for k, v in q_opts.items():
-            if k != 'deserializer':
-                final_opts[k] = v
-
-        return (QueryRequest(statement,
-                             deserializer,
-                             options=q_opts,
-                             database_name=self._database_name,
-                             scope_name=self._scope_name),
+        return (create_query_request(self._conn_details,
+                                     statement,
+                                     q_opts,
+                                     database_name=self._database_name,
+                                     scope_name=self._scope_name),
                 cancel_token)
 
     @staticmethod
@@ -0,0 +1,216 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List
+
+from couchbase_columnar.common.core.metrics import StatementStatisticsCore, StatementStatisticsSnapshotCore
+
+DEFAULT_STATEMENT_STATISTICS_CAPACITY = 1000
+
+
+class _LatencyHistogram:
+    """
+        **INTERNAL**
+
+    A sparse log-linear histogram of latencies (in microseconds), the relative error of a percentile is at most ~6%.
+    """
+
+    __slots__ = ('_buckets',)
+
+    SUB_BUCKET_BITS = 4
+
+    def __init__(self) -> None:
+        self._buckets: Dict[int, int] = {}
+
+    @classmethod
+    def _bucket(cls, value: int) -> int:
+        shift = max(value.bit_length() - cls.SUB_BUCKET_BITS - 1, 0)
+        # the shift is in the high bits so that the buckets are ordered by their values
+        return (shift << (cls.SUB_BUCKET_BITS + 1)) | (value >> shift)
+
+    @classmethod
+    def _upper_bound(cls, bucket: int) -> int:
+        shift = bucket >> (cls.SUB_BUCKET_BITS + 1)
+        sub_bucket = bucket & ((1 << (cls.SUB_BUCKET_BITS + 1)) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        bucket = self._bucket(value)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def merge(self, other: _LatencyHistogram) -> None:
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+
+    def percentile(self, percentile: float, count: int) -> int:
+        target = max(count * percentile / 100.0, 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= target:
+                return self._upper_bound(bucket)
+        return 0
+
+
+class _StatementStatistics:
+    """
+        **INTERNAL**
+    """
+
+    __slots__ = ('fingerprint', 'statement', 'calls', 'errors', 'timeouts', 'cancellations', 'rows', 'bytes',
+                 'total_latency', 'min_latency', 'max_latency', 'latency_histogram')
+
+    def __init__(self, fingerprint: str, statement: str) -> None:
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.cancellations = 0
+        self.rows = 0
+        self.bytes = 0
+        self.total_latency = 0
+        self.min_latency = 0
+        self.max_latency = 0
+        self.latency_histogram = _LatencyHistogram()
+
+    def record(self, outcome: str, latency: int, rows: int, num_bytes: int) -> None:
+        if outcome == 'timeout':
+            self.errors += 1
+            self.timeouts += 1
+        elif outcome == 'error':
+            self.errors += 1
+        elif outcome == 'cancel':
+            self.cancellations += 1
+        self.rows += rows
+        self.bytes += num_bytes
+        self.total_latency += latency
+        self.min_latency = latency if self.calls == 1 else min(self.min_latency, latency)
+        self.max_latency = max(self.max_latency, latency)
+        self.latency_histogram.record(latency)
+
+    def snapshot(self) -> StatementStatisticsCore:
+        return {
+            'fingerprint': self.fingerprint,
+            'statement': self.statement,
+            'calls': self.calls,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'cancellations': self.cancellations,
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'total_latency': self.total_latency,
+            'min_latency': self.min_latency,
+            'max_latency': self.max_latency,
+            'p50_latency': min(self.latency_histogram.percentile(50, self.calls), self.max_latency),
+            'p99_latency': min(self.latency_histogram.percentile(99, self.calls), self.max_latency),
+        }
+
+
+class _StatementStatisticsRegistry:
+    """
+        **INTERNAL**
+
+    Aggregates the statistics of the queries executed by a cluster per statement fingerprint (see
+    :func:`~couchbase_columnar.tracing.statement_fingerprint`).  The registry holds at most `capacity` statements, once
+    full the least frequently executed statement (the least recently executed one for ties) is evicted to make room
+    for a new statement.  Recording and evicting are O(1).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_STATEMENT_STATISTICS_CAPACITY) -> None:
+        self._capacity = capacity
+        self._lock = Lock()
+        self._entries: Dict[str, _StatementStatistics] = {}
+        # call count -> fingerprints with that call count, in least recently executed order
+        self._frequencies: Dict[int, OrderedDict[str, None]] = {}
+        self._min_frequency = 0
+        self._evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+            **INTERNAL**
+        """
+        return self._capacity
+
+    def _increment_frequency(self, entry: _StatementStatistics) -> None:
+        """
+            **INTERNAL**
+        """
+        if entry.calls > 0:
+            fingerprints = self._frequencies[entry.calls]
+            del fingerprints[entry.fingerprint]
+            if not fingerprints:
+                del self._frequencies[entry.calls]
+                if self._min_frequency == entry.calls:
+                    self._min_frequency += 1
+        entry.calls += 1
+        self._frequencies.setdefault(entry.calls, OrderedDict())[entry.fingerprint] = None
+
+    def _evict(self) -> None:
+        """
+            **INTERNAL**
+        """
+        fingerprints = self._frequencies[self._min_frequency]
+        fingerprint, _ = fingerprints.popitem(last=False)
+        if not fingerprints:
+            del self._frequencies[self._min_frequency]
+        del self._entries[fingerprint]
+        self._evictions += 1
+
+    def record(self,
+               fingerprint: str,
+               statement: str,
+               outcome: str,
+               latency: int,
+               rows: int,
+               num_bytes: int) -> None:
+        """
+            **INTERNAL**
+
+        Records a completed query, the latency is in microseconds.
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint, None)
+            if entry is None:
+                if len(self._entries) >= self._capacity:
+                    self._evict()
+                entry = _StatementStatistics(fingerprint, statement)
+                self._entries[fingerprint] = entry
+                self._min_frequency = 1
+            self._increment_frequency(entry)
+            entry.record(outcome, latency, rows, num_bytes)
+
+    def snapshot(self, reset: bool = False) -> StatementStatisticsSnapshotCore:
+        """
+            **INTERNAL**
+        """
+        with self._lock:
+            statements: List[StatementStatisticsCore] = [entry.snapshot() for entry in self._entries.values()]
+            evictions = self._evictions
+            if reset:
+                self._entries.clear()
+                self._frequencies.clear()
+                self._min_frequency = 0
+                self._evictions = 0
+        return {
+            'capacity': self._capacity,
+            'evictions': evictions,
+            'statements': statements,
+        }
@@ -22,6 +22,7 @@ from typing import (Any,
                     Dict,
                     List,
                     Literal,
+                    Mapping,
                     Optional,
                     Tuple,
                     TypedDict,
@@ -36,23 +37,43 @@ else:
 from couchbase_columnar.common.core.utils import (VALIDATE_BOOL,
                                                   VALIDATE_DESERIALIZER,
                                                   VALIDATE_INT,
+                                                  VALIDATE_REQUEST_SPAN,
+                                                  VALIDATE_REQUEST_TRACER,
+                                                  VALIDATE_RETRY_STRATEGY,
                                                   VALIDATE_STR,
                                                   VALIDATE_STR_LIST,
                                                   EnumToStr,
+                                                  num_io_threads_to_max,
                                                   timedelta_as_microseconds,
                                                   to_microseconds,
+                                                  validate_backoff_ratio,
+                                                  validate_bootstrap_cache_ttl,
+                                                  validate_concurrency_limit,
+                                                  validate_latency_threshold,
+                                                  validate_max_in_flight,
+                                                  validate_num_io_threads,
                                                   validate_path,
-                                                  validate_raw_dict)
+                                                  validate_progress_callback,
+                                                  validate_progress_interval,
+                                                  validate_raw_dict,
+                                                  validate_resume_key,
+                                                  validate_statement_statistics_capacity)
 from couchbase_columnar.common.deserializer import Deserializer
 from couchbase_columnar.common.enums import IpProtocol, QueryScanConsistency
-from couchbase_columnar.common.options import (ClusterOptions,
+from couchbase_columnar.common.options import (AdaptiveConcurrencyOptions,
+                                               ClusterOptions,
+                                               ExecutionLaneOptions,
                                                OptionsClass,
                                                QueryOptions,
                                                SecurityOptions,
                                                TimeoutOptions)
-from couchbase_columnar.common.options_base import (ClusterOptionsValidKeys,
+from couchbase_columnar.common.options_base import (AdaptiveConcurrencyOptionsValidKeys,
+                                                    ClusterOptionsValidKeys,
+                                                    ExecutionLaneOptionsValidKeys,
                                                     SecurityOptionsValidKeys,
                                                     TimeoutOptionsValidKeys)
+from couchbase_columnar.common.retry import RetryStrategy
+from couchbase_columnar.common.tracing import RequestSpan, RequestTracer
 
 QUERY_CONSISTENCY_TO_STR = EnumToStr[QueryScanConsistency]()
 
@@ -60,7 +81,10 @@ QueryStrVal = Union[List[str], str, bool, int]
 
 
 class ClusterOptionsTransforms(TypedDict):
+    adaptive_concurrency: Dict[Literal['adaptive_concurrency'], Callable[[Any], Any]]
     allow_unknown_qstr_options: Dict[Literal['allow_unknown_qstr_options'], Callable[[Any], bool]]
+    bootstrap_cache_path: Dict[Literal['bootstrap_cache_path'], Callable[[Any], str]]
+    bootstrap_cache_ttl: Dict[Literal['bootstrap_cache_ttl'], Callable[[Any], int]]
     config_poll_floor: Dict[Literal['config_poll_floor'], Callable[[Any], int]]
     config_poll_interval: Dict[Literal['config_poll_interval'], Callable[[Any], int]]
     deserializer: Dict[Literal['deserializer'], Callable[[Any], Deserializer]]
@@ -69,15 +93,27 @@ class ClusterOptionsTransforms(TypedDict):
     dns_port: Dict[Literal['dns_port'], Callable[[Any], int]]
     dump_configuration: Dict[Literal['dump_configuration'], Callable[[Any], bool]]
     enable_clustermap_notification: Dict[Literal['enable_clustermap_notification'], Callable[[Any], bool]]
+    execution_lanes: Dict[Literal['execution_lanes'], Callable[[Any], Any]]
     ip_protocol: Dict[Literal['use_ip_protocol'], Callable[[Any], str]]
+    lazy_connect: Dict[Literal['lazy_connect'], Callable[[Any], bool]]
     network: Dict[Literal['network'], Callable[[Any], str]]
+    num_io_threads: Dict[Literal['num_io_threads', 'max_io_threads'], Callable[[Any], Optional[int]]]
+    retry_strategy: Dict[Literal['retry_strategy'], Callable[[Any], RetryStrategy]]
     security_options: Dict[Literal['security_options'], Callable[[Any], Any]]
+    share_connection: Dict[Literal['share_connection'], Callable[[Any], bool]]
+    slow_query_threshold: Dict[Literal['slow_query_threshold'], Callable[[Any], int]]
+    statement_statistics: Dict[Literal['statement_statistics'], Callable[[Any], bool]]
+    statement_statistics_capacity: Dict[Literal['statement_statistics_capacity'], Callable[[Any], int]]
     timeout_options: Dict[Literal['timeout_options'], Callable[[Any], Any]]
+    tracer: Dict[Literal['tracer'], Callable[[Any], RequestTracer]]
     user_agent_extra: Dict[Literal['user_agent_extra'], Callable[[Any], str]]
 
 
 CLUSTER_OPTIONS_TRANSFORMS: ClusterOptionsTransforms = {
+    'adaptive_concurrency': {'adaptive_concurrency': lambda x: x},
     'allow_unknown_qstr_options': {'allow_unknown_qstr_options': VALIDATE_BOOL},
+    'bootstrap_cache_path': {'bootstrap_cache_path': VALIDATE_STR},
+    'bootstrap_cache_ttl': {'bootstrap_cache_ttl': validate_bootstrap_cache_ttl},
     'config_poll_floor': {'config_poll_floor': timedelta_as_microseconds},
     'config_poll_interval': {'config_poll_interval': timedelta_as_microseconds},
     'deserializer': {'deserializer': VALIDATE_DESERIALIZER},
@@ -86,16 +122,28 @@ CLUSTER_OPTIONS_TRANSFORMS: ClusterOptionsTransforms = {
     'dns_port': {'dns_port': VALIDATE_INT},
     'dump_configuration': {'dump_configuration': VALIDATE_BOOL},
     'enable_clustermap_notification': {'enable_clustermap_notification': VALIDATE_BOOL},
+    'execution_lanes': {'execution_lanes': lambda x: x},
     'ip_protocol': {'use_ip_protocol': EnumToStr[IpProtocol]()},
+    'lazy_connect': {'lazy_connect': VALIDATE_BOOL},
     'network': {'network': VALIDATE_STR},
+    'num_io_threads': {'num_io_threads': validate_num_io_threads, 'max_io_threads': num_io_threads_to_max},
+    'retry_strategy': {'retry_strategy': VALIDATE_RETRY_STRATEGY},
     'security_options': {'security_options': lambda x: x},
+    'share_connection': {'share_connection': VALIDATE_BOOL},
+    'slow_query_threshold': {'slow_query_threshold': timedelta_as_microseconds},
+    'statement_statistics': {'statement_statistics': VALIDATE_BOOL},
+    'statement_statistics_capacity': {'statement_statistics_capacity': validate_statement_statistics_capacity},
     'timeout_options': {'timeout_options': lambda x: x},
+    'tracer': {'tracer': VALIDATE_REQUEST_TRACER},
     'user_agent_extra': {'user_agent_extra': VALIDATE_STR},
 }
 
 
 class ClusterOptionsTransformedKwargs(TypedDict, total=False):
+    adaptive_concurrency: Optional[AdaptiveConcurrencyOptionsTransformedKwargs]
     allow_unknown_qstr_options: Optional[bool]
+    bootstrap_cache_path: Optional[str]
+    bootstrap_cache_ttl: Optional[int]
     config_poll_floor: Optional[int]
     config_poll_interval: Optional[int]
     deserializer: Optional[Deserializer]
@@ -104,13 +152,65 @@ class ClusterOptionsTransformedKwargs(TypedDict, total=False):
     dns_port: Optional[int]
     dump_configuration: Optional[bool]
     enable_clustermap_notification: Optional[bool]
+    execution_lanes: Optional[Dict[str, ExecutionLaneOptionsTransformedKwargs]]
+    lazy_connect: Optional[bool]
+    max_io_threads: Optional[int]
     network: Optional[str]
+    num_io_threads: Optional[int]
+    retry_strategy: Optional[RetryStrategy]
     security_options: Optional[SecurityOptionsTransformedKwargs]
+    share_connection: Optional[bool]
+    slow_query_threshold: Optional[int]
+    statement_statistics: Optional[bool]
+    statement_statistics_capacity: Optional[int]
     timeout_options: Optional[TimeoutOptionsTransformedKwargs]
+    tracer: Optional[RequestTracer]
     user_agent_extra: Optional[str]
     use_ip_protocol: Optional[str]
 
 
+class AdaptiveConcurrencyOptionsTransforms(TypedDict):
+    backoff_ratio: Dict[Literal['backoff_ratio'], Callable[[Any], float]]
+    initial_limit: Dict[Literal['initial_limit'], Callable[[Any], int]]
+    latency_threshold: Dict[Literal['latency_threshold'], Callable[[Any], int]]
+    max_limit: Dict[Literal['max_limit'], Callable[[Any], int]]
+    min_limit: Dict[Literal['min_limit'], Callable[[Any], int]]
+
+
+ADAPTIVE_CONCURRENCY_OPTIONS_TRANSFORMS: AdaptiveConcurrencyOptionsTransforms = {
+    'backoff_ratio': {'backoff_ratio': validate_backoff_ratio},
+    'initial_limit': {'initial_limit': validate_concurrency_limit},
+    'latency_threshold': {'latency_threshold': validate_latency_threshold},
+    'max_limit': {'max_limit': validate_concurrency_limit},
+    'min_limit': {'min_limit': validate_concurrency_limit},
+}
+
+
+class AdaptiveConcurrencyOptionsTransformedKwargs(TypedDict, total=False):
+    backoff_ratio: Optional[float]
+    initial_limit: Optional[int]
+    latency_threshold: Optional[int]
+    max_limit: Optional[int]
+    min_limit: Optional[int]
+
+
+class ExecutionLaneOptionsTransforms(TypedDict):
+    max_in_flight: Dict[Literal['max_in_flight'], Callable[[Any], int]]
+    num_io_threads: Dict[Literal['num_io_threads', 'max_io_threads'], Callable[[Any], Optional[int]]]
+
+
+EXECUTION_LANE_OPTIONS_TRANSFORMS: ExecutionLaneOptionsTransforms = {
+    'max_in_flight': {'max_in_flight': validate_max_in_flight},
+    'num_io_threads': {'num_io_threads': validate_num_io_threads, 'max_io_threads': num_io_threads_to_max},
+}
+
+
+class ExecutionLaneOptionsTransformedKwargs(TypedDict, total=False):
+    max_in_flight: Optional[int]
+    max_io_threads: Optional[int]
+    num_io_threads: Optional[int]
+
+
 class SecurityOptionsTransforms(TypedDict):
     trust_only_capella: Dict[Literal['trust_only_capella'], Callable[[Any], bool]]
     trust_only_pem_file: Dict[Literal['trust_only_pem_file'], Callable[[Any], str]]
@@ -174,72 +274,114 @@ class TimeoutOptionsTransformedKwargs(TypedDict, total=False):
 
 
 QueryOptionsValidKeys: TypeAlias = Literal[
+    'capture_path',
+    'checkpoint_path',
     'deserializer',
+    'lane',
     'lazy_execute',
     'named_parameters',
+    'parent_span',
     'positional_parameters',
     'priority',
+    'progress_callback',
+    'progress_interval',
     'query_context',
     'raw',
     'read_only',
+    'resume_key',
+    'retry_strategy',
     'scan_consistency',
+    'slow_query_threshold',
     'timeout',
 ]
 
 
 class QueryOptionsTransforms(TypedDict):
+    capture_path: Dict[Literal['capture_path'], Callable[[Any], str]]
+    checkpoint_path: Dict[Literal['checkpoint_path'], Callable[[Any], str]]
     deserializer: Dict[Literal['deserializer'], Callable[[Any], Deserializer]]
+    lane: Dict[Literal['lane'], Callable[[Any], str]]
     lazy_execute: Dict[Literal['lazy_execute'], Callable[[Any], bool]]
     named_parameters: Dict[Literal['named_parameters'], Callable[[Any], Any]]
+    parent_span: Dict[Literal['parent_span'], Callable[[Any], RequestSpan]]
     positional_parameters: Dict[Literal['positional_parameters'], Callable[[Any], Any]]
     priority: Dict[Literal['priority'], Callable[[Any], bool]]
+    progress_callback: Dict[Literal['progress_callback'], Callable[[Any], Callable[..., Any]]]
+    progress_interval: Dict[Literal['progress_interval'], Callable[[Any], int]]
     query_context: Dict[Literal['query_context'], Callable[[Any], str]]
     raw: Dict[Literal['raw'], Callable[[Any], Dict[str, Any]]]
     read_only: Dict[Literal['readonly'], Callable[[Any], bool]]
+    resume_key: Dict[Literal['resume_key'], Callable[[Any], List[str]]]
+    retry_strategy: Dict[Literal['retry_strategy'], Callable[[Any], RetryStrategy]]
     scan_consistency: Dict[Literal['scan_consistency'], Callable[[Any], str]]
+    slow_query_threshold: Dict[Literal['slow_query_threshold'], Callable[[Any], int]]
     timeout: Dict[Literal['timeout'], Callable[[Any], int]]
 
 
 QUERY_OPTIONS_TRANSFORMS: QueryOptionsTransforms = {
+    'capture_path': {'capture_path': VALIDATE_STR},
+    'checkpoint_path': {'checkpoint_path': VALIDATE_STR},
     'deserializer': {'deserializer': VALIDATE_DESERIALIZER},
+    'lane': {'lane': VALIDATE_STR},
     'lazy_execute': {'lazy_execute': VALIDATE_BOOL},
     'named_parameters':  {'named_parameters': lambda x: x},
+    'parent_span': {'parent_span': VALIDATE_REQUEST_SPAN},
     'positional_parameters':  {'positional_parameters': lambda x: x},
     'priority': {'priority': VALIDATE_BOOL},
+    'progress_callback': {'progress_callback': validate_progress_callback},
+    'progress_interval': {'progress_interval': validate_progress_interval},
     'query_context': {'query_context': VALIDATE_STR},
     'raw': {'raw': validate_raw_dict},
     'read_only': {'readonly': VALIDATE_BOOL},
+    'resume_key': {'resume_key': validate_resume_key},
+    'retry_strategy': {'retry_strategy': VALIDATE_RETRY_STRATEGY},
     'scan_consistency': {'scan_consistency': QUERY_CONSISTENCY_TO_STR},
+    'slow_query_threshold': {'slow_query_threshold': timedelta_as_microseconds},
     'timeout': {'timeout': to_microseconds}
 }
 
 
 class QueryOptionsTransformedKwargs(TypedDict, total=False):
+    capture_path: Optional[str]
+    checkpoint_path: Optional[str]
     deserializer: Optional[Deserializer]
+    lane: Optional[str]
     lazy_execute: Optional[bool]
     named_parameters: Optional[Any]
+    parent_span: Optional[RequestSpan]
     positional_parameters: Optional[Any]
     priority: Optional[bool]
+    progress_callback: Optional[Callable[..., Any]]
+    progress_interval: Optional[int]
     query_context: Optional[str]
     raw: Optional[Dict[str, Any]]
     readonly: Optional[bool]
+    resume_key: Optional[List[str]]
+    retry_strategy: Optional[RetryStrategy]
     scan_consistency: Optional[str]
+    slow_query_threshold: Optional[int]
     timeout: Optional[int]
 
 
 TransformedOptionKwargs = TypeVar('TransformedOptionKwargs',
+                                  AdaptiveConcurrencyOptionsTransformedKwargs,
                                   QueryOptionsTransformedKwargs,
                                   ClusterOptionsTransformedKwargs,
+                                  ExecutionLaneOptionsTransformedKwargs,
                                   SecurityOptionsTransformedKwargs,
                                   TimeoutOptionsTransformedKwargs)
 
 TransformedClusterOptionKwargs = TypeVar('TransformedClusterOptionKwargs',
+                                         AdaptiveConcurrencyOptionsTransformedKwargs,
                                          ClusterOptionsTransformedKwargs,
+                                         ExecutionLaneOptionsTransformedKwargs,
                                          SecurityOptionsTransformedKwargs,
                                          TimeoutOptionsTransformedKwargs)
 
 TransformDetailsPair = Union[Tuple[List[QueryOptionsValidKeys], QueryOptionsTransforms],
                              Tuple[List[ClusterOptionsValidKeys], ClusterOptionsTransforms],
+                             Tuple[List[AdaptiveConcurrencyOptionsValidKeys], AdaptiveConcurrencyOptionsTransforms],
+                             Tuple[List[ExecutionLaneOptionsValidKeys], ExecutionLaneOptionsTransforms],
                              Tuple[List[SecurityOptionsValidKeys], SecurityOptionsTransforms],
                              Tuple[List[TimeoutOptionsValidKeys], TimeoutOptionsTransforms],
                              ]
@@ -270,6 +412,10 @@ class OptionsBuilder:
 
         if option_type == 'ClusterOptions':
             return ClusterOptions.VALID_OPTION_KEYS, CLUSTER_OPTIONS_TRANSFORMS
+        elif option_type == 'AdaptiveConcurrencyOptions':
+            return AdaptiveConcurrencyOptions.VALID_OPTION_KEYS, ADAPTIVE_CONCURRENCY_OPTIONS_TRANSFORMS
+        elif option_type == 'ExecutionLaneOptions':
+            return ExecutionLaneOptions.VALID_OPTION_KEYS, EXECUTION_LANE_OPTIONS_TRANSFORMS
         elif option_type == 'SecurityOptions':
             return SecurityOptions.VALID_OPTION_KEYS, SECURITY_OPTIONS_TRANSFORMS
         elif option_type == 'TimeoutOptions':
@@ -327,11 +473,49 @@ class OptionsBuilder:
         if transformed_timeout_opts:
             temp_options['timeout_options'] = transformed_timeout_opts
 
+        execution_lanes = temp_options.pop('execution_lanes', None)
+        if execution_lanes is not None:
+            temp_options['execution_lanes'] = self._build_execution_lanes(execution_lanes)
+
+        adaptive_concurrency = temp_options.pop('adaptive_concurrency', None)
+        if adaptive_concurrency is not None:
+            temp_options['adaptive_concurrency'] = self._build_adaptive_concurrency(adaptive_concurrency)
+
         # transform final ClusterOptions
         transformed_opts = self.build_options(option_type, output_type, temp_options)
 
         return transformed_opts
 
+    def _build_adaptive_concurrency(self, adaptive_concurrency: object) -> AdaptiveConcurrencyOptionsTransformedKwargs:
+        if not isinstance(adaptive_concurrency, dict):
+            raise ValueError('Expected adaptive_concurrency to be AdaptiveConcurrencyOptions.')
+
+        transformed_opts = self.build_options(AdaptiveConcurrencyOptions,
+                                              AdaptiveConcurrencyOptionsTransformedKwargs,
+                                              {},
+                                              adaptive_concurrency)
+        min_limit = transformed_opts.get('min_limit', None)
+        max_limit = transformed_opts.get('max_limit', None)
+        if min_limit is not None and max_limit is not None and min_limit > max_limit:
+            raise ValueError(f'Expected min_limit ({min_limit}) to be at most max_limit ({max_limit}).')
+        return transformed_opts
+
+    def _build_execution_lanes(self, execution_lanes: object) -> Dict[str, ExecutionLaneOptionsTransformedKwargs]:
+        if not isinstance(execution_lanes, Mapping):
+            raise ValueError(f'Expected execution_lanes to be a dict instead of {type(execution_lanes)}.')
+
+        transformed_lanes: Dict[str, ExecutionLaneOptionsTransformedKwargs] = {}
+        for lane_name, lane_opts in execution_lanes.items():
+            if not isinstance(lane_name, str) or not lane_name:
+                raise ValueError(f'Expected execution lane name to be a non-empty str instead of {lane_name}.')
+            if not isinstance(lane_opts, dict):
+                raise ValueError(f'Expected options for execution lane {lane_name} to be ExecutionLaneOptions.')
+            transformed_lanes[lane_name] = self.build_options(ExecutionLaneOptions,
+                                                              ExecutionLaneOptionsTransformedKwargs,
+                                                              {},
+                                                              lane_opts)
+        return transformed_lanes
+
     def build_options(self,
                       option_type: type[OptionsClass],
                       output_type: type[TransformedOptionKwargs],
@@ -16,10 +16,14 @@
 from enum import IntEnum, auto
 from typing import (Any,
                     Dict,
+                    List,
                     Optional,
                     Union)
 
-from couchbase_columnar.common.core.query import QueryMetadataCore
+from couchbase_columnar.common.core.metrics import (CoreStatsCore,
+                                                    IoStatsCore,
+                                                    QueryOutcomeMetricsCore)
+from couchbase_columnar.common.core.query import QueryMetadataCore, QueryProgressCore
 from couchbase_columnar.protocol.core import PyCapsuleType
 from couchbase_columnar.protocol.exceptions import CoreColumnarError
 
@@ -42,6 +46,7 @@ class pycbcc_logger:
     def configure_logging_sink(self, *args: object, **kwargs: object) -> None: ...
     def create_console_logger(self, *args: object, **kwargs: object) -> None: ...
     def enable_protocol_logger(self, *args: object, **kwargs: object) -> None: ...
+    def flush_logging_sink(self, *args: object, **kwargs: object) -> bool: ...
 
 class result:
     raw_result: Dict[str, Any]
@@ -58,6 +63,7 @@ class columnar_query_iterator:
     def cancel(self) -> None: ...
     def wait_for_core_query_result(self) -> Union[bool, CoreColumnarError]: ...
     def metadata(self) -> Optional[QueryMetadataCore]: ...
+    def progress(self) -> QueryProgressCore: ...
     # def is_cancelled(self, *args: object, **kwargs: object) -> bool: ...
     def __iter__(self) -> Any: ...
     def __next__(self) -> Any: ...
@@ -67,6 +73,11 @@ def close_connection(*args: object, **kwargs: object) -> bool: ...
 def cluster_info(*args: object, **kwargs: object) -> result: ...
 def create_connection(*args: object, **kwargs: object) -> PyCapsuleType: ...
 def get_connection_info(*args: object, **kwargs: object) -> result: ...
+def warmup_connection(*args: object, **kwargs: object) -> List[Dict[str, Any]]: ...
+def get_bootstrap_nodes(*args: object, **kwargs: object) -> List[str]: ...
+def get_io_thread_stats(*args: object, **kwargs: object) -> IoStatsCore: ...
+def get_query_metrics(*args: object, **kwargs: object) -> List[QueryOutcomeMetricsCore]: ...
+def stats(*args: object, **kwargs: object) -> CoreStatsCore: ...
 def _test_exception_builder(error_type: int,
                             build_cpp_core_exception: Optional[bool]=False,
                             set_inner_cause: Optional[bool]=False) -> CoreColumnarError: ...
@@ -15,25 +15,38 @@
 
 from __future__ import annotations
 
+import weakref
 from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Event
+from time import sleep
 from typing import (TYPE_CHECKING,
                     Any,
+                    Callable,
                     Optional,
                     Union)
 
 from couchbase_columnar.common.exceptions import (ColumnarError,
                                                   InternalSDKError,
                                                   QueryOperationCanceledError)
-from couchbase_columnar.common.query import CancelToken, QueryMetadata
-from couchbase_columnar.common.streaming import StreamingExecutor, StreamingState
+from couchbase_columnar.common.query import (CancelToken,
+                                             QueryMetadata,
+                                             QueryProgress)
+from couchbase_columnar.common.resume import QueryResumer
+from couchbase_columnar.common.streaming import (ClientMetricsRecorder,
+                                                 ProgressReporter,
+                                                 QueryInstrumentation,
+                                                 QueryRetryHandler,
+                                                 StreamingExecutor,
+                                                 StreamingState)
 from couchbase_columnar.protocol.core.result import CoreQueryIterator
 from couchbase_columnar.protocol.exceptions import (ClientError,
                                                     CoreColumnarError,
                                                     ErrorMapper)
 
 if TYPE_CHECKING:
+    from couchbase_columnar.common.capture import QueryCaptureWriter
     from couchbase_columnar.protocol.core.client import _CoreClient
+    from couchbase_columnar.protocol.core.lanes import _InFlightLimiter, _InFlightPermit
     from couchbase_columnar.protocol.core.request import QueryRequest
 
 
@@ -46,10 +59,28 @@ class _QueryStreamingExecutor(StreamingExecutor):
                  client: _CoreClient,
                  request: QueryRequest,
                  cancel_token: Optional[CancelToken] = None,
-                 lazy_execute: Optional[bool] = None) -> None:
+                 lazy_execute: Optional[bool] = None,
+                 limiter: Optional[_InFlightLimiter] = None,
+                 instrumentation: Optional[QueryInstrumentation] = None) -> None:
         self._client = client
         self._request = request
+        self._limiter = limiter
+        self._permit: Optional[_InFlightPermit] = None
         self._deserializer = request.deserializer
+        self._client_metrics = ClientMetricsRecorder()
+        self._progress_reporter = ProgressReporter.create(request)
+        self._retry_handler: Optional[QueryRetryHandler] = None
+        self._capture: Optional[QueryCaptureWriter] = None
+        self._resumer: Optional[QueryResumer] = None
+        if request.resume_key is not None:
+            self._resumer = QueryResumer.create(request)
+            if self._resumer is not None and request.checkpoint_path is not None:
+                # make sure the checkpoint is written if the result is dropped before all rows are iterated
+                weakref.finalize(self, self._resumer.checkpoint)
+        self._instrumentation = instrumentation
+        if instrumentation is not None:
+            # make sure the query's instrumentation is finished if the result is dropped before all rows are iterated
+            weakref.finalize(self, instrumentation.finish, outcome='abandoned')
         if lazy_execute is not None:
             self._lazy_execute = lazy_execute
         else:
@@ -104,6 +135,27 @@ class _QueryStreamingExecutor(StreamingExecutor):
         if self._cancel_token is not None and not self._cancel_token.token.is_set():
             self._cancel_token.token.set()
         self._streaming_state = StreamingState.Cancelled
+        self._release_permit()
+        self._finish_instrumentation(outcome='cancel')
+
+    def _acquire_permit(self) -> None:
+        """
+            **INTERNAL**
+
+        Blocks until the query is allowed to execute on its execution lane.
+        """
+        if self._limiter is None:
+            return
+        self._permit = self._limiter.acquire(priority=self._request.priority)
+        # make sure the lane's slot is given back if the result is dropped before all rows are iterated
+        weakref.finalize(self, self._permit.release)
+
+    def _release_permit(self) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._permit is not None:
+            self._permit.release()
 
     def get_metadata(self) -> QueryMetadata:
         """
@@ -134,8 +186,24 @@ class _QueryStreamingExecutor(StreamingExecutor):
             raise ErrorMapper.build_error(query_metadata)
         if query_metadata is None:
             return
+        if self._capture is not None:
+            self._capture.metadata_received(query_metadata)
+        self._client_metrics.add_to_metadata(query_metadata)
         self._metadata = QueryMetadata(query_metadata)
 
+    def get_progress(self) -> QueryProgress:
+        """
+            **INTERNAL**
+        """
+        if not hasattr(self, '_query_iter'):
+            # the query has not been dispatched yet
+            return QueryProgress({})
+        result_count = self._metadata.metrics().result_count() if self._metadata is not None else None
+        progress = self._query_iter.progress()
+        if self._resumer is not None:
+            progress = self._resumer.progress(progress)
+        return QueryProgress(progress, result_count=result_count)
+
     def set_threadpool_executor(self, tp_executor: ThreadPoolExecutor) -> None:
         """
             **INTERNAL**
@@ -147,10 +215,61 @@ class _QueryStreamingExecutor(StreamingExecutor):
             **INTERNAL**
         """
         res = self._query_iter.wait_for_core_query_result()
-        if isinstance(res, CoreColumnarError):
-            return ErrorMapper.build_error(res)
+        while isinstance(res, CoreColumnarError):
+            err = ErrorMapper.build_error(res)
+            if not self._retry(err):
+                if self._cancel_token is not None and self._cancel_token.token.is_set():
+                    # the query was canceled while waiting to be retried
+                    return QueryOperationCanceledError(str(err))
+                return err
+            res = self._query_iter.wait_for_core_query_result()
         return res
 
+    def _retry(self, err: Exception) -> bool:
+        """
+            **INTERNAL**
+
+        Dispatches the query again if the failed attempt is retried, the query keeps its execution lane slot.
+        """
+        if self._retry_handler is None:
+            return False
+        delay = self._retry_handler.retry_after(err)
+        if delay is None:
+            return False
+        if self._permit is not None:
+            # the lane's limiter adapts its limit to the failed attempt
+            self._permit.response_received(err)
+        if self._cancel_token is not None:
+            if self._cancel_token.token.wait(delay):
+                return False
+        else:
+            sleep(delay)
+        self._client_metrics.retrying()
+        self._dispatch()
+        if self._cancel_token is not None and self._cancel_token.token.is_set():
+            # canceled while the query was dispatched again, cancel() might have canceled the previous attempt
+            self._query_iter.cancel()
+        return True
+
+    def _resume(self, err: Exception) -> Optional[Exception]:
+        """
+            **INTERNAL**
+
+        Dispatches a resumable query again for the rows after its last returned row, if the failed attempt is retried.
+        Returns the error the query fails with if it is not resumed.
+        """
+        if self._resumer is None or self._retry_handler is None:
+            return err
+        if self._resumer.progressed:
+            # the attempt returned rows, the retry strategy starts over
+            self._retry_handler.reset()
+        if not self._retry(err):
+            if self._cancel_token is not None and self._cancel_token.token.is_set():
+                return QueryOperationCanceledError(str(err))
+            return err
+        res = self._get_core_query_result()
+        return res if isinstance(res, Exception) else None
+
     def submit_query(self) -> None:
         """
             **INTERNAL**
@@ -159,17 +278,99 @@ class _QueryStreamingExecutor(StreamingExecutor):
             raise RuntimeError('Query has been canceled or previously executed.')
 
         self._streaming_state = StreamingState.Started
+        self._acquire_permit()
+        self._retry_handler = QueryRetryHandler.create(self._request)
+        self._dispatch()
+
+        res = self._get_core_query_result()
+        if isinstance(res, Exception):
+            self._headers_received(res)
+            self._release_permit()
+            raise res
+        self._headers_received(res)
+
+    def _dispatch(self) -> None:
+        """
+            **INTERNAL**
+        """
+        self._start_capture()
+        if self._resumer is not None:
+            self._resumer.apply()
+        if self._instrumentation is not None:
+            self._instrumentation.dispatch_started()
         try:
             self._query_iter = self._client.columnar_query_op(self._request)
         except Exception as ex:
+            self._release_permit()
             # suppress context, we know we have raised an error from the bindings
             if isinstance(ex, CoreColumnarError):
-                raise ErrorMapper.build_error(ex) from None
-            raise InternalSDKError(str(ex)) from None
+                err: Exception = ErrorMapper.build_error(ex)
+            else:
+                err = InternalSDKError(str(ex))
+            self._finish_instrumentation(err)
+            raise err from None
+        if self._instrumentation is not None:
+            self._instrumentation.dispatch_completed()
 
-        res = self._query_iter.wait_for_core_query_result()
-        if isinstance(res, CoreColumnarError):
-            raise ErrorMapper.build_error(res)
+    def _headers_received(self, res: Union[bool, Exception]) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._permit is not None:
+            # the lane's limiter adapts its limit to the query's response
+            self._permit.response_received(res if isinstance(res, Exception) else None)
+        if isinstance(res, Exception):
+            self._finish_instrumentation(res)
+            return
+        if self._instrumentation is not None:
+            self._instrumentation.headers_received()
+        if self._capture is not None:
+            self._capture.headers_received()
+
+    def _start_capture(self) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._request.capture_path is None or self._capture is not None:
+            # a retried query keeps recording to the capture of its first attempt
+            return
+        # only imported if a query is captured, the capture module is rarely used
+        from couchbase_columnar.common.capture import QueryCaptureWriter
+        self._capture = QueryCaptureWriter.create(self._request)
+        if self._capture is not None:
+            # make sure the capture file is closed if the result is dropped before all rows are iterated
+            weakref.finalize(self, self._capture.close)
+
+    def _finish_instrumentation(self,
+                                error: Optional[Exception] = None,
+                                outcome: Optional[str] = None,
+                                metadata: Optional[Callable[[], Optional[QueryMetadata]]] = None) -> None:
+        """
+            **INTERNAL**
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.finish(error,
+                                         outcome=outcome,
+                                         deserialize_ns=self._client_metrics.deserialize_ns,
+                                         metadata=metadata)
+        if self._capture is not None and not self._capture.closed:
+            if metadata is not None:
+                # fetching the metadata records it to the capture
+                metadata()
+            self._capture.finish(error, outcome=outcome)
+        if self._resumer is not None:
+            self._resumer.finish(completed=error is None and outcome is None)
+
+    def _completed_metadata(self) -> Optional[QueryMetadata]:
+        """
+            **INTERNAL**
+
+        Returns the metadata of a query whose rows have all been streamed, used by the slow query log.
+        """
+        try:
+            return self.get_metadata()
+        except (ColumnarError, InternalSDKError, RuntimeError):
+            return None
 
     def _wait_for_result(self) -> None:
         """
@@ -184,9 +385,11 @@ class _QueryStreamingExecutor(StreamingExecutor):
                 self.cancel()
 
         res = self._query_res_ft.result()
+        self._headers_received(res)
         if isinstance(res, QueryOperationCanceledError):
-            pass
+            self._release_permit()
         elif isinstance(res, Exception):
+            self._release_permit()
             raise res
 
     def submit_query_in_background(self) -> None:
@@ -197,17 +400,47 @@ class _QueryStreamingExecutor(StreamingExecutor):
             raise RuntimeError('Query has been canceled or previously executed.')
 
         self._streaming_state = StreamingState.Started
-        try:
-            self._query_iter = self._client.columnar_query_op(self._request)
-        except Exception as ex:
-            # suppress context, we know we have raised an error from the bindings
-            if isinstance(ex, CoreColumnarError):
-                raise ErrorMapper.build_error(ex) from None
-            raise InternalSDKError(str(ex)) from None
+        self._acquire_permit()
+        self._retry_handler = QueryRetryHandler.create(self._request)
+        self._dispatch()
 
         self._query_res_ft = self._tp_executor.submit(self._get_core_query_result)
         self._wait_for_result()
 
+    def _next_core_row(self) -> Any:
+        """
+            **INTERNAL**
+
+        Returns the next row from the bindings, a query that fails while its rows are streamed is resumed (see the
+        `resume_key` query option) if possible, the query's error is raised otherwise.
+        """
+        row = next(self._query_iter)
+        while isinstance(row, CoreColumnarError):
+            err = self._resume(ErrorMapper.build_error(row))
+            if err is not None:
+                self._release_permit()
+                self._finish_instrumentation(err)
+                raise err
+            row = next(self._query_iter)
+        return row
+
+    def _rows_completed(self) -> None:
+        """
+            **INTERNAL**
+
+        Finishes a query once all of its rows have been streamed.
+        """
+        if self._streaming_state == StreamingState.Completed:
+            # another thread iterating the same result received the end of the rows
+            return
+        self._streaming_state = StreamingState.Completed
+        self._release_permit()
+        self._finish_instrumentation(metadata=self._completed_metadata)
+        if self._progress_reporter is not None:
+            # the result count is only known once all rows have been streamed
+            self._completed_metadata()
+            self._progress_reporter.completed(self.get_progress)
+
     def get_next_row(self) -> Any:
         """
             **INTERNAL**
@@ -219,12 +452,20 @@ class _QueryStreamingExecutor(StreamingExecutor):
             self.cancel()
             raise StopIteration
 
-        row = next(self._query_iter)
-        if isinstance(row, CoreColumnarError):
-            raise ErrorMapper.build_error(row)
+        self._client_metrics.row_requested()
+        row = self._next_core_row()
         # should only be None once query request is complete and _no_ errors found
         if row is None:
-            self._streaming_state = StreamingState.Completed
+            self._rows_completed()
             raise StopIteration
 
-        return self._deserializer.deserialize(row)
+        if self._instrumentation is not None:
+            self._instrumentation.row_received(row)
+        if self._capture is not None:
+            self._capture.row_received(row)
+        if self._progress_reporter is not None:
+            self._progress_reporter.row_received(self.get_progress)
+        value = self._client_metrics.deserialize(self._deserializer, row)
+        if self._resumer is not None:
+            self._resumer.row_returned(row, value)
+        return value
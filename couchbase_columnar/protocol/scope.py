@@ -16,9 +16,11 @@
 from __future__ import annotations
 
 from concurrent.futures import Future, ThreadPoolExecutor
+from time import time_ns
 from typing import TYPE_CHECKING, Union
 
 from couchbase_columnar.common.result import BlockingQueryResult
+from couchbase_columnar.common.streaming import QueryInstrumentation
 from couchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 from couchbase_columnar.protocol.core.request import ScopeRequestBuilder
 from couchbase_columnar.protocol.query import _QueryStreamingExecutor
@@ -66,12 +68,20 @@ class Scope:
                       statement: str,
                       *args: object,
                       **kwargs: object) -> Union[BlockingQueryResult, Future[BlockingQueryResult]]:
+        request_start = time_ns()
         req, cancel_token = self._request_builder.build_query_request(statement, *args, **kwargs)
         lazy_execute = req.options.pop('lazy_execute', None)
-        executor = _QueryStreamingExecutor(self.client_adapter.client,
+        lane = self.client_adapter.get_execution_lane(req.lane)
+        instrumentation = QueryInstrumentation.create(req,
+                                                      tracer=self.client_adapter.connection_details.tracer,
+                                                      statistics=self.client_adapter.statement_statistics,
+                                                      request_start=request_start)
+        executor = _QueryStreamingExecutor(lane.client,
                                            req,
                                            cancel_token=cancel_token,
-                                           lazy_execute=lazy_execute)
+                                           lazy_execute=lazy_execute,
+                                           limiter=lane.limiter,
+                                           instrumentation=instrumentation)
         if executor.cancel_token is not None:
             executor.set_threadpool_executor(self.threadpool_executor)
             if lazy_execute is True:
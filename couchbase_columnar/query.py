@@ -15,6 +15,8 @@
 
 from couchbase_columnar.common.enums import QueryScanConsistency as QueryScanConsistency  # noqa: F401
 from couchbase_columnar.common.query import CancelToken as CancelToken  # noqa: F401
+from couchbase_columnar.common.query import QueryClientMetrics as QueryClientMetrics  # noqa: F401
 from couchbase_columnar.common.query import QueryMetadata as QueryMetadata  # noqa: F401
 from couchbase_columnar.common.query import QueryMetrics as QueryMetrics  # noqa: F401
+from couchbase_columnar.common.query import QueryProgress as QueryProgress  # noqa: F401
 from couchbase_columnar.common.query import QueryWarning as QueryWarning  # noqa: F401
@@ -0,0 +1,155 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Thread
+from time import sleep
+from typing import (TYPE_CHECKING,
+                    Callable,
+                    List)
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.exceptions import QueryError
+from couchbase_columnar.options import AdaptiveConcurrencyOptions, ExecutionLaneOptions
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class AdmissionTestSuite:
+    TEST_MANIFEST = [
+        'test_admission_stats',
+        'test_limit_decreases_when_overloaded',
+        'test_limit_increases',
+        'test_priority',
+    ]
+
+    STATEMENT = 'SELECT * FROM admission;'
+    OVERLOADED_STATEMENT = 'SELECT * FROM admission_overloaded;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statements(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=10))
+        mock_server.register_response(self.OVERLOADED_STATEMENT, MockQueryResponse(rows=10))
+
+    def wait_until_queued(self, cluster: Cluster, queued: int) -> None:
+        for _ in range(500):
+            if cluster.admission_stats().queued() == queued:
+                return
+            sleep(0.01)
+        pytest.fail(f'Expected {queued} queries to be waiting to be admitted.')
+
+    def test_admission_stats(self, test_env: BlockingTestEnvironment) -> None:
+        stats = test_env.cluster.admission_stats()
+        assert stats.adaptive() is False
+        assert stats.limit() is None
+        admitted = stats.admitted()
+        assert len(test_env.cluster.execute_query(self.STATEMENT).get_all_rows()) == 10
+        stats = test_env.cluster.admission_stats()
+        assert stats.admitted() == admitted + 1
+        assert stats.in_flight() == 0
+        assert stats.queued() == 0
+        with pytest.raises(ValueError):
+            test_env.cluster.admission_stats(lane='does-not-exist')
+
+    def test_limit_decreases_when_overloaded(self,
+                                             create_cluster: Callable[..., Cluster],
+                                             mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.OVERLOADED_STATEMENT, MockFault(status=503, error_code=23007, times=3))
+        opts = AdaptiveConcurrencyOptions(initial_limit=8, min_limit=2, backoff_ratio=0.5)
+        cluster = create_cluster(adaptive_concurrency=opts)
+        assert cluster.admission_stats().limit() == 8
+        for _ in range(3):
+            with pytest.raises(QueryError):
+                cluster.execute_query(self.OVERLOADED_STATEMENT)
+        stats = cluster.admission_stats()
+        assert stats.adaptive() is True
+        # 8 -> 4 -> 2, the minimum limit stops the third decrease
+        assert stats.limit() == 2
+        assert stats.limit_decreases() == 2
+        assert stats.in_flight() == 0
+
+    def test_limit_increases(self, create_cluster: Callable[..., Cluster]) -> None:
+        opts = AdaptiveConcurrencyOptions(initial_limit=2, max_limit=8)
+        cluster = create_cluster(adaptive_concurrency=opts,
+                                 execution_lanes={'bulk': ExecutionLaneOptions(max_in_flight=4)})
+
+        def run_queries(lane: str) -> None:
+            for _ in range(25):
+                assert len(cluster.execute_query(self.STATEMENT, lane=lane).get_all_rows()) == 10
+
+        with ThreadPoolExecutor(max_workers=8) as tp:
+            list(tp.map(run_queries, ['default'] * 8))
+            list(tp.map(run_queries, ['bulk'] * 8))
+
+        stats = cluster.admission_stats()
+        assert stats.limit_increases() > 0
+        assert 2 < (stats.limit() or 0) <= 8
+        assert stats.admitted() == 200
+        # each lane adapts its limit independently, the lane's max_in_flight caps the limit
+        bulk_stats = cluster.admission_stats(lane='bulk')
+        assert 2 < (bulk_stats.limit() or 0) <= 4
+        assert bulk_stats.admitted() == 200
+
+    def test_priority(self, create_cluster: Callable[..., Cluster]) -> None:
+        cluster = create_cluster(execution_lanes={'default': ExecutionLaneOptions(max_in_flight=1)})
+        # the result holds the lane's only slot until its rows have been iterated
+        result = cluster.execute_query(self.STATEMENT)
+        admitted: List[str] = []
+
+        def run_query(name: str, priority: bool) -> None:
+            cluster.execute_query(self.STATEMENT, priority=priority).get_all_rows()
+            admitted.append(name)
+
+        waiters = [Thread(target=run_query, args=('normal', False)), Thread(target=run_query, args=('priority', True))]
+        for idx, waiter in enumerate(waiters):
+            waiter.start()
+            self.wait_until_queued(cluster, idx + 1)
+        assert len(result.get_all_rows()) == 10
+        for waiter in waiters:
+            waiter.join()
+        assert admitted == ['priority', 'normal']
+        stats = cluster.admission_stats()
+        assert stats.queued() == 0
+        assert stats.queue_wait_max_time() > timedelta(0)
+
+
+class ClusterAdmissionTests(AdmissionTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterAdmissionTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterAdmissionTests) if valid_test_method(meth)]
+        test_list = set(AdmissionTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
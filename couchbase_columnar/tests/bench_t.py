@@ -0,0 +1,133 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from couchbase_columnar.bench import (BenchConfig,
+                                      BenchStatement,
+                                      run_bench)
+from couchbase_columnar.bench.__main__ import main
+from tests.environments.mock_server import MockColumnarServer, MockQueryResponse
+
+
+class BenchTestSuite:
+    TEST_MANIFEST = [
+        'test_closed_loop',
+        'test_invalid_config',
+        'test_main',
+        'test_multiple_processes',
+        'test_open_loop',
+        'test_statement_mix',
+    ]
+
+    SMALL_STATEMENT = 'SELECT * FROM bench WHERE size = "small";'
+    LARGE_STATEMENT = 'SELECT * FROM bench WHERE size = "large";'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statements(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.SMALL_STATEMENT, MockQueryResponse(rows=10))
+        mock_server.register_response(self.LARGE_STATEMENT, MockQueryResponse(rows=1000))
+
+    def bench_config(self, mock_server: MockColumnarServer, **kwargs: Any) -> BenchConfig:
+        username, password = mock_server.credentials
+        opts = {
+            'statements': [BenchStatement(self.SMALL_STATEMENT)],
+            'warmup': 0.5,
+            'duration': 1.0,
+            **kwargs
+        }
+        return BenchConfig(mock_server.connection_string,
+                           username,
+                           password,
+                           trust_pem_file=mock_server.certificate_path,
+                           **opts)
+
+    @pytest.mark.parametrize('api', ['blocking', 'async'])
+    def test_closed_loop(self, mock_server: MockColumnarServer, api: str) -> None:
+        report = run_bench(self.bench_config(mock_server, api=api, workers=4))
+        assert report.total.queries > 0
+        assert report.total.error_count == 0
+        assert report.total.rows == report.total.queries * 10
+        assert report.queries_per_second() > 0
+        assert report.cpu_per_row_us() > 0
+        latency = report.total.percentiles()
+        assert 0 < latency['p50'] <= latency['p95'] <= latency['p99'] <= latency['p99.9'] <= latency['max']
+
+    def test_invalid_config(self, mock_server: MockColumnarServer) -> None:
+        with pytest.raises(ValueError):
+            run_bench(self.bench_config(mock_server, statements=[]))
+        with pytest.raises(ValueError):
+            run_bench(self.bench_config(mock_server, rate=0))
+        with pytest.raises(ValueError):
+            run_bench(self.bench_config(mock_server, cluster_options={'not_an_option': 1}))
+
+    def test_main(self, mock_server: MockColumnarServer, tmp_path: Any) -> None:
+        output = tmp_path / 'bench.json'
+        username, password = mock_server.credentials
+        assert main(['--connstr', mock_server.connection_string,
+                     '--username', username,
+                     '--password', password,
+                     '--trust-pem-file', mock_server.certificate_path,
+                     '--statement', self.SMALL_STATEMENT,
+                     '--warmup', '0',
+                     '--duration', '1',
+                     '--cluster-option', 'num_io_threads=2',
+                     '--query-option', 'timeout=5',
+                     '--deserializer', 'passthrough',
+                     '--output', str(output)]) == 0
+        results = json.loads(output.read_text())
+        assert results['queries'] > 0
+        assert results['config']['cluster_options'] == {'num_io_threads': '2'}
+        assert set(results['latency_ms']) == {'p50', 'p95', 'p99', 'p99.9', 'max'}
+
+    def test_multiple_processes(self, mock_server: MockColumnarServer) -> None:
+        report = run_bench(self.bench_config(mock_server, processes=2, workers=2))
+        assert report.total.queries > 0
+        assert report.total.error_count == 0
+
+    @pytest.mark.parametrize('api', ['blocking', 'async'])
+    def test_open_loop(self, mock_server: MockColumnarServer, api: str) -> None:
+        rate = 50.0
+        config = self.bench_config(mock_server, api=api, workers=2, rate=rate, arrival='poisson', seed=42)
+        report = run_bench(config)
+        assert report.total.error_count == 0
+        # the mock server easily keeps up with the arrival rate
+        assert rate * config.duration * 0.5 <= report.total.queries <= rate * config.duration * 1.5
+
+    def test_statement_mix(self, mock_server: MockColumnarServer) -> None:
+        statements = [BenchStatement(self.SMALL_STATEMENT, weight=3), BenchStatement(self.LARGE_STATEMENT)]
+        report = run_bench(self.bench_config(mock_server, statements=statements, workers=2, seed=42))
+        results = {s['statement']: s for s in report.to_dict()['statements']}
+        assert set(results) == {self.SMALL_STATEMENT, self.LARGE_STATEMENT}
+        assert results[self.SMALL_STATEMENT]['rows'] == results[self.SMALL_STATEMENT]['queries'] * 10
+        assert results[self.LARGE_STATEMENT]['rows'] == results[self.LARGE_STATEMENT]['queries'] * 1000
+
+
+class ClusterBenchTests(BenchTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterBenchTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterBenchTests) if valid_test_method(meth)]
+        test_list = set(BenchTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
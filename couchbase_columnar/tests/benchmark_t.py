@@ -0,0 +1,246 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from statistics import median
+from threading import Barrier, Event
+from time import perf_counter_ns
+from typing import (TYPE_CHECKING,
+                    List,
+                    Tuple)
+
+import pytest
+
+from couchbase_columnar.capture import QueryCapture
+from couchbase_columnar.options import QueryOptions
+from couchbase_columnar.query import CancelToken
+from couchbase_columnar.result import BlockingQueryResult
+from tests import YieldFixture
+from tests.environments.benchmark import (BENCHMARK_REPLAY_SPEED,
+                                          BenchmarkRecorder,
+                                          BenchmarkResult,
+                                          capture_params,
+                                          gil_enabled,
+                                          peak_rss_kb,
+                                          stream_thread_counts)
+from tests.environments.mock_server import (MockCapturedResponse,
+                                            MockColumnarServer,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+STREAMING_RESPONSES = [
+    pytest.param(MockQueryResponse(rows=100_000, row_width=64, rows_per_chunk=100), id='narrow'),
+    pytest.param(MockQueryResponse(rows=20_000, row_width=1024, rows_per_chunk=10), id='wide'),
+]
+
+
+class BenchmarkTestSuite:
+    TEST_MANIFEST = [
+        'test_benchmark_cancel_token',
+        'test_benchmark_lazy_execute',
+        'test_benchmark_multi_stream_decode',
+        'test_benchmark_query_overhead',
+        'test_benchmark_replay',
+        'test_benchmark_rows_per_second',
+        'test_benchmark_time_to_first_row',
+    ]
+
+    ITERATIONS = 3
+    OVERHEAD_ITERATIONS = 200
+    TTFR_ITERATIONS = 50
+
+    def register_capture(self, mock_server: MockColumnarServer, capture_path: str) -> Tuple[str, MockQueryResponse]:
+        capture = QueryCapture.load(capture_path)
+        response = MockCapturedResponse(capture=capture, speed=BENCHMARK_REPLAY_SPEED)
+        statement = f'SELECT * FROM capture WHERE fingerprint = "{capture.statement_fingerprint()}";'
+        mock_server.register_response(statement, response)
+        return statement, response
+
+    def register_statement(self, mock_server: MockColumnarServer, response: MockQueryResponse) -> str:
+        statement = (f'SELECT * FROM benchmark WHERE rows = {response.rows} AND width = {response.row_width} '
+                     f'AND chunk = {response.rows_per_chunk};')
+        mock_server.register_response(statement, response)
+        return statement
+
+    def drain(self, result: BlockingQueryResult) -> int:
+        return sum(1 for _ in result.rows())
+
+    @pytest.fixture(scope='class', autouse=True)
+    def warm_up(self, test_env: BlockingTestEnvironment, mock_server: MockColumnarServer) -> None:
+        # the first query pays for bootstrapping the connection
+        statement = self.register_statement(mock_server, MockQueryResponse(rows=1))
+        test_env.assert_rows(test_env.cluster_or_scope.execute_query(statement), 1)
+
+    def test_benchmark_cancel_token(self,
+                                    test_env: BlockingTestEnvironment,
+                                    mock_server: MockColumnarServer,
+                                    benchmark_recorder: BenchmarkRecorder) -> None:
+        response = MockQueryResponse(rows=100_000, row_width=64, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            ft = test_env.cluster_or_scope.execute_query(statement, CancelToken(Event()))
+            assert isinstance(ft, Future)
+            rows += self.drain(ft.result())
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('cancel_token', 'couchbase', 'cancel-token', rows,
+                                                  self.ITERATIONS, elapsed, peak_rss_kb=peak_rss_kb()))
+
+    def test_benchmark_lazy_execute(self,
+                                    test_env: BlockingTestEnvironment,
+                                    mock_server: MockColumnarServer,
+                                    benchmark_recorder: BenchmarkRecorder) -> None:
+        response = MockQueryResponse(rows=100_000, row_width=64, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            result = test_env.cluster_or_scope.execute_query(statement, QueryOptions(lazy_execute=True))
+            rows += self.drain(result)
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('lazy_execute', 'couchbase', 'lazy-execute', rows,
+                                                  self.ITERATIONS, elapsed, peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.parametrize('num_threads', stream_thread_counts())
+    def test_benchmark_multi_stream_decode(self,
+                                           test_env: BlockingTestEnvironment,
+                                           mock_server: MockColumnarServer,
+                                           benchmark_recorder: BenchmarkRecorder,
+                                           num_threads: int) -> None:
+        response = MockQueryResponse(rows=50_000, row_width=256, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+        barrier = Barrier(num_threads + 1)
+
+        def consume() -> int:
+            barrier.wait()
+            return sum(self.drain(test_env.cluster_or_scope.execute_query(statement)) for _ in range(self.ITERATIONS))
+
+        with ThreadPoolExecutor(max_workers=num_threads) as tp:
+            fts = [tp.submit(consume) for _ in range(num_threads)]
+            barrier.wait()
+            start = perf_counter_ns()
+            rows = sum(ft.result() for ft in fts)
+            elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS * num_threads
+        mode = 'gil' if gil_enabled() else 'free-threaded'
+        benchmark_recorder.record(BenchmarkResult(f'multi_stream_decode[threads={num_threads}]', 'couchbase', mode,
+                                                  rows, self.ITERATIONS * num_threads, elapsed,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    def test_benchmark_query_overhead(self,
+                                      test_env: BlockingTestEnvironment,
+                                      mock_server: MockColumnarServer,
+                                      benchmark_recorder: BenchmarkRecorder) -> None:
+        statement = self.register_statement(mock_server, MockQueryResponse(rows=1))
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.OVERHEAD_ITERATIONS):
+            rows += self.drain(test_env.cluster_or_scope.execute_query(statement))
+        elapsed = perf_counter_ns() - start
+        assert rows == self.OVERHEAD_ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('query_overhead', 'couchbase', 'blocking', rows,
+                                                  self.OVERHEAD_ITERATIONS, elapsed, peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.parametrize('capture_path', capture_params())
+    def test_benchmark_replay(self,
+                              test_env: BlockingTestEnvironment,
+                              mock_server: MockColumnarServer,
+                              benchmark_recorder: BenchmarkRecorder,
+                              request: pytest.FixtureRequest,
+                              capture_path: str) -> None:
+        statement, response = self.register_capture(mock_server, capture_path)
+        rows = 0
+        first_row_times: List[int] = []
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            query_start = perf_counter_ns()
+            row_iter = iter(test_env.cluster_or_scope.execute_query(statement).rows())
+            if next(row_iter, None) is not None:
+                first_row_times.append(perf_counter_ns() - query_start)
+                rows += 1
+            rows += sum(1 for _ in row_iter)
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult(f'replay[{request.node.callspec.id}]', 'couchbase', 'replay', rows,
+                                                  self.ITERATIONS, elapsed,
+                                                  time_to_first_row_ns=int(median(first_row_times or [0])),
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    @pytest.mark.parametrize('response', STREAMING_RESPONSES)
+    def test_benchmark_rows_per_second(self,
+                                       test_env: BlockingTestEnvironment,
+                                       mock_server: MockColumnarServer,
+                                       benchmark_recorder: BenchmarkRecorder,
+                                       request: pytest.FixtureRequest,
+                                       response: MockQueryResponse) -> None:
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        start = perf_counter_ns()
+        for _ in range(self.ITERATIONS):
+            rows += self.drain(test_env.cluster_or_scope.execute_query(statement))
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.ITERATIONS
+        benchmark_recorder.record(BenchmarkResult(f'rows_per_second[{request.node.callspec.id}]', 'couchbase',
+                                                  'blocking', rows, self.ITERATIONS, elapsed,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    def test_benchmark_time_to_first_row(self,
+                                         test_env: BlockingTestEnvironment,
+                                         mock_server: MockColumnarServer,
+                                         benchmark_recorder: BenchmarkRecorder) -> None:
+        response = MockQueryResponse(rows=1000, row_width=64, rows_per_chunk=100)
+        statement = self.register_statement(mock_server, response)
+        rows = 0
+        first_row_times: List[int] = []
+        start = perf_counter_ns()
+        for _ in range(self.TTFR_ITERATIONS):
+            query_start = perf_counter_ns()
+            row_iter = iter(test_env.cluster_or_scope.execute_query(statement).rows())
+            next(row_iter)
+            first_row_times.append(perf_counter_ns() - query_start)
+            rows += 1 + sum(1 for _ in row_iter)
+        elapsed = perf_counter_ns() - start
+        assert rows == response.rows * self.TTFR_ITERATIONS
+        benchmark_recorder.record(BenchmarkResult('time_to_first_row', 'couchbase', 'blocking', rows,
+                                                  self.TTFR_ITERATIONS, elapsed,
+                                                  time_to_first_row_ns=int(median(first_row_times)),
+                                                  peak_rss_kb=peak_rss_kb()))
+
+
+class ClusterBenchmarkTests(BenchmarkTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterBenchmarkTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterBenchmarkTests) if valid_test_method(meth)]
+        test_list = set(BenchmarkTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
@@ -0,0 +1,147 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.credential import Credential
+from couchbase_columnar.options import (ClusterOptions,
+                                        SecurityOptions,
+                                        TimeoutOptions)
+from couchbase_columnar.protocol.core.bootstrap_cache import (_BootstrapCache,
+                                                              _BootstrapCacheEntry,
+                                                              with_nodes)
+from tests.environments.mock_server import MockColumnarServer, MockQueryResponse
+
+
+class BootstrapCacheTestSuite:
+    TEST_MANIFEST = [
+        'test_bootstrap_from_cache',
+        'test_entry_expired',
+        'test_entry_invalid',
+        'test_entry_round_trip',
+        'test_stale_entry',
+        'test_with_nodes',
+    ]
+
+    STATEMENT = 'SELECT * FROM bootstrap_cache;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=10))
+
+    def create_cluster(self, mock_server: MockColumnarServer, cache_path: str) -> Cluster:
+        username, password = mock_server.credentials
+        opts = ClusterOptions(bootstrap_cache_path=cache_path,
+                              security_options=SecurityOptions.trust_only_pem_file(mock_server.certificate_path),
+                              timeout_options=TimeoutOptions(connect_timeout=timedelta(seconds=2)))
+        return Cluster.create_instance(mock_server.connection_string,
+                                       Credential.from_username_and_password(username, password),
+                                       opts)
+
+    def run_query(self, mock_server: MockColumnarServer, cache_path: str) -> None:
+        cluster = self.create_cluster(mock_server, cache_path)
+        try:
+            assert len(cluster.execute_query(self.STATEMENT).get_all_rows()) == 10
+        finally:
+            cluster.close()
+
+    def test_bootstrap_from_cache(self, mock_server: MockColumnarServer, tmp_path: Any) -> None:
+        cache = _BootstrapCache(str(tmp_path))
+        self.run_query(mock_server, str(tmp_path))
+        entry = cache.load(mock_server.connection_string)
+        assert entry is not None
+        assert entry.nodes == [f'{mock_server.host}:{mock_server.kv_port}']
+
+        # bootstrapping from the cached nodes refreshes them, but the entry still expires when the connection string
+        # was resolved plus the TTL
+        self.run_query(mock_server, str(tmp_path))
+        refreshed = cache.load(mock_server.connection_string)
+        assert refreshed is not None
+        assert refreshed.nodes == entry.nodes
+        assert refreshed.resolved_at == entry.resolved_at
+
+    def test_entry_expired(self, tmp_path: Any) -> None:
+        cache = _BootstrapCache(str(tmp_path), ttl=int(60 * 1e6))
+        conn_str = 'couchbases://columnar.example.com'
+        cache.store(_BootstrapCacheEntry(conn_str, ['node1.example.com:11207'], time.time() - 120))
+        assert cache.load(conn_str) is None
+        # expired entries are removed
+        assert not (tmp_path / f'{cache.get_key(conn_str)}.json').exists()
+
+    @pytest.mark.parametrize('nodes', [[], ['node1.example.com'], ['node1.example.com:port'], ['a.com/x:11207'], 42])
+    def test_entry_invalid(self, tmp_path: Any, nodes: Any) -> None:
+        cache = _BootstrapCache(str(tmp_path))
+        conn_str = 'couchbases://columnar.example.com'
+        cache.store(_BootstrapCacheEntry(conn_str, nodes, time.time()))
+        assert cache.load(conn_str) is None
+
+        # entries that are not valid JSON, or do not belong to the connection string, are ignored
+        with open(cache.entry_path(conn_str), 'w') as entry_file:
+            entry_file.write('{"nodes": ')
+        assert cache.load(conn_str) is None
+        with open(cache.entry_path(conn_str), 'w') as entry_file:
+            json.dump({'connection_str': 'couchbases://other.example.com',
+                       'nodes': ['node1.example.com:11207'],
+                       'resolved_at': time.time()}, entry_file)
+        assert cache.load(conn_str) is None
+
+    def test_entry_round_trip(self, tmp_path: Any) -> None:
+        cache = _BootstrapCache(str(tmp_path / 'cache'))
+        conn_str = 'couchbases://columnar.example.com'
+        assert cache.load(conn_str) is None
+        entry = _BootstrapCacheEntry(conn_str, ['node1.example.com:11207', 'node2.example.com:11207'], time.time())
+        cache.store(entry)
+        assert cache.load(conn_str) == entry
+        # no temporary files are left behind
+        assert [p.name for p in (tmp_path / 'cache').iterdir()] == [f'{cache.get_key(conn_str)}.json']
+        cache.invalidate(conn_str)
+        assert cache.load(conn_str) is None
+
+    def test_stale_entry(self, mock_server: MockColumnarServer, tmp_path: Any) -> None:
+        cache = _BootstrapCache(str(tmp_path))
+        # nothing listens on port 1, bootstrapping from the cached nodes fails and the connection string is used
+        cache.store(_BootstrapCacheEntry(mock_server.connection_string, [f'{mock_server.host}:1'], time.time()))
+        self.run_query(mock_server, str(tmp_path))
+        entry = cache.load(mock_server.connection_string)
+        assert entry is not None
+        assert entry.nodes == [f'{mock_server.host}:{mock_server.kv_port}']
+
+    def test_with_nodes(self) -> None:
+        nodes = ['node1.example.com:11207', 'node2.example.com:11207']
+        assert with_nodes('couchbases://columnar.example.com', nodes) == \
+            'couchbases://node1.example.com:11207,node2.example.com:11207'
+        assert with_nodes('couchbases://columnar.example.com?network=external', nodes) == \
+            'couchbases://node1.example.com:11207,node2.example.com:11207?network=external'
+
+
+class ClusterBootstrapCacheTests(BootstrapCacheTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterBootstrapCacheTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterBootstrapCacheTests) if valid_test_method(meth)]
+        test_list = set(BootstrapCacheTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
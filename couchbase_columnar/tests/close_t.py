@@ -0,0 +1,107 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.exceptions import TimeoutError
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse,
+                                            cluster_has_connection)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class CloseTestSuite:
+    TEST_MANIFEST = [
+        'test_close_drain',
+        'test_close_drain_timeout',
+        'test_close_shared_timeout',
+    ]
+
+    STATEMENT = 'SELECT * FROM close;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=100, rows_per_chunk=10))
+
+    def test_close_drain(self, create_cluster: Callable[..., Cluster]) -> None:
+        cluster = create_cluster()
+        assert len(cluster.execute_query(self.STATEMENT).get_all_rows()) == 100
+        # nothing is in-flight, the cluster closes cleanly
+        cluster.close(timeout=timedelta(seconds=5), drain=True)
+        assert cluster_has_connection(cluster) is False
+
+    def test_close_drain_timeout(self,
+                                 create_cluster: Callable[..., Cluster],
+                                 mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(stall_after_rows=10))
+        cluster = create_cluster()
+        # the result holds its execution lane slot until its rows have been iterated, the stalled query never completes
+        result = cluster.execute_query(self.STATEMENT)
+        assert result is not None
+        start = perf_counter()
+        with pytest.raises(TimeoutError):
+            cluster.close(timeout=timedelta(milliseconds=500), drain=True)
+        assert perf_counter() - start < 5
+        # the cluster is closed even though the stalled query was cut off
+        assert cluster_has_connection(cluster) is False
+
+    def test_close_shared_timeout(self,
+                                  create_cluster: Callable[..., Cluster],
+                                  mock_server: MockColumnarServer) -> None:
+        clusters = [create_cluster(share_connection=True) for _ in range(2)]
+        # the shared connection is still used by the other cluster, it stays open
+        clusters[0].close(timeout=timedelta(seconds=5))
+        assert len(clusters[1].execute_query(self.STATEMENT).get_all_rows()) == 100
+
+        mock_server.register_fault(self.STATEMENT, MockFault(stall_after_rows=10))
+        result = clusters[1].execute_query(self.STATEMENT)
+        assert result is not None
+        start = perf_counter()
+        # the last cluster closes the shared connection, bounded by the close timeout
+        with pytest.raises(TimeoutError):
+            clusters[1].close(timeout=timedelta(milliseconds=500), drain=True)
+        assert perf_counter() - start < 5
+        assert all(cluster_has_connection(cluster) is False for cluster in clusters)
+
+
+class ClusterCloseTests(CloseTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterCloseTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterCloseTests) if valid_test_method(meth)]
+        test_list = set(CloseTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
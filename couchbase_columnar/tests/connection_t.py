@@ -15,7 +15,9 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import (Dict,
+                    List,
+                    Optional)
 
 import pytest
 
@@ -26,12 +28,31 @@ from couchbase_columnar.protocol.core.client_adapter import _ClientAdapter
 
 class ConnectionTestSuite:
     TEST_MANIFEST = [
+        'test_close_connection_request',
         'test_connection_string_options',
         'test_dns_srv_disabled',
         'test_invalid_connection_strings',
+        'test_shared_connection_key',
         'test_valid_connection_strings',
+        'test_wait_until_connected_threads',
     ]
 
+    def test_close_connection_request(self) -> None:
+        from datetime import timedelta
+
+        from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
+
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred)
+        builder = ClusterRequestBuilder(client)
+        # the bindings wait for the close to complete if a timeout is not provided
+        assert 'timeout' not in builder.build_close_connection_request().to_req_dict()
+        req = builder.build_close_connection_request(timedelta(seconds=2.5))
+        assert req.to_req_dict() == {'timeout': 2500000}
+        # a timeout of 0 means no timeout to the bindings, an expired deadline should not wait indefinitely
+        req = builder.build_close_connection_request(timedelta(0))
+        assert req.to_req_dict() == {'timeout': 1}
+
     @pytest.mark.parametrize('connstr, expected_opts',
                              [('couchbases://10.0.0.1?dns_nameserver=127.0.0.1&dump_configuration=true',
                                {'dns_nameserver': '127.0.0.1', 'dump_configuration': True}),
@@ -97,6 +118,32 @@ class ConnectionTestSuite:
         with pytest.raises(ValueError):
             Cluster.create_instance(connstr, cred)
 
+    def test_shared_connection_key(self) -> None:
+        from acouchbase_columnar.protocol.core.client_adapter import _ClientAdapter as _AsyncClientAdapter
+        from couchbase_columnar.protocol.core.registry import _ConnectionRegistry
+        from couchbase_columnar.protocol.core.request import ClusterRequestBuilder
+
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred, share_connection=True)
+        req = ClusterRequestBuilder(client).build_connection_request()
+        key = _ConnectionRegistry.get_key(req)
+        # the key should not contain the credential
+        assert 'password' not in key
+
+        # sync and async clusters w/ the same connection string, credential and options share a key
+        async_client = _AsyncClientAdapter('couchbases://localhost', cred, share_connection=True)
+        async_req = ClusterRequestBuilder(async_client).build_connection_request()
+        assert key == _ConnectionRegistry.get_key(async_req)
+
+        other_cred = Credential.from_username_and_password('Administrator', 'password1')
+        other_client = _ClientAdapter('couchbases://localhost', other_cred, share_connection=True)
+        other_req = ClusterRequestBuilder(other_client).build_connection_request()
+        assert key != _ConnectionRegistry.get_key(other_req)
+
+        other_client = _ClientAdapter('couchbases://localhost', cred, share_connection=True, num_io_threads=2)
+        other_req = ClusterRequestBuilder(other_client).build_connection_request()
+        assert key != _ConnectionRegistry.get_key(other_req)
+
     @pytest.mark.parametrize('connstr', ['couchbases://10.0.0.1',
                                          'couchbases://10.0.0.1:11222,10.0.0.2,10.0.0.3:11207',
                                          'couchbases://10.0.0.1;10.0.0.2:11210;10.0.0.3',
@@ -118,6 +165,49 @@ class ConnectionTestSuite:
         expected_conn_str = connstr.split('?')[0]
         assert expected_conn_str == client.connection_details.connection_str
 
+    def test_wait_until_connected_threads(self) -> None:
+        import sys
+        from concurrent.futures import Future
+        from threading import Barrier, Thread
+
+        from couchbase_columnar.protocol.core.result import CoreResult
+
+        cred = Credential.from_username_and_password('Administrator', 'password')
+        client = _ClientAdapter('couchbases://localhost', cred)
+        errors: List[BaseException] = []
+        num_threads = 8
+
+        def wait(barrier: Barrier) -> None:
+            barrier.wait()
+            try:
+                client.wait_until_connected()
+            except BaseException as ex:
+                errors.append(ex)
+
+        # switch threads as often as possible so that the threads interleave while checking for the connection
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for idx in range(200):
+                connect_ft: Future[Optional[CoreResult]] = Future()
+                client._connect_ft = connect_ft
+                barrier = Barrier(num_threads + 1)
+                threads = [Thread(target=wait, args=(barrier,)) for _ in range(num_threads)]
+                for thread in threads:
+                    thread.start()
+                # the background connection completes before, or while, the threads wait on it
+                if idx % 2 == 0:
+                    connect_ft.set_result(None)
+                barrier.wait()
+                if not connect_ft.done():
+                    connect_ft.set_result(None)
+                for thread in threads:
+                    thread.join()
+                assert errors == []
+                assert client.connection_pending is False
+        finally:
+            sys.setswitchinterval(switch_interval)
+
 
 class ConnectionTests(ConnectionTestSuite):
 
@@ -0,0 +1,208 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from threading import Timer
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from couchbase_columnar.exceptions import (ColumnarError,
+                                           QueryError,
+                                           TimeoutError)
+from couchbase_columnar.options import QueryOptions
+from tests import YieldFixture
+from tests.environments.benchmark import (BenchmarkRecorder,
+                                          BenchmarkResult,
+                                          peak_rss_kb)
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+def to_ns(duration: timedelta) -> int:
+    return int(duration.total_seconds() * 1e9)
+
+
+class FaultTestSuite:
+    TEST_MANIFEST = [
+        'test_cancel_while_stalled',
+        'test_mid_stream_disconnect',
+        'test_service_unavailable',
+        'test_slow_first_byte',
+        'test_timeout_while_stalled',
+        'test_trickling_rows',
+    ]
+
+    # how late a timeout or a cancellation is allowed to be
+    LATENCY_SLACK = timedelta(seconds=1)
+
+    def register_statement(self,
+                           mock_server: MockColumnarServer,
+                           name: str,
+                           response: MockQueryResponse,
+                           fault: MockFault) -> str:
+        statement = f'SELECT * FROM fault WHERE test = "{name}";'
+        mock_server.register_response(statement, response)
+        mock_server.register_fault(statement, fault)
+        return statement
+
+    @pytest.fixture(autouse=True)
+    def clear_faults(self, mock_server: MockColumnarServer) -> YieldFixture[None]:
+        yield
+        mock_server.clear_faults()
+
+    def test_cancel_while_stalled(self,
+                                  test_env: BlockingTestEnvironment,
+                                  mock_server: MockColumnarServer,
+                                  benchmark_recorder: BenchmarkRecorder) -> None:
+        statement = self.register_statement(mock_server,
+                                            'cancel_while_stalled',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault(stall_after_rows=10))
+        result = test_env.cluster_or_scope.execute_query(statement)
+        row_iter = iter(result.rows())
+        for _ in range(10):
+            next(row_iter)
+
+        cancelled_at: List[int] = []
+
+        def cancel() -> None:
+            cancelled_at.append(perf_counter_ns())
+            result.cancel()
+
+        timer = Timer(0.2, cancel)
+        timer.start()
+        try:
+            # blocks until the query is cancelled, cancelling either ends or fails the iteration
+            for _ in row_iter:
+                pass
+        except ColumnarError:
+            pass
+        returned_at = perf_counter_ns()
+        timer.join()
+        assert len(cancelled_at) == 1
+        latency = returned_at - cancelled_at[0]
+        assert latency < to_ns(self.LATENCY_SLACK)
+        benchmark_recorder.record(BenchmarkResult('cancel_while_stalled', 'couchbase', 'fault', 10, 1, latency,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    def test_mid_stream_disconnect(self,
+                                   test_env: BlockingTestEnvironment,
+                                   mock_server: MockColumnarServer) -> None:
+        statement = self.register_statement(mock_server,
+                                            'mid_stream_disconnect',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault(disconnect_after_rows=100))
+        rows = 0
+        with pytest.raises(ColumnarError):
+            for _ in test_env.cluster_or_scope.execute_query(statement).rows():
+                rows += 1
+        assert rows <= 100
+
+    def test_service_unavailable(self,
+                                 test_env: BlockingTestEnvironment,
+                                 mock_server: MockColumnarServer) -> None:
+        statement = self.register_statement(mock_server,
+                                            'service_unavailable',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(status=503, error_code=23007))
+        with pytest.raises(QueryError) as ex:
+            test_env.cluster_or_scope.execute_query(statement, QueryOptions(timeout=timedelta(seconds=5)))
+        assert ex.value.code == 23007
+
+    def test_slow_first_byte(self,
+                             test_env: BlockingTestEnvironment,
+                             mock_server: MockColumnarServer,
+                             benchmark_recorder: BenchmarkRecorder) -> None:
+        delay = timedelta(milliseconds=500)
+        statement = self.register_statement(mock_server,
+                                            'slow_first_byte',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(first_byte_delay=delay))
+        start = perf_counter_ns()
+        row_iter = iter(test_env.cluster_or_scope.execute_query(statement).rows())
+        next(row_iter)
+        time_to_first_row = perf_counter_ns() - start
+        rows = 1 + sum(1 for _ in row_iter)
+        elapsed = perf_counter_ns() - start
+        assert rows == 10
+        assert time_to_first_row >= to_ns(delay)
+        benchmark_recorder.record(BenchmarkResult('slow_first_byte', 'couchbase', 'fault', rows, 1, elapsed,
+                                                  time_to_first_row_ns=time_to_first_row,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    def test_timeout_while_stalled(self,
+                                   test_env: BlockingTestEnvironment,
+                                   mock_server: MockColumnarServer,
+                                   benchmark_recorder: BenchmarkRecorder) -> None:
+        timeout = timedelta(seconds=1)
+        statement = self.register_statement(mock_server,
+                                            'timeout_while_stalled',
+                                            MockQueryResponse(rows=10000, row_width=1024, rows_per_chunk=100),
+                                            MockFault(stall_after_rows=5000))
+        rows = 0
+        start = perf_counter_ns()
+        with pytest.raises(TimeoutError):
+            for _ in test_env.cluster_or_scope.execute_query(statement, QueryOptions(timeout=timeout)).rows():
+                rows += 1
+        elapsed = perf_counter_ns() - start
+        assert rows <= 5000
+        # the timeout should fire neither early nor (much) late while the stream is stalled
+        assert elapsed >= to_ns(timeout)
+        assert elapsed < to_ns(timeout + self.LATENCY_SLACK)
+        benchmark_recorder.record(BenchmarkResult('timeout_while_stalled', 'couchbase', 'fault', rows, 1, elapsed,
+                                                  peak_rss_kb=peak_rss_kb()))
+
+    def test_trickling_rows(self,
+                            test_env: BlockingTestEnvironment,
+                            mock_server: MockColumnarServer) -> None:
+        chunk_delay = timedelta(milliseconds=25)
+        statement = self.register_statement(mock_server,
+                                            'trickling_rows',
+                                            MockQueryResponse(rows=20, rows_per_chunk=1),
+                                            MockFault(chunk_delay=chunk_delay))
+        start = perf_counter_ns()
+        rows = sum(1 for _ in test_env.cluster_or_scope.execute_query(statement).rows())
+        elapsed = perf_counter_ns() - start
+        assert rows == 20
+        # every row after the first one (and the end of the result set) is delayed
+        assert elapsed >= 20 * to_ns(chunk_delay)
+
+
+class ClusterFaultTests(FaultTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterFaultTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterFaultTests) if valid_test_method(meth)]
+        test_list = set(FaultTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
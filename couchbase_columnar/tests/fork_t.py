@@ -0,0 +1,143 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+import traceback
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockQueryResponse,
+                                            cluster_has_connection,
+                                            cluster_impl)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+def run_in_child(fn: Callable[[], None]) -> int:
+    """Runs the function in a forked child, returns the child's exit code.
+    """
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            fn()
+            code = 0
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Requires os.fork().')
+class ForkTestSuite:
+    TEST_MANIFEST = [
+        'test_bootstrap_nodes',
+        'test_close_after_fork',
+        'test_query_after_fork',
+        'test_shared_connection_after_fork',
+    ]
+
+    STATEMENT = 'SELECT * FROM fork;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=10))
+
+    def query(self, cluster: Cluster) -> None:
+        assert len(cluster.execute_query(self.STATEMENT).get_all_rows()) == 10
+
+    def test_bootstrap_nodes(self, mock_server: MockColumnarServer, create_cluster: Callable[..., Cluster]) -> None:
+        cluster = create_cluster()
+        adapter = cluster_impl(cluster).client_adapter
+
+        def child() -> None:
+            assert adapter.forked is True
+            # the child reconnects from the parent's bootstrap nodes
+            req = adapter._fork_connect_req
+            assert req is not None
+            assert req.bootstrap_nodes == [f'{mock_server.host}:{mock_server.kv_port}']
+            self.query(cluster)
+            assert adapter.forked is False
+
+        assert adapter.forked is False
+        assert run_in_child(child) == 0
+
+    def test_close_after_fork(self, create_cluster: Callable[..., Cluster]) -> None:
+        cluster = create_cluster()
+        self.query(cluster)
+
+        def child() -> None:
+            # the connection belongs to the parent, closing the cluster must neither hang nor close the parent's
+            # sockets
+            cluster.close()
+            assert cluster_has_connection(cluster) is False
+
+        assert run_in_child(child) == 0
+        self.query(cluster)
+
+    def test_query_after_fork(self, test_env: BlockingTestEnvironment) -> None:
+        self.query(test_env.cluster)
+
+        def child() -> None:
+            for _ in range(3):
+                self.query(test_env.cluster)
+
+        # several children, one after the other, share the parent's cluster
+        assert [run_in_child(child) for _ in range(3)] == [0, 0, 0]
+        self.query(test_env.cluster)
+
+    def test_shared_connection_after_fork(self, create_cluster: Callable[..., Cluster]) -> None:
+        clusters = [create_cluster(share_connection=True) for _ in range(2)]
+        for cluster in clusters:
+            self.query(cluster)
+
+        def child() -> None:
+            for cluster in clusters:
+                self.query(cluster)
+            clusters[0].close()
+            self.query(clusters[1])
+
+        assert run_in_child(child) == 0
+        for cluster in clusters:
+            self.query(cluster)
+
+
+class ClusterForkTests(ForkTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterForkTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterForkTests) if valid_test_method(meth)]
+        test_list = set(ForkTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
@@ -18,14 +18,17 @@ from __future__ import annotations
 from concurrent.futures import Future
 from datetime import timedelta
 from threading import Event
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 import pytest
 
 from couchbase_columnar.common.streaming import StreamingState
 from couchbase_columnar.exceptions import QueryError
+from couchbase_columnar.metrics import core_stats
 from couchbase_columnar.options import QueryOptions
-from couchbase_columnar.query import CancelToken, QueryScanConsistency
+from couchbase_columnar.query import (CancelToken,
+                                      QueryProgress,
+                                      QueryScanConsistency)
 from couchbase_columnar.result import BlockingQueryResult
 from tests import YieldFixture
 
@@ -43,14 +46,18 @@ class QueryTestSuite:
         'test_cancel_prior_iterating_with_options',
         'test_cancel_prior_iterating_with_opts_and_kwargs',
         'test_cancel_while_iterating',
+        'test_query_client_metrics',
+        'test_query_core_stats',
         'test_query_metadata',
         'test_query_metadata_not_available',
+        'test_query_metrics',
         'test_query_named_parameters',
         'test_query_named_parameters_no_options',
         'test_query_named_parameters_override',
         'test_query_positional_params',
         'test_query_positional_params_no_option',
         'test_query_positional_params_override',
+        'test_query_progress',
         'test_query_raises_exception_prior_to_iterating',
         'test_query_raw_options',
         'test_simple_query',
@@ -249,6 +256,22 @@ class QueryTestSuite:
         expected_state = StreamingState.Cancelled
         assert res._executor.streaming_state == expected_state
 
+    def test_query_client_metrics(self,
+                                  test_env: BlockingTestEnvironment,
+                                  query_statement_limit5: str) -> None:
+        result = test_env.cluster_or_scope.execute_query(query_statement_limit5)
+        test_env.assert_rows(result, 5)
+
+        client_metrics = result.metadata().client_metrics()
+
+        assert client_metrics.dispatch_time() > timedelta(0)
+        assert client_metrics.time_to_headers() > timedelta(0)
+        assert client_metrics.time_to_first_row() >= client_metrics.time_to_headers()
+        assert client_metrics.time_to_last_row() >= client_metrics.time_to_first_row()
+        assert client_metrics.bytes_received() > 0
+        assert client_metrics.deserialize_time() > timedelta(0)
+        assert client_metrics.consumer_time() >= timedelta(0)
+
     def test_query_metadata(self,
                             test_env: BlockingTestEnvironment,
                             query_statement_limit5: str) -> None:
@@ -291,6 +314,46 @@ class QueryTestSuite:
         assert len(metadata.warnings()) == 0
         assert len(metadata.request_id()) > 0
 
+    def test_query_core_stats(self,
+                              test_env: BlockingTestEnvironment,
+                              query_statement_limit5: str) -> None:
+        core_stats(reset=True)
+        result = test_env.cluster_or_scope.execute_query(query_statement_limit5)
+        test_env.assert_rows(result, 5)
+
+        stats = core_stats(reset=True)
+        # the counters are process-wide, other connections might have recorded values as well
+        assert stats.rows() >= 5
+        assert stats.row_bytes() > 0
+        # the response headers, each row and the end of the result set are handed off by an I/O thread
+        assert stats.gil_acquisitions() >= 7
+        assert stats.gil_wait_max_time() <= stats.gil_wait_time()
+        # the blocking API waits for the response headers and for each row
+        assert stats.future_waits() >= 7
+        assert stats.future_wait_max_time() <= stats.future_wait_time()
+        assert stats.callback_errors() == 0
+
+    def test_query_metrics(self,
+                           test_env: BlockingTestEnvironment,
+                           query_statement_limit5: str) -> None:
+        test_env.cluster.metrics(reset=True)
+        result = test_env.cluster_or_scope.execute_query(query_statement_limit5)
+        test_env.assert_rows(result, 5)
+
+        metrics = test_env.cluster.metrics(reset=True).query_metrics(outcome='success')
+        assert len(metrics) == 1
+        assert metrics[0].queries() == 1
+        assert metrics[0].rows() == 5
+        assert metrics[0].bytes() > 0
+        assert metrics[0].first_row_latency().count() == 1
+        assert metrics[0].total_latency().percentile(100) >= metrics[0].first_row_latency().percentile(100)
+        assert metrics[0].rows_per_second().count() == 1
+
+        # the previous snapshot reset the metrics
+        assert len(test_env.cluster.metrics().query_metrics()) == 0
+        exposition = test_env.cluster.metrics().to_prometheus()
+        assert all(line.startswith('#') for line in exposition.splitlines())
+
     def test_query_named_parameters(self,
                                     test_env: BlockingTestEnvironment,
                                     query_statement_named_params_limit2: str) -> None:
@@ -333,6 +396,29 @@ class QueryTestSuite:
                                                          'United States')
         test_env.assert_rows(result, 2)
 
+    def test_query_progress(self,
+                            test_env: BlockingTestEnvironment,
+                            query_statement_limit5: str) -> None:
+        progress: List[QueryProgress] = []
+        result = test_env.cluster_or_scope.execute_query(query_statement_limit5,
+                                                         QueryOptions(progress_callback=progress.append,
+                                                                      progress_interval=timedelta(0)))
+        assert result.progress().completed() is False
+        test_env.assert_rows(result, 5)
+
+        # reported for every row (the interval is 0) and once more when the query completed, the rows are counted as
+        # they are received so the client might be ahead of the application
+        assert len(progress) == 6
+        assert [p.rows() for p in progress] == sorted(p.rows() for p in progress)
+        assert progress[-1].rows() == 5
+        assert progress[-1].completed() is True
+        assert progress[-1].result_count() == 5
+        assert progress[-1].eta() == timedelta(0)
+        final = result.progress()
+        assert final.rows() == 5
+        assert final.bytes() > 0
+        assert final.elapsed() > timedelta(0)
+
     def test_query_raises_exception_prior_to_iterating(self, test_env: BlockingTestEnvironment) -> None:
         statement = "I'm not N1QL!"
         with pytest.raises(QueryError):
@@ -0,0 +1,179 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from couchbase_columnar.common.resume import has_top_level_limit, keyset_statement
+from couchbase_columnar.exceptions import ColumnarError
+from couchbase_columnar.retry import BestEffortRetryStrategy
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class ResumeTestSuite:
+    TEST_MANIFEST = [
+        'test_has_top_level_limit',
+        'test_keyset_statement',
+        'test_resume_after_disconnect',
+        'test_resume_from_checkpoint',
+        'test_resume_key_limit',
+        'test_resume_subquery_limit',
+    ]
+
+    STATEMENT = 'SELECT * FROM resume;'
+    # LIMIT and OFFSET are only applied by the subquery, the rows it selects are the same for every attempt
+    SUBQUERY_STATEMENT = ('SELECT d.* FROM (SELECT VALUE r FROM resume AS r ORDER BY r.id LIMIT 1000 OFFSET 0) AS d\n'
+                          "WHERE d.note != 'LIMIT 10' -- no top-level LIMIT\n;")
+    STRATEGY = BestEffortRetryStrategy(initial_backoff=timedelta(milliseconds=10))
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        # the statements a resumable query is executed as, the mock server resumes after the key's id
+        for statement in (self.STATEMENT, self.SUBQUERY_STATEMENT):
+            for resumed in (False, True):
+                mock_server.register_response(keyset_statement(statement, ['id'], resumed=resumed),
+                                              MockQueryResponse(rows=1000, rows_per_chunk=50))
+
+    @pytest.fixture(name='clear_faults')
+    def clear_faults_fixture(self, mock_server: MockColumnarServer) -> YieldFixture[None]:
+        yield
+        mock_server.clear_faults()
+
+    @pytest.mark.parametrize('statement, expected', [
+        ('SELECT d.* FROM d LIMIT 10', True),
+        ('select d.* from d offset 5;', True),
+        ('SELECT d.* FROM d ORDER BY d.id LIMIT $page_size OFFSET $page', True),
+        ('SELECT d.* FROM (SELECT VALUE r FROM d AS r LIMIT 10) AS d', False),
+        ('SELECT [1, 2][0] AS one FROM d LIMIT 1', True),
+        # escaped and doubled quotes do not end the literal
+        (r"SELECT d.* FROM d WHERE d.note = 'it\'s LIMIT 1'", False),
+        ("SELECT d.* FROM d WHERE d.note = 'it''s LIMIT 1'", False),
+        ('SELECT d.* FROM d WHERE d.note = "say ""OFFSET 1"" "', False),
+        ('SELECT d.`limit` FROM d', False),
+        ("SELECT d.* FROM d WHERE d.note = 'it''s' LIMIT 1", True),
+        # comments are skipped
+        ('SELECT d.* FROM d -- LIMIT 10\n', False),
+        ('SELECT d.* FROM d /* OFFSET 10 */ WHERE d.id > 0', False),
+        ('SELECT d.* FROM d /* a comment */ LIMIT 10', True),
+        ('SELECT d.* FROM d -- a comment\nLIMIT 10', True),
+        # fields named like the clauses
+        ('SELECT d.offset, d.limit FROM d WHERE d.offset > 0', False),
+        ('SELECT limited, offset_ms FROM d', False),
+    ])
+    def test_has_top_level_limit(self, statement: str, expected: bool) -> None:
+        assert has_top_level_limit(statement) is expected
+
+    def test_keyset_statement(self) -> None:
+        statement = keyset_statement('SELECT d.* FROM d -- all rows\n;', ['name', 'id'])
+        assert statement == ('SELECT VALUE resumable_row FROM (\nSELECT d.* FROM d -- all rows\n) AS resumable_row '
+                             'ORDER BY resumable_row.`name`, resumable_row.`id`;')
+        statement = keyset_statement('SELECT d.* FROM d', ['name', 'id'], resumed=True)
+        assert statement == ('SELECT VALUE resumable_row FROM (\nSELECT d.* FROM d\n) AS resumable_row '
+                             'WHERE (resumable_row.`name` > $resume_key_0) '
+                             'OR (resumable_row.`name` = $resume_key_0 AND resumable_row.`id` > $resume_key_1) '
+                             'ORDER BY resumable_row.`name`, resumable_row.`id`;')
+
+    @pytest.mark.usefixtures('clear_faults')
+    def test_resume_after_disconnect(self,
+                                     test_env: BlockingTestEnvironment,
+                                     mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(keyset_statement(self.STATEMENT, ['id']),
+                                   MockFault(disconnect_after_rows=100, times=1))
+        query_count = mock_server.query_count
+        result = test_env.cluster.execute_query(self.STATEMENT, resume_key='id', retry_strategy=self.STRATEGY)
+        rows = result.get_all_rows()
+        # each row is returned exactly once, in order, the second attempt selects the rows after the 100th row
+        assert [row['id'] for row in rows] == list(range(1000))
+        assert mock_server.query_count - query_count == 2
+        assert result.metadata().client_metrics().attempts() == 2
+
+    @pytest.mark.usefixtures('clear_faults')
+    def test_resume_from_checkpoint(self,
+                                    test_env: BlockingTestEnvironment,
+                                    mock_server: MockColumnarServer,
+                                    tmp_path: Path) -> None:
+        mock_server.register_fault(keyset_statement(self.STATEMENT, ['id']),
+                                   MockFault(disconnect_after_rows=100, times=1))
+        checkpoint_path = tmp_path / 'export.checkpoint'
+        # the query is not retried, the checkpoint is written when it fails
+        result = test_env.cluster.execute_query(self.STATEMENT,
+                                                resume_key='id',
+                                                checkpoint_path=str(checkpoint_path),
+                                                retry_strategy=BestEffortRetryStrategy(max_attempts=1))
+        ids: List[int] = []
+        with pytest.raises(ColumnarError):
+            for row in result.rows():
+                ids.append(row['id'])
+        assert ids == list(range(100))
+        assert json.loads(checkpoint_path.read_text())['key'] == [99]
+
+        # executing the same query again resumes after the checkpoint, which is removed once all rows are returned
+        result = test_env.cluster.execute_query(self.STATEMENT, resume_key='id', checkpoint_path=str(checkpoint_path))
+        assert [row['id'] for row in result.rows()] == list(range(100, 1000))
+        assert result.progress().rows() == 1000
+        assert not checkpoint_path.exists()
+
+    @pytest.mark.parametrize('statement', ['SELECT * FROM resume ORDER BY id LIMIT 10;',
+                                           'SELECT r.* FROM resume AS r /* first page */ OFFSET 100',
+                                           'SELECT (SELECT VALUE 1)[0] AS one, r.* FROM resume AS r limit $page_size'])
+    def test_resume_key_limit(self, test_env: BlockingTestEnvironment, statement: str) -> None:
+        # a top-level LIMIT or OFFSET would be applied again to the rows of a resumed attempt
+        with pytest.raises(ValueError):
+            test_env.cluster.execute_query(statement, resume_key='id')
+
+    @pytest.mark.usefixtures('clear_faults')
+    def test_resume_subquery_limit(self,
+                                   test_env: BlockingTestEnvironment,
+                                   mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(keyset_statement(self.SUBQUERY_STATEMENT, ['id']),
+                                   MockFault(disconnect_after_rows=100, times=1))
+        query_count = mock_server.query_count
+        result = test_env.cluster.execute_query(self.SUBQUERY_STATEMENT,
+                                                resume_key='id',
+                                                retry_strategy=self.STRATEGY)
+        assert [row['id'] for row in result.rows()] == list(range(1000))
+        assert mock_server.query_count - query_count == 2
+
+
+class ClusterResumeTests(ResumeTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterResumeTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterResumeTests) if valid_test_method(meth)]
+        test_list = set(ResumeTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
@@ -0,0 +1,121 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.exceptions import QueryError, TimeoutError
+from couchbase_columnar.options import QueryOptions
+from couchbase_columnar.retry import BestEffortRetryStrategy
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class RetryTestSuite:
+    TEST_MANIFEST = [
+        'test_retry_deadline',
+        'test_retry_exhausted',
+        'test_retry_not_read_only',
+        'test_retry_query_option',
+        'test_retry_read_only',
+    ]
+
+    STATEMENT = 'SELECT * FROM retry;'
+    STRATEGY = BestEffortRetryStrategy(initial_backoff=timedelta(milliseconds=10))
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=10))
+
+    def test_retry_deadline(self, create_cluster: Callable[..., Cluster], mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(status=503, error_code=23007))
+        strategy = BestEffortRetryStrategy(max_attempts=100,
+                                           initial_backoff=timedelta(milliseconds=50),
+                                           max_backoff=timedelta(milliseconds=50))
+        cluster = create_cluster(retry_strategy=strategy)
+        start = perf_counter()
+        with pytest.raises((QueryError, TimeoutError)):
+            cluster.execute_query(self.STATEMENT, QueryOptions(read_only=True, timeout=timedelta(seconds=1)))
+        # the attempts share the query's timeout, the query is not retried once its deadline would be exceeded
+        assert perf_counter() - start < 2
+
+    def test_retry_exhausted(self, create_cluster: Callable[..., Cluster], mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(status=503, error_code=23007, times=3))
+        strategy = BestEffortRetryStrategy(max_attempts=2, initial_backoff=timedelta(milliseconds=10))
+        cluster = create_cluster(retry_strategy=strategy)
+        query_count = mock_server.query_count
+        with pytest.raises(QueryError) as ex:
+            cluster.execute_query(self.STATEMENT, read_only=True)
+        assert ex.value.code == 23007
+        assert mock_server.query_count - query_count == 2
+
+    def test_retry_not_read_only(self,
+                                 create_cluster: Callable[..., Cluster],
+                                 mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(status=503, error_code=23007, times=1))
+        cluster = create_cluster(retry_strategy=self.STRATEGY)
+        # the query might not be idempotent, it is not retried
+        with pytest.raises(QueryError):
+            cluster.execute_query(self.STATEMENT)
+        result = cluster.execute_query(self.STATEMENT)
+        assert len(result.get_all_rows()) == 10
+        assert result.metadata().client_metrics().attempts() == 1
+
+    def test_retry_query_option(self, test_env: BlockingTestEnvironment, mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(status=503, error_code=23007, times=1))
+        try:
+            result = test_env.cluster.execute_query(self.STATEMENT, read_only=True, retry_strategy=self.STRATEGY)
+            assert len(result.get_all_rows()) == 10
+            assert result.metadata().client_metrics().attempts() == 2
+        finally:
+            mock_server.clear_faults()
+
+    def test_retry_read_only(self, create_cluster: Callable[..., Cluster], mock_server: MockColumnarServer) -> None:
+        mock_server.register_fault(self.STATEMENT, MockFault(status=503, error_code=23007, times=2))
+        cluster = create_cluster(retry_strategy=self.STRATEGY)
+        result = cluster.execute_query(self.STATEMENT, read_only=True)
+        assert len(result.get_all_rows()) == 10
+        assert result.metadata().client_metrics().attempts() == 3
+
+
+class ClusterRetryTests(RetryTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterRetryTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterRetryTests) if valid_test_method(meth)]
+        test_list = set(RetryTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
@@ -0,0 +1,178 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import sys
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from couchbase_columnar.exceptions import ColumnarError, TimeoutError
+from couchbase_columnar.options import QueryOptions
+from couchbase_columnar.protocol.pycbcc_core import result as core_result
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockFault,
+                                            MockQueryResponse)
+from tests.environments.soak import SOAK_ITERATIONS, LeakTracker
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class SoakTestSuite:
+    TEST_MANIFEST = [
+        'test_cancel_mid_stream',
+        'test_error_response',
+        'test_mid_stream_disconnect',
+        'test_query',
+        'test_result_get_default',
+        'test_timeout_before_headers',
+    ]
+
+    def register_statement(self,
+                           mock_server: MockColumnarServer,
+                           name: str,
+                           response: MockQueryResponse,
+                           fault: MockFault) -> str:
+        statement = f'SELECT * FROM soak WHERE test = "{name}";'
+        mock_server.register_response(statement, response)
+        mock_server.register_fault(statement, fault)
+        return statement
+
+    @pytest.fixture(autouse=True)
+    def clear_faults(self, mock_server: MockColumnarServer) -> YieldFixture[None]:
+        yield
+        mock_server.clear_faults()
+
+    def soak(self, name: str, leak_tracker: LeakTracker, iteration: Callable[[], None]) -> None:
+        warmup = max(SOAK_ITERATIONS // 10, 1)
+        for _ in range(warmup):
+            iteration()
+        leak_tracker.start()
+        for _ in range(SOAK_ITERATIONS):
+            iteration()
+        leak_tracker.check(name, SOAK_ITERATIONS)
+
+    def test_cancel_mid_stream(self,
+                               test_env: BlockingTestEnvironment,
+                               mock_server: MockColumnarServer,
+                               leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'cancel_mid_stream',
+                                            MockQueryResponse(rows=1000, rows_per_chunk=10),
+                                            MockFault())
+
+        def iteration() -> None:
+            result = test_env.cluster_or_scope.execute_query(statement)
+            row_iter = iter(result.rows())
+            for _ in range(10):
+                next(row_iter)
+            result.cancel()
+
+        self.soak('cancel_mid_stream', leak_tracker, iteration)
+
+    def test_error_response(self,
+                            test_env: BlockingTestEnvironment,
+                            mock_server: MockColumnarServer,
+                            leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'error_response',
+                                            MockQueryResponse(),
+                                            MockFault(status=503))
+
+        def iteration() -> None:
+            with pytest.raises(ColumnarError):
+                test_env.cluster_or_scope.execute_query(statement).get_all_rows()
+
+        self.soak('error_response', leak_tracker, iteration)
+
+    def test_mid_stream_disconnect(self,
+                                   test_env: BlockingTestEnvironment,
+                                   mock_server: MockColumnarServer,
+                                   leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'mid_stream_disconnect',
+                                            MockQueryResponse(rows=100, rows_per_chunk=10),
+                                            MockFault(disconnect_after_rows=50))
+
+        def iteration() -> None:
+            with pytest.raises(ColumnarError):
+                for _ in test_env.cluster_or_scope.execute_query(statement).rows():
+                    pass
+
+        self.soak('mid_stream_disconnect', leak_tracker, iteration)
+
+    def test_query(self,
+                   test_env: BlockingTestEnvironment,
+                   mock_server: MockColumnarServer,
+                   leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server, 'query', MockQueryResponse(rows=100), MockFault())
+
+        def iteration() -> None:
+            result = test_env.cluster_or_scope.execute_query(statement)
+            assert len(result.get_all_rows()) == 100
+            result.metadata()
+
+        self.soak('query', leak_tracker, iteration)
+
+    def test_timeout_before_headers(self,
+                                    test_env: BlockingTestEnvironment,
+                                    mock_server: MockColumnarServer,
+                                    leak_tracker: LeakTracker) -> None:
+        statement = self.register_statement(mock_server,
+                                            'timeout_before_headers',
+                                            MockQueryResponse(rows=10),
+                                            MockFault(first_byte_delay=timedelta(milliseconds=100)))
+
+        def iteration() -> None:
+            with pytest.raises(TimeoutError):
+                test_env.cluster_or_scope.execute_query(statement, QueryOptions(timeout=timedelta(milliseconds=5)))
+
+        self.soak('timeout_before_headers', leak_tracker, iteration)
+
+    def test_result_get_default(self, leak_tracker: LeakTracker) -> None:
+        res = core_result()
+        default = object()
+        refcount = sys.getrefcount(default)
+
+        def iteration() -> None:
+            assert res.get('missing', default) is default
+
+        self.soak('result_get_default', leak_tracker, iteration)
+        # the default value is borrowed, get() must neither steal nor leak a reference to it
+        assert sys.getrefcount(default) == refcount
+
+
+class ClusterSoakTests(SoakTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterSoakTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterSoakTests) if valid_test_method(meth)]
+        test_list = set(SoakTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
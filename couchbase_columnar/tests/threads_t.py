@@ -0,0 +1,109 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Thread
+from typing import TYPE_CHECKING, List
+
+import pytest
+
+from couchbase_columnar.result import BlockingQueryResult
+from tests import YieldFixture
+from tests.environments.mock_server import MockColumnarServer, MockQueryResponse
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class ThreadsTestSuite:
+    TEST_MANIFEST = [
+        'test_concurrent_streams',
+        'test_progress_while_iterating',
+        'test_shared_result',
+    ]
+
+    NUM_THREADS = 4
+    RESPONSE = MockQueryResponse(rows=5000, row_width=64, rows_per_chunk=50)
+    STATEMENT = 'SELECT * FROM threads;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, self.RESPONSE)
+
+    def row_ids(self, result: BlockingQueryResult) -> List[int]:
+        return [row['id'] for row in result.rows()]
+
+    def test_concurrent_streams(self, test_env: BlockingTestEnvironment) -> None:
+        barrier = Barrier(self.NUM_THREADS)
+
+        def consume() -> List[int]:
+            barrier.wait()
+            return self.row_ids(test_env.cluster.execute_query(self.STATEMENT))
+
+        with ThreadPoolExecutor(max_workers=self.NUM_THREADS) as tp:
+            results = list(tp.map(lambda _: consume(), range(self.NUM_THREADS)))
+        assert results == [list(range(self.RESPONSE.rows))] * self.NUM_THREADS
+
+    def test_progress_while_iterating(self, test_env: BlockingTestEnvironment) -> None:
+        result = test_env.cluster.execute_query(self.STATEMENT)
+        consumer = Thread(target=self.row_ids, args=(result,))
+        consumer.start()
+        rows_seen: List[int] = []
+        while consumer.is_alive():
+            rows_seen.append(result.progress().rows())
+        consumer.join()
+        assert rows_seen == sorted(rows_seen)
+        progress = result.progress()
+        assert progress.completed() is True
+        assert progress.rows() == self.RESPONSE.rows
+
+    def test_shared_result(self, test_env: BlockingTestEnvironment) -> None:
+        result = test_env.cluster.execute_query(self.STATEMENT)
+        barrier = Barrier(self.NUM_THREADS)
+
+        def consume() -> List[int]:
+            barrier.wait()
+            return self.row_ids(result)
+
+        # the threads share the result's stream, every row is returned to exactly one of them
+        with ThreadPoolExecutor(max_workers=self.NUM_THREADS) as tp:
+            results = list(tp.map(lambda _: consume(), range(self.NUM_THREADS)))
+        row_ids = [row_id for ids in results for row_id in ids]
+        assert sorted(row_ids) == list(range(self.RESPONSE.rows))
+        for ids in results:
+            assert ids == sorted(ids)
+        assert result.metadata() is not None
+
+
+class ClusterThreadsTests(ThreadsTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterThreadsTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterThreadsTests) if valid_test_method(meth)]
+        test_list = set(ThreadsTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
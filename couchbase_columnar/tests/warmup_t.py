@@ -0,0 +1,88 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable
+
+import pytest
+
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.exceptions import TimeoutError
+from tests import YieldFixture
+from tests.environments.mock_server import (MockColumnarServer,
+                                            MockQueryResponse,
+                                            cluster_has_connection)
+
+if TYPE_CHECKING:
+    from tests.environments.base_environment import BlockingTestEnvironment
+
+
+class WarmupTestSuite:
+    TEST_MANIFEST = [
+        'test_lazy_connect_warmup',
+        'test_warmup_timeout',
+    ]
+
+    STATEMENT = 'SELECT * FROM warmup;'
+
+    @pytest.fixture(scope='class', autouse=True)
+    def register_statement(self, mock_server: MockColumnarServer) -> None:
+        mock_server.register_response(self.STATEMENT, MockQueryResponse(rows=10))
+
+    def test_lazy_connect_warmup(self,
+                                 create_cluster: Callable[..., Cluster],
+                                 mock_server: MockColumnarServer) -> None:
+        cluster = create_cluster(lazy_connect=True)
+        # the bootstrap completes in the background, warming up waits for it and pings the query service
+        cluster.warmup(timeout=timedelta(seconds=5))
+        assert cluster_has_connection(cluster) is True
+        query_count = mock_server.query_count
+        assert len(cluster.execute_query(self.STATEMENT).get_all_rows()) == 10
+        # the ping is not a query
+        assert mock_server.query_count - query_count == 1
+
+    def test_warmup_timeout(self,
+                            create_cluster: Callable[..., Cluster],
+                            mock_server: MockColumnarServer) -> None:
+        mock_server.set_ping_delay(timedelta(seconds=2))
+        cluster = create_cluster(lazy_connect=True)
+        # no endpoint responds before the timeout expires
+        with pytest.raises(TimeoutError):
+            cluster.warmup(timeout=timedelta(milliseconds=500))
+        # the cluster is still usable, its query service connections are opened by the queries
+        mock_server.clear_faults()
+        assert len(cluster.execute_query(self.STATEMENT).get_all_rows()) == 10
+
+
+class ClusterWarmupTests(WarmupTestSuite):
+
+    @pytest.fixture(scope='class', autouse=True)
+    def validate_test_manifest(self) -> None:
+        def valid_test_method(meth: str) -> bool:
+            attr = getattr(ClusterWarmupTests, meth)
+            return callable(attr) and not meth.startswith('__') and meth.startswith('test')
+        method_list = [meth for meth in dir(ClusterWarmupTests) if valid_test_method(meth)]
+        test_list = set(WarmupTestSuite.TEST_MANIFEST).symmetric_difference(method_list)
+        if test_list:
+            pytest.fail(f'Test manifest invalid.  Missing/extra tests: {test_list}.')
+
+    @pytest.fixture(scope='class', name='test_env')
+    def couchbase_test_environment(
+        self,
+        mock_sync_test_env: BlockingTestEnvironment
+    ) -> YieldFixture[BlockingTestEnvironment]:
+        yield mock_sync_test_env
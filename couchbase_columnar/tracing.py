@@ -0,0 +1,24 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from couchbase_columnar.common.tracing import InMemorySpan as InMemorySpan  # noqa: F401
+from couchbase_columnar.common.tracing import InMemoryTracer as InMemoryTracer  # noqa: F401
+from couchbase_columnar.common.tracing import NoOpTracer as NoOpTracer  # noqa: F401
+from couchbase_columnar.common.tracing import OpenTelemetrySpan as OpenTelemetrySpan  # noqa: F401
+from couchbase_columnar.common.tracing import OpenTelemetryTracer as OpenTelemetryTracer  # noqa: F401
+from couchbase_columnar.common.tracing import RequestSpan as RequestSpan  # noqa: F401
+from couchbase_columnar.common.tracing import RequestTracer as RequestTracer  # noqa: F401
+from couchbase_columnar.common.tracing import normalize_statement as normalize_statement  # noqa: F401
+from couchbase_columnar.common.tracing import statement_fingerprint as statement_fingerprint  # noqa: F401
@@ -93,6 +93,10 @@ def process_build_env_vars():  # noqa: C901
     if os.getenv('PYCBCC_VERBOSE_MAKEFILE', None):
         cmake_extra_args += ['-DCMAKE_VERBOSE_MAKEFILE:BOOL=ON']
 
+    # free-threaded CPython (e.g. 3.13t), the extension is built against the free-threaded ABI
+    if get_config_var('Py_GIL_DISABLED'):
+        cmake_extra_args += ['-DPYCBCC_PY_GIL_DISABLED:BOOL=ON']
+
     pycbcc_cmake_system_version = os.getenv('PYCBCC_CMAKE_SYSTEM_VERSION', None)
     if pycbcc_cmake_system_version is not None:
         cmake_extra_args += [f'-DCMAKE_SYSTEM_VERSION={pycbcc_cmake_system_version}']
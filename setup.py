@@ -52,6 +52,7 @@ setup(name='couchbase_columnar',
           include=['acouchbase_columnar', 'couchbase_columnar', 'acouchbase_columnar.*', 'couchbase_columnar.*'],
           exclude=['acouchbase_columnar.tests', 'couchbase_columnar.tests']),
       package_data=package_data,
+      extras_require={'otel': ['opentelemetry-api>=1.0']},
       url="https://github.com/couchbase/columnar-python-client",
       author="Couchbase, Inc.",
       author_email="PythonPackage@couchbase.com",
@@ -68,6 +69,7 @@ setup(name='couchbase_columnar',
           "Programming Language :: Python",
           "Programming Language :: Python :: 3",
           "Programming Language :: Python :: Implementation :: CPython",
+          "Programming Language :: Python :: Free Threading :: 2 - Beta",
           "Topic :: Database",
           "Topic :: Software Development :: Libraries",
           "Topic :: Software Development :: Libraries :: Python Modules"],
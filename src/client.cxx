@@ -25,7 +25,9 @@
 #include "connection.hxx"
 #include "exceptions.hxx"
 #include "logger.hxx"
+#include "metrics.hxx"
 #include "result.hxx"
+#include "stats.hxx"
 
 void
 add_core_enums(PyObject* pyObj_module)
@@ -163,27 +165,104 @@ close_connection(PyObject* self, PyObject* args, PyObject* kwargs)
   return res;
 }
 
-static struct PyMethodDef methods[] = { { "create_connection",
-                                          (PyCFunction)create_connection,
-                                          METH_VARARGS | METH_KEYWORDS,
-                                          "Create connection object" },
-                                        { "get_connection_info",
-                                          (PyCFunction)get_connection_information,
-                                          METH_VARARGS | METH_KEYWORDS,
-                                          "Get connection options" },
-                                        { "close_connection",
-                                          (PyCFunction)close_connection,
-                                          METH_VARARGS | METH_KEYWORDS,
-                                          "Close a connection" },
-                                        { "columnar_query",
-                                          (PyCFunction)columnar_query,
-                                          METH_VARARGS | METH_KEYWORDS,
-                                          "Execute a streaming columnar query" },
-                                        { "_test_exception_builder",
-                                          (PyCFunction)test_exception_builder,
-                                          METH_VARARGS,
-                                          "Test method to build exceptions from bindings" },
-                                        { nullptr, nullptr, 0, nullptr } };
+static PyObject*
+warmup_connection(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = handle_warmup_connection(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbcc_set_python_exception(
+      CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Unable to warm up connection.");
+  }
+  return res;
+}
+
+static PyObject*
+get_bootstrap_nodes(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = handle_get_bootstrap_nodes(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbcc_set_python_exception(
+      CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Unable to get bootstrap nodes.");
+  }
+  return res;
+}
+
+static PyObject*
+get_io_thread_stats(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = handle_get_io_thread_stats(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbcc_set_python_exception(
+      CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Unable to get io thread stats.");
+  }
+  return res;
+}
+
+static PyObject*
+get_query_metrics(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = handle_get_query_metrics(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbcc_set_python_exception(
+      CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Unable to get query metrics.");
+  }
+  return res;
+}
+
+static PyObject*
+get_core_stats(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* res = handle_get_core_stats(self, args, kwargs);
+  if (res == nullptr && PyErr_Occurred() == nullptr) {
+    pycbcc_set_python_exception(
+      CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Unable to get core stats.");
+  }
+  return res;
+}
+
+static struct PyMethodDef methods[] = {
+  { "create_connection",
+    (PyCFunction)create_connection,
+    METH_VARARGS | METH_KEYWORDS,
+    "Create connection object" },
+  { "get_connection_info",
+    (PyCFunction)get_connection_information,
+    METH_VARARGS | METH_KEYWORDS,
+    "Get connection options" },
+  { "close_connection",
+    (PyCFunction)close_connection,
+    METH_VARARGS | METH_KEYWORDS,
+    "Close a connection" },
+  { "warmup_connection",
+    (PyCFunction)warmup_connection,
+    METH_VARARGS | METH_KEYWORDS,
+    "Open connections to the Columnar query service" },
+  { "get_bootstrap_nodes",
+    (PyCFunction)get_bootstrap_nodes,
+    METH_VARARGS | METH_KEYWORDS,
+    "Get the nodes a connection bootstraps from" },
+  { "get_io_thread_stats",
+    (PyCFunction)get_io_thread_stats,
+    METH_VARARGS | METH_KEYWORDS,
+    "Get io thread utilization for a connection" },
+  { "get_query_metrics",
+    (PyCFunction)get_query_metrics,
+    METH_VARARGS | METH_KEYWORDS,
+    "Get query latency and throughput metrics for a connection" },
+  { "stats",
+    (PyCFunction)get_core_stats,
+    METH_VARARGS | METH_KEYWORDS,
+    "Get the bindings' GIL, row handoff, callback and blocking wait counters" },
+  { "columnar_query",
+    (PyCFunction)columnar_query,
+    METH_VARARGS | METH_KEYWORDS,
+    "Execute a streaming columnar query" },
+  { "_test_exception_builder",
+    (PyCFunction)test_exception_builder,
+    METH_VARARGS,
+    "Test method to build exceptions from bindings" },
+  { nullptr, nullptr, 0, nullptr }
+};
 
 static struct PyModuleDef pycbcc_core_module = { { PyObject_HEAD_INIT(NULL) nullptr, 0, nullptr },
                                                  "pycbcc_core",
@@ -225,6 +304,13 @@ PyInit_pycbcc_core(void)
   if (m == nullptr) {
     return nullptr;
   }
+#ifdef Py_GIL_DISABLED
+  // Equivalent of the Py_mod_gil slot for single-phase init.  Free-threaded builds would otherwise
+  // re-enable the GIL when the module is imported.  The bindings do not rely on the GIL to protect
+  // their own state: the query iterator's state is guarded by mutexes, the timings, stats and
+  // metrics are atomics, and no mutex is held while calling into Python.
+  PyUnstable_Module_SetGIL(m, Py_MOD_GIL_NOT_USED);
+#endif
 
   Py_INCREF(result_type);
   if (PyModule_AddObject(m, "result", result_type) < 0) {
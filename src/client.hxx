@@ -21,15 +21,26 @@
 #include "Python.h" // NOLINT
 #include "structmember.h"
 
+#include <algorithm>
+#include <atomic>
 #include <future>
 #include <list>
+#include <mutex>
 #include <thread>
 
+#if defined(_WIN32)
+#include <process.h>
+#else
+#include <unistd.h>
+#endif
+
 #include <core/cluster.hxx>
 #include <core/columnar/agent.hxx>
 #include <core/logger/logger.hxx>
 #include <core/operations.hxx>
 
+#include "metrics.hxx"
+
 #define PY_SSIZE_T_CLEAN
 
 class Operations
@@ -198,37 +209,76 @@ public:
 #define TRANSCODER_DECODE "decode_value"
 #define DESERIALIZE "deserialize"
 
+inline long
+current_pid()
+{
+#if defined(_WIN32)
+  return static_cast<long>(_getpid());
+#else
+  return static_cast<long>(getpid());
+#endif
+}
+
+struct io_thread {
+  std::thread thread_;
+  std::uint64_t last_cpu_time_ns_{ 0 };
+  double utilization_{ 0.0 };
+};
+
 struct connection {
   asio::io_context io_;
   couchbase::core::cluster cluster_;
   couchbase::core::columnar::agent agent_;
-  std::list<std::thread> io_threads_;
+  std::list<io_thread> io_threads_;
+  std::mutex io_threads_mutex_;
+  std::size_t max_io_threads_;
+  bool stopping_{ false };
+  asio::steady_timer io_monitor_timer_;
+  std::chrono::steady_clock::time_point io_monitor_last_sample_{ std::chrono::steady_clock::now() };
+  std::uint64_t io_loop_lag_us_{ 0 };
+  std::size_t io_saturated_samples_{ 0 };
+  // set once the cluster has been closed, the io_context is stopped at that point
+  std::atomic_bool closed_{ false };
+  // shared w/ the connection's in-flight queries, which might complete after the connection is
+  // freed
+  std::shared_ptr<query_metrics> query_metrics_{ std::make_shared<query_metrics>() };
+  // the process that created the connection, a forked child inherits the connection's memory
+  // (and its sockets) but not its io threads
+  long owner_pid_{ current_pid() };
 
   connection()
     : connection{ 1 }
   {
   }
 
-  connection(int num_io_threads)
+  connection(int num_io_threads, int max_io_threads = 0)
     : cluster_(couchbase::core::cluster(io_))
     , agent_(couchbase::core::columnar::agent(io_, { { cluster_ } }))
+    , max_io_threads_{ static_cast<std::size_t>(std::max(num_io_threads, max_io_threads)) }
+    , io_monitor_timer_{ io_ }
   {
+    start_io_monitor();
     for (int i = 0; i < num_io_threads; i++) {
-      // TODO: consider maybe catching exceptions and running run() again?  For now, lets
-      // log the exception and rethrow (which will lead to a crash)
-      io_threads_.emplace_back([&] {
-        try {
-          io_.run();
-        } catch (const std::exception& e) {
-          CB_LOG_ERROR(e.what());
-          throw;
-        } catch (...) {
-          CB_LOG_ERROR("Unknown exception");
-          throw;
-        }
-      });
+      add_io_thread();
     }
   }
+
+  // Adds a thread to the io_context's pool.  Returns false if the pool is at max_io_threads_ or the
+  // connection is being shut down.
+  bool add_io_thread();
+  void start_io_monitor();
+  void sample_io_threads(std::chrono::steady_clock::time_point scheduled_at);
+  // Returns true if the calling thread is one of the connection's io threads.
+  bool is_io_thread(std::thread::id id);
+  // Stops the io_context and joins all io threads.  If detach is set, the io threads are detached
+  // instead of joined (used when the connection is intentionally leaked).
+  void stop_io_threads(bool detach = false);
+  // Returns true if the connection was inherited from a parent process (i.e. the calling process
+  // forked after the connection was created).  Such a connection cannot be used or closed.
+  bool is_forked() const
+  {
+    return current_pid() != owner_pid_;
+  }
 };
 
 void
@@ -22,6 +22,7 @@
 
 #include "exceptions.hxx"
 #include "result.hxx"
+#include "stats.hxx"
 
 couchbase::core::columnar::query_scan_consistency
 str_to_columnar_scan_consistency_type(std::string consistency)
@@ -50,8 +51,15 @@ create_columnar_response(couchbase::core::columnar::query_result resp,
   PyObject* pyObj_func = NULL;
   PyObject* pyObj_callback_res = nullptr;
 
-  PyGILState_STATE state = PyGILState_Ensure();
+  PyGILState_STATE state = pycbcc_gil_ensure();
   auto query_iter = reinterpret_cast<columnar_query_iterator*>(pyObj_query_iter);
+  if (query_iter->timings_) {
+    columnar_query_timings::set_elapsed(query_iter->timings_->time_to_headers_ns,
+                                        query_iter->timings_->elapsed());
+    if (err.ec) {
+      query_iter->timings_->record(err);
+    }
+  }
   if (err.ec) {
     pyObj_exc = pycbcc_build_exception(err, __FILE__, __LINE__);
     if (pyObj_callback == nullptr) {
@@ -73,7 +81,7 @@ create_columnar_response(couchbase::core::columnar::query_result resp,
   }
 
   if (pyObj_func != nullptr) {
-    pyObj_callback_res = PyObject_CallObject(pyObj_func, pyObj_args);
+    pyObj_callback_res = pycbcc_call_callback(pyObj_func, pyObj_args);
     if (pyObj_callback_res) {
       Py_DECREF(pyObj_callback_res);
     } else {
@@ -83,6 +91,8 @@ create_columnar_response(couchbase::core::columnar::query_result resp,
     Py_DECREF(pyObj_args);
     Py_XDECREF(pyObj_callback);
   }
+  // release the reference held on behalf of this callback (see handle_columnar_query)
+  Py_DECREF(pyObj_query_iter);
   PyGILState_Release(state);
 }
 
@@ -275,6 +285,7 @@ build_query_options(PyObject* pyObj_query_args)
 PyObject*
 handle_columnar_query([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
 {
+  auto submitted_at = std::chrono::steady_clock::now();
   PyObject* pyObj_conn = nullptr;
   PyObject* pyObj_query_args = nullptr;
   PyObject* pyObj_callback = nullptr;
@@ -317,11 +328,15 @@ handle_columnar_query([[maybe_unused]] PyObject* self, PyObject* args, PyObject*
                couchbase::core::columnar::error>
     resp;
 
-  PyObject* pyObj_query_iter = create_columnar_query_iterator_obj(pyObj_row_callback);
+  PyObject* pyObj_query_iter = create_columnar_query_iterator_obj(pyObj_row_callback, submitted_at);
   auto query_iter = reinterpret_cast<columnar_query_iterator*>(pyObj_query_iter);
+  query_iter->timings_->metrics = conn->query_metrics_->entry(
+    query_options.database_name.value_or(""), query_options.scope_name.value_or(""));
   if (nullptr == pyObj_callback) {
     query_iter->barrier_ = std::make_shared<std::promise<PyObject*>>();
   }
+  // keep the iterator alive until the response callback has run, even if Python drops the result
+  Py_INCREF(pyObj_query_iter);
   {
     Py_BEGIN_ALLOW_THREADS resp = conn->agent_.execute_query(
       query_options,
@@ -331,6 +346,8 @@ handle_columnar_query([[maybe_unused]] PyObject* self, PyObject* args, PyObject*
       });
     Py_END_ALLOW_THREADS
   }
+  columnar_query_timings::set_elapsed(query_iter->timings_->dispatch_time_ns,
+                                      query_iter->timings_->elapsed());
 
   if (!resp.has_value()) {
     auto err_message =
@@ -340,6 +357,10 @@ handle_columnar_query([[maybe_unused]] PyObject* self, PyObject* args, PyObject*
       "PYCBCC:",
       resp.error().ec.value(),
       err_message);
+    // the response callback will not be called, release the references it would have released
+    Py_XDECREF(pyObj_callback);
+    Py_DECREF(pyObj_query_iter);
+    Py_DECREF(pyObj_query_iter);
     pycbcc_set_python_exception(resp.error(), __FILE__, __LINE__);
     return nullptr;
   }
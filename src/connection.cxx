@@ -17,10 +17,199 @@
 
 #include "connection.hxx"
 
+#include <core/diagnostics.hxx>
 #include <core/io/ip_protocol.hxx>
+#include <core/service_type.hxx>
 #include <core/utils/connection_string.hxx>
 
 #include "exceptions.hxx"
+#include "stats.hxx"
+#include "utils.hxx"
+
+#include <utility>
+#include <vector>
+
+#if defined(_WIN32)
+#ifndef NOMINMAX
+#define NOMINMAX
+#endif
+#include <windows.h>
+#elif defined(__APPLE__)
+#include <mach/mach.h>
+#include <pthread.h>
+#else
+#include <pthread.h>
+#include <time.h>
+#endif
+
+namespace
+{
+constexpr auto io_monitor_interval = std::chrono::milliseconds(500);
+// auto mode: number of consecutive saturated samples required before another io thread is added
+constexpr std::size_t io_saturated_samples_threshold = 2;
+constexpr double io_saturated_utilization = 0.75;
+constexpr std::uint64_t io_saturated_loop_lag_us = 5000;
+// upper bound on how long deallocating a connection that was not explicitly closed waits for the
+// cluster to close
+constexpr auto dealloc_close_timeout = std::chrono::milliseconds(5000);
+
+std::uint64_t
+thread_cpu_time_ns(std::thread& t)
+{
+#if defined(_WIN32)
+  FILETIME creation_time, exit_time, kernel_time, user_time;
+  if (GetThreadTimes(static_cast<HANDLE>(t.native_handle()),
+                     &creation_time,
+                     &exit_time,
+                     &kernel_time,
+                     &user_time) == 0) {
+    return 0;
+  }
+  auto to_100ns = [](const FILETIME& ft) {
+    return (static_cast<std::uint64_t>(ft.dwHighDateTime) << 32) | ft.dwLowDateTime;
+  };
+  return (to_100ns(kernel_time) + to_100ns(user_time)) * 100;
+#elif defined(__APPLE__)
+  mach_port_t port = pthread_mach_thread_np(t.native_handle());
+  thread_basic_info_data_t info{};
+  mach_msg_type_number_t count = THREAD_BASIC_INFO_COUNT;
+  if (thread_info(port, THREAD_BASIC_INFO, reinterpret_cast<thread_info_t>(&info), &count) !=
+      KERN_SUCCESS) {
+    return 0;
+  }
+  std::uint64_t cpu_time_us =
+    static_cast<std::uint64_t>(info.user_time.seconds + info.system_time.seconds) * 1000000ULL +
+    static_cast<std::uint64_t>(info.user_time.microseconds + info.system_time.microseconds);
+  return cpu_time_us * 1000ULL;
+#else
+  clockid_t clock_id;
+  if (pthread_getcpuclockid(t.native_handle(), &clock_id) != 0) {
+    return 0;
+  }
+  timespec ts{};
+  if (clock_gettime(clock_id, &ts) != 0) {
+    return 0;
+  }
+  return static_cast<std::uint64_t>(ts.tv_sec) * 1000000000ULL +
+         static_cast<std::uint64_t>(ts.tv_nsec);
+#endif
+}
+} // namespace
+
+bool
+connection::add_io_thread()
+{
+  std::scoped_lock lock(io_threads_mutex_);
+  if (stopping_ || io_threads_.size() >= max_io_threads_) {
+    return false;
+  }
+  auto& t = io_threads_.emplace_back();
+  // TODO: consider maybe catching exceptions and running run() again?  For now, lets
+  // log the exception and rethrow (which will lead to a crash)
+  t.thread_ = std::thread([this] {
+    try {
+      io_.run();
+    } catch (const std::exception& e) {
+      CB_LOG_ERROR(e.what());
+      throw;
+    } catch (...) {
+      CB_LOG_ERROR("Unknown exception");
+      throw;
+    }
+  });
+  return true;
+}
+
+void
+connection::start_io_monitor()
+{
+  auto scheduled_at = std::chrono::steady_clock::now() + io_monitor_interval;
+  io_monitor_timer_.expires_at(scheduled_at);
+  io_monitor_timer_.async_wait([this, scheduled_at](std::error_code ec) {
+    if (ec == asio::error::operation_aborted) {
+      return;
+    }
+    sample_io_threads(scheduled_at);
+    start_io_monitor();
+  });
+}
+
+void
+connection::sample_io_threads(std::chrono::steady_clock::time_point scheduled_at)
+{
+  auto now = std::chrono::steady_clock::now();
+  // how late the timer fired is a good proxy for how long handlers wait in the io_context's queue
+  auto lag = std::chrono::duration_cast<std::chrono::microseconds>(now - scheduled_at).count();
+  auto wall_ns =
+    std::chrono::duration_cast<std::chrono::nanoseconds>(now - io_monitor_last_sample_).count();
+  io_monitor_last_sample_ = now;
+
+  std::size_t thread_count = 0;
+  {
+    std::scoped_lock lock(io_threads_mutex_);
+    io_loop_lag_us_ = lag > 0 ? static_cast<std::uint64_t>(lag) : 0;
+    double total_utilization = 0.0;
+    for (auto& t : io_threads_) {
+      auto cpu_time_ns = thread_cpu_time_ns(t.thread_);
+      if (wall_ns > 0 && cpu_time_ns >= t.last_cpu_time_ns_) {
+        t.utilization_ = std::min(1.0,
+                                  static_cast<double>(cpu_time_ns - t.last_cpu_time_ns_) /
+                                    static_cast<double>(wall_ns));
+      }
+      t.last_cpu_time_ns_ = cpu_time_ns;
+      total_utilization += t.utilization_;
+    }
+    thread_count = io_threads_.size();
+    if (stopping_ || thread_count == 0 || thread_count >= max_io_threads_) {
+      io_saturated_samples_ = 0;
+      return;
+    }
+    bool saturated =
+      total_utilization / static_cast<double>(thread_count) >= io_saturated_utilization ||
+      io_loop_lag_us_ >= io_saturated_loop_lag_us;
+    io_saturated_samples_ = saturated ? io_saturated_samples_ + 1 : 0;
+    if (io_saturated_samples_ < io_saturated_samples_threshold) {
+      return;
+    }
+    io_saturated_samples_ = 0;
+  }
+
+  if (add_io_thread()) {
+    CB_LOG_DEBUG(
+      "{}: io threads saturated, increased io threads to {}", "PYCBCC", thread_count + 1);
+  }
+}
+
+bool
+connection::is_io_thread(std::thread::id id)
+{
+  std::scoped_lock lock(io_threads_mutex_);
+  return std::any_of(io_threads_.begin(), io_threads_.end(), [id](const io_thread& t) {
+    return t.thread_.get_id() == id;
+  });
+}
+
+void
+connection::stop_io_threads(bool detach)
+{
+  std::list<io_thread> threads{};
+  {
+    std::scoped_lock lock(io_threads_mutex_);
+    stopping_ = true;
+    threads.splice(threads.end(), io_threads_);
+  }
+  io_.stop();
+  for (auto& t : threads) {
+    if (!t.thread_.joinable()) {
+      continue;
+    }
+    if (detach || t.thread_.get_id() == std::this_thread::get_id()) {
+      t.thread_.detach();
+    } else {
+      t.thread_.join();
+    }
+  }
+}
 
 couchbase::core::io::ip_protocol
 pyObj_to_ip_protocol(std::string ip_protocol)
@@ -74,21 +263,59 @@ static void
 dealloc_conn(PyObject* obj)
 {
   auto conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(obj, "conn_"));
-  if (conn) {
+  if (conn == nullptr) {
+    return;
+  }
+
+  if (conn->is_forked()) {
+    // The connection was inherited from the parent process.  Its io threads only exist in the
+    // parent and its sockets are shared w/ the parent, so neither close the cluster nor join (or
+    // detach) the threads, the connection is intentionally leaked.
+    return;
+  }
+
+  if (pycbcc_is_finalizing()) {
+    // The interpreter is shutting down and the process is about to exit.  Do not wait on the
+    // cluster or on the io threads (they might be waiting on the GIL), the connection is
+    // intentionally leaked.
+    conn->stop_io_threads(true);
+    return;
+  }
+
+  if (!conn->closed_.load()) {
     auto barrier = std::make_shared<std::promise<void>>();
     auto f = barrier->get_future();
     conn->cluster_.close([barrier]() {
       barrier->set_value();
     });
-    f.get();
-    conn->io_.stop();
-    for (auto& t : conn->io_threads_) {
-      if (t.joinable()) {
-        t.join();
-      }
+    std::future_status status{};
+    Py_BEGIN_ALLOW_THREADS status = f.wait_for(dealloc_close_timeout);
+    Py_END_ALLOW_THREADS if (status != std::future_status::ready)
+    {
+      // Cannot safely delete the connection while the cluster still uses it, leak it rather than
+      // stall the interpreter (dealloc can run during GC w/ the GIL held).
+      CB_LOG_WARNING("{}: timed out after {}ms closing connection, leaking connection",
+                     "PYCBCC",
+                     dealloc_close_timeout.count());
+      conn->stop_io_threads(true);
+      return;
     }
   }
-  CB_LOG_DEBUG("{}: dealloc_conn completed", "PYCBCC");
+
+  if (conn->is_io_thread(std::this_thread::get_id())) {
+    // The last reference was released on one of the connection's own io threads (e.g. w/in a
+    // callback).  The io_context cannot be destroyed while this thread is still running it, so join
+    // and delete from another thread.
+    std::thread([conn]() {
+      conn->stop_io_threads();
+      delete conn;
+      CB_LOG_DEBUG("{}: dealloc_conn completed", "PYCBCC");
+    }).detach();
+    return;
+  }
+
+  Py_BEGIN_ALLOW_THREADS conn->stop_io_threads();
+  Py_END_ALLOW_THREADS CB_LOG_DEBUG("{}: dealloc_conn completed", "PYCBCC");
   delete conn;
 }
 
@@ -102,7 +329,9 @@ close_connection_callback(PyObject* pyObj_conn,
   PyObject* pyObj_func = NULL;
   PyObject* pyObj_callback_res = nullptr;
 
-  PyGILState_STATE state = PyGILState_Ensure();
+  PyGILState_STATE state = pycbcc_gil_ensure();
+  auto conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  conn->closed_.store(true);
 
   if (pyObj_callback == nullptr) {
     barrier->set_value(PyBool_FromLong(static_cast<long>(1)));
@@ -113,7 +342,7 @@ close_connection_callback(PyObject* pyObj_conn,
   }
 
   if (pyObj_func != nullptr) {
-    pyObj_callback_res = PyObject_CallObject(pyObj_func, pyObj_args);
+    pyObj_callback_res = pycbcc_call_callback(pyObj_func, pyObj_args);
     CB_LOG_DEBUG("{}: return from close conn callback.", "PYCBCC");
     if (pyObj_callback_res) {
       Py_DECREF(pyObj_callback_res);
@@ -126,7 +355,6 @@ close_connection_callback(PyObject* pyObj_conn,
     Py_XDECREF(pyObj_errback);
   }
   CB_LOG_DEBUG("{}: close conn callback completed", "PYCBCC");
-  auto conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
   conn->io_.stop();
   // the pyObj_conn was incref'd before being passed into this callback, decref it here
   Py_DECREF(pyObj_conn);
@@ -140,7 +368,7 @@ create_connection_callback(PyObject* pyObj_conn,
 {
   PyObject* pyObj_exc = nullptr;
 
-  PyGILState_STATE state = PyGILState_Ensure();
+  PyGILState_STATE state = pycbcc_gil_ensure();
   if (ec.value()) {
     auto error = couchbase::core::columnar::error{ ec, ec.message() };
     pyObj_exc = pycbcc_build_exception(error, __FILE__, __LINE__);
@@ -447,7 +675,9 @@ handle_create_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObje
     couchbase::core::utils::parse_connection_string(conn_str);
   couchbase::core::cluster_credentials auth = get_cluster_credentials(pyObj_credential);
   try {
-    update_cluster_options(connection_str.options, pyObj_options);
+    if (pyObj_options != nullptr) {
+      update_cluster_options(connection_str.options, pyObj_options);
+    }
   } catch (const std::invalid_argument& e) {
     pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, e.what());
     return nullptr;
@@ -456,13 +686,22 @@ handle_create_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObje
     return nullptr;
   }
 
-  PyObject* pyObj_num_io_threads = PyDict_GetItemString(pyObj_options, "num_io_threads");
   int num_io_threads = 1;
-  if (pyObj_num_io_threads != nullptr) {
-    num_io_threads = static_cast<uint32_t>(PyLong_AsUnsignedLong(pyObj_num_io_threads));
+  int max_io_threads = 0;
+  if (pyObj_options != nullptr) {
+    PyObject* pyObj_num_io_threads = PyDict_GetItemString(pyObj_options, "num_io_threads");
+    if (pyObj_num_io_threads != nullptr) {
+      num_io_threads = static_cast<int>(PyLong_AsUnsignedLong(pyObj_num_io_threads));
+    }
+    // if set (num_io_threads='auto'), the io thread pool grows up to max_io_threads under load
+    PyObject* pyObj_max_io_threads = PyDict_GetItemString(pyObj_options, "max_io_threads");
+    if (pyObj_max_io_threads != nullptr) {
+      max_io_threads = static_cast<int>(PyLong_AsUnsignedLong(pyObj_max_io_threads));
+    }
   }
+  num_io_threads = std::max(num_io_threads, 1);
 
-  connection* const conn = new connection(num_io_threads);
+  connection* const conn = new connection(num_io_threads, max_io_threads);
   PyObject* pyObj_conn = PyCapsule_New(conn, "conn_", dealloc_conn);
 
   if (pyObj_conn == nullptr) {
@@ -708,10 +947,11 @@ handle_close_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObjec
   PyObject* pyObj_callback = nullptr;
   PyObject* pyObj_errback = nullptr;
   PyObject* pyObj_result = nullptr;
+  unsigned long long timeout = 0;
 
-  static const char* kw_list[] = { "", "callback", "errback", nullptr };
+  static const char* kw_list[] = { "", "callback", "errback", "timeout", nullptr };
 
-  const char* kw_format = "O!|OO";
+  const char* kw_format = "O!|OOK";
   int ret = PyArg_ParseTupleAndKeywords(args,
                                         kwargs,
                                         kw_format,
@@ -719,7 +959,8 @@ handle_close_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObjec
                                         &PyCapsule_Type,
                                         &pyObj_conn,
                                         &pyObj_callback,
-                                        &pyObj_errback);
+                                        &pyObj_errback,
+                                        &timeout);
 
   if (!ret) {
     std::string msg = "Cannot close connection. Unable to parse args/kwargs.";
@@ -733,6 +974,16 @@ handle_close_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObjec
     return nullptr;
   }
 
+  if (conn->closed_.load()) {
+    Py_RETURN_TRUE;
+  }
+
+  if (conn->is_forked()) {
+    // closing would shut down the parent process' sockets (and wait on io threads that do not exist
+    // in this process), the connection is left to the parent
+    Py_RETURN_TRUE;
+  }
+
   // PyObjects that need to be around for the cxx client lambda
   // have their increment/decrement handled w/in the callback_context struct
   // struct callback_context callback_ctx = { pyObj_callback, pyObj_errback };
@@ -755,9 +1006,258 @@ handle_close_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObjec
     Py_END_ALLOW_THREADS
   }
   if (nullptr == pyObj_callback || nullptr == pyObj_errback) {
+    if (timeout > 0) {
+      std::future_status status{};
+      Py_BEGIN_ALLOW_THREADS status = f.wait_for(std::chrono::microseconds(timeout));
+      Py_END_ALLOW_THREADS if (status != std::future_status::ready)
+      {
+        // the close continues in the background, the close callback releases the references it
+        // holds
+        CB_LOG_WARNING("{}: timed out after {}us waiting for connection to close, the connection "
+                       "closes in the background",
+                       "PYCBCC",
+                       timeout);
+        Py_RETURN_FALSE;
+      }
+    }
     PyObject* ret = nullptr;
     Py_BEGIN_ALLOW_THREADS ret = f.get();
     Py_END_ALLOW_THREADS return ret;
   }
   Py_RETURN_NONE;
 }
+
+PyObject*
+ping_state_to_pyObj(couchbase::core::diag::ping_state state)
+{
+  if (state == couchbase::core::diag::ping_state::ok) {
+    return PyUnicode_FromString("ok");
+  } else if (state == couchbase::core::diag::ping_state::timeout) {
+    return PyUnicode_FromString("timeout");
+  } else {
+    return PyUnicode_FromString("error");
+  }
+}
+
+PyObject*
+build_warmup_endpoints(const couchbase::core::diag::ping_result& result)
+{
+  PyObject* pyObj_endpoints = PyList_New(static_cast<Py_ssize_t>(0));
+  for (const auto& service_endpoints : result.services) {
+    for (const auto& endpoint : service_endpoints.second) {
+      PyObject* pyObj_endpoint = PyDict_New();
+      PyObject* pyObj_tmp = PyUnicode_FromString(endpoint.remote.c_str());
+      if (-1 == PyDict_SetItemString(pyObj_endpoint, "remote", pyObj_tmp)) {
+        PyErr_Print();
+        PyErr_Clear();
+      }
+      Py_XDECREF(pyObj_tmp);
+
+      pyObj_tmp = ping_state_to_pyObj(endpoint.state);
+      if (-1 == PyDict_SetItemString(pyObj_endpoint, "state", pyObj_tmp)) {
+        PyErr_Print();
+        PyErr_Clear();
+      }
+      Py_XDECREF(pyObj_tmp);
+
+      if (endpoint.latency.has_value()) {
+        pyObj_tmp = PyLong_FromUnsignedLongLong(endpoint.latency.value().count());
+        if (-1 == PyDict_SetItemString(pyObj_endpoint, "latency", pyObj_tmp)) {
+          PyErr_Print();
+          PyErr_Clear();
+        }
+        Py_XDECREF(pyObj_tmp);
+      }
+
+      if (endpoint.error.has_value()) {
+        pyObj_tmp = PyUnicode_FromString(endpoint.error.value().c_str());
+        if (-1 == PyDict_SetItemString(pyObj_endpoint, "error", pyObj_tmp)) {
+          PyErr_Print();
+          PyErr_Clear();
+        }
+        Py_XDECREF(pyObj_tmp);
+      }
+
+      if (-1 == PyList_Append(pyObj_endpoints, pyObj_endpoint)) {
+        PyErr_Print();
+        PyErr_Clear();
+      }
+      Py_DECREF(pyObj_endpoint);
+    }
+  }
+  return pyObj_endpoints;
+}
+
+PyObject*
+handle_warmup_connection([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* pyObj_conn = nullptr;
+  unsigned long long timeout = 0;
+
+  static const char* kw_list[] = { "", "timeout", nullptr };
+
+  const char* kw_format = "O!|K";
+  int ret = PyArg_ParseTupleAndKeywords(
+    args, kwargs, kw_format, const_cast<char**>(kw_list), &PyCapsule_Type, &pyObj_conn, &timeout);
+
+  if (!ret) {
+    std::string msg = "Cannot warm up connection. Unable to parse args/kwargs.";
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, msg.c_str());
+    return nullptr;
+  }
+
+  connection* conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  std::optional<std::chrono::milliseconds> timeout_ms{};
+  if (timeout > 0) {
+    timeout_ms = std::chrono::milliseconds(std::max(1ULL, timeout / 1000ULL));
+  }
+
+  // A ping of the analytics service checks out (and then returns to the idle pool) an HTTP session
+  // for every analytics endpoint in the current configuration.  This allows applications to pay the
+  // DNS/TCP/TLS setup costs up front instead of on the first query.
+  auto barrier = std::make_shared<std::promise<couchbase::core::diag::ping_result>>();
+  auto f = barrier->get_future();
+  couchbase::core::diag::ping_result result{};
+  Py_BEGIN_ALLOW_THREADS conn->cluster_.ping(std::nullopt,
+                                             std::nullopt,
+                                             { couchbase::core::service_type::analytics },
+                                             timeout_ms,
+                                             [barrier](couchbase::core::diag::ping_result res) {
+                                               barrier->set_value(std::move(res));
+                                             });
+  result = f.get();
+  Py_END_ALLOW_THREADS
+
+    CB_LOG_DEBUG("{}: warmup connection completed", "PYCBCC");
+  return build_warmup_endpoints(result);
+}
+
+PyObject*
+handle_get_bootstrap_nodes([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* pyObj_conn = nullptr;
+  static const char* kw_list[] = { "", nullptr };
+
+  const char* kw_format = "O!";
+  int ret = PyArg_ParseTupleAndKeywords(
+    args, kwargs, kw_format, const_cast<char**>(kw_list), &PyCapsule_Type, &pyObj_conn);
+
+  if (!ret) {
+    std::string msg = "Cannot get bootstrap nodes. Unable to parse args/kwargs.";
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, msg.c_str());
+    return nullptr;
+  }
+
+  connection* conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  PyObject* pyObj_nodes = PyList_New(static_cast<Py_ssize_t>(0));
+  // The origin holds the nodes the core bootstraps from: the DNS SRV records (if the connection
+  // string was resolved), otherwise the connection string's nodes.  An empty list is returned if
+  // the connection has been closed.
+  auto cluster_info = conn->cluster_.origin();
+  if (cluster_info.first) {
+    return pyObj_nodes;
+  }
+  for (const auto& node : cluster_info.second.get_nodes()) {
+    PyObject* pyObj_tmp = PyUnicode_FromString(node.c_str());
+    if (-1 == PyList_Append(pyObj_nodes, pyObj_tmp)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_XDECREF(pyObj_tmp);
+  }
+  return pyObj_nodes;
+}
+
+PyObject*
+handle_get_io_thread_stats([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* pyObj_conn = nullptr;
+  static const char* kw_list[] = { "", nullptr };
+
+  const char* kw_format = "O!";
+  int ret = PyArg_ParseTupleAndKeywords(
+    args, kwargs, kw_format, const_cast<char**>(kw_list), &PyCapsule_Type, &pyObj_conn);
+
+  if (!ret) {
+    std::string msg = "Cannot get io thread stats. Unable to parse args/kwargs.";
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, msg.c_str());
+    return nullptr;
+  }
+
+  connection* conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  // copy the stats w/ the mutex held and build the dicts after releasing it: allocating Python
+  // objects can trigger a (free-threaded) stop-the-world pause, which would deadlock w/ a thread
+  // waiting for the mutex
+  std::uint64_t io_loop_lag_us{ 0 };
+  std::size_t max_io_threads{ 0 };
+  std::vector<std::pair<std::uint64_t, double>> io_threads{};
+  {
+    std::scoped_lock lock(conn->io_threads_mutex_);
+    io_loop_lag_us = conn->io_loop_lag_us_;
+    max_io_threads = conn->max_io_threads_;
+    for (const auto& t : conn->io_threads_) {
+      io_threads.emplace_back(t.last_cpu_time_ns_, t.utilization_);
+    }
+  }
+
+  PyObject* pyObj_stats = PyDict_New();
+  PyObject* pyObj_threads = PyList_New(static_cast<Py_ssize_t>(0));
+  PyObject* pyObj_tmp = PyLong_FromUnsignedLongLong(io_loop_lag_us);
+  if (-1 == PyDict_SetItemString(pyObj_stats, "loop_lag", pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+
+  pyObj_tmp = PyLong_FromSize_t(max_io_threads);
+  if (-1 == PyDict_SetItemString(pyObj_stats, "max_io_threads", pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+
+  for (const auto& [cpu_time_ns, utilization] : io_threads) {
+    PyObject* pyObj_thread = PyDict_New();
+    pyObj_tmp = PyLong_FromUnsignedLongLong(cpu_time_ns / 1000ULL);
+    if (-1 == PyDict_SetItemString(pyObj_thread, "cpu_time", pyObj_tmp)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_XDECREF(pyObj_tmp);
+
+    pyObj_tmp = PyFloat_FromDouble(utilization);
+    if (-1 == PyDict_SetItemString(pyObj_thread, "utilization", pyObj_tmp)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_XDECREF(pyObj_tmp);
+
+    if (-1 == PyList_Append(pyObj_threads, pyObj_thread)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_DECREF(pyObj_thread);
+  }
+
+  if (-1 == PyDict_SetItemString(pyObj_stats, "threads", pyObj_threads)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_DECREF(pyObj_threads);
+  return pyObj_stats;
+}
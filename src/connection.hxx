@@ -27,3 +27,12 @@ get_connection_info(PyObject* self, PyObject* args, PyObject* kwargs);
 
 PyObject*
 handle_close_connection(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject*
+handle_warmup_connection(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject*
+handle_get_bootstrap_nodes(PyObject* self, PyObject* args, PyObject* kwargs);
+
+PyObject*
+handle_get_io_thread_stats(PyObject* self, PyObject* args, PyObject* kwargs);
@@ -33,10 +33,18 @@ pycbcc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject
   auto logger = reinterpret_cast<pycbcc_logger*>(self);
   PyObject* pyObj_logger = nullptr;
   PyObject* pyObj_level = nullptr;
-  const char* kw_list[] = { "logger", "level", nullptr };
-  const char* kw_format = "OO";
-  if (!PyArg_ParseTupleAndKeywords(
-        args, kwargs, kw_format, const_cast<char**>(kw_list), &pyObj_logger, &pyObj_level)) {
+  unsigned long long max_queue_size = 0;
+  unsigned long long rate_limit = 0;
+  const char* kw_list[] = { "logger", "level", "max_queue_size", "rate_limit", nullptr };
+  const char* kw_format = "OO|KK";
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   kw_format,
+                                   const_cast<char**>(kw_list),
+                                   &pyObj_logger,
+                                   &pyObj_level,
+                                   &max_queue_size,
+                                   &rate_limit)) {
     pycbcc_set_python_exception(CoreClientErrors::VALUE,
                                 __FILE__,
                                 __LINE__,
@@ -53,7 +61,8 @@ pycbcc_logger__configure_logging_sink__(PyObject* self, PyObject* args, PyObject
   }
 
   if (pyObj_logger != nullptr) {
-    logger->logger_sink_ = std::make_shared<pycbcc_logger_sink>(pyObj_logger);
+    logger->logger_sink_ = std::make_shared<pycbcc_logger_sink>(
+      pyObj_logger, static_cast<std::size_t>(max_queue_size), static_cast<std::size_t>(rate_limit));
   }
 
   couchbase::core::logger::configuration logger_settings;
@@ -121,6 +130,37 @@ pycbcc_logger__enable_protocol_logger__(PyObject* self, PyObject* args, PyObject
   Py_RETURN_NONE;
 }
 
+PyObject*
+pycbcc_logger__flush_logging_sink__(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  auto logger = reinterpret_cast<pycbcc_logger*>(self);
+  unsigned long long timeout_ms = 0;
+  const char* kw_list[] = { "timeout", nullptr };
+  const char* kw_format = "|K";
+  if (!PyArg_ParseTupleAndKeywords(
+        args, kwargs, kw_format, const_cast<char**>(kw_list), &timeout_ms)) {
+    pycbcc_set_python_exception(CoreClientErrors::VALUE,
+                                __FILE__,
+                                __LINE__,
+                                "Cannot flush pycbcc_logger sink.  Unable to parse args/kwargs.");
+    return nullptr;
+  }
+
+  if (!logger->logger_sink_) {
+    Py_RETURN_TRUE;
+  }
+
+  bool flushed = false;
+  auto sink = logger->logger_sink_;
+  // the sink's dispatch thread needs the GIL to hand the queued messages to the Python logger
+  Py_BEGIN_ALLOW_THREADS flushed = sink->wait_until_flushed(std::chrono::milliseconds(timeout_ms));
+  Py_END_ALLOW_THREADS if (flushed)
+  {
+    Py_RETURN_TRUE;
+  }
+  Py_RETURN_FALSE;
+}
+
 static PyMethodDef pycbcc_logger_methods[] = {
   { "configure_logging_sink",
     (PyCFunction)pycbcc_logger__configure_logging_sink__,
@@ -134,6 +174,10 @@ static PyMethodDef pycbcc_logger_methods[] = {
     (PyCFunction)pycbcc_logger__enable_protocol_logger__,
     METH_VARARGS | METH_KEYWORDS,
     PyDoc_STR("Enables the protocol logger") },
+  { "flush_logging_sink",
+    (PyCFunction)pycbcc_logger__flush_logging_sink__,
+    METH_VARARGS | METH_KEYWORDS,
+    PyDoc_STR("Waits for the logger's logging sink to hand queued messages to Python logging") },
   { NULL }
 };
 
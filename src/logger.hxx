@@ -17,12 +17,22 @@
 
 #pragma once
 #include "Python.h"
+#include <atomic>
+#include <condition_variable>
 #include <core/logger/configuration.hxx>
 #include <core/logger/logger.hxx>
 #include <core/transactions.hxx>
+#include <deque>
+#include <mutex>
 #include <queue>
 #include <spdlog/details/log_msg.h>
 #include <spdlog/sinks/base_sink.h>
+#include <string_view>
+#include <thread>
+#include <unordered_map>
+#include <utility>
+
+#include "utils.hxx"
 
 // the spdlog::log_msg uses string_view, since it doesn't want
 // copies.   Since we consume the log_msg then asych process it,
@@ -52,24 +62,41 @@ convert_spdlog_level(spdlog::level::level_enum lvl);
 couchbase::core::logger::level
 convert_python_log_level(PyObject* level);
 
-// Moved to implementing a spdlog::sinks::sink instead of a base_sink.  Allows us to not
-// worry about the mutex w/in the base_sink.  The GIL is the locking mechanism that makes
-// sure logging is thread safe as we acquire the GIL prior to passing the log message to
-// Python's Logging module.
+// Implements a spdlog::sinks::sink instead of a base_sink.  Allows us to not worry about the mutex
+// w/in the base_sink.
 //
-// Still probably the better way to do logging: asynchronous logger (see note below).
+// The sink is asynchronous: log() is called on the C++ core's threads (including the io threads),
+// so it never acquires the GIL.  Messages below the Python logger's effective level are dropped
+// before being copied, the remaining messages are queued and a dedicated thread hands them, in
+// batches (one GIL acquisition per batch), to the Python logger.  The queue is bounded, if it is
+// full messages are dropped and the number of dropped messages is logged once there is room.
+// Repetitive messages (same source location) can optionally be rate limited.
 //
-// A third way would be to use asynchronous logger.   However the txns lib only creates synchronous
-// loggers now.   This is probably the best solution, which we can do when we merge the txn lib
-// into the client lib.
+// The effective level of the Python logger is refreshed by the dispatch thread after each batch
+// and at least every level_refresh_interval.
 //
 class pycbcc_logger_sink : public spdlog::sinks::sink
 {
 public:
-  pycbcc_logger_sink(PyObject* pyObj_logger)
+  static constexpr std::size_t default_max_queue_size = 10000;
+  static constexpr auto level_refresh_interval = std::chrono::milliseconds(1000);
+  static constexpr auto rate_limit_window = std::chrono::seconds(1);
+  // bounds the number of tracked source locations when rate limiting
+  static constexpr std::size_t max_rate_limit_entries = 4096;
+
+  // must be created w/ the GIL held
+  pycbcc_logger_sink(PyObject* pyObj_logger,
+                     std::size_t max_queue_size = default_max_queue_size,
+                     std::size_t rate_limit = 0)
     : pyObj_logger_(pyObj_logger)
+    , max_queue_size_(max_queue_size == 0 ? default_max_queue_size : max_queue_size)
+    , rate_limit_(rate_limit)
   {
     Py_INCREF(pyObj_logger_);
+    refresh_effective_level_();
+    dispatch_thread_ = std::thread([this]() {
+      dispatch_();
+    });
   }
 
   // no copy or move constructor or assignment
@@ -81,7 +108,23 @@ public:
 
   ~pycbcc_logger_sink()
   {
-    if (0 == _Py_IsFinalizing()) {
+    {
+      std::scoped_lock lock(mutex_);
+      stop_ = true;
+    }
+    cv_.notify_all();
+    if (dispatch_thread_.joinable()) {
+      if (pycbcc_is_finalizing() || dispatch_thread_.get_id() == std::this_thread::get_id()) {
+        // the dispatch thread might be blocked acquiring the GIL
+        dispatch_thread_.detach();
+      } else if (PyGILState_Check() == 1) {
+        Py_BEGIN_ALLOW_THREADS dispatch_thread_.join();
+        Py_END_ALLOW_THREADS
+      } else {
+        dispatch_thread_.join();
+      }
+    }
+    if (!pycbcc_is_finalizing()) {
       auto state = PyGILState_Ensure();
       Py_DECREF(pyObj_logger_);
       PyGILState_Release(state);
@@ -90,9 +133,22 @@ public:
 
   void log(const spdlog::details::log_msg& msg) final
   {
-    if (0 == _Py_IsFinalizing()) {
-      log_it_(msg);
+    if (convert_spdlog_level(msg.level) <
+        static_cast<std::size_t>(effective_level_.load(std::memory_order_relaxed))) {
+      return;
     }
+    {
+      std::scoped_lock lock(mutex_);
+      if (stop_ || is_rate_limited_(msg)) {
+        return;
+      }
+      if (queue_.size() >= max_queue_size_) {
+        dropped_++;
+        return;
+      }
+      queue_.emplace_back(msg);
+    }
+    cv_.notify_one();
   }
 
   void flush() final {};
@@ -100,44 +156,177 @@ public:
   void set_pattern(const std::string& pattern) final {};
   void set_formatter(std::unique_ptr<spdlog::formatter> sink_formatter) final {};
 
+  // Blocks until the queued messages have been handed to the Python logger, or until the timeout
+  // expires.  Must be called w/o the GIL held.
+  bool wait_until_flushed(std::chrono::milliseconds timeout)
+  {
+    std::unique_lock lock(mutex_);
+    return flushed_cv_.wait_for(lock, timeout, [this]() {
+      return stop_ || (queue_.empty() && !dispatching_);
+    });
+  }
+
 protected:
-  void log_it_(const spdlog::details::log_msg& msg)
+  struct rate_limit_state {
+    std::chrono::steady_clock::time_point window_start{};
+    std::size_t count{ 0 };
+    std::size_t suppressed{ 0 };
+  };
+
+  // must be called w/ mutex_ held
+  bool is_rate_limited_(const spdlog::details::log_msg& msg)
   {
-    PyGILState_STATE state = PyGILState_Ensure();
-    try {
-
-      // static initialize the type and method once.   These 'leak' a single
-      // object, but that is fine.  Same for an empty tuple we will on each call.
-      static PyObject* pyObj_log_record_type = init_log_record_type();
-      static PyObject* pyObj_logger_handle_method = init_logger_handle_method();
-
-      // convert the log_msg_copy to a dict first...
-      auto pyObj_log_record_details = convert_log_msg(msg);
-
-      // now, create an actual LogRecord from it...
-      auto pyObj_log_record = PyObject_CallObject(pyObj_log_record_type, pyObj_log_record_details);
-      Py_DECREF(pyObj_log_record_details);
-      if (nullptr != pyObj_log_record) {
-        // we need to fixup the created time, which cannot be passed in the constructor...
-        // The created member is a float containing a float expressed as seconds since the epoch, in
-        // UTC.
-        PyObject* log_time = convert_time_to_float(msg.time);
-        PyObject_SetAttrString(pyObj_log_record, "created", log_time);
-        Py_DECREF(log_time);
-
-        // now, we want to hand this record to the logger...
-        PyObject* pyObj_args = PyTuple_Pack(1, pyObj_log_record);
-        PyObject_CallObject(pyObj_logger_handle_method, pyObj_args);
-
-        // that's it, now cleanup.
-        Py_DECREF(pyObj_log_record);
-        Py_DECREF(pyObj_args);
-      } else {
+    if (rate_limit_ == 0) {
+      return false;
+    }
+    std::size_t key = 0;
+    if (nullptr != msg.source.filename) {
+      key =
+        std::hash<const char*>{}(msg.source.filename) ^ (std::hash<int>{}(msg.source.line) << 1);
+    } else {
+      key = std::hash<std::string_view>{}(std::string_view(msg.payload.data(), msg.payload.size()));
+    }
+    if (rate_limits_.size() >= max_rate_limit_entries && rate_limits_.count(key) == 0) {
+      rate_limits_.clear();
+    }
+    auto now = std::chrono::steady_clock::now();
+    auto& state = rate_limits_[key];
+    if (now - state.window_start >= rate_limit_window) {
+      if (state.suppressed > 0 && queue_.size() < max_queue_size_) {
+        queue_.emplace_back(msg);
+        queue_.back().payload =
+          std::to_string(state.suppressed) +
+          " similar messages suppressed (rate limit: " + std::to_string(rate_limit_) +
+          "/s), last message: " + queue_.back().payload;
+        state = { now, 1, 0 };
+        // the message was queued w/ the summary
+        return true;
+      }
+      state = { now, 0, 0 };
+    }
+    if (state.count >= rate_limit_) {
+      state.suppressed++;
+      return true;
+    }
+    state.count++;
+    return false;
+  }
+
+  void dispatch_()
+  {
+    std::deque<log_msg_copy> batch{};
+    while (true) {
+      std::size_t dropped = 0;
+      {
+        std::unique_lock lock(mutex_);
+        cv_.wait_for(lock, level_refresh_interval, [this]() {
+          return stop_ || !queue_.empty();
+        });
+        if (stop_ && queue_.empty()) {
+          break;
+        }
+        batch.swap(queue_);
+        dropped = std::exchange(dropped_, 0);
+        dispatching_ = true;
+      }
+
+      if (!pycbcc_is_finalizing()) {
+        PyGILState_STATE state = PyGILState_Ensure();
+        if (dropped > 0) {
+          auto pyObj_msg =
+            PyUnicode_FromFormat("%zu log messages dropped, the log queue is full (max size: %zu)",
+                                 dropped,
+                                 max_queue_size_);
+          if (nullptr != pyObj_msg) {
+            PyObject* pyObj_res = PyObject_CallMethod(pyObj_logger_, "warning", "O", pyObj_msg);
+            Py_XDECREF(pyObj_res);
+            Py_DECREF(pyObj_msg);
+          }
+          PyErr_Clear();
+        }
+        for (const auto& msg : batch) {
+          log_it_(msg);
+        }
+        refresh_effective_level_();
+        PyGILState_Release(state);
+      }
+      batch.clear();
+
+      {
+        std::scoped_lock lock(mutex_);
+        dispatching_ = false;
+      }
+      flushed_cv_.notify_all();
+    }
+    flushed_cv_.notify_all();
+  }
+
+  // must be called w/ the GIL held
+  void refresh_effective_level_()
+  {
+    PyObject* pyObj_level = PyObject_CallMethod(pyObj_logger_, "getEffectiveLevel", nullptr);
+    if (nullptr == pyObj_level) {
+      PyErr_Clear();
+      return;
+    }
+    auto level = PyLong_AsLong(pyObj_level);
+    Py_DECREF(pyObj_level);
+    if (level == -1 && PyErr_Occurred()) {
+      PyErr_Clear();
+      return;
+    }
+    // logging.disable() applies to every logger, regardless of its level
+    PyObject* pyObj_manager = PyObject_GetAttrString(pyObj_logger_, "manager");
+    if (nullptr != pyObj_manager) {
+      PyObject* pyObj_disable = PyObject_GetAttrString(pyObj_manager, "disable");
+      if (nullptr != pyObj_disable) {
+        auto disable = PyLong_AsLong(pyObj_disable);
+        if (disable > 0 && disable >= level) {
+          level = disable + 1;
+        }
+        Py_DECREF(pyObj_disable);
+      }
+      Py_DECREF(pyObj_manager);
+    }
+    PyErr_Clear();
+    effective_level_.store(level, std::memory_order_relaxed);
+  }
+
+  // must be called w/ the GIL held
+  void log_it_(const log_msg_copy& msg)
+  {
+    // static initialize the type and method once.   These 'leak' a single
+    // object, but that is fine.  Same for an empty tuple we will on each call.
+    static PyObject* pyObj_log_record_type = init_log_record_type();
+    static PyObject* pyObj_logger_handle_method = init_logger_handle_method();
+
+    // convert the log_msg_copy to a dict first...
+    auto pyObj_log_record_details = convert_log_msg(msg);
+
+    // now, create an actual LogRecord from it...
+    auto pyObj_log_record = PyObject_CallObject(pyObj_log_record_type, pyObj_log_record_details);
+    Py_DECREF(pyObj_log_record_details);
+    if (nullptr != pyObj_log_record) {
+      // we need to fixup the created time, which cannot be passed in the constructor...
+      // The created member is a float containing a float expressed as seconds since the epoch, in
+      // UTC.
+      PyObject* log_time = convert_time_to_float(msg.time);
+      PyObject_SetAttrString(pyObj_log_record, "created", log_time);
+      Py_DECREF(log_time);
+
+      // now, we want to hand this record to the logger...
+      PyObject* pyObj_args = PyTuple_Pack(1, pyObj_log_record);
+      PyObject* pyObj_res = PyObject_CallObject(pyObj_logger_handle_method, pyObj_args);
+      if (nullptr == pyObj_res) {
         PyErr_Print();
       }
-      PyGILState_Release(state);
-    } catch (...) {
-      PyGILState_Release(state);
+      Py_XDECREF(pyObj_res);
+
+      // that's it, now cleanup.
+      Py_DECREF(pyObj_log_record);
+      Py_DECREF(pyObj_args);
+    } else {
+      PyErr_Print();
     }
   }
 
@@ -217,6 +406,18 @@ protected:
 
 private:
   PyObject* pyObj_logger_;
+  std::size_t max_queue_size_;
+  std::size_t rate_limit_;
+  std::atomic<long> effective_level_{ 0 };
+  std::mutex mutex_;
+  std::condition_variable cv_;
+  std::condition_variable flushed_cv_;
+  std::deque<log_msg_copy> queue_{};
+  std::unordered_map<std::size_t, rate_limit_state> rate_limits_{};
+  std::size_t dropped_{ 0 };
+  bool dispatching_{ false };
+  bool stop_{ false };
+  std::thread dispatch_thread_;
 };
 
 struct pycbcc_logger {
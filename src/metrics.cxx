@@ -0,0 +1,294 @@
+/*
+ *  Copyright 2016-2024. Couchbase, Inc.
+ *  All Rights Reserved.
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+
+#include "metrics.hxx"
+
+#include "client.hxx"
+#include "exceptions.hxx"
+
+namespace
+{
+void
+set_dict_item(PyObject* pyObj_dict, const char* key, PyObject* pyObj_value)
+{
+  if (-1 == PyDict_SetItemString(pyObj_dict, key, pyObj_value)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_value);
+}
+
+std::size_t
+most_significant_bit(std::uint64_t value)
+{
+#if defined(__GNUC__) || defined(__clang__)
+  return static_cast<std::size_t>(63 - __builtin_clzll(value));
+#else
+  std::size_t msb = 0;
+  while (value >>= 1) {
+    msb++;
+  }
+  return msb;
+#endif
+}
+
+void
+update_min(std::atomic<std::uint64_t>& target, std::uint64_t value)
+{
+  auto current = target.load(std::memory_order_relaxed);
+  while (value < current &&
+         !target.compare_exchange_weak(current, value, std::memory_order_relaxed)) {
+  }
+}
+
+void
+update_max(std::atomic<std::uint64_t>& target, std::uint64_t value)
+{
+  auto current = target.load(std::memory_order_relaxed);
+  while (value > current &&
+         !target.compare_exchange_weak(current, value, std::memory_order_relaxed)) {
+  }
+}
+
+std::uint64_t
+read(std::atomic<std::uint64_t>& value, bool reset, std::uint64_t reset_value = 0)
+{
+  return reset ? value.exchange(reset_value, std::memory_order_relaxed)
+               : value.load(std::memory_order_relaxed);
+}
+
+std::uint64_t
+per_second(std::uint64_t value, std::chrono::nanoseconds duration)
+{
+  auto us = std::chrono::duration_cast<std::chrono::microseconds>(duration).count();
+  if (us <= 0) {
+    return 0;
+  }
+  return static_cast<std::uint64_t>(static_cast<double>(value) * 1e6 / static_cast<double>(us));
+}
+} // namespace
+
+std::size_t
+query_histogram::bucket_index(std::uint64_t value)
+{
+  if (value < sub_bucket_count) {
+    return static_cast<std::size_t>(value);
+  }
+  auto msb = most_significant_bit(value);
+  if (msb >= max_value_bits) {
+    return bucket_count - 1;
+  }
+  auto shift = msb - sub_bucket_bits;
+  auto sub_bucket = static_cast<std::size_t>(value >> shift) & (sub_bucket_count - 1);
+  return (shift + 1) * sub_bucket_count + sub_bucket;
+}
+
+std::uint64_t
+query_histogram::bucket_upper_bound(std::size_t index)
+{
+  if (index < sub_bucket_count) {
+    return index;
+  }
+  auto shift = index / sub_bucket_count - 1;
+  auto sub_bucket = index % sub_bucket_count;
+  return ((sub_bucket_count + sub_bucket + 1) << shift) - 1;
+}
+
+void
+query_histogram::record(std::uint64_t value)
+{
+  buckets_[bucket_index(value)].fetch_add(1, std::memory_order_relaxed);
+  count_.fetch_add(1, std::memory_order_relaxed);
+  sum_.fetch_add(value, std::memory_order_relaxed);
+  update_min(min_, value);
+  update_max(max_, value);
+}
+
+PyObject*
+query_histogram::snapshot(bool reset)
+{
+  PyObject* pyObj_histogram = PyDict_New();
+  auto count = read(count_, reset);
+  set_dict_item(pyObj_histogram, "count", PyLong_FromUnsignedLongLong(count));
+  set_dict_item(pyObj_histogram, "sum", PyLong_FromUnsignedLongLong(read(sum_, reset)));
+  auto min = read(min_, reset, UINT64_MAX);
+  set_dict_item(pyObj_histogram, "min", PyLong_FromUnsignedLongLong(min == UINT64_MAX ? 0 : min));
+  set_dict_item(pyObj_histogram, "max", PyLong_FromUnsignedLongLong(read(max_, reset)));
+
+  PyObject* pyObj_buckets = PyList_New(static_cast<Py_ssize_t>(0));
+  for (std::size_t i = 0; i < bucket_count; i++) {
+    auto bucket = read(buckets_[i], reset);
+    if (bucket == 0) {
+      continue;
+    }
+    PyObject* pyObj_bucket = Py_BuildValue("(KK)",
+                                           static_cast<unsigned long long>(bucket_upper_bound(i)),
+                                           static_cast<unsigned long long>(bucket));
+    if (nullptr == pyObj_bucket || -1 == PyList_Append(pyObj_buckets, pyObj_bucket)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_XDECREF(pyObj_bucket);
+  }
+  set_dict_item(pyObj_histogram, "buckets", pyObj_buckets);
+  return pyObj_histogram;
+}
+
+const char*
+query_outcome_name(query_outcome outcome)
+{
+  switch (outcome) {
+    case query_outcome::success:
+      return "success";
+    case query_outcome::timeout:
+      return "timeout";
+    case query_outcome::cancel:
+      return "cancel";
+    default:
+      return "error";
+  }
+}
+
+query_metrics_entry::~query_metrics_entry()
+{
+  for (auto& outcome : outcomes_) {
+    delete outcome.load();
+  }
+}
+
+query_outcome_metrics&
+query_metrics_entry::outcome_metrics(query_outcome outcome)
+{
+  auto& slot = outcomes_[static_cast<std::size_t>(outcome)];
+  auto* metrics = slot.load(std::memory_order_acquire);
+  if (metrics != nullptr) {
+    return *metrics;
+  }
+  auto* created = new query_outcome_metrics();
+  if (slot.compare_exchange_strong(metrics, created, std::memory_order_acq_rel)) {
+    return *created;
+  }
+  // another thread allocated the metrics first
+  delete created;
+  return *metrics;
+}
+
+void
+query_metrics_entry::record(query_outcome outcome,
+                            std::chrono::nanoseconds time_to_first_row,
+                            std::chrono::nanoseconds total_time,
+                            std::uint64_t rows,
+                            std::uint64_t bytes)
+{
+  auto& metrics = outcome_metrics(outcome);
+  metrics.queries_.fetch_add(1, std::memory_order_relaxed);
+  metrics.rows_.fetch_add(rows, std::memory_order_relaxed);
+  metrics.bytes_.fetch_add(bytes, std::memory_order_relaxed);
+  if (rows > 0) {
+    metrics.first_row_latency_.record(static_cast<std::uint64_t>(
+      std::chrono::duration_cast<std::chrono::microseconds>(time_to_first_row).count()));
+  }
+  metrics.total_latency_.record(static_cast<std::uint64_t>(
+    std::chrono::duration_cast<std::chrono::microseconds>(total_time).count()));
+  metrics.rows_per_second_.record(per_second(rows, total_time));
+  metrics.bytes_per_second_.record(per_second(bytes, total_time));
+}
+
+void
+query_metrics_entry::snapshot(PyObject* pyObj_entries, bool reset)
+{
+  for (std::size_t i = 0; i < outcomes_.size(); i++) {
+    auto* metrics = outcomes_[i].load(std::memory_order_acquire);
+    if (metrics == nullptr) {
+      continue;
+    }
+    PyObject* pyObj_entry = PyDict_New();
+    set_dict_item(pyObj_entry, "database_name", PyUnicode_FromString(database_name_.c_str()));
+    set_dict_item(pyObj_entry, "scope_name", PyUnicode_FromString(scope_name_.c_str()));
+    set_dict_item(pyObj_entry,
+                  "outcome",
+                  PyUnicode_FromString(query_outcome_name(static_cast<query_outcome>(i))));
+    set_dict_item(
+      pyObj_entry, "queries", PyLong_FromUnsignedLongLong(read(metrics->queries_, reset)));
+    set_dict_item(pyObj_entry, "rows", PyLong_FromUnsignedLongLong(read(metrics->rows_, reset)));
+    set_dict_item(pyObj_entry, "bytes", PyLong_FromUnsignedLongLong(read(metrics->bytes_, reset)));
+    set_dict_item(pyObj_entry, "first_row_latency", metrics->first_row_latency_.snapshot(reset));
+    set_dict_item(pyObj_entry, "total_latency", metrics->total_latency_.snapshot(reset));
+    set_dict_item(pyObj_entry, "rows_per_second", metrics->rows_per_second_.snapshot(reset));
+    set_dict_item(pyObj_entry, "bytes_per_second", metrics->bytes_per_second_.snapshot(reset));
+    if (-1 == PyList_Append(pyObj_entries, pyObj_entry)) {
+      PyErr_Print();
+      PyErr_Clear();
+    }
+    Py_DECREF(pyObj_entry);
+  }
+}
+
+std::shared_ptr<query_metrics_entry>
+query_metrics::entry(const std::string& database_name, const std::string& scope_name)
+{
+  std::scoped_lock lock(mutex_);
+  auto& entry = entries_[{ database_name, scope_name }];
+  if (!entry) {
+    entry = std::make_shared<query_metrics_entry>(database_name, scope_name);
+  }
+  return entry;
+}
+
+PyObject*
+query_metrics::snapshot(bool reset)
+{
+  std::vector<std::shared_ptr<query_metrics_entry>> entries{};
+  {
+    std::scoped_lock lock(mutex_);
+    entries.reserve(entries_.size());
+    for (const auto& [key, entry] : entries_) {
+      entries.push_back(entry);
+    }
+  }
+  PyObject* pyObj_entries = PyList_New(static_cast<Py_ssize_t>(0));
+  for (const auto& entry : entries) {
+    entry->snapshot(pyObj_entries, reset);
+  }
+  return pyObj_entries;
+}
+
+PyObject*
+handle_get_query_metrics([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  PyObject* pyObj_conn = nullptr;
+  int reset = 0;
+  static const char* kw_list[] = { "", "reset", nullptr };
+
+  const char* kw_format = "O!|p";
+  int ret = PyArg_ParseTupleAndKeywords(
+    args, kwargs, kw_format, const_cast<char**>(kw_list), &PyCapsule_Type, &pyObj_conn, &reset);
+
+  if (!ret) {
+    std::string msg = "Cannot get query metrics. Unable to parse args/kwargs.";
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, msg.c_str());
+    return nullptr;
+  }
+
+  connection* conn = reinterpret_cast<connection*>(PyCapsule_GetPointer(pyObj_conn, "conn_"));
+  if (nullptr == conn) {
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, NULL_CONN_OBJECT);
+    return nullptr;
+  }
+
+  return conn->query_metrics_->snapshot(reset != 0);
+}
@@ -0,0 +1,139 @@
+/*
+ *  Copyright 2016-2024. Couchbase, Inc.
+ *  All Rights Reserved.
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+#pragma once
+
+#include "Python.h" // NOLINT
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <vector>
+
+// Log-linear (HDR-style) histogram: values are grouped by power of two, each power of two is split
+// into 2^sub_bucket_bits linear sub-buckets, so the relative error of any bucket is at most
+// 1/2^sub_bucket_bits (~6%).  Recording is lock-free (relaxed atomics), a snapshot taken while
+// values are being recorded might be off by the in-flight values.
+class query_histogram
+{
+public:
+  static constexpr std::size_t sub_bucket_bits = 4;
+  static constexpr std::size_t sub_bucket_count = std::size_t{ 1 } << sub_bucket_bits;
+  // values are clamped to 2^max_value_bits - 1 (~12 days when recording microseconds)
+  static constexpr std::size_t max_value_bits = 40;
+  static constexpr std::size_t bucket_count =
+    (max_value_bits - sub_bucket_bits + 1) * sub_bucket_count;
+
+  void record(std::uint64_t value);
+
+  // Returns a dict w/ the count, sum, min, max and the non-empty buckets (a list of
+  // [upper bound, count] pairs).  If reset is set, the histogram is reset.  Must be called w/ the
+  // GIL held.
+  PyObject* snapshot(bool reset);
+
+  static std::size_t bucket_index(std::uint64_t value);
+  static std::uint64_t bucket_upper_bound(std::size_t index);
+
+private:
+  std::array<std::atomic<std::uint64_t>, bucket_count> buckets_{};
+  std::atomic<std::uint64_t> count_{ 0 };
+  std::atomic<std::uint64_t> sum_{ 0 };
+  std::atomic<std::uint64_t> min_{ UINT64_MAX };
+  std::atomic<std::uint64_t> max_{ 0 };
+};
+
+enum class query_outcome : std::size_t {
+  success = 0,
+  timeout,
+  cancel,
+  error,
+  count_
+};
+
+const char*
+query_outcome_name(query_outcome outcome);
+
+// The metrics of the queries w/ a given outcome
+struct query_outcome_metrics {
+  std::atomic<std::uint64_t> queries_{ 0 };
+  std::atomic<std::uint64_t> rows_{ 0 };
+  std::atomic<std::uint64_t> bytes_{ 0 };
+  // latencies are recorded in microseconds
+  query_histogram first_row_latency_{};
+  query_histogram total_latency_{};
+  query_histogram rows_per_second_{};
+  query_histogram bytes_per_second_{};
+};
+
+// The metrics of the queries executed against a database/scope (both are empty for cluster level
+// queries).  The outcome metrics are allocated on first use.
+class query_metrics_entry
+{
+public:
+  query_metrics_entry(std::string database_name, std::string scope_name)
+    : database_name_{ std::move(database_name) }
+    , scope_name_{ std::move(scope_name) }
+  {
+  }
+
+  ~query_metrics_entry();
+
+  query_metrics_entry(const query_metrics_entry&) = delete;
+  query_metrics_entry& operator=(const query_metrics_entry&) = delete;
+
+  void record(query_outcome outcome,
+              std::chrono::nanoseconds time_to_first_row,
+              std::chrono::nanoseconds total_time,
+              std::uint64_t rows,
+              std::uint64_t bytes);
+
+  // Appends a dict per outcome w/ recorded queries to the provided list.  Must be called w/ the
+  // GIL held.
+  void snapshot(PyObject* pyObj_entries, bool reset);
+
+private:
+  query_outcome_metrics& outcome_metrics(query_outcome outcome);
+
+  std::string database_name_;
+  std::string scope_name_;
+  std::array<std::atomic<query_outcome_metrics*>, static_cast<std::size_t>(query_outcome::count_)>
+    outcomes_{};
+};
+
+// The query metrics of a connection.  Entries are looked up (under a mutex) once per query when it
+// is submitted, recording the query's completion is lock-free.
+class query_metrics
+{
+public:
+  std::shared_ptr<query_metrics_entry> entry(const std::string& database_name,
+                                             const std::string& scope_name);
+
+  // Returns a list of dicts, one per database/scope/outcome.  Must be called w/ the GIL held.
+  PyObject* snapshot(bool reset);
+
+private:
+  std::mutex mutex_;
+  std::map<std::pair<std::string, std::string>, std::shared_ptr<query_metrics_entry>> entries_;
+};
+
+PyObject*
+handle_get_query_metrics(PyObject* self, PyObject* args, PyObject* kwargs);
@@ -18,10 +18,13 @@
 #include "result.hxx"
 #include "client.hxx"
 #include "exceptions.hxx"
+#include "stats.hxx"
 
 #include <core/columnar/error.hxx>
 #include <core/columnar/query_result.hxx>
 
+#include <new>
+
 /* result type methods */
 
 static void
@@ -56,11 +59,8 @@ result__get__(result* self, PyObject* args)
   if (val == nullptr) {
     val = default_value;
   }
+  // both the dict's value and the default value are borrowed references
   Py_INCREF(val);
-  if (default_value != nullptr) {
-    Py_XDECREF(default_value);
-  }
-
   return val;
 }
 
@@ -172,6 +172,45 @@ get_columnar_metrics(couchbase::core::columnar::query_metrics metrics)
   return pyObj_metrics;
 }
 
+static void
+set_duration_ns(PyObject* pyObj_dict, const char* key, std::chrono::nanoseconds duration)
+{
+  PyObject* pyObj_tmp = PyLong_FromLongLong(static_cast<long long>(duration.count()));
+  if (-1 == PyDict_SetItemString(pyObj_dict, key, pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+}
+
+PyObject*
+get_columnar_query_client_metrics(const columnar_query_timings& timings)
+{
+  PyObject* pyObj_client_metrics = PyDict_New();
+  set_duration_ns(pyObj_client_metrics,
+                  "dispatch_time",
+                  columnar_query_timings::get(timings.dispatch_time_ns));
+  set_duration_ns(pyObj_client_metrics,
+                  "time_to_headers",
+                  columnar_query_timings::get(timings.time_to_headers_ns));
+  set_duration_ns(pyObj_client_metrics,
+                  "time_to_first_row",
+                  columnar_query_timings::get(timings.time_to_first_row_ns));
+  set_duration_ns(pyObj_client_metrics,
+                  "time_to_last_row",
+                  columnar_query_timings::get(timings.time_to_last_row_ns));
+
+  PyObject* pyObj_tmp =
+    PyLong_FromUnsignedLongLong(timings.bytes_received.load(std::memory_order_relaxed));
+  if (-1 == PyDict_SetItemString(pyObj_client_metrics, "bytes_received", pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+
+  return pyObj_client_metrics;
+}
+
 PyObject*
 get_columnar_query_metadata(couchbase::core::columnar::query_metadata metadata)
 {
@@ -228,6 +267,13 @@ static void
 columnar_query_iterator_dealloc(columnar_query_iterator* self)
 {
   Py_XDECREF(self->row_callback);
+  // the members are not destroyed by tp_free, release the core's query result and pending operation here
+  self->pending_op_.reset();
+  self->query_result_.reset();
+  self->barrier_.reset();
+  self->timings_.reset();
+  self->state_mutex_.~mutex();
+  self->next_row_mutex_.~mutex();
   Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
@@ -235,11 +281,10 @@ static PyObject*
 columnar_query_iterator__cancel__(columnar_query_iterator* self)
 {
   columnar_query_iterator* query_iter = reinterpret_cast<columnar_query_iterator*>(self);
-  if (query_iter->pending_op_ && !query_iter->query_result_) {
-    query_iter->pending_op_->cancel();
-  } else if (query_iter->query_result_) {
-    query_iter->query_result_->cancel();
+  if (query_iter->timings_) {
+    query_iter->timings_->record(query_outcome::cancel);
   }
+  query_iter->cancel();
 
   Py_RETURN_NONE;
 }
@@ -250,7 +295,7 @@ columnar_query_iterator__wait_for_core_query_result__(columnar_query_iterator* s
   columnar_query_iterator* query_iter = reinterpret_cast<columnar_query_iterator*>(self);
   auto future = query_iter->barrier_->get_future();
   PyObject* ret = nullptr;
-  Py_BEGIN_ALLOW_THREADS ret = future.get();
+  Py_BEGIN_ALLOW_THREADS ret = pycbcc_wait_for_future(future);
   Py_END_ALLOW_THREADS return ret;
 }
 
@@ -258,13 +303,60 @@ static PyObject*
 columnar_query_iterator__metadata__(columnar_query_iterator* self)
 {
   columnar_query_iterator* query_iter = reinterpret_cast<columnar_query_iterator*>(self);
-  auto metadata = query_iter->query_result_->metadata();
+  auto query_result = query_iter->query_result();
+  if (!query_result) {
+    Py_RETURN_NONE;
+  }
+  auto metadata = query_result->metadata();
   if (metadata.has_value()) {
-    return get_columnar_query_metadata(metadata.value());
+    PyObject* pyObj_metadata = get_columnar_query_metadata(metadata.value());
+    if (query_iter->timings_) {
+      PyObject* pyObj_client_metrics = get_columnar_query_client_metrics(*query_iter->timings_);
+      if (-1 == PyDict_SetItemString(pyObj_metadata, "client_metrics", pyObj_client_metrics)) {
+        PyErr_Print();
+        PyErr_Clear();
+      }
+      Py_XDECREF(pyObj_client_metrics);
+    }
+    return pyObj_metadata;
   }
   Py_RETURN_NONE;
 }
 
+static PyObject*
+columnar_query_iterator__progress__(columnar_query_iterator* self)
+{
+  columnar_query_iterator* query_iter = reinterpret_cast<columnar_query_iterator*>(self);
+  PyObject* pyObj_progress = PyDict_New();
+  if (!query_iter->timings_) {
+    return pyObj_progress;
+  }
+  const auto& timings = *query_iter->timings_;
+  PyObject* pyObj_tmp =
+    PyLong_FromUnsignedLongLong(timings.rows_received.load(std::memory_order_relaxed));
+  if (-1 == PyDict_SetItemString(pyObj_progress, "rows", pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+
+  pyObj_tmp = PyLong_FromUnsignedLongLong(timings.bytes_received.load(std::memory_order_relaxed));
+  if (-1 == PyDict_SetItemString(pyObj_progress, "bytes", pyObj_tmp)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_tmp);
+
+  set_duration_ns(pyObj_progress, "elapsed_time", timings.elapsed_or_total());
+
+  auto completed = timings.completed.load(std::memory_order_acquire);
+  if (-1 == PyDict_SetItemString(pyObj_progress, "completed", completed ? Py_True : Py_False)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  return pyObj_progress;
+}
+
 // static PyObject*
 // columnar_query_iterator__is_cancelled__(columnar_query_iterator* self)
 // {
@@ -287,6 +379,10 @@ static PyMethodDef columnar_query_iterator_TABLE_methods[] = {
     (PyCFunction)columnar_query_iterator__wait_for_core_query_result__,
     METH_NOARGS,
     PyDoc_STR("Wait for query stream's query result.") },
+  { "progress",
+    (PyCFunction)columnar_query_iterator__progress__,
+    METH_NOARGS,
+    PyDoc_STR("Get the rows and bytes received so far") },
   { "metadata",
     (PyCFunction)columnar_query_iterator__metadata__,
     METH_NOARGS,
@@ -305,7 +401,8 @@ void
 get_next_row(columnar_query_result_variant result,
              couchbase::core::columnar::error err,
              PyObject* pyObj_row_callback,
-             std::shared_ptr<std::promise<PyObject*>> barrier = nullptr)
+             std::shared_ptr<std::promise<PyObject*>> barrier = nullptr,
+             std::shared_ptr<columnar_query_timings> timings = nullptr)
 {
   auto set_exception = false;
   PyObject* pyObj_exc = nullptr;
@@ -314,8 +411,11 @@ get_next_row(columnar_query_result_variant result,
   PyObject* pyObj_result = nullptr;
   PyObject* pyObj_callback_res = nullptr;
 
-  PyGILState_STATE state = PyGILState_Ensure();
+  PyGILState_STATE state = pycbcc_gil_ensure();
   if (err.ec) {
+    if (timings) {
+      timings->record(err);
+    }
     pyObj_exc = pycbcc_build_exception(err, __FILE__, __LINE__);
     if (pyObj_row_callback == nullptr) {
       barrier->set_value(pyObj_exc);
@@ -329,8 +429,16 @@ get_next_row(columnar_query_result_variant result,
   } else {
     if (std::holds_alternative<couchbase::core::columnar::query_result_row>(result)) {
       auto row = std::get<couchbase::core::columnar::query_result_row>(result);
+      if (timings) {
+        timings->row_received(row.content.length());
+      }
       pyObj_result = PyBytes_FromStringAndSize(row.content.c_str(), row.content.length());
+      core_stats::instance().record_row(row.content.length());
     } else if (std::holds_alternative<couchbase::core::columnar::query_result_end>(result)) {
+      if (timings) {
+        columnar_query_timings::set_elapsed(timings->time_to_last_row_ns, timings->elapsed());
+        timings->record(query_outcome::success);
+      }
       Py_INCREF(Py_None);
       pyObj_result = Py_None;
     } else {
@@ -347,7 +455,7 @@ get_next_row(columnar_query_result_variant result,
   }
 
   if (pyObj_func != nullptr) {
-    pyObj_callback_res = PyObject_CallObject(pyObj_func, pyObj_args);
+    pyObj_callback_res = pycbcc_call_callback(pyObj_func, pyObj_args);
     if (pyObj_callback_res) {
       Py_DECREF(pyObj_callback_res);
     } else {
@@ -358,6 +466,8 @@ get_next_row(columnar_query_result_variant result,
     }
     Py_DECREF(pyObj_args);
   }
+  // release the reference taken by columnar_query_iterator_iternext
+  Py_XDECREF(pyObj_row_callback);
   PyGILState_Release(state);
 }
 
@@ -368,19 +478,30 @@ columnar_query_iterator_iternext(PyObject* self)
   PyObject* result = nullptr;
   std::shared_ptr<std::promise<PyObject*>> barrier = nullptr;
   std::future<PyObject*> fut;
+  std::unique_lock next_row_lock(query_iter->next_row_mutex_, std::defer_lock);
   if (query_iter->row_callback == nullptr) {
     barrier = std::make_shared<std::promise<PyObject*>>();
     fut = barrier->get_future();
+    // another thread is iterating the same result, wait for its row w/ the thread state detached
+    if (!next_row_lock.try_lock()) {
+      Py_BEGIN_ALLOW_THREADS next_row_lock.lock();
+      Py_END_ALLOW_THREADS
+    }
+    if (query_iter->rows_ended_.load()) {
+      Py_RETURN_NONE;
+    }
   }
 
-  query_iter->query_result_->next_row(
-    [row_callback = query_iter->row_callback,
-     barrier](columnar_query_result_variant res, couchbase::core::columnar::error err) mutable {
-      get_next_row(res, err, row_callback, barrier);
+  // the row callback must outlive the iterator if Python drops the result while a row is pending
+  Py_XINCREF(query_iter->row_callback);
+  query_iter->query_result()->next_row(
+    [row_callback = query_iter->row_callback, barrier, timings = query_iter->timings_](
+      columnar_query_result_variant res, couchbase::core::columnar::error err) mutable {
+      get_next_row(res, err, row_callback, barrier, timings);
     });
 
   if (query_iter->row_callback == nullptr) {
-    Py_BEGIN_ALLOW_THREADS result = fut.get();
+    Py_BEGIN_ALLOW_THREADS result = pycbcc_wait_for_future(fut);
     Py_END_ALLOW_THREADS
 
       if (result == nullptr)
@@ -389,6 +510,9 @@ columnar_query_iterator_iternext(PyObject* self)
         CoreClientErrors::INTERNAL_SDK, __FILE__, __LINE__, "Error retrieving next query row.");
       return pyObj_exc;
     }
+    if (result == Py_None) {
+      query_iter->rows_ended_.store(true);
+    }
     return result;
   }
   // we don't want to return None as that signals we should retrieve metadata.
@@ -401,6 +525,12 @@ columnar_query_iterator_new(PyTypeObject* type, PyObject*, PyObject*)
 {
   columnar_query_iterator* self =
     reinterpret_cast<columnar_query_iterator*>(type->tp_alloc(type, 0));
+  if (self == nullptr) {
+    return nullptr;
+  }
+  new (&self->state_mutex_) std::mutex();
+  new (&self->next_row_mutex_) std::mutex();
+  new (&self->rows_ended_) std::atomic_bool(false);
   return reinterpret_cast<PyObject*>(self);
 }
 
@@ -428,7 +558,8 @@ pycbcc_columnar_query_iterator_type_init(PyObject** ptr)
 }
 
 PyObject*
-create_columnar_query_iterator_obj(PyObject* pyObj_row_callback)
+create_columnar_query_iterator_obj(PyObject* pyObj_row_callback,
+                                   std::chrono::steady_clock::time_point submitted_at)
 {
   PyObject* pyObj_res =
     PyObject_CallObject(reinterpret_cast<PyObject*>(&columnar_query_iterator_type), nullptr);
@@ -436,6 +567,8 @@ create_columnar_query_iterator_obj(PyObject* pyObj_row_callback)
   if (pyObj_row_callback != nullptr) {
     query_iter->row_callback = pyObj_row_callback;
   }
+  query_iter->timings_ = std::make_shared<columnar_query_timings>();
+  query_iter->timings_->submitted_at = submitted_at;
   return reinterpret_cast<PyObject*>(query_iter);
 }
 
@@ -18,7 +18,9 @@
 #pragma once
 
 #include "client.hxx"
+#include "metrics.hxx"
 #include "utils.hxx"
+#include <core/columnar/error.hxx>
 #include <core/columnar/query_result.hxx>
 #include <core/pending_operation.hxx>
 #include <core/scan_result.hxx>
@@ -33,21 +35,144 @@ pycbcc_result_type_init(PyObject** ptr);
 PyObject*
 create_result_obj();
 
+// Client side timings of a query, the durations are relative to when the query was submitted.
+// The timings are updated from the io threads (rows are received) and read from Python threads
+// (progress, metadata, cancel).  Every field is a relaxed atomic so the timings need neither the
+// GIL nor a lock (on free-threaded builds the GIL does not serialize the updates).  A snapshot
+// taken while rows are being received might be off by the in-flight row.
+struct columnar_query_timings {
+  std::chrono::steady_clock::time_point submitted_at{ std::chrono::steady_clock::now() };
+  std::atomic<std::int64_t> dispatch_time_ns{ 0 };
+  std::atomic<std::int64_t> time_to_headers_ns{ 0 };
+  std::atomic<std::int64_t> time_to_first_row_ns{ 0 };
+  std::atomic<std::int64_t> time_to_last_row_ns{ 0 };
+  // set once the query completes, regardless of its outcome
+  std::atomic<std::int64_t> total_time_ns{ 0 };
+  std::atomic<std::uint64_t> bytes_received{ 0 };
+  std::atomic<std::uint64_t> rows_received{ 0 };
+  // the connection's query metrics for the query's database/scope, set before the query is
+  // dispatched
+  std::shared_ptr<query_metrics_entry> metrics{ nullptr };
+  // claimed by the first outcome recorded, completed is set once total_time_ns is available
+  std::atomic_bool recorded{ false };
+  std::atomic_bool completed{ false };
+
+  std::chrono::nanoseconds elapsed() const
+  {
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(std::chrono::steady_clock::now() -
+                                                                submitted_at);
+  }
+
+  static void set_elapsed(std::atomic<std::int64_t>& duration, std::chrono::nanoseconds elapsed)
+  {
+    duration.store(elapsed.count(), std::memory_order_relaxed);
+  }
+
+  static std::chrono::nanoseconds get(const std::atomic<std::int64_t>& duration)
+  {
+    return std::chrono::nanoseconds{ duration.load(std::memory_order_relaxed) };
+  }
+
+  void row_received(std::size_t bytes)
+  {
+    std::int64_t unset = 0;
+    time_to_first_row_ns.compare_exchange_strong(
+      unset, elapsed().count(), std::memory_order_relaxed);
+    bytes_received.fetch_add(bytes, std::memory_order_relaxed);
+    rows_received.fetch_add(1, std::memory_order_relaxed);
+  }
+
+  // The elapsed time of a query still in flight, the total time once it completed.
+  std::chrono::nanoseconds elapsed_or_total() const
+  {
+    return completed.load(std::memory_order_acquire) ? get(total_time_ns) : elapsed();
+  }
+
+  // Records the query's completion in the connection's query metrics (once).
+  void record(query_outcome outcome)
+  {
+    if (recorded.exchange(true)) {
+      return;
+    }
+    auto total_time = elapsed();
+    total_time_ns.store(total_time.count(), std::memory_order_relaxed);
+    completed.store(true, std::memory_order_release);
+    if (metrics) {
+      metrics->record(outcome,
+                      get(time_to_first_row_ns),
+                      total_time,
+                      rows_received.load(std::memory_order_relaxed),
+                      bytes_received.load(std::memory_order_relaxed));
+    }
+  }
+
+  void record(const couchbase::core::columnar::error& err)
+  {
+    if (err.ec == couchbase::core::columnar::client_errc::canceled) {
+      record(query_outcome::cancel);
+    } else if (err.ec == couchbase::core::columnar::errc::timeout) {
+      record(query_outcome::timeout);
+    } else {
+      record(query_outcome::error);
+    }
+  }
+};
+
+// The iterator's members are not constructed by tp_alloc (the object is zeroed), the mutexes and
+// rows_ended_ are constructed in columnar_query_iterator_new (the mutexes are destroyed in
+// columnar_query_iterator_dealloc).
+//
+// The pending operation and the query result are set from an io thread (the response callback)
+// while Python threads might cancel the query, they are only accessed w/ state_mutex_ held.  Rows
+// are requested one at a time, next_row_mutex_ serializes threads iterating the same result.  Both
+// mutexes are never held while calling into Python, and next_row_mutex_ is only waited on w/ the
+// thread state detached (a free-threaded stop-the-world pause would otherwise deadlock).
 struct columnar_query_iterator {
   PyObject_HEAD std::shared_ptr<couchbase::core::pending_operation> pending_op_;
   std::shared_ptr<couchbase::core::columnar::query_result> query_result_;
   std::shared_ptr<std::promise<PyObject*>> barrier_ = nullptr;
   PyObject* row_callback = nullptr;
+  std::shared_ptr<columnar_query_timings> timings_;
+  std::mutex state_mutex_;
+  std::mutex next_row_mutex_;
+  // set once the end of the rows has been returned, threads that were waiting for next_row_mutex_
+  // must not request another row from the core
+  std::atomic_bool rows_ended_;
 
   void set_pending_operation(std::shared_ptr<couchbase::core::pending_operation> pending_op)
   {
+    std::scoped_lock lock(state_mutex_);
     pending_op_ = pending_op;
   }
 
   void set_query_result(couchbase::core::columnar::query_result query_result)
   {
-    query_result_.reset();
-    query_result_ = std::make_shared<couchbase::core::columnar::query_result>(query_result);
+    auto res = std::make_shared<couchbase::core::columnar::query_result>(query_result);
+    std::scoped_lock lock(state_mutex_);
+    query_result_ = std::move(res);
+  }
+
+  std::shared_ptr<couchbase::core::columnar::query_result> query_result()
+  {
+    std::scoped_lock lock(state_mutex_);
+    return query_result_;
+  }
+
+  // Cancels the query result if the response has been received, otherwise the pending operation.
+  void cancel()
+  {
+    std::shared_ptr<couchbase::core::pending_operation> pending_op;
+    std::shared_ptr<couchbase::core::columnar::query_result> query_result;
+    {
+      std::scoped_lock lock(state_mutex_);
+      pending_op = pending_op_;
+      query_result = query_result_;
+    }
+    if (query_result) {
+      query_result->cancel();
+    } else if (pending_op) {
+      pending_op->cancel();
+    }
   }
 };
 
@@ -55,7 +180,8 @@ int
 pycbcc_columnar_query_iterator_type_init(PyObject** ptr);
 
 PyObject*
-create_columnar_query_iterator_obj(PyObject* pyObj_row_callback);
+create_columnar_query_iterator_obj(PyObject* pyObj_row_callback,
+                                   std::chrono::steady_clock::time_point submitted_at);
 
 PyObject*
 get_columnar_query_metadata();
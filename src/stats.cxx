@@ -0,0 +1,154 @@
+/*
+ *  Copyright 2016-2024. Couchbase, Inc.
+ *  All Rights Reserved.
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+
+#include "stats.hxx"
+
+#include "client.hxx"
+#include "exceptions.hxx"
+
+namespace
+{
+void
+set_dict_item(PyObject* pyObj_dict, const char* key, std::atomic<std::uint64_t>& value, bool reset)
+{
+  auto current =
+    reset ? value.exchange(0, std::memory_order_relaxed) : value.load(std::memory_order_relaxed);
+  PyObject* pyObj_value = PyLong_FromUnsignedLongLong(current);
+  if (-1 == PyDict_SetItemString(pyObj_dict, key, pyObj_value)) {
+    PyErr_Print();
+    PyErr_Clear();
+  }
+  Py_XDECREF(pyObj_value);
+}
+
+void
+update_max(std::atomic<std::uint64_t>& target, std::uint64_t value)
+{
+  auto current = target.load(std::memory_order_relaxed);
+  while (value > current &&
+         !target.compare_exchange_weak(current, value, std::memory_order_relaxed)) {
+  }
+}
+
+std::uint64_t
+to_uint64(std::chrono::nanoseconds duration)
+{
+  return duration.count() > 0 ? static_cast<std::uint64_t>(duration.count()) : 0;
+}
+} // namespace
+
+core_stats&
+core_stats::instance()
+{
+  // intentionally leaked, io threads might still record values while the interpreter shuts down
+  static auto* stats = new core_stats();
+  return *stats;
+}
+
+void
+core_stats::record_gil_acquired(std::chrono::nanoseconds wait)
+{
+  auto wait_ns = to_uint64(wait);
+  gil_acquisitions_.fetch_add(1, std::memory_order_relaxed);
+  gil_wait_time_.fetch_add(wait_ns, std::memory_order_relaxed);
+  update_max(gil_wait_max_time_, wait_ns);
+}
+
+void
+core_stats::record_row(std::size_t bytes)
+{
+  rows_.fetch_add(1, std::memory_order_relaxed);
+  row_bytes_.fetch_add(bytes, std::memory_order_relaxed);
+}
+
+void
+core_stats::record_callback(std::chrono::nanoseconds duration, bool failed)
+{
+  auto duration_ns = to_uint64(duration);
+  callbacks_.fetch_add(1, std::memory_order_relaxed);
+  if (failed) {
+    callback_errors_.fetch_add(1, std::memory_order_relaxed);
+  }
+  callback_time_.fetch_add(duration_ns, std::memory_order_relaxed);
+  update_max(callback_max_time_, duration_ns);
+}
+
+void
+core_stats::record_future_wait(std::chrono::nanoseconds wait)
+{
+  auto wait_ns = to_uint64(wait);
+  future_waits_.fetch_add(1, std::memory_order_relaxed);
+  future_wait_time_.fetch_add(wait_ns, std::memory_order_relaxed);
+  update_max(future_wait_max_time_, wait_ns);
+}
+
+PyObject*
+core_stats::snapshot(bool reset)
+{
+  PyObject* pyObj_stats = PyDict_New();
+  set_dict_item(pyObj_stats, "gil_acquisitions", gil_acquisitions_, reset);
+  set_dict_item(pyObj_stats, "gil_wait_time", gil_wait_time_, reset);
+  set_dict_item(pyObj_stats, "gil_wait_max_time", gil_wait_max_time_, reset);
+  set_dict_item(pyObj_stats, "rows", rows_, reset);
+  set_dict_item(pyObj_stats, "row_bytes", row_bytes_, reset);
+  set_dict_item(pyObj_stats, "callbacks", callbacks_, reset);
+  set_dict_item(pyObj_stats, "callback_errors", callback_errors_, reset);
+  set_dict_item(pyObj_stats, "callback_time", callback_time_, reset);
+  set_dict_item(pyObj_stats, "callback_max_time", callback_max_time_, reset);
+  set_dict_item(pyObj_stats, "future_waits", future_waits_, reset);
+  set_dict_item(pyObj_stats, "future_wait_time", future_wait_time_, reset);
+  set_dict_item(pyObj_stats, "future_wait_max_time", future_wait_max_time_, reset);
+  return pyObj_stats;
+}
+
+PyGILState_STATE
+pycbcc_gil_ensure()
+{
+  auto start = std::chrono::steady_clock::now();
+  PyGILState_STATE state = PyGILState_Ensure();
+  core_stats::instance().record_gil_acquired(std::chrono::steady_clock::now() - start);
+  return state;
+}
+
+PyObject*
+pycbcc_call_callback(PyObject* pyObj_func, PyObject* pyObj_args)
+{
+  auto start = std::chrono::steady_clock::now();
+  PyObject* pyObj_res = PyObject_CallObject(pyObj_func, pyObj_args);
+  core_stats::instance().record_callback(std::chrono::steady_clock::now() - start,
+                                         pyObj_res == nullptr);
+  return pyObj_res;
+}
+
+PyObject*
+handle_get_core_stats([[maybe_unused]] PyObject* self, PyObject* args, PyObject* kwargs)
+{
+  int reset = 0;
+  static const char* kw_list[] = { "reset", nullptr };
+
+  const char* kw_format = "|p";
+  int ret =
+    PyArg_ParseTupleAndKeywords(args, kwargs, kw_format, const_cast<char**>(kw_list), &reset);
+
+  if (!ret) {
+    std::string msg = "Cannot get core stats. Unable to parse args/kwargs.";
+    pycbcc_set_python_exception(CoreClientErrors::VALUE, __FILE__, __LINE__, msg.c_str());
+    return nullptr;
+  }
+
+  return core_stats::instance().snapshot(reset != 0);
+}
@@ -0,0 +1,82 @@
+/*
+ *  Copyright 2016-2024. Couchbase, Inc.
+ *  All Rights Reserved.
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *      http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+#pragma once
+
+#include "Python.h" // NOLINT
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <future>
+
+// Process-wide counters and timers of the bindings' hot paths (acquiring the GIL from io threads,
+// handing rows to Python, calling Python callbacks and blocking on results).  Every update is a
+// relaxed atomic, a snapshot taken while values are being recorded might be off by the in-flight
+// values.
+class core_stats
+{
+public:
+  static core_stats& instance();
+
+  void record_gil_acquired(std::chrono::nanoseconds wait);
+  void record_row(std::size_t bytes);
+  void record_callback(std::chrono::nanoseconds duration, bool failed);
+  void record_future_wait(std::chrono::nanoseconds wait);
+
+  // Returns a dict w/ the counters, durations are in nanoseconds.  If reset is set, the counters
+  // are reset.  Must be called w/ the GIL held.
+  PyObject* snapshot(bool reset);
+
+private:
+  std::atomic<std::uint64_t> gil_acquisitions_{ 0 };
+  std::atomic<std::uint64_t> gil_wait_time_{ 0 };
+  std::atomic<std::uint64_t> gil_wait_max_time_{ 0 };
+  std::atomic<std::uint64_t> rows_{ 0 };
+  std::atomic<std::uint64_t> row_bytes_{ 0 };
+  std::atomic<std::uint64_t> callbacks_{ 0 };
+  std::atomic<std::uint64_t> callback_errors_{ 0 };
+  std::atomic<std::uint64_t> callback_time_{ 0 };
+  std::atomic<std::uint64_t> callback_max_time_{ 0 };
+  std::atomic<std::uint64_t> future_waits_{ 0 };
+  std::atomic<std::uint64_t> future_wait_time_{ 0 };
+  std::atomic<std::uint64_t> future_wait_max_time_{ 0 };
+};
+
+// Acquires the GIL from a thread that might not hold it (i.e. an io thread), recording the time
+// spent waiting for it.
+PyGILState_STATE
+pycbcc_gil_ensure();
+
+// Calls a Python callback, recording its duration and whether it raised.  Must be called w/ the
+// GIL held.
+PyObject*
+pycbcc_call_callback(PyObject* pyObj_func, PyObject* pyObj_args);
+
+// Blocks until the future's value is available, recording the wait.  Must be called w/ the GIL
+// released.
+template<typename T>
+T
+pycbcc_wait_for_future(std::future<T>& fut)
+{
+  auto start = std::chrono::steady_clock::now();
+  fut.wait();
+  core_stats::instance().record_future_wait(std::chrono::steady_clock::now() - start);
+  return fut.get();
+}
+
+PyObject*
+handle_get_core_stats(PyObject* self, PyObject* args, PyObject* kwargs);
@@ -39,5 +39,17 @@ binary_to_PyObject_unicode(couchbase::core::utils::binary value);
 std::string
 binary_to_string(couchbase::core::utils::binary value);
 
+// true once the interpreter has started shutting down (or has shut down), Python must not be
+// called into (nor the GIL acquired) from non-Python threads after this point
+inline bool
+pycbcc_is_finalizing()
+{
+#if PY_VERSION_HEX >= 0x030D0000
+  return Py_IsFinalizing() != 0 || Py_IsInitialized() == 0;
+#else
+  return _Py_IsFinalizing() != 0 || Py_IsInitialized() == 0;
+#endif
+}
+
 std::size_t py_ssize_t_to_size_t(Py_ssize_t);
 Py_ssize_t size_t_to_py_ssize_t(std::size_t);
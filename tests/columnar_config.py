@@ -18,7 +18,7 @@ from __future__ import annotations
 import os
 import pathlib
 from configparser import ConfigParser
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pytest
 
@@ -41,6 +41,7 @@ class ColumnarConfig:
         self._scope_name = 'inventory'
         self._collection_name = 'airline'
         self._tls_verify = True
+        self._trust_pem_file: Optional[str] = None
 
     @property
     def database_name(self) -> str:
@@ -66,6 +67,10 @@ class ColumnarConfig:
     def scope_name(self) -> str:
         return self._scope_name
 
+    @property
+    def trust_pem_file(self) -> Optional[str]:
+        return self._trust_pem_file
+
     def get_connection_string(self) -> str:
         return f'{self._scheme}://{self._host}'
 
@@ -111,6 +116,17 @@ class ColumnarConfig:
 
         return columnar_config
 
+    @classmethod
+    def for_mock_server(cls, host: str, port: int, trust_pem_file: str, username: str, password: str) -> ColumnarConfig:
+        columnar_config = cls()
+        columnar_config._scheme = 'couchbases'
+        columnar_config._host = f'{host}:{port}'
+        columnar_config._port = port
+        columnar_config._username = username
+        columnar_config._password = password
+        columnar_config._trust_pem_file = trust_pem_file
+        return columnar_config
+
 
 @pytest.fixture(name='columnar_config', scope='session')
 def columnar_test_config() -> ColumnarConfig:
@@ -38,6 +38,7 @@ from tests import ColumnarTestEnvironmentException, YieldFixture
 
 if TYPE_CHECKING:
     from tests.columnar_config import ColumnarConfig
+    from tests.environments.mock_server import MockColumnarServer
 
 
 class TestEnvironmentOptionsKwargs(TypedDict, total=False):
@@ -163,7 +164,9 @@ class BlockingTestEnvironment(TestEnvironment):
         username, pw = config.get_username_and_pw()
         cred = Credential.from_username_and_password(username, pw)
         sec_opts: Optional[SecurityOptions] = None
-        if config.nonprod is True:
+        if config.trust_pem_file is not None:
+            sec_opts = SecurityOptions.trust_only_pem_file(config.trust_pem_file)
+        elif config.nonprod is True:
             from couchbase_columnar.common.core._certificates import _Certificates
             sec_opts = SecurityOptions.trust_only_certificates(_Certificates.get_nonprod_certificates())
 
@@ -272,7 +275,9 @@ class AsyncTestEnvironment(TestEnvironment):
         username, pw = config.get_username_and_pw()
         cred = Credential.from_username_and_password(username, pw)
         sec_opts: Optional[SecurityOptions] = None
-        if config.nonprod is True:
+        if config.trust_pem_file is not None:
+            sec_opts = SecurityOptions.trust_only_pem_file(config.trust_pem_file)
+        elif config.nonprod is True:
             from couchbase_columnar.common.core._certificates import _Certificates
             sec_opts = SecurityOptions.trust_only_certificates(_Certificates.get_nonprod_certificates())
 
@@ -310,3 +315,13 @@ def base_test_environment(columnar_config: ColumnarConfig) -> BlockingTestEnviro
 @pytest.fixture(scope='session', name='async_test_env')
 def base_async_test_environment(columnar_config: ColumnarConfig) -> AsyncTestEnvironment:
     return AsyncTestEnvironment.get_environment(columnar_config)
+
+
+@pytest.fixture(scope='session', name='mock_sync_test_env')
+def mock_test_environment(mock_server: MockColumnarServer) -> BlockingTestEnvironment:
+    return BlockingTestEnvironment.get_environment(mock_server.columnar_config())
+
+
+@pytest.fixture(scope='session', name='mock_async_test_env')
+def mock_async_test_environment(mock_server: MockColumnarServer) -> AsyncTestEnvironment:
+    return AsyncTestEnvironment.get_environment(mock_server.columnar_config())
@@ -0,0 +1,212 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    Helpers for the benchmark suites (couchbase_columnar/tests/benchmark_t.py and
+    acouchbase_columnar/tests/benchmark_t.py).
+
+    The benchmarks run against the local mock Columnar server and are only run when PYCBCC_BENCHMARK is set, as are
+    the import time suites (ImportTimeTests in the import_t.py files), whose wall-clock budgets are set with
+    PYCBCC_IMPORT_BUDGET_MS and PYCBCC_CLUSTER_IMPORT_BUDGET_MS.  Set PYCBCC_BENCHMARK_OUTPUT to write the results to a
+    JSON file and PYCBCC_BENCHMARK_BASELINE to a previous results file to fail benchmarks whose throughput regressed by
+    more than PYCBCC_BENCHMARK_TOLERANCE (defaults to 0.2).
+
+    The multi-stream benchmark consumes (and decodes) a separate query stream per thread, with up to one thread per
+    CPU.  The benchmark's mode records whether the GIL is enabled, compare the results of a free-threaded build
+    (e.g. python3.13t) with those of a build with the GIL to see how decoding scales across cores.
+
+    The replay benchmarks stream the rows of the query captures (see the `capture_path` query option) listed in
+    PYCBCC_BENCHMARK_CAPTURES (separated by os.pathsep) through the client, at PYCBCC_BENCHMARK_REPLAY_SPEED times the
+    captured pace (as fast as possible if not set).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import (Any,
+                    Dict,
+                    List,
+                    Optional,
+                    Set)
+
+import pytest
+
+from tests import YieldFixture
+from tests.columnar_config import BASEDIR, ENV_TRUE
+
+BENCHMARK_ENABLED = os.environ.get('PYCBCC_BENCHMARK', 'OFF').lower() in ENV_TRUE
+BENCHMARK_REPLAY_SPEED = (float(os.environ['PYCBCC_BENCHMARK_REPLAY_SPEED'])
+                          if os.environ.get('PYCBCC_BENCHMARK_REPLAY_SPEED') else None)
+
+
+def capture_params() -> List[Any]:
+    """Returns the parameters of the replay benchmarks, one per capture listed in PYCBCC_BENCHMARK_CAPTURES.
+    """
+    captures = [path for path in os.environ.get('PYCBCC_BENCHMARK_CAPTURES', '').split(os.pathsep) if path]
+    if not captures:
+        return [pytest.param(None,
+                             id='no-captures',
+                             marks=pytest.mark.skip(reason='PYCBCC_BENCHMARK_CAPTURES not set.'))]
+    return [pytest.param(path, id=os.path.basename(path)) for path in captures]
+
+
+@dataclass
+class ImportProfile:
+    """The result of importing a module in a fresh interpreter with `-X importtime`.
+    """
+    module: str
+    cumulative_us: int
+    modules: Set[str]
+
+
+def profile_import(module: str, runs: int = 3) -> ImportProfile:
+    """Imports the module in `runs` fresh interpreters, returns the fastest import time and the loaded modules.
+
+    The import time is the cumulative time of the top level imports of the module's package (e.g. both
+    `couchbase_columnar` and `couchbase_columnar.cluster` for `couchbase_columnar.cluster`).
+    """
+    package = module.split('.')[0]
+    cumulative_us: Optional[int] = None
+    modules: Set[str] = set()
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                               f'import sys; import {module}; print("\\n".join(sys.modules))'],
+                              capture_output=True,
+                              text=True,
+                              check=True,
+                              cwd=str(BASEDIR))
+        modules = set(proc.stdout.split())
+        run_us = 0
+        for line in proc.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package, nested imports are indented
+            fields = line.split('|')
+            if len(fields) != 3 or fields[2][1:2].isspace():
+                continue
+            name = fields[2].strip()
+            if name == package or name.startswith(f'{package}.'):
+                run_us += int(fields[1])
+        if run_us > 0:
+            cumulative_us = run_us if cumulative_us is None else min(cumulative_us, run_us)
+    if cumulative_us is None:
+        raise RuntimeError(f'-X importtime did not report {module}, was it already imported?')
+    return ImportProfile(module, cumulative_us, modules)
+
+
+def gil_enabled() -> bool:
+    """Returns whether the GIL is enabled, always True before Python 3.13 and on builds that are not free-threaded.
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return bool(is_gil_enabled()) if is_gil_enabled is not None else True
+
+
+def stream_thread_counts() -> List[int]:
+    """Returns the thread counts of the multi-stream benchmarks: powers of two up to the number of CPUs.
+    """
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def peak_rss_kb() -> int:
+    """Returns the process' peak resident set size in KiB (0 if it cannot be determined on the platform).
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports the peak RSS in bytes, Linux in KiB
+    return int(max_rss / 1024) if sys.platform == 'darwin' else int(max_rss)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    api: str
+    mode: str
+    rows: int
+    iterations: int
+    elapsed_ns: int
+    time_to_first_row_ns: Optional[int] = None
+    peak_rss_kb: int = 0
+
+    @property
+    def key(self) -> str:
+        return f'{self.api}::{self.name}'
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / (self.elapsed_ns / 1e9) if self.elapsed_ns > 0 else 0.0
+
+    @property
+    def per_query_us(self) -> float:
+        return self.elapsed_ns / 1e3 / self.iterations if self.iterations > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {**asdict(self), 'rows_per_second': self.rows_per_second, 'per_query_us': self.per_query_us}
+
+
+class BenchmarkRecorder:
+    def __init__(self,
+                 output: Optional[str] = None,
+                 baseline: Optional[str] = None,
+                 tolerance: float = 0.2) -> None:
+        self._output = output
+        self._tolerance = tolerance
+        self._results: List[BenchmarkResult] = []
+        self._baseline: Dict[str, Dict[str, float]] = {}
+        if baseline is not None:
+            with open(baseline, 'r') as baseline_file:
+                self._baseline = {f'{r["api"]}::{r["name"]}': r for r in json.load(baseline_file)['results']}
+
+    def record(self, result: BenchmarkResult) -> None:
+        """Records the benchmark's result, fails the benchmark if it regressed compared to the baseline.
+        """
+        self._results.append(result)
+        print(f'\n{result.key}: {result.rows_per_second:,.0f} rows/s, {result.per_query_us:,.1f} us/query, '
+              f'time to first row {(result.time_to_first_row_ns or 0) / 1e3:,.1f} us, '
+              f'peak RSS {result.peak_rss_kb:,} KiB')
+        baseline = self._baseline.get(result.key)
+        if baseline is None:
+            return
+        if result.rows > 0 and result.rows_per_second < baseline['rows_per_second'] * (1 - self._tolerance):
+            pytest.fail(f'{result.key} regressed: {result.rows_per_second:,.0f} rows/s compared to '
+                        f'{baseline["rows_per_second"]:,.0f} rows/s.')
+        if result.per_query_us > baseline['per_query_us'] * (1 + self._tolerance):
+            pytest.fail(f'{result.key} regressed: {result.per_query_us:,.1f} us/query compared to '
+                        f'{baseline["per_query_us"]:,.1f} us/query.')
+
+    def write(self) -> None:
+        if self._output is None or not self._results:
+            return
+        with open(self._output, 'w') as output_file:
+            json.dump({'results': [r.to_dict() for r in self._results]}, output_file, indent=2)
+
+
+@pytest.fixture(scope='session', name='benchmark_recorder')
+def benchmark_results_recorder() -> YieldFixture[BenchmarkRecorder]:
+    recorder = BenchmarkRecorder(output=os.environ.get('PYCBCC_BENCHMARK_OUTPUT', None),
+                                 baseline=os.environ.get('PYCBCC_BENCHMARK_BASELINE', None),
+                                 tolerance=float(os.environ.get('PYCBCC_BENCHMARK_TOLERANCE', '0.2')))
+    yield recorder
+    recorder.write()
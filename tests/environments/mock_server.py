@@ -0,0 +1,647 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    A local stand-in for a Columnar cluster, used by the benchmark suite (and other tests that should not need a live
+    cluster).  The server speaks just enough of the KV (MCBP) protocol over TLS for the C++ core to bootstrap (HELLO,
+    SASL PLAIN and GET_CLUSTER_CONFIG) and serves the query service over HTTPS, streaming synthetic results of a
+    configurable row count, row width and chunking, or replaying a query capture (see :class:`MockCapturedResponse`).
+    Fault scripts (see :class:`MockFault`) can be registered per statement to delay, trickle, stall, disconnect or fail
+    the query's response, the analytics ping (used to warm up a cluster's connections) can be delayed.  A resumed
+    query (see the `resume_key` query option) streams the rows after the id passed as its first resume key parameter.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import select
+import shutil
+import socketserver
+import ssl
+import struct
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socket import SHUT_RDWR
+from socket import socket as Socket
+from time import perf_counter_ns, sleep
+from typing import (TYPE_CHECKING,
+                    Any,
+                    Callable,
+                    Dict,
+                    Iterator,
+                    List,
+                    Mapping,
+                    Optional,
+                    Tuple,
+                    cast)
+from uuid import uuid4
+
+import pytest
+
+from couchbase_columnar.capture import QueryCapture
+from couchbase_columnar.cluster import Cluster
+from couchbase_columnar.credential import Credential
+from couchbase_columnar.options import (AdaptiveConcurrencyOptions,
+                                        ClusterOptions,
+                                        ExecutionLaneOptions,
+                                        SecurityOptions)
+from couchbase_columnar.retry import RetryStrategy
+from tests import ColumnarTestEnvironmentException, YieldFixture
+from tests.columnar_config import ColumnarConfig
+
+if TYPE_CHECKING:
+    from couchbase_columnar.protocol.cluster import Cluster as ProtocolCluster
+
+MCBP_HEADER = struct.Struct('>BBHBBHIIQ')
+MCBP_REQUEST_MAGIC = 0x80
+MCBP_RESPONSE_MAGIC = 0x81
+MCBP_DATATYPE_JSON = 0x01
+
+MCBP_OPCODE_NOOP = 0x0a
+MCBP_OPCODE_HELLO = 0x1f
+MCBP_OPCODE_SASL_LIST_MECHS = 0x20
+MCBP_OPCODE_SASL_AUTH = 0x21
+MCBP_OPCODE_SELECT_BUCKET = 0x89
+MCBP_OPCODE_GET_CLUSTER_CONFIG = 0xb5
+MCBP_OPCODE_GET_ERROR_MAP = 0xfe
+
+MCBP_STATUS_SUCCESS = 0x00
+MCBP_STATUS_AUTH_ERROR = 0x20
+MCBP_STATUS_UNKNOWN_COMMAND = 0x81
+
+
+@dataclass
+class MockQueryResponse:
+    """The synthetic result the mock server streams for a query.
+
+    Args:
+        rows (int): The number of rows in the result set.
+        row_width (int): The approximate size, in bytes, of each (JSON) row.
+        rows_per_chunk (int): The number of rows written per HTTP chunk.
+    """
+    rows: int = 1000
+    row_width: int = 64
+    rows_per_chunk: int = 100
+
+    def row(self, idx: int) -> bytes:
+        # {"id":<idx>,"payload":"<padding>"} padded up to the row width
+        prefix = f'{{"id":{idx},"payload":"'
+        padding = max(self.row_width - len(prefix) - 2, 0)
+        return f'{prefix}{"x" * padding}"}}'.encode('utf-8')
+
+    def first_byte_delay(self) -> timedelta:
+        """The delay before the response headers are sent (on top of the fault's delay, if any).
+        """
+        return timedelta(0)
+
+    def chunks(self,
+               request_id: str,
+               stop_after_rows: Optional[int] = None,
+               first_row: int = 0) -> Iterator[bytes]:
+        """Yields the response body's chunks, starting with the row at index `first_row`.  If `stop_after_rows` is set
+        the body is cut off after that many rows.
+        """
+        start = perf_counter_ns()
+        yield f'{{"requestID":"{request_id}","signature":{{"*":"*"}},"results":['.encode('utf-8')
+        result_size = 0
+        rows_per_chunk = max(self.rows_per_chunk, 1)
+        first_row = min(max(first_row, 0), self.rows)
+        num_rows = self.rows if stop_after_rows is None else min(first_row + stop_after_rows, self.rows)
+        for chunk_start in range(first_row, num_rows, rows_per_chunk):
+            chunk_rows = [self.row(idx) for idx in range(chunk_start, min(chunk_start + rows_per_chunk, num_rows))]
+            result_size += sum(len(r) for r in chunk_rows)
+            chunk = b','.join(chunk_rows)
+            yield chunk if chunk_start == first_row else b',' + chunk
+        if num_rows < self.rows:
+            return
+        elapsed = f'{(perf_counter_ns() - start) / 1e6:.3f}ms'
+        metrics = {
+            'elapsedTime': elapsed,
+            'executionTime': elapsed,
+            'resultCount': self.rows - first_row,
+            'resultSize': result_size,
+            'processedObjects': self.rows - first_row,
+        }
+        yield f'],"plans":{{}},"status":"success","metrics":{json.dumps(metrics)}}}'.encode('utf-8')
+
+
+@dataclass
+class MockCapturedResponse(MockQueryResponse):
+    """Replays the rows of a query capture (see the `capture_path` query option).
+
+    Args:
+        capture (Optional[QueryCapture]): The capture to replay.
+        speed (Optional[float]): The speed of the replay relative to the captured stream, `None` streams the rows as
+            fast as possible.
+    """
+    capture: Optional[QueryCapture] = None
+    speed: Optional[float] = None
+    rows_per_chunk: int = 1
+
+    def __post_init__(self) -> None:
+        if self.capture is None:
+            raise ColumnarTestEnvironmentException('MockCapturedResponse requires a capture.')
+        self._rows = self.capture.rows()
+        self.rows = len(self._rows)
+        self.row_width = sum(len(r) for r in self._rows) // self.rows if self.rows > 0 else 0
+        # the rows' offsets relative to the response headers
+        time_to_response = self.capture.time_to_response() or timedelta(0)
+        self._row_offsets = [offset - time_to_response for offset in self.capture.row_offsets()]
+
+    def row(self, idx: int) -> bytes:
+        return self._rows[idx]
+
+    def first_byte_delay(self) -> timedelta:
+        if self.speed is None or self.capture is None:
+            return timedelta(0)
+        return (self.capture.time_to_response() or timedelta(0)) / self.speed
+
+    def chunks(self,
+               request_id: str,
+               stop_after_rows: Optional[int] = None,
+               first_row: int = 0) -> Iterator[bytes]:
+        start = perf_counter_ns()
+        rows_per_chunk = max(self.rows_per_chunk, 1)
+        for idx, chunk in enumerate(super().chunks(request_id, stop_after_rows=stop_after_rows, first_row=first_row)):
+            # the first chunk only opens the response body, each following chunk is sent once its last row was
+            # received in the captured stream
+            last_row = min(idx * rows_per_chunk, self.rows) - 1
+            if self.speed is not None and idx > 0 and last_row < len(self._row_offsets):
+                delay = self._row_offsets[last_row].total_seconds() / self.speed - (perf_counter_ns() - start) / 1e9
+                if delay > 0:
+                    sleep(delay)
+            yield chunk
+
+
+@dataclass
+class MockFault:
+    """A fault script the mock server applies to the responses of a statement.
+
+    Args:
+        first_byte_delay (timedelta): The delay before the response headers are sent.
+        chunk_delay (timedelta): The delay between the chunks of rows (combine with a small
+            :attr:`MockQueryResponse.rows_per_chunk` to trickle rows).
+        status (int): The HTTP status of the response, anything but 200 responds with a Columnar error.
+        error_code (int): The Columnar error code of the error response.
+        error_message (str): The message of the error response.
+        retriable (bool): Whether the error response is marked as retriable.
+        disconnect_after_rows (Optional[int]): Closes the connection after streaming that many rows.
+        stall_after_rows (Optional[int]): Stops streaming after that many rows (without closing the connection) until
+            the client disconnects or the server is stopped.
+        times (Optional[int]): The number of requests the fault is applied to, `None` for every request.
+    """
+    first_byte_delay: timedelta = timedelta(0)
+    chunk_delay: timedelta = timedelta(0)
+    status: int = 200
+    error_code: int = 23007
+    error_message: str = 'Service is currently unavailable'
+    retriable: bool = False
+    disconnect_after_rows: Optional[int] = None
+    stall_after_rows: Optional[int] = None
+    times: Optional[int] = None
+
+    def error_body(self, request_id: str) -> bytes:
+        return json.dumps({
+            'requestID': request_id,
+            'errors': [{'code': self.error_code, 'msg': self.error_message, 'retriable': self.retriable}],
+            'status': 'fatal',
+        }).encode('utf-8')
+
+
+def create_self_signed_certificate(directory: str, host: str) -> Tuple[str, str]:
+    """Creates a self-signed certificate (and key) for the mock server's host, returns the paths to the PEM files.
+    """
+    openssl = shutil.which('openssl')
+    if openssl is None:
+        raise ColumnarTestEnvironmentException('The mock Columnar server requires openssl to create a certificate.')
+    cert_path = os.path.join(directory, 'mock-columnar.pem')
+    key_path = os.path.join(directory, 'mock-columnar-key.pem')
+    subprocess.run([openssl, 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '2',
+                    '-subj', f'/CN={host}',
+                    '-addext', f'subjectAltName=IP:{host}',
+                    '-keyout', key_path,
+                    '-out', cert_path],
+                   check=True,
+                   capture_output=True)
+    return cert_path, key_path
+
+
+class _TLSServerMixin:
+    ssl_context: ssl.SSLContext
+    socket: Socket
+
+    def get_request(self) -> Tuple[Socket, Any]:
+        sock, addr = self.socket.accept()
+        # the handshake is done by the handler's thread, otherwise a slow client would block the accept loop
+        return self.ssl_context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), addr
+
+
+class _MockKvServer(_TLSServerMixin, socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, mock: MockColumnarServer, ssl_context: ssl.SSLContext) -> None:
+        self.mock = mock
+        self.ssl_context = ssl_context
+        super().__init__((mock.host, 0), _MockKvHandler)
+
+
+class _MockKvHandler(socketserver.BaseRequestHandler):
+    server: _MockKvServer
+
+    def handle(self) -> None:
+        sock: ssl.SSLSocket = self.request
+        try:
+            sock.do_handshake()
+            while True:
+                header = self._read_exactly(MCBP_HEADER.size)
+                if header is None:
+                    return
+                magic, opcode, key_len, ext_len, _, _, body_len, opaque, _ = MCBP_HEADER.unpack(header)
+                body = self._read_exactly(body_len) if body_len > 0 else b''
+                if magic != MCBP_REQUEST_MAGIC or body is None:
+                    return
+                key = body[ext_len:ext_len + key_len]
+                value = body[ext_len + key_len:]
+                status, datatype, response = self._dispatch(opcode, key, value)
+                sock.sendall(MCBP_HEADER.pack(MCBP_RESPONSE_MAGIC, opcode, 0, 0, datatype, status,
+                                              len(response), opaque, 0) + response)
+        except (OSError, ssl.SSLError):
+            return
+
+    def _read_exactly(self, num_bytes: int) -> Optional[bytes]:
+        buf = bytearray()
+        while len(buf) < num_bytes:
+            data = self.request.recv(num_bytes - len(buf))
+            if not data:
+                return None
+            buf.extend(data)
+        return bytes(buf)
+
+    def _dispatch(self, opcode: int, key: bytes, value: bytes) -> Tuple[int, int, bytes]:
+        mock = self.server.mock
+        if opcode == MCBP_OPCODE_HELLO:
+            # no optional features are negotiated, the core falls back to the plain protocol
+            return MCBP_STATUS_SUCCESS, 0, b''
+        if opcode == MCBP_OPCODE_SASL_LIST_MECHS:
+            return MCBP_STATUS_SUCCESS, 0, b'PLAIN'
+        if opcode == MCBP_OPCODE_SASL_AUTH:
+            credentials = tuple(v.decode('utf-8') for v in value.split(b'\x00')[1:])
+            if key == b'PLAIN' and credentials == mock.credentials:
+                return MCBP_STATUS_SUCCESS, 0, b'Authenticated'
+            return MCBP_STATUS_AUTH_ERROR, 0, b'Auth failure'
+        if opcode == MCBP_OPCODE_GET_ERROR_MAP:
+            return MCBP_STATUS_SUCCESS, MCBP_DATATYPE_JSON, b'{"version":2,"revision":1,"errors":{}}'
+        if opcode in (MCBP_OPCODE_SELECT_BUCKET, MCBP_OPCODE_NOOP):
+            return MCBP_STATUS_SUCCESS, 0, b''
+        if opcode == MCBP_OPCODE_GET_CLUSTER_CONFIG:
+            return MCBP_STATUS_SUCCESS, MCBP_DATATYPE_JSON, json.dumps(mock.cluster_config()).encode('utf-8')
+        return MCBP_STATUS_UNKNOWN_COMMAND, 0, b''
+
+
+class _MockQueryServer(_TLSServerMixin, ThreadingHTTPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, mock: MockColumnarServer, ssl_context: ssl.SSLContext) -> None:
+        self.mock = mock
+        self.ssl_context = ssl_context
+        super().__init__((mock.host, 0), _MockQueryHandler)
+
+
+class _MockQueryHandler(BaseHTTPRequestHandler):
+    # keep-alive, the core reuses its HTTP connections
+    protocol_version = 'HTTP/1.1'
+    server: _MockQueryServer
+
+    def setup(self) -> None:
+        self.request.do_handshake()
+        super().setup()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # the server is used by benchmarks, don't pay for logging every request
+        pass
+
+    def do_GET(self) -> None:
+        # the analytics ping, see Cluster.warmup()
+        if self.path.split('?')[0] != '/admin/ping':
+            self.send_error(404)
+            return
+        mock = self.server.mock
+        if mock.wait(mock.ping_delay):
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def do_POST(self) -> None:
+        content_length = int(self.headers.get('Content-Length', 0))
+        try:
+            body: Dict[str, Any] = json.loads(self.rfile.read(content_length) or b'{}')
+        except ValueError:
+            body = {}
+        statement = body.get('statement')
+        if statement is None:
+            self.send_error(404)
+            return
+        mock = self.server.mock
+        request_id = body.get('client_context_id') or str(uuid4())
+        response, fault = mock.query_received(statement)
+        if fault is None:
+            fault = MockFault()
+        if mock.wait(fault.first_byte_delay + response.first_byte_delay()):
+            return
+        if fault.status != 200:
+            self._write_error(fault, request_id)
+        else:
+            # the rows of the mock responses are ordered by their id, a resumed query selects the rows after its key
+            resume_after = body.get('$resume_key_0')
+            first_row = resume_after + 1 if isinstance(resume_after, int) else 0
+            self._write_rows(response, fault, request_id, first_row=first_row)
+
+    def _write_error(self, fault: MockFault, request_id: str) -> None:
+        error_body = fault.error_body(request_id)
+        self.send_response(fault.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(error_body)))
+        self.end_headers()
+        self.wfile.write(error_body)
+
+    def _write_rows(self,
+                    response: MockQueryResponse,
+                    fault: MockFault,
+                    request_id: str,
+                    first_row: int = 0) -> None:
+        mock = self.server.mock
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        stop_after_rows = fault.disconnect_after_rows
+        if fault.stall_after_rows is not None:
+            stop_after_rows = fault.stall_after_rows
+        for idx, chunk in enumerate(response.chunks(request_id, stop_after_rows=stop_after_rows, first_row=first_row)):
+            # the first chunk only opens the response body, the rows are delayed
+            if idx > 1 and mock.wait(fault.chunk_delay):
+                return
+            self._write_chunk(chunk)
+        if fault.stall_after_rows is not None:
+            self._wait_for_disconnect()
+        elif fault.disconnect_after_rows is not None:
+            self.close_connection = True
+            self.request.shutdown(SHUT_RDWR)
+        else:
+            self._write_chunk(b'')
+
+    def _wait_for_disconnect(self) -> None:
+        self.close_connection = True
+        while not self.server.mock.wait(timedelta(milliseconds=50)):
+            readable, _, _ = select.select([self.request], [], [], 0)
+            if not readable:
+                continue
+            try:
+                if not self.request.recv(1024):
+                    return
+            except (OSError, ssl.SSLError):
+                return
+
+    def _write_chunk(self, chunk: bytes) -> None:
+        self.wfile.write(f'{len(chunk):x}\r\n'.encode('utf-8') + chunk + b'\r\n')
+        self.wfile.flush()
+
+
+class MockColumnarServer:
+    """A local stand-in for a Columnar cluster.
+
+    Queries are answered with the response registered for their statement (see :meth:`register_response`), or with
+    the default response.
+
+    Example:
+        with MockColumnarServer() as server:
+            server.register_response('SELECT 1', MockQueryResponse(rows=1))
+            cluster = Cluster.create_instance(server.connection_string, credential, server.cluster_options())
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 username: str = 'Administrator',
+                 password: str = 'password',
+                 default_response: Optional[MockQueryResponse] = None) -> None:
+        self._host = host
+        self._credentials = (username, password)
+        self._default_response = default_response or MockQueryResponse()
+        self._responses: Dict[str, MockQueryResponse] = {}
+        self._faults: Dict[str, MockFault] = {}
+        self._fault_requests_remaining: Dict[str, Optional[int]] = {}
+        self._faults_applied = 0
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._query_count = 0
+        self._ping_delay = timedelta(0)
+        self._tmp_dir: Optional[str] = None
+        self._cert_path: Optional[str] = None
+        self._kv_server: Optional[_MockKvServer] = None
+        self._query_server: Optional[_MockQueryServer] = None
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def credentials(self) -> Tuple[str, str]:
+        return self._credentials
+
+    @property
+    def certificate_path(self) -> str:
+        if self._cert_path is None:
+            raise ColumnarTestEnvironmentException('The mock Columnar server has not been started.')
+        return self._cert_path
+
+    @property
+    def kv_port(self) -> int:
+        if self._kv_server is None:
+            raise ColumnarTestEnvironmentException('The mock Columnar server has not been started.')
+        return int(self._kv_server.server_address[1])
+
+    @property
+    def query_port(self) -> int:
+        if self._query_server is None:
+            raise ColumnarTestEnvironmentException('The mock Columnar server has not been started.')
+        return int(self._query_server.server_address[1])
+
+    @property
+    def connection_string(self) -> str:
+        return f'couchbases://{self._host}:{self.kv_port}'
+
+    @property
+    def query_count(self) -> int:
+        return self._query_count
+
+    @property
+    def faults_applied(self) -> int:
+        return self._faults_applied
+
+    @property
+    def ping_delay(self) -> timedelta:
+        return self._ping_delay
+
+    def columnar_config(self) -> ColumnarConfig:
+        username, password = self._credentials
+        return ColumnarConfig.for_mock_server(self._host, self.kv_port, self.certificate_path, username, password)
+
+    def cluster_config(self) -> Dict[str, Any]:
+        return {
+            'rev': 1,
+            'revEpoch': 1,
+            'nodesExt': [{
+                'hostname': self._host,
+                'thisNode': True,
+                'services': {
+                    'kvSSL': self.kv_port,
+                    'cbasSSL': self.query_port,
+                },
+            }],
+            'clusterCapabilitiesVer': [1, 0],
+            'clusterCapabilities': {},
+        }
+
+    def register_response(self, statement: str, response: MockQueryResponse) -> None:
+        with self._lock:
+            self._responses[statement] = response
+
+    def register_fault(self, statement: str, fault: MockFault) -> None:
+        with self._lock:
+            self._faults[statement] = fault
+            self._fault_requests_remaining[statement] = fault.times
+
+    def set_ping_delay(self, delay: timedelta) -> None:
+        """Delays the responses to the analytics ping, until :meth:`clear_faults` is called.
+        """
+        with self._lock:
+            self._ping_delay = delay
+
+    def clear_faults(self) -> None:
+        with self._lock:
+            self._faults.clear()
+            self._fault_requests_remaining.clear()
+            self._ping_delay = timedelta(0)
+
+    def query_received(self, statement: str) -> Tuple[MockQueryResponse, Optional[MockFault]]:
+        with self._lock:
+            self._query_count += 1
+            fault = self._faults.get(statement, None)
+            if fault is not None:
+                self._faults_applied += 1
+                remaining = self._fault_requests_remaining[statement]
+                if remaining is not None:
+                    self._fault_requests_remaining[statement] = remaining - 1
+                    if remaining <= 1:
+                        del self._faults[statement]
+            return self._responses.get(statement, self._default_response), fault
+
+    def wait(self, delay: timedelta) -> bool:
+        """Waits for the delay, returns `True` if the server is stopped in the meantime.
+        """
+        if delay <= timedelta(0):
+            return self._stopping.is_set()
+        return self._stopping.wait(delay.total_seconds())
+
+    def start(self) -> MockColumnarServer:
+        self._stopping.clear()
+        self._tmp_dir = tempfile.mkdtemp(prefix='pycbcc-mock-')
+        self._cert_path, key_path = create_self_signed_certificate(self._tmp_dir, self._host)
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(self._cert_path, key_path)
+        self._kv_server = _MockKvServer(self, ssl_context)
+        self._query_server = _MockQueryServer(self, ssl_context)
+        for server in (self._kv_server, self._query_server):
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._stopping.set()
+        for server in (self._kv_server, self._query_server):
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        self._kv_server = None
+        self._query_server = None
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+
+    def __enter__(self) -> MockColumnarServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+@pytest.fixture(scope='session', name='mock_server')
+def mock_columnar_server() -> YieldFixture[MockColumnarServer]:
+    with MockColumnarServer() as server:
+        yield server
+
+
+def cluster_impl(cluster: Cluster) -> ProtocolCluster:
+    """Returns the cluster's protocol cluster, used by tests that inspect the cluster's connection."""
+    return cast('ProtocolCluster', getattr(cluster, '_impl'))
+
+
+def cluster_has_connection(cluster: Cluster) -> bool:
+    """Returns `True` if the cluster is connected or connecting (see the `lazy_connect` cluster option), `False` once
+    it has been closed.
+    """
+    impl = cluster_impl(cluster)
+    return impl.has_connection or impl.client_adapter.connection_pending
+
+
+@pytest.fixture(name='create_cluster')
+def create_cluster_fixture(mock_server: MockColumnarServer) -> YieldFixture[Callable[..., Cluster]]:
+    """Creates clusters connected to the mock server, the keyword arguments are the cluster options.  Once the test
+    completes, the clusters that are still connected are closed and the server's faults are cleared.
+    """
+    clusters: List[Cluster] = []
+
+    def create_cluster(adaptive_concurrency: Optional[AdaptiveConcurrencyOptions] = None,
+                       execution_lanes: Optional[Mapping[str, ExecutionLaneOptions]] = None,
+                       lazy_connect: Optional[bool] = None,
+                       retry_strategy: Optional[RetryStrategy] = None,
+                       share_connection: Optional[bool] = None) -> Cluster:
+        username, password = mock_server.credentials
+        opts = ClusterOptions(adaptive_concurrency=adaptive_concurrency,
+                              execution_lanes=execution_lanes,
+                              lazy_connect=lazy_connect,
+                              retry_strategy=retry_strategy,
+                              security_options=SecurityOptions.trust_only_pem_file(mock_server.certificate_path),
+                              share_connection=share_connection)
+        cluster = Cluster.create_instance(mock_server.connection_string,
+                                          Credential.from_username_and_password(username, password),
+                                          opts)
+        clusters.append(cluster)
+        return cluster
+
+    yield create_cluster
+    mock_server.clear_faults()
+    for cluster in clusters:
+        if cluster_has_connection(cluster):
+            cluster.close()
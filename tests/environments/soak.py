@@ -0,0 +1,148 @@
+#  Copyright 2016-2024. Couchbase, Inc.
+#  All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+    Helpers for the soak suites (couchbase_columnar/tests/soak_t.py and acouchbase_columnar/tests/soak_t.py).
+
+    The soak tests churn queries, cancellations and error paths through the bindings against the local mock Columnar
+    server and fail if the process leaks.  They are only run when PYCBCC_SOAK is set.  PYCBCC_SOAK_ITERATIONS sets the
+    number of iterations per test (defaults to 10000, use millions for a release soak).  A test fails if, between the
+    end of its warmup (the first 10% of the iterations) and its end:
+    - the total reference count grew by more than PYCBCC_SOAK_MAX_REFCOUNT_GROWTH (defaults to 1000; only checked
+      on debug builds of CPython, which provide sys.gettotalrefcount());
+    - the memory traced by tracemalloc grew by more than PYCBCC_SOAK_MAX_TRACED_GROWTH_KB (defaults to 1024 KiB);
+    - the process' RSS grew by more than PYCBCC_SOAK_MAX_RSS_GROWTH_KB (defaults to 32768 KiB).
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import (Callable,
+                    List,
+                    Optional)
+
+import pytest
+
+from tests import YieldFixture
+from tests.columnar_config import ENV_TRUE
+from tests.environments.benchmark import peak_rss_kb
+
+SOAK_ENABLED = os.environ.get('PYCBCC_SOAK', 'OFF').lower() in ENV_TRUE
+SOAK_ITERATIONS = int(os.environ.get('PYCBCC_SOAK_ITERATIONS', '10000'))
+
+# allocations made by the mock server (it runs in the test process) are not the bindings' concern
+_TRACEMALLOC_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '*/tests/environments/*'),
+    tracemalloc.Filter(False, '*/http/*'),
+    tracemalloc.Filter(False, '*/socketserver.py'),
+    tracemalloc.Filter(False, '*/ssl.py'),
+    tracemalloc.Filter(False, '*/threading.py'),
+]
+
+
+def current_rss_kb() -> int:
+    """Returns the process' current resident set size in KiB, falls back to the peak RSS where the current RSS is not
+    available (only Linux provides it through /proc).
+    """
+    try:
+        with open('/proc/self/statm', 'r') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_kb()
+
+
+def total_refcount() -> Optional[int]:
+    """Returns the interpreter's total reference count, `None` if this is not a debug build of CPython.
+    """
+    gettotalrefcount: Optional[Callable[[], int]] = getattr(sys, 'gettotalrefcount', None)
+    return gettotalrefcount() if gettotalrefcount is not None else None
+
+
+@dataclass
+class LeakSample:
+    refcount: Optional[int]
+    traced_bytes: int
+    rss_kb: int
+    snapshot: tracemalloc.Snapshot
+
+    @classmethod
+    def take(cls) -> LeakSample:
+        # collect twice, the first collection can resurrect objects with finalizers
+        gc.collect()
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_TRACEMALLOC_FILTERS)
+        traced_bytes = sum(stat.size for stat in snapshot.statistics('filename'))
+        return cls(total_refcount(), traced_bytes, current_rss_kb(), snapshot)
+
+
+class LeakTracker:
+    """Samples the reference count, the traced memory and the RSS of the process, see :meth:`check`.
+    """
+
+    def __init__(self,
+                 max_refcount_growth: int = 1000,
+                 max_traced_growth_kb: int = 1024,
+                 max_rss_growth_kb: int = 32768) -> None:
+        self._max_refcount_growth = max_refcount_growth
+        self._max_traced_growth_kb = max_traced_growth_kb
+        self._max_rss_growth_kb = max_rss_growth_kb
+        self._baseline: Optional[LeakSample] = None
+
+    def start(self) -> None:
+        """Takes the baseline sample, call once the warmup is over (caches, pools and connections are populated).
+        """
+        self._baseline = LeakSample.take()
+
+    def check(self, name: str, iterations: int) -> None:
+        """Fails the test if the process grew past the allowed limits since the baseline.
+        """
+        if self._baseline is None:
+            raise RuntimeError('LeakTracker.start() has not been called.')
+        sample = LeakSample.take()
+        failures: List[str] = []
+        if sample.refcount is not None and self._baseline.refcount is not None:
+            refcount_growth = sample.refcount - self._baseline.refcount
+            if refcount_growth > self._max_refcount_growth:
+                failures.append(f'total refcount grew by {refcount_growth:,}')
+        traced_growth_kb = (sample.traced_bytes - self._baseline.traced_bytes) // 1024
+        if traced_growth_kb > self._max_traced_growth_kb:
+            top_stats = sample.snapshot.compare_to(self._baseline.snapshot, 'lineno')[:5]
+            failures.append(f'traced memory grew by {traced_growth_kb:,} KiB, top allocations: '
+                            + '; '.join(str(stat) for stat in top_stats))
+        rss_growth_kb = sample.rss_kb - self._baseline.rss_kb
+        if rss_growth_kb > self._max_rss_growth_kb:
+            failures.append(f'RSS grew by {rss_growth_kb:,} KiB')
+        print(f'\n{name}: {iterations:,} iterations, refcount {sample.refcount}, '
+              f'traced growth {traced_growth_kb:,} KiB, RSS growth {rss_growth_kb:,} KiB')
+        if failures:
+            pytest.fail(f'{name} leaked over {iterations:,} iterations: {", ".join(failures)}.')
+
+
+@pytest.fixture(name='leak_tracker')
+def leak_tracker_fixture() -> YieldFixture[LeakTracker]:
+    started = tracemalloc.is_tracing()
+    if not started:
+        tracemalloc.start()
+    yield LeakTracker(max_refcount_growth=int(os.environ.get('PYCBCC_SOAK_MAX_REFCOUNT_GROWTH', '1000')),
+                      max_traced_growth_kb=int(os.environ.get('PYCBCC_SOAK_MAX_TRACED_GROWTH_KB', '1024')),
+                      max_rss_growth_kb=int(os.environ.get('PYCBCC_SOAK_MAX_RSS_GROWTH_KB', '32768')))
+    if not started:
+        tracemalloc.stop()